@@ -1,5 +1,12 @@
 """Investment Signal Alerts Module"""
 
-from alerts.email_alerts import EmailAlertService
+from utils.lazy import lazy_exports
 
-__all__ = ['EmailAlertService']
+# 채널별 SDK 는 해당 알림을 실제로 보낼 때만 로드
+_EXPORTS = {
+    'EmailAlertService': '.email_alerts'
+}
+
+__getattr__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
@@ -1,7 +1,14 @@
-from .relevance_analyzer import RelevanceAnalyzer
-from .analysis_pipeline import AnalysisPipeline
+from utils.lazy import lazy_exports
 
-__all__ = [
-    'RelevanceAnalyzer',
-    'AnalysisPipeline'
-]
+_EXPORTS = {
+    'RelevanceAnalyzer': '.relevance_analyzer',
+    'AnalysisPipeline': '.analysis_pipeline',
+    'BatchAnalysisWorker': '.batch_worker',
+    'get_llm_backend': '.llm_backends',
+    'AnalysisClient': '.analysis_service',
+    'run_backtest': '.backtest'
+}
+
+__getattr__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
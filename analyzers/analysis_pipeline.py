@@ -1,20 +1,22 @@
-from typing import List, Dict
+from typing import List, Dict, Optional
 from loguru import logger
 import sys
 
 sys.path.append('..')
-from database.supabase_client import SupabaseClient
-from database.models import AnalyzedNews
+from database.storage import StorageBackend
+from analyzers.batch_worker import to_analyzed_news
 from analyzers.relevance_analyzer import RelevanceAnalyzer
+from monitoring.metrics import inc, timer
 
 class AnalysisPipeline:
     """뉴스 분석 파이프라인"""
 
-    def __init__(self, db_client: SupabaseClient):
+    def __init__(self, db_client: StorageBackend, analyzer: Optional[RelevanceAnalyzer] = None):
         self.db = db_client
-        self.analyzer = RelevanceAnalyzer()
+        self.analyzer = analyzer or RelevanceAnalyzer()
         logger.info("Analysis pipeline initialized")
 
+    @timer("analysis_run_seconds")
     def run_analysis(self, limit: int = 50) -> int:
         """미분석 뉴스를 분석하고 저장"""
         try:
@@ -28,38 +30,58 @@ class AnalysisPipeline:
             logger.info(f"Found {len(unanalyzed_news)} unanalyzed news items")
 
             # 배치 분석
-            analysis_results = self.analyzer.batch_analyze(unanalyzed_news)
+            with timer("analyzer_seconds", analyzer="relevance"):
+                analysis_results = self.analyzer.batch_analyze(unanalyzed_news)
+            inc("analysis_news_total", len(unanalyzed_news))
 
-            # 저장
+            # 일괄 저장
             saved_count = 0
-            for result in analysis_results:
-                analyzed_news = AnalyzedNews(
-                    raw_news_id=result['news_id'],
-                    relevance_score=result['relevance_score'],
-                    affected_symbols=result['affected_symbols'],
-                    price_impact=result['price_impact'],
-                    importance=result['importance'],
-                    signal_level=result.get('signal_level', 4),  # 신호 레벨 포함
-                    analysis={
-                        'reasoning': result.get('reasoning', ''),
-                        'key_points': result.get('key_points', [])
-                    }
-                )
-
-                news_id = self.db.insert_analyzed_news(analyzed_news)
+            new_signals = []
+            raw_by_id = {news.get('id'): news for news in unanalyzed_news}
+            news_ids = self.db.insert_analyzed_news_many([to_analyzed_news(result) for result in analysis_results])
+            for result, news_id in zip(analysis_results, news_ids):
                 if news_id:
                     saved_count += 1
+                    raw = raw_by_id.get(result['news_id'], {})
+                    new_signals.append({
+                        "id": news_id,
+                        "raw_news_id": result['news_id'],
+                        "title": raw.get('title', ''),
+                        "url": raw.get('url', ''),
+                        "source": raw.get('source', ''),
+                        "published_at": raw.get('published_at'),
+                        "relevance_score": result['relevance_score'],
+                        "affected_symbols": result['affected_symbols'],
+                        "price_impact": result['price_impact'],
+                        "importance": result['importance'],
+                        "signal_level": result.get('signal_level', 4),
+                        "reasoning": result.get('reasoning', '')
+                    })
+                    # 종목 라벨은 값 종류가 끝없이 늘어나므로 레벨만 (종목별 집계는 analyzed_news_symbols)
+                    inc("signals_total", level=result.get('signal_level', 4))
                     # 신호 레벨에 따라 로깅
                     signal_name = {1: "🔴 URGENT", 2: "🟠 HIGH", 3: "🟡 MEDIUM", 4: "🟢 LOW"}
                     logger.info(f"{signal_name.get(result.get('signal_level', 4), '?')} | {result['relevance_score']} points | {', '.join(result['affected_symbols'])}")
 
             logger.info(f"Analysis pipeline completed: {saved_count} news items analyzed and saved")
+
+            # 대시보드에 새 시그널 + 변경된 집계 발행 (SSE)
+            if new_signals:
+                self._publish_dashboard_events(new_signals)
+
             return saved_count
 
         except Exception as e:
             logger.error(f"Analysis pipeline error: {e}")
             return 0
 
+    def _publish_dashboard_events(self, new_signals: List[Dict]):
+        try:
+            from dashboard.event_stream import publish_analysis_update
+            publish_analysis_update(self.db, new_signals)
+        except Exception as e:
+            logger.warning(f"Dashboard event publish failed: {e}")
+
     def get_trending_symbols(self, hours: int = 24) -> Dict[str, int]:
         """최근 트렌딩 종목 분석"""
         try:
@@ -0,0 +1,354 @@
+"""
+상주 분석 서비스 (NER + 감성 + 정책)
+Warm resident analysis service over a Unix socket
+
+main.py --mode analyze, 테스트 스크립트, 스케줄러처럼 짧게 도는 프로세스가 매번
+NERExtractor / SentimentAnalyzer(FinBERT) / PolicyDetector 를 새로 만들고 모델을
+다시 읽지 않도록, 모델을 한 번 로드한 데몬이 Unix 소켓으로 analyze_many 를 제공합니다.
+
+- 프로토콜: 줄 단위 JSON ({"op": "analyze_many", "texts": [...], "method": "vader"} → {"ok": true, "results": [...]})
+- 여러 호출자의 요청을 BATCH_WINDOW_MS 동안 모아 최대 MAX_BATCH_TEXTS 개씩 한 번에 분석
+  (FinBERT 는 SentimentAnalyzer.batch_analyze 로 배치 추론)
+- AnalysisClient 는 데몬에 연결할 수 없거나 응답이 없으면 프로세스 안에서 분석 (LocalAnalyzer)
+
+결과 항목: {"symbols": [...], "sentiment": {...}, "policy": {...}} (분석 실패 시 None)
+
+사용법:
+    python -m analyzers.analysis_service serve --finbert     # 데몬 (하루 한 번 시작)
+    python -m analyzers.analysis_service ping
+
+    client = AnalysisClient()
+    results = client.analyze_many(articles)   # RawNews / {"title", "content"} / 문자열
+"""
+
+import json
+import os
+import queue
+import socket
+import socketserver
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from config.settings import ANALYSIS_SERVICE_SOCKET, ANALYSIS_SERVICE_TIMEOUT
+from monitoring.metrics import inc, set_gauge, timer
+from pipeline.registry import create
+
+BATCH_WINDOW_MS = 20       # 첫 요청 도착 후 다른 요청을 기다리는 시간
+MAX_BATCH_TEXTS = 256
+CONNECT_TIMEOUT = 1.0
+
+
+class AnalysisServiceError(RuntimeError):
+    """데몬이 요청을 처리하지 못함"""
+
+
+def article_text(article) -> str:
+    """RawNews / dict / 문자열 → 분석할 텍스트"""
+    if isinstance(article, str):
+        return article
+    if isinstance(article, dict):
+        if "text" in article:
+            return article["text"] or ""
+        return f"{article.get('title', '')} {article.get('content') or ''}"
+    return f"{article.title} {article.content or ''}"
+
+
+class LocalAnalyzer:
+    """NER + 감성 + 정책 분석 (프로세스 안에서 실행, 데몬도 이것을 사용)"""
+
+    def __init__(self, use_finbert: bool = False, use_spacy: bool = False):
+        self.ner = create("ner_extractor", use_spacy=use_spacy)
+        self.sentiment = create("sentiment_analyzer", use_finbert=use_finbert)
+        self.policy = create("policy_detector")
+        self.use_finbert = self.sentiment.use_finbert
+
+    def analyze_many(self, texts: List[str], method: str = "vader") -> List[Optional[Dict]]:
+        with timer("analyzer_batch_seconds", analyzer="sentiment"):
+            sentiments = self.sentiment.batch_analyze(texts, method=method)
+
+        results = []
+        for text, sentiment in zip(texts, sentiments):
+            try:
+                with timer("analyzer_seconds", analyzer="ner"):
+                    symbols = self.ner.extract_symbols(text)
+                with timer("analyzer_seconds", analyzer="policy"):
+                    policy = self.policy.detect(text)
+                results.append({"symbols": symbols, "sentiment": sentiment, "policy": policy})
+            except Exception as e:
+                logger.warning(f"  Analysis failed for article: {e}")
+                results.append(None)
+        return results
+
+
+# ==================== 데몬 ====================
+
+class AnalysisService:
+    """모델을 상주시키고 요청을 마이크로 배치로 묶어 분석"""
+
+    def __init__(self, socket_path: str = ANALYSIS_SERVICE_SOCKET, use_finbert: bool = False,
+                 use_spacy: bool = False, batch_window_ms: float = BATCH_WINDOW_MS,
+                 max_batch: int = MAX_BATCH_TEXTS):
+        self.socket_path = Path(socket_path)
+        self.batch_window = batch_window_ms / 1000
+        self.max_batch = max_batch
+        self.started = time.time()
+        self.stats = {"requests": 0, "texts": 0, "batches": 0}
+
+        started = time.perf_counter()
+        self.analyzer = LocalAnalyzer(use_finbert=use_finbert, use_spacy=use_spacy)
+        logger.info(f"Analysis models loaded in {time.perf_counter() - started:.1f}s")
+
+        self._queue: "queue.Queue[Optional[Tuple[List[str], str, Future]]]" = queue.Queue()
+        self._server: Optional[socketserver.BaseServer] = None
+
+    def submit(self, texts: List[str], method: str = "vader") -> List[Optional[Dict]]:
+        """요청 하나를 배치 큐에 넣고 결과를 기다림 (연결 핸들러 스레드에서 호출)"""
+        future: Future = Future()
+        self._queue.put((texts, method, future))
+        return future.result()
+
+    def _batch_loop(self):
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            items, count = [first], len(first[0])
+            deadline = time.monotonic() + self.batch_window
+            while count < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._queue.put(None)
+                    break
+                items.append(item)
+                count += len(item[0])
+            self._run_batch(items)
+
+    def _run_batch(self, items: List[Tuple[List[str], str, Future]]):
+        """요청들을 method 별로 합쳐 한 번에 분석하고 결과를 나눠 돌려줌"""
+        for method in dict.fromkeys(method for _, method, _ in items):
+            group = [item for item in items if item[1] == method]
+            texts = [text for group_texts, _, _ in group for text in group_texts]
+            try:
+                with timer("analysis_service_batch_seconds"):
+                    results = self.analyzer.analyze_many(texts, method)
+            except Exception as e:
+                logger.error(f"Analysis batch of {len(texts)} failed: {e}")
+                for _, _, future in group:
+                    future.set_exception(e)
+                continue
+
+            offset = 0
+            for group_texts, _, future in group:
+                future.set_result(results[offset:offset + len(group_texts)])
+                offset += len(group_texts)
+
+            self.stats["batches"] += 1
+            self.stats["texts"] += len(texts)
+            inc("analysis_service_texts_total", len(texts))
+            set_gauge("analysis_service_last_batch_size", len(texts))
+            logger.debug(f"Analyzed batch of {len(texts)} texts from {len(group)} requests")
+
+    def handle(self, request: Dict) -> Dict:
+        op = request.get("op")
+        if op == "ping":
+            return {
+                "ok": True,
+                "pid": os.getpid(),
+                "uptime_seconds": round(time.time() - self.started, 1),
+                "use_finbert": self.analyzer.use_finbert,
+                **self.stats,
+            }
+        if op == "analyze_many":
+            texts = request.get("texts")
+            if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+                return {"ok": False, "error": "texts must be a list of strings"}
+            self.stats["requests"] += 1
+            inc("analysis_service_requests_total")
+            return {"ok": True, "results": self.submit(texts, request.get("method", "vader"))}
+        return {"ok": False, "error": f"unknown op: {op}"}
+
+    def serve_forever(self):
+        if self.socket_path.exists():
+            if _is_listening(self.socket_path):
+                raise AnalysisServiceError(f"Analysis service already running on {self.socket_path}")
+            self.socket_path.unlink()   # 이전 프로세스가 남긴 소켓 파일
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+        service = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for line in self.rfile:
+                    try:
+                        response = service.handle(json.loads(line))
+                    except Exception as e:
+                        response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+                    self.wfile.write(json.dumps(response, ensure_ascii=False).encode() + b"\n")
+                    self.wfile.flush()
+
+        self._server = _UnixServer(str(self.socket_path), Handler)
+        os.chmod(self.socket_path, 0o600)
+        batcher = threading.Thread(target=self._batch_loop, name="analysis-batcher", daemon=True)
+        batcher.start()
+
+        logger.info(f"✅ Analysis service listening on {self.socket_path} (FinBERT: {self.analyzer.use_finbert})")
+        try:
+            self._server.serve_forever()
+        finally:
+            self._queue.put(None)
+            self._server.server_close()
+            self.socket_path.unlink(missing_ok=True)
+            logger.info("Analysis service stopped")
+
+    def shutdown(self):
+        if self._server:
+            self._server.shutdown()
+
+
+class _UnixServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+def _is_listening(path: Path) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(CONNECT_TIMEOUT)
+        try:
+            sock.connect(str(path))
+            return True
+        except OSError:
+            return False
+
+
+# ==================== 클라이언트 ====================
+
+class AnalysisClient:
+    """
+    상주 서비스 클라이언트
+
+    데몬이 없거나 응답하지 않으면 (fallback=True) 같은 분석을 프로세스 안에서 실행합니다.
+    """
+
+    def __init__(self, socket_path: str = ANALYSIS_SERVICE_SOCKET, timeout: float = ANALYSIS_SERVICE_TIMEOUT,
+                 use_finbert: bool = False, fallback: bool = True):
+        self.socket_path = str(socket_path)
+        self.timeout = timeout
+        self.use_finbert = use_finbert
+        self.fallback = fallback
+        self._sock: Optional[socket.socket] = None
+        self._file = None
+        self._local: Optional[LocalAnalyzer] = None
+        self._lock = threading.Lock()
+        self._warned = False
+
+    def analyze_many(self, articles: List, method: str = "vader") -> List[Optional[Dict]]:
+        """기사 목록 분석 → 항목별 {"symbols", "sentiment", "policy"} (실패 시 None)"""
+        texts = [article_text(article) for article in articles]
+        if not texts:
+            return []
+
+        try:
+            response = self._request({"op": "analyze_many", "texts": texts, "method": method})
+            inc("analysis_client_requests_total", mode="service")
+            return response["results"]
+        except (OSError, ValueError, AnalysisServiceError) as e:
+            if not self.fallback:
+                raise
+            if not self._warned:
+                logger.info(f"Analysis service unavailable ({e}), analyzing in-process")
+                self._warned = True
+
+        inc("analysis_client_requests_total", mode="local")
+        return self.local.analyze_many(texts, method)
+
+    def ping(self) -> Dict:
+        return self._request({"op": "ping"})
+
+    @property
+    def local(self) -> LocalAnalyzer:
+        if self._local is None:
+            self._local = LocalAnalyzer(use_finbert=self.use_finbert)
+        return self._local
+
+    def _request(self, payload: Dict) -> Dict:
+        with self._lock:
+            try:
+                if self._sock is None:
+                    self._connect()
+                self._file.write(json.dumps(payload, ensure_ascii=False).encode() + b"\n")
+                self._file.flush()
+                line = self._file.readline()
+                if not line:
+                    raise ConnectionError("analysis service closed the connection")
+            except OSError:
+                self.close()
+                raise
+
+        response = json.loads(line)
+        if not response.get("ok"):
+            raise AnalysisServiceError(response.get("error", "unknown error"))
+        return response
+
+    def _connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(CONNECT_TIMEOUT)
+            sock.connect(self.socket_path)
+            sock.settimeout(self.timeout)
+        except OSError:
+            sock.close()
+            raise
+        self._sock, self._file = sock, sock.makefile("rwb")
+
+    def close(self):
+        if self._file:
+            self._file.close()
+        if self._sock:
+            self._sock.close()
+        self._sock = self._file = None
+
+
+if __name__ == "__main__":
+    import argparse
+    import signal
+    import sys
+
+    parser = argparse.ArgumentParser(description="상주 분석 서비스 (NER + 감성 + 정책)")
+    parser.add_argument("--socket", default=ANALYSIS_SERVICE_SOCKET, help="Unix 소켓 경로")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = sub.add_parser("serve", help="데몬 실행")
+    serve_parser.add_argument("--finbert", action="store_true", help="FinBERT 로드")
+    serve_parser.add_argument("--spacy", action="store_true", help="spaCy NER 사용")
+    serve_parser.add_argument("--window-ms", type=float, default=BATCH_WINDOW_MS, help="요청을 모으는 시간")
+    serve_parser.add_argument("--max-batch", type=int, default=MAX_BATCH_TEXTS, help="배치당 최대 텍스트 수")
+
+    sub.add_parser("ping", help="데몬 상태 확인")
+    args = parser.parse_args()
+
+    if args.command == "ping":
+        try:
+            print(json.dumps(AnalysisClient(args.socket, fallback=False).ping(), indent=2))
+        except (OSError, AnalysisServiceError) as e:
+            print(f"❌ Analysis service not reachable on {args.socket}: {e}")
+            sys.exit(1)
+        sys.exit(0)
+
+    service = AnalysisService(args.socket, use_finbert=args.finbert, use_spacy=args.spacy,
+                              batch_window_ms=args.window_ms, max_batch=args.max_batch)
+    # SIGTERM 도 정상 종료 (소켓 파일 정리)
+    signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=service.shutdown).start())
+    try:
+        service.serve_forever()
+    except KeyboardInterrupt:
+        pass
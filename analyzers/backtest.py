@@ -0,0 +1,441 @@
+"""
+시그널 백테스트 (보관된 시그널 × 로컬 OHLCV, 벡터화)
+Vectorized signal backtest over archived news
+
+AnalyzedNews 의 price_impact / signal_level / relevance_score 가 실제 가격 움직임과 맞았는지
+측정합니다. NewsArchive 의 analyzed_news 와 로컬 가격 파일(CSV/Parquet)을 컬럼 배열로 읽고,
+종목별 as-of 조인(정렬된 (종목, 시각) 키에 np.searchsorted)으로 시그널 시각 직전 종가와
+각 horizon 뒤 종가를 한 번에 찾습니다. 집계도 np.bincount 로 하므로 파이썬 루프는
+그룹 종류(전체/레벨/레이어/정책 유형) 수만큼만 돕니다.
+
+- 시그널 시각: analyzed_news.created_at (분석이 끝나 시그널을 쓸 수 있게 된 시각)
+- 진입가: 시그널 시각 이전(포함) 마지막 봉 종가 (MAX_ENTRY_AGE 보다 오래된 봉이면 제외)
+- 청산가: 시그널 시각 + horizon 이전(포함) 마지막 봉 종가 (가격 데이터가 거기까지 없거나
+  진입 이후 새 봉이 없으면 제외)
+- hit_rate:      방향(up=+1, down=-1)이 있는 시그널 중 수익률 부호가 맞은 비율
+- signed_return: 방향 × 수익률 평균 (시그널대로 매수/매도했을 때의 평균 수익률)
+- ic:            방향 × relevance_score 와 수익률의 스피어만 순위 상관 (neutral 은 0)
+
+그룹: all, signal_level, source_layer (news_raw.metadata), change_type
+(PolicyDetector 의 policy_type, 없으면 analysis.policy_impact.change_type)
+
+가격 파일 컬럼: symbol(ticker), timestamp(datetime/date), close(adj_close 가 있으면 우선).
+timestamp 는 봉이 끝난 시각이며 시간대가 없으면 UTC 로 봅니다. 날짜만 있는(또는 모두 자정인)
+일봉은 DAILY_CLOSE_HOUR_UTC(미 동부 장 마감)로 옮겨 장중 뉴스가 그날 종가를 미리 보지 않게 합니다.
+
+사용법:
+    python -m analyzers.backtest prices.parquet --start 2025-10-01
+    python -m analyzers.backtest prices.csv --horizons 1h,1d,5d --min-score 60 --output report.json
+
+    signals = load_signals(NewsArchive(), start="2025-10-01")
+    report = run_backtest(signals, load_prices("prices.csv"))
+"""
+
+import json
+import re
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+from loguru import logger
+
+DEFAULT_HORIZONS = ("1h", "1d", "5d")
+MAX_ENTRY_AGE = 4 * 86400          # 주말/연휴를 넘는 진입 봉은 쓰지 않음
+DAILY_CLOSE_HOUR_UTC = 21          # 16:00 ET
+MIN_IC_SAMPLES = 10
+GROUPS = ("all", "signal_level", "source_layer", "change_type")
+
+PRICE_COLUMNS = {
+    "symbol": ("symbol", "ticker"),
+    "timestamp": ("timestamp", "datetime", "date", "time"),
+    "close": ("adj_close", "adjclose", "adj close", "close"),
+}
+HORIZON_UNITS = {"m": 60, "h": 3600, "d": 86400, "w": 7 * 86400}
+
+# 시그널 테이블 (load_signals 결과, 종목당 한 행) — 직접 만든 테이블도 run_backtest 에 넣을 수 있음
+SIGNAL_SCHEMA = pa.schema([
+    ("symbol", pa.string()),
+    ("ts", pa.int64()),                # UTC epoch 초
+    ("relevance_score", pa.int16()),
+    ("signal_level", pa.int8()),
+    ("direction", pa.int8()),          # up=+1, down=-1, neutral=0
+    ("source_layer", pa.int8()),       # 0 = 알 수 없음
+    ("change_type", pa.string()),
+])
+
+_SHIFT = np.int64(1 << 32)             # (종목 코드, 시각) → 정렬 키 하나
+
+
+def parse_horizon(text: str) -> int:
+    """'30m' / '1h' / '5d' / '2w' → 초"""
+    match = re.fullmatch(r"\s*(\d+)\s*([mhdw])\s*", text.lower())
+    if not match:
+        raise ValueError(f"Invalid horizon: {text!r} (expected e.g. 1h, 1d, 5d)")
+    return int(match.group(1)) * HORIZON_UNITS[match.group(2)]
+
+
+def _epoch_seconds(column) -> Tuple[np.ndarray, np.ndarray]:
+    """timestamp/date/문자열 컬럼 → (UTC epoch 초, 유효 여부)"""
+    if pa.types.is_string(column.type) or pa.types.is_large_string(column.type):
+        column = pc.cast(column, pa.timestamp("s"))
+    if pa.types.is_date(column.type):
+        column = pc.cast(column, pa.timestamp("s"))
+    values = column.to_numpy(zero_copy_only=False).astype("datetime64[s]")
+    valid = ~np.isnat(values)
+    return values.astype(np.int64), valid
+
+
+class PriceIndex:
+    """종목별로 정렬된 종가 배열 + 벡터화 as-of 조회"""
+
+    def __init__(self, symbols: Sequence[str], keys: np.ndarray, close: np.ndarray):
+        """
+        Args:
+            symbols: 코드 순서의 종목명
+            keys: 오름차순 정렬된 (코드 << 32 | epoch 초)
+            close: keys 와 같은 순서의 종가
+        """
+        self.symbols = list(symbols)
+        self.keys = keys
+        self.close = close
+
+    @classmethod
+    def from_arrays(cls, symbols: pa.Array, ts: np.ndarray, close: np.ndarray) -> "PriceIndex":
+        """종목명 + 시각 + 종가 (정렬 전) → PriceIndex (같은 종목/시각이 겹치면 마지막 값)"""
+        encoded = pc.dictionary_encode(_combined(symbols))
+        codes = encoded.indices.to_numpy(zero_copy_only=False).astype(np.int64)
+        keys = codes * _SHIFT + ts
+        order = np.argsort(keys, kind="stable")
+        return cls(encoded.dictionary.to_pylist(), keys[order], close[order])
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def codes_for(self, symbols) -> np.ndarray:
+        """종목명 → 코드 (가격이 없는 종목은 -1)"""
+        found = pc.index_in(symbols, value_set=pa.array(self.symbols, pa.string()))
+        return pc.fill_null(found, -1).to_numpy(zero_copy_only=False).astype(np.int64)
+
+    def asof(self, codes: np.ndarray, ts: np.ndarray) -> np.ndarray:
+        """각 (종목, 시각) 이전(포함) 마지막 봉의 위치 (없으면 -1)"""
+        queries = codes * _SHIFT + ts
+        order = np.argsort(queries)     # 정렬된 질의가 캐시 적중률이 높아 더 빠름
+        positions = np.empty(len(queries), np.int64)
+        positions[order] = np.searchsorted(self.keys, queries[order], side="right") - 1
+        same_symbol = (positions >= 0) & (codes >= 0)
+        same_symbol[same_symbol] = self.keys[positions[same_symbol]] // _SHIFT == codes[same_symbol]
+        return np.where(same_symbol, positions, -1)
+
+    def bar_time(self, positions: np.ndarray) -> np.ndarray:
+        return self.keys[positions] % _SHIFT
+
+    def last_time(self, codes: np.ndarray) -> np.ndarray:
+        """종목별 마지막 봉 시각 (가격 없는 종목은 -1)"""
+        last = self.asof(codes, np.full(len(codes), _SHIFT - 1))
+        return np.where(last >= 0, self.bar_time(np.maximum(last, 0)), -1)
+
+
+def load_prices(path: Union[str, Path]) -> PriceIndex:
+    """
+    OHLCV 파일(CSV/Parquet, Parquet 디렉토리) → PriceIndex
+
+    Raises:
+        ValueError: symbol/timestamp/close 컬럼을 찾지 못함
+    """
+    path = Path(path)
+    if path.is_dir() or path.suffix in (".parquet", ".pq"):
+        import pyarrow.parquet as pq
+        table = pq.read_table(path)
+    else:
+        import pyarrow.csv as pv
+        table = pv.read_csv(path)
+
+    names = {name.lower().strip(): name for name in table.column_names}
+    picked = {}
+    for role, aliases in PRICE_COLUMNS.items():
+        match = next((names[alias] for alias in aliases if alias in names), None)
+        if match is None:
+            raise ValueError(f"{path.name}: no {role} column (expected one of {', '.join(aliases)})")
+        picked[role] = match
+
+    ts, valid = _epoch_seconds(table[picked["timestamp"]])
+    close = pc.cast(table[picked["close"]], pa.float64()).to_numpy(zero_copy_only=False)
+    symbols = pc.utf8_upper(pc.utf8_trim_whitespace(pc.cast(table[picked["symbol"]], pa.string())))
+    valid &= ~np.isnan(close) & (close > 0)
+    valid &= pc.is_valid(symbols).to_numpy(zero_copy_only=False)
+
+    # 일봉 (날짜만 있거나 모두 자정) → 장 마감 시각
+    if valid.any() and not np.any(ts[valid] % 86400):
+        ts = ts + DAILY_CLOSE_HOUR_UTC * 3600
+
+    mask = pa.array(valid)
+    prices = PriceIndex.from_arrays(pc.filter(symbols, mask), ts[valid], close[valid])
+    logger.info(f"Loaded {len(prices)} bars for {len(prices.symbols)} symbols from {path.name}")
+    return prices
+
+
+def load_signals(archive, start=None, end=None, symbols: Optional[Iterable[str]] = None,
+                 min_score: Optional[int] = None, sources: Optional[Iterable[str]] = None) -> pa.Table:
+    """
+    NewsArchive 의 analyzed_news → 종목당 한 행의 시그널 테이블 (SIGNAL_SCHEMA)
+
+    source_layer 는 같은 아카이브의 news_raw.metadata 에서 raw_news_id 로 찾습니다.
+    """
+    wanted = [symbol.upper() for symbol in symbols] if symbols else None
+    table = archive.read_signals(
+        start=start, end=end, symbols=wanted, min_score=min_score, sources=sources,
+        columns=["raw_news_id", "created_at", "relevance_score", "signal_level", "affected_symbols",
+                 "price_impact", "policy_type", "analysis"],
+    )
+    if table.num_rows == 0:
+        return SIGNAL_SCHEMA.empty_table()
+
+    raw_ids = pc.unique(table["raw_news_id"])
+    raw = archive.read_raw(end=end, ids=raw_ids, columns=["id", "metadata"])
+    layer = pc.struct_field(pc.extract_regex(raw["metadata"], r'"source_layer":\s*(?P<layer>\d+)'), [0])
+    layer = pc.take(pc.cast(layer, pa.int8()), pc.index_in(table["raw_news_id"], value_set=raw["id"]))
+
+    change_type = pc.coalesce(
+        table["policy_type"],
+        pc.struct_field(pc.extract_regex(table["analysis"], r'"change_type":\s*"(?P<type>[a-z_]+)"'), [0]),
+        pa.scalar("none"),
+    )
+    impact = pc.utf8_lower(pc.fill_null(table["price_impact"], "neutral"))
+    direction = pc.subtract(pc.cast(pc.equal(impact, "up"), pa.int8()), pc.cast(pc.equal(impact, "down"), pa.int8()))
+    ts = table["created_at"].to_numpy().astype("datetime64[s]").astype(np.int64)
+
+    # 종목 리스트 펼치기
+    parents = pc.list_parent_indices(table["affected_symbols"])
+    flat = pc.utf8_upper(pc.list_flatten(table["affected_symbols"]))
+    signals = pa.table({
+        "symbol": flat,
+        "ts": pa.array(ts).take(parents),
+        "relevance_score": pc.take(pc.cast(table["relevance_score"], pa.int16()), parents),
+        "signal_level": pc.take(pc.cast(table["signal_level"], pa.int8()), parents),
+        "direction": pc.take(direction, parents),
+        "source_layer": pc.take(pc.fill_null(layer, 0), parents),
+        "change_type": pc.take(change_type, parents),
+    }, schema=SIGNAL_SCHEMA)
+    if wanted:
+        signals = signals.filter(pc.is_in(signals["symbol"], value_set=pa.array(wanted)))
+    return signals
+
+
+def _group_ranks(groups: np.ndarray, values: np.ndarray, order: np.ndarray) -> np.ndarray:
+    """
+    그룹별 평균 순위 (1부터, 동점은 평균)
+
+    order 는 values 의 argsort 로 한 번만 구해 두고, 그룹 종류마다 그룹 번호로만
+    안정 정렬(작은 정수 → radix)해서 (그룹, 값) 순서를 얻습니다.
+    """
+    n = len(values)
+    if not n:
+        return np.empty(0)
+    narrow = groups.astype(np.int16) if groups.max() < np.iinfo(np.int16).max else groups
+    order = order[np.argsort(narrow[order], kind="stable")]
+    sorted_groups, sorted_values = groups[order], values[order]
+    positions = np.arange(n)
+    new_group = np.r_[True, sorted_groups[1:] != sorted_groups[:-1]]
+    group_start = np.maximum.accumulate(np.where(new_group, positions, 0))
+    new_run = new_group | np.r_[True, sorted_values[1:] != sorted_values[:-1]]
+    run_start = positions[new_run]
+    run_length = np.diff(np.r_[run_start, n])
+    run_id = np.cumsum(new_run) - 1
+    ranks = np.empty(n)
+    ranks[order] = run_start[run_id] + (run_length[run_id] - 1) / 2 - group_start + 1
+    return ranks
+
+
+def _counted_ranks(groups: np.ndarray, size: int, values: np.ndarray) -> np.ndarray:
+    """정수 값(방향 × 점수)의 그룹별 평균 순위 — 정렬 없이 (그룹, 값) 개수 표에서 찾음"""
+    if not len(values):
+        return np.empty(0)
+    codes = values - values.min()
+    width = int(codes.max()) + 1
+    cells = groups * width + codes
+    counts = np.bincount(cells, minlength=size * width).reshape(size, width)
+    table = np.cumsum(counts, axis=1) - counts + (counts + 1) / 2
+    return table.ravel()[cells]
+
+
+def _aggregate(groups: np.ndarray, size: int, returns: np.ndarray, direction: np.ndarray,
+               signal: np.ndarray, return_order: np.ndarray) -> Dict[str, np.ndarray]:
+    """그룹 번호별 통계 (np.bincount, return_order: returns 의 argsort)"""
+    def total(weights=None, mask=None):
+        if mask is None:
+            return np.bincount(groups, weights, minlength=size)
+        return np.bincount(groups[mask], None if weights is None else weights[mask], minlength=size)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        n = total()
+        directional = direction != 0
+        n_directional = total(mask=directional)
+        hits = total(mask=directional & (np.sign(returns) == direction))
+        signed = total(direction * returns, directional)
+
+        x = _counted_ranks(groups, size, signal)
+        y = _group_ranks(groups, returns, return_order)
+        sx, sy = total(x), total(y)
+        cov = total(x * y) - sx * sy / n
+        var_x = total(x * x) - sx * sx / n
+        var_y = total(y * y) - sy * sy / n
+        ic = cov / np.sqrt(var_x * var_y)
+        ic[(n < MIN_IC_SAMPLES) | (var_x <= 0) | (var_y <= 0)] = np.nan
+
+        return {
+            "n": n.astype(np.int64),
+            "directional": n_directional.astype(np.int64),
+            "hit_rate": hits / n_directional,
+            "mean_return": total(returns) / n,
+            "signed_return": signed / n_directional,
+            "ic": ic,
+        }
+
+
+def _group_codes(signals: pa.Table, name: str) -> Tuple[np.ndarray, List[str]]:
+    """그룹 종류 → (행별 코드, 코드별 라벨, 값 순서로 정렬)"""
+    if name == "all":
+        return np.zeros(signals.num_rows, np.int64), ["all"]
+    column = _combined(signals[name])
+    values = pc.unique(column.drop_null()).sort()
+    codes = pc.fill_null(pc.index_in(column, value_set=values), len(values))
+    return codes.to_numpy(zero_copy_only=False).astype(np.int64), [str(value) for value in values.to_pylist()] + ["null"]
+
+
+def run_backtest(signals: pa.Table, prices: PriceIndex, horizons: Sequence[str] = DEFAULT_HORIZONS,
+                 max_entry_age: int = MAX_ENTRY_AGE) -> Dict:
+    """
+    시그널 × horizon 전체를 한 번에 가격과 맞춰 그룹별 적중률/수익률/IC 계산
+
+    Returns:
+        {"signals", "priced", "pairs", "seconds", "rows": [{"group", "value", "horizon", "n", "directional",
+         "hit_rate", "mean_return", "signed_return", "ic"}, ...]}
+    """
+    started = time.perf_counter()
+    seconds = [parse_horizon(horizon) for horizon in horizons]
+
+    codes = prices.codes_for(signals["symbol"])
+    ts = signals["ts"].to_numpy(zero_copy_only=False).astype(np.int64)
+    entry = prices.asof(codes, ts)
+    priced = entry >= 0
+    priced[priced] = ts[priced] - prices.bar_time(entry[priced]) <= max_entry_age
+    last_bar = prices.last_time(codes)
+
+    # (시그널, horizon) 쌍을 한 배열로
+    rows = np.nonzero(priced)[0]
+    pair_rows = np.tile(rows, len(seconds))
+    pair_horizon = np.repeat(np.arange(len(seconds)), len(rows))
+    exit_ts = ts[pair_rows] + np.asarray(seconds, np.int64)[pair_horizon]
+    exits = prices.asof(codes[pair_rows], exit_ts)
+    entries = entry[pair_rows]
+    valid = (exits > entries) & (exit_ts <= last_bar[pair_rows])
+    pair_rows, pair_horizon = pair_rows[valid], pair_horizon[valid]
+    returns = prices.close[exits[valid]] / prices.close[entries[valid]] - 1
+
+    direction = signals["direction"].to_numpy(zero_copy_only=False).astype(np.int64)[pair_rows]
+    score = signals["relevance_score"].to_numpy(zero_copy_only=False).astype(np.int64)[pair_rows]
+    signal = direction * score
+    return_order = np.argsort(returns)
+
+    report_rows = []
+    for name in GROUPS:
+        group_codes, labels = _group_codes(signals, name)
+        size = len(labels) * len(seconds)
+        stats = _aggregate(group_codes[pair_rows] * len(seconds) + pair_horizon, size, returns, direction,
+                           signal, return_order)
+        for code, label in enumerate(labels):
+            for h, horizon in enumerate(horizons):
+                i = code * len(seconds) + h
+                if not stats["n"][i]:
+                    continue
+                report_rows.append({
+                    "group": name,
+                    "value": label,
+                    "horizon": horizon,
+                    **{key: _number(values[i]) for key, values in stats.items()},
+                })
+
+    elapsed = time.perf_counter() - started
+    logger.info(f"Backtest: {signals.num_rows} signals, {len(returns)} signal×horizon pairs in {elapsed:.2f}s")
+    return {
+        "signals": signals.num_rows,
+        "priced": int(priced.sum()),
+        "pairs": len(returns),
+        "seconds": round(elapsed, 3),
+        "rows": report_rows,
+    }
+
+
+def _combined(array):
+    return array.combine_chunks() if isinstance(array, pa.ChunkedArray) else array
+
+
+def _number(value):
+    if isinstance(value, np.integer):
+        return int(value)
+    return None if np.isnan(value) else round(float(value), 6)
+
+
+def format_report(report: Dict) -> str:
+    """run_backtest 결과 → 콘솔 표"""
+    lines = [
+        f"signals {report['signals']}  priced {report['priced']}  pairs {report['pairs']}  ({report['seconds']}s)",
+        f"{'group':<14}{'value':<16}{'horizon':>8}{'n':>9}{'hit':>8}{'mean':>10}{'signed':>10}{'ic':>8}",
+    ]
+
+    def pct(value):
+        return "-" if value is None else f"{value * 100:.2f}%"
+
+    for row in report["rows"]:
+        ic = "-" if row["ic"] is None else f"{row['ic']:.3f}"
+        lines.append(
+            f"{row['group']:<14}{row['value']:<16}{row['horizon']:>8}{row['n']:>9}{pct(row['hit_rate']):>8}"
+            f"{pct(row['mean_return']):>10}{pct(row['signed_return']):>10}{ic:>8}"
+        )
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+
+    from config.settings import NEWS_ARCHIVE_DIR
+    from database.archive import NewsArchive
+
+    parser = argparse.ArgumentParser(description="보관된 뉴스 시그널 백테스트 (오프라인)")
+    parser.add_argument("prices", help="OHLCV CSV/Parquet 파일 또는 Parquet 디렉토리")
+    parser.add_argument("--archive", default=NEWS_ARCHIVE_DIR, help="뉴스 아카이브 디렉토리")
+    parser.add_argument("--start", help="시그널 시작 날짜")
+    parser.add_argument("--end", help="시그널 끝 날짜 (포함)")
+    parser.add_argument("--symbols", help="쉼표 구분")
+    parser.add_argument("--sources", help="쉼표 구분")
+    parser.add_argument("--min-score", type=int)
+    parser.add_argument("--horizons", default=",".join(DEFAULT_HORIZONS), help="예: 1h,1d,5d")
+    parser.add_argument("--max-entry-age", default="4d", help="진입 봉이 이보다 오래되면 제외")
+    parser.add_argument("--output", type=Path, help="결과 JSON 경로")
+    args = parser.parse_args()
+
+    horizons = args.horizons.split(",")
+    for horizon in horizons:
+        try:
+            parse_horizon(horizon)
+        except ValueError as e:
+            parser.error(str(e))
+
+    signals = load_signals(
+        NewsArchive(args.archive), args.start, args.end,
+        symbols=args.symbols.split(",") if args.symbols else None,
+        min_score=args.min_score,
+        sources=args.sources.split(",") if args.sources else None,
+    )
+    report = run_backtest(signals, load_prices(args.prices), horizons, parse_horizon(args.max_entry_age))
+    print(format_report(report))
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+        print(f"결과 저장: {args.output}")
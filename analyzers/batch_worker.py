@@ -0,0 +1,155 @@
+"""
+LLM 배치 관련성 분석 워커
+Automated batched relevance analysis
+
+뉴스 여러 건을 한 프롬프트(RelevanceAnalyzer._build_batch_prompt)에 담아 LLM 백엔드를
+동시에 최대 concurrency 개까지 호출하고, 응답의 각 항목을 _parse_item 으로 검증합니다.
+응답에서 빠졌거나 형식이 잘못된 항목, 호출 자체가 실패한 배치의 항목만 모아
+max_retries 번까지 다시 배치로 보냅니다.
+
+임계값 미만으로 걸러진 뉴스는 저장되지 않아 다음 실행에서도 미분석으로 조회되므로,
+screened 집합에 ID 를 남겨 같은 프로세스에서 다시 LLM 에 보내지 않습니다.
+
+결과는 AnalysisPipeline 이 insert_analyzed_news_many 로 일괄 저장하는 형식
+(news_id, signal_level 포함)입니다. ANALYSIS_LLM_BACKEND 가 설정되면
+RelevanceAnalyzer.batch_analyze 가 이 워커를 사용합니다.
+
+사용법:
+    worker = BatchAnalysisWorker(RelevanceAnalyzer(), get_llm_backend("stub"))
+    results = worker.analyze(db.get_unanalyzed_news(limit=200))
+"""
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from analyzers.llm_backends import LLMBackend
+from analyzers.relevance_analyzer import RelevanceAnalyzer, signal_level_for
+from config.settings import ANALYSIS_BATCH_SIZE, ANALYSIS_CONCURRENCY, ANALYSIS_MAX_RETRIES
+from database.models import AnalyzedNews
+from monitoring.metrics import inc
+
+RETRY_BACKOFF_SECONDS = 2.0
+MAX_SCREENED_IDS = 50000   # 원본 뉴스는 24시간 뒤 삭제되므로 넘치면 비움
+
+
+def to_analyzed_news(result: Dict) -> AnalyzedNews:
+    """분석 결과 → AnalyzedNews"""
+    return AnalyzedNews(
+        raw_news_id=result['news_id'],
+        relevance_score=result['relevance_score'],
+        affected_symbols=result['affected_symbols'],
+        price_impact=result['price_impact'],
+        importance=result['importance'],
+        signal_level=result.get('signal_level', 4),
+        analysis={
+            'reasoning': result.get('reasoning', ''),
+            'key_points': result.get('key_points', [])
+        }
+    )
+
+
+def extract_items(response_text: str) -> List[Dict]:
+    """응답 텍스트에서 JSON 배열 추출 (코드 블록/앞뒤 설명 허용)"""
+    start = response_text.find('[')
+    end = response_text.rfind(']') + 1
+    if start == -1 or end <= start:
+        raise ValueError("No JSON array in response")
+    items = json.loads(response_text[start:end])
+    if not isinstance(items, list):
+        raise ValueError("Response is not a JSON array")
+    return [item for item in items if isinstance(item, dict)]
+
+
+class BatchAnalysisWorker:
+    """배치 프롬프트 + 동시 호출 + 항목별 재시도"""
+
+    def __init__(self, analyzer: RelevanceAnalyzer, backend: LLMBackend,
+                 batch_size: Optional[int] = None, concurrency: Optional[int] = None,
+                 max_retries: Optional[int] = None, retry_backoff: float = RETRY_BACKOFF_SECONDS,
+                 screened: Optional[set] = None):
+        self.analyzer = analyzer
+        self.backend = backend
+        self.batch_size = max(1, batch_size or ANALYSIS_BATCH_SIZE)
+        self.concurrency = max(1, concurrency or ANALYSIS_CONCURRENCY)
+        self.max_retries = ANALYSIS_MAX_RETRIES if max_retries is None else max_retries
+        self.retry_backoff = retry_backoff
+        self.screened = screened if screened is not None else set()
+
+    def analyze(self, news_list: List[Dict]) -> List[Dict]:
+        """
+        뉴스 분석 (임계값 이상 결과만 반환)
+
+        Returns:
+            [{news_id, relevance_score, affected_symbols, price_impact, importance,
+              signal_level, reasoning, key_points}, ...]
+        """
+        if len(self.screened) > MAX_SCREENED_IDS:
+            self.screened.clear()
+        pending = [news for news in news_list if news.get('id') and news['id'] not in self.screened]
+        total = len(pending)
+        results: List[Dict] = []
+        filtered = 0
+
+        for attempt in range(self.max_retries + 1):
+            if not pending:
+                break
+            if attempt:
+                logger.warning(f"Retrying {len(pending)} news items (attempt {attempt + 1}/{self.max_retries + 1})")
+                inc("analysis_retries_total", len(pending))
+                time.sleep(self.retry_backoff * attempt)
+
+            batches = [pending[i:i + self.batch_size] for i in range(0, len(pending), self.batch_size)]
+            with ThreadPoolExecutor(max_workers=min(self.concurrency, len(batches))) as executor:
+                outcomes = list(executor.map(self._run_batch, batches))
+
+            pending = []
+            for batch_results, batch_filtered, failed in outcomes:
+                results.extend(batch_results)
+                filtered += batch_filtered
+                pending.extend(failed)
+
+        if pending:
+            inc("analysis_failed_total", len(pending))
+            logger.error(f"Gave up on {len(pending)} news items after {self.max_retries + 1} attempts")
+
+        logger.info(
+            f"✅ Analyzed {total - len(pending)}/{total} news items "
+            f"({len(results)} relevant, {filtered} filtered) via {self.backend.name}"
+        )
+        return results
+
+    def _run_batch(self, batch: List[Dict]) -> Tuple[List[Dict], int, List[Dict]]:
+        """배치 하나 호출 → (결과, 필터된 개수, 재시도할 뉴스)"""
+        try:
+            items = extract_items(self.backend.complete(self.analyzer._build_batch_prompt(batch)))
+        except Exception as e:
+            logger.warning(f"LLM batch of {len(batch)} failed: {e}")
+            return [], 0, batch
+
+        by_id = {str(item.get('news_id')): item for item in items}
+        results, filtered, failed = [], 0, []
+        for news in batch:
+            item = by_id.get(str(news['id']))
+            if item is None:
+                failed.append(news)
+                continue
+            try:
+                parsed = self.analyzer._parse_item(item)
+            except (KeyError, ValueError, TypeError) as e:
+                logger.warning(f"Invalid analysis for {news['id']}: {e}")
+                failed.append(news)
+                continue
+
+            if parsed is None:
+                self.screened.add(news['id'])
+                filtered += 1
+                continue
+            parsed['news_id'] = news['id']
+            parsed['signal_level'] = signal_level_for(parsed['relevance_score'])
+            results.append(parsed)
+
+        return results, filtered, failed
@@ -0,0 +1,187 @@
+"""
+뉴스 분석용 LLM 백엔드
+Pluggable LLM backends for batched relevance analysis
+
+모든 백엔드는 프롬프트 문자열을 받아 응답 텍스트를 돌려주는 complete() 하나만 구현합니다.
+ANALYSIS_LLM_BACKEND 설정으로 고릅니다:
+
+- anthropic: Claude Messages API (ANTHROPIC_API_KEY)
+- openai:    Chat Completions API (OPENAI_API_KEY)
+- stub:      네트워크 없이 키워드 규칙으로 응답 (로컬 테스트/벤치마크)
+
+사용법:
+    backend = get_llm_backend("stub")
+    text = backend.complete(prompt)
+"""
+
+import json
+import re
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from loguru import logger
+
+from config.settings import ANTHROPIC_API_KEY, OPENAI_API_KEY
+from monitoring.metrics import inc, timer
+
+LLM_BACKENDS = ("anthropic", "openai", "stub")
+
+CLAUDE_MODEL = "claude-3-5-sonnet-20241022"
+OPENAI_MODEL = "gpt-4o-mini"
+MAX_TOKENS = 4096          # 배치 10건 기준 응답 여유
+REQUEST_TIMEOUT = 120
+
+
+class LLMBackend(ABC):
+    """프롬프트 → 응답 텍스트"""
+
+    name = "base"
+
+    def complete(self, prompt: str) -> str:
+        """LLM 호출 (호출 시간/결과 메트릭 기록)"""
+        try:
+            with timer("llm_call_seconds", backend=self.name):
+                text = self._complete(prompt)
+            inc("llm_calls_total", backend=self.name, status="ok")
+            return text
+        except Exception:
+            inc("llm_calls_total", backend=self.name, status="error")
+            raise
+
+    @abstractmethod
+    def _complete(self, prompt: str) -> str: ...
+
+
+class _HTTPBackend(LLMBackend):
+    """keep-alive 세션을 공유하는 HTTP API 백엔드 (동시 호출 수만큼 커넥션 풀)"""
+
+    def __init__(self, api_key: Optional[str], model: str, pool_size: int = 16):
+        if not api_key:
+            raise ValueError(f"{self.name} backend requires an API key")
+        self.api_key = api_key
+        self.model = model
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_maxsize=pool_size))
+
+
+class AnthropicBackend(_HTTPBackend):
+    name = "anthropic"
+
+    def __init__(self, api_key: Optional[str] = ANTHROPIC_API_KEY, model: str = CLAUDE_MODEL):
+        super().__init__(api_key, model)
+
+    def _complete(self, prompt: str) -> str:
+        resp = self.session.post(
+            "https://api.anthropic.com/v1/messages",
+            headers={
+                "x-api-key": self.api_key,
+                "anthropic-version": "2023-06-01",
+                "content-type": "application/json",
+            },
+            json={
+                "model": self.model,
+                "max_tokens": MAX_TOKENS,
+                "temperature": 0,
+                "messages": [{"role": "user", "content": prompt}],
+            },
+            timeout=REQUEST_TIMEOUT,
+        )
+        resp.raise_for_status()
+        return resp.json()["content"][0]["text"]
+
+
+class OpenAIBackend(_HTTPBackend):
+    name = "openai"
+
+    def __init__(self, api_key: Optional[str] = OPENAI_API_KEY, model: str = OPENAI_MODEL):
+        super().__init__(api_key, model)
+
+    def _complete(self, prompt: str) -> str:
+        resp = self.session.post(
+            "https://api.openai.com/v1/chat/completions",
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            json={
+                "model": self.model,
+                "max_tokens": MAX_TOKENS,
+                "temperature": 0,
+                "messages": [{"role": "user", "content": prompt}],
+            },
+            timeout=REQUEST_TIMEOUT,
+        )
+        resp.raise_for_status()
+        return resp.json()["choices"][0]["message"]["content"]
+
+
+class StubBackend(LLMBackend):
+    """
+    네트워크 없는 결정적 백엔드
+
+    배치 프롬프트의 뉴스 블록(ID/제목/심볼)을 읽어 키워드 규칙으로 점수를 매깁니다.
+    fail_ids 에 든 뉴스는 응답에서 빼서 재시도 경로를 확인할 수 있습니다.
+    """
+
+    name = "stub"
+
+    POLICY_KEYWORDS = ("regulation", "tariff", "fda", "ftc", "sec ", "ban", "policy", "antitrust", "규제", "관세", "정책")
+    EVENT_KEYWORDS = ("earnings", "acquire", "merger", "launch", "guidance", "revenue", "실적", "인수", "출시")
+    NEGATIVE_KEYWORDS = ("ban", "probe", "lawsuit", "cut", "miss", "decline", "fall", "소송", "하락")
+
+    _BLOCK = re.compile(r"^## 뉴스 #\d+\s*$", re.MULTILINE)
+    _FIELD = re.compile(r"^\*\*(ID|제목|기존 심볼)\*\*: ?(.*)$", re.MULTILINE)
+
+    def __init__(self, fail_ids: Optional[set] = None):
+        self.fail_ids = set(fail_ids or ())
+
+    def _complete(self, prompt: str) -> str:
+        items = []
+        for block in self._BLOCK.split(prompt)[1:]:
+            fields = dict(self._FIELD.findall(block))
+            news_id = fields.get("ID", "").strip()
+            if not news_id or news_id in self.fail_ids:
+                continue
+            items.append(self._score(news_id, fields.get("제목", ""), fields.get("기존 심볼", "")))
+        return json.dumps(items, ensure_ascii=False)
+
+    def _score(self, news_id: str, title: str, symbols: str) -> Dict:
+        text = title.lower()
+        symbol_list: List[str] = [s.strip() for s in symbols.split(",") if s.strip() and s.strip() != "없음"][:5]
+        has_policy = any(k in text for k in self.POLICY_KEYWORDS)
+
+        if has_policy:
+            score = 95
+        elif any(k in text for k in self.EVENT_KEYWORDS):
+            score = 85
+        elif symbol_list:
+            score = 72
+        else:
+            score = 40
+
+        return {
+            "news_id": news_id,
+            "relevance_score": score,
+            "affected_symbols": symbol_list,
+            "price_impact": "down" if any(k in text for k in self.NEGATIVE_KEYWORDS) else "up",
+            "importance": "high" if score >= 90 else "medium" if score >= 80 else "low",
+            "reasoning": f"Stub analysis of: {title[:80]}",
+            "key_points": [title[:80]],
+            "policy_impact": {"has_policy_change": has_policy, "change_type": "policy_changed" if has_policy else "none"},
+        }
+
+
+def get_llm_backend(name: Optional[str] = None) -> Optional[LLMBackend]:
+    """설정(ANALYSIS_LLM_BACKEND)에 맞는 LLM 백엔드 (비어 있으면 None = 프롬프트 파일 모드)"""
+    if name is None:
+        from config.settings import ANALYSIS_LLM_BACKEND
+        name = ANALYSIS_LLM_BACKEND
+
+    name = (name or "").lower()
+    if not name:
+        return None
+    if name not in LLM_BACKENDS:
+        raise ValueError(f"Unknown LLM backend: {name} (choose from {', '.join(LLM_BACKENDS)})")
+
+    backend = {"anthropic": AnthropicBackend, "openai": OpenAIBackend, "stub": StubBackend}[name]()
+    logger.info(f"LLM analysis backend: {name}")
+    return backend
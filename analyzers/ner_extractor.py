@@ -1,16 +1,13 @@
 """
 Named Entity Recognition (NER) - 종목 심볼 및 회사명 추출
 """
+import importlib.util
 import re
 from typing import List, Dict, Set
 from loguru import logger
 
-try:
-    import spacy
-    SPACY_AVAILABLE = True
-except ImportError:
-    SPACY_AVAILABLE = False
-    logger.warning("spaCy not installed. Falling back to regex-based extraction.")
+# 설치 여부만 확인 (spaCy 는 use_spacy=True 일 때만 import)
+SPACY_AVAILABLE = importlib.util.find_spec("spacy") is not None
 
 
 class NERExtractor:
@@ -49,11 +46,14 @@ class NERExtractor:
         Args:
             use_spacy: spaCy 사용 여부 (False면 regex만)
         """
+        if use_spacy and not SPACY_AVAILABLE:
+            logger.warning("spaCy not installed. Falling back to regex-based extraction.")
         self.use_spacy = use_spacy and SPACY_AVAILABLE
         self.nlp = None
 
         if self.use_spacy:
             try:
+                import spacy
                 self.nlp = spacy.load("en_core_web_sm")
                 logger.info("✅ spaCy model loaded: en_core_web_sm")
             except Exception as e:
@@ -1,4 +1,4 @@
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 import json
 from loguru import logger
 import sys
@@ -8,17 +8,41 @@ from pathlib import Path
 sys.path.append('..')
 from config.settings import MIN_RELEVANCE_SCORE
 from database.models import AnalyzedNews, PriceImpact, Importance
+from analyzers.llm_backends import LLMBackend, get_llm_backend
+
+
+def signal_level_for(score: int) -> int:
+    """관련성 점수 → 신호 레벨 (1: 90+, 2: 80-89, 3: 70-79, 4: <70)"""
+    if score >= 90:
+        return 1
+    if score >= 80:
+        return 2
+    if score >= 70:
+        return 3
+    return 4
+
 
 class RelevanceAnalyzer:
-    """뉴스 관련성 분석 (프롬프트 기반 - Claude Code 사용)"""
+    """뉴스 관련성 분석 (LLM 백엔드 설정 시 자동 배치 분석, 없으면 프롬프트 파일 - Claude Code 사용)"""
 
-    def __init__(self):
+    def __init__(self, backend: Optional[LLMBackend] = None):
         self.prompts_dir = Path("prompts/analysis")
         self.results_dir = Path("prompts/results")
         self.prompts_dir.mkdir(parents=True, exist_ok=True)
         self.results_dir.mkdir(parents=True, exist_ok=True)
 
-        logger.info("Relevance analyzer initialized (Prompt-based mode - Claude Code)")
+        if backend is None:
+            try:
+                backend = get_llm_backend()
+            except ValueError as e:
+                logger.warning(f"LLM backend unavailable, falling back to prompt mode: {e}")
+        self.backend = backend
+        self._screened_ids = set()  # 임계값 미만으로 걸러진 뉴스 (재분석 방지)
+
+        if self.backend:
+            logger.info(f"Relevance analyzer initialized (Automated mode - {self.backend.name})")
+        else:
+            logger.info("Relevance analyzer initialized (Prompt-based mode - Claude Code)")
 
     def analyze_news(self, news_data: Dict) -> Dict:
         """뉴스 분석 프롬프트 생성 (수동 분석용)"""
@@ -135,6 +159,91 @@ class RelevanceAnalyzer:
   }}
 }}"""
 
+    def _build_batch_prompt(self, news_batch: List[Dict]) -> str:
+        """여러 뉴스를 담은 배치 분석 프롬프트 (PromptGenerator 형식 + JSON 배열 응답)"""
+        prompt = f"""당신은 미국 주식 시장 전문 애널리스트입니다. 다음 {len(news_batch)}개 뉴스를 각각 분석하여 주식 투자자에게 얼마나 유용한지 평가해주세요.
+
+## 분석 방법
+
+1. **relevance_score** (0-100): 0-30 무관, 31-60 간접 관련, 61-80 직접 관련, 81-89 중요 (실적, M&A, 신제품), 90-100 정부 정책/규제 변화, FDA 승인, FTC 조사
+2. **affected_symbols**: 직접 언급된 기업의 주식 심볼 (최대 5개)
+3. **price_impact**: "up", "down", "neutral"
+4. **importance**: "high", "medium", "low"
+5. **reasoning**: 분석 근거 (2-3문장)
+6. **key_points**: 핵심 포인트 (3-5개)
+7. **policy_impact**: has_policy_change, change_type ("new_policy", "policy_removed", "policy_changed", "none"), policy_description
+
+---
+"""
+        for i, news in enumerate(news_batch, 1):
+            symbols = news.get('symbols') or []
+            prompt += f"""
+## 뉴스 #{i}
+
+**ID**: {news['id']}
+**출처**: {news.get('source', '')}
+**제목**: {news.get('title', '')}
+**발행일**: {news.get('published_at', '')}
+**기존 심볼**: {', '.join(symbols) if symbols else '없음'}
+
+**내용**:
+{(news.get('content') or '')[:1000]}
+
+---
+"""
+        prompt += """
+## 출력 형식
+
+모든 뉴스에 대해 빠짐없이, 관련성이 낮아도 점수를 매겨 JSON 배열만 반환하세요.
+news_id 는 위의 **ID** 값을 그대로 씁니다.
+
+[
+  {
+    "news_id": "uuid",
+    "relevance_score": 85,
+    "affected_symbols": ["AAPL"],
+    "price_impact": "up",
+    "importance": "high",
+    "reasoning": "...",
+    "key_points": ["...", "..."],
+    "policy_impact": {"has_policy_change": false, "change_type": "none", "policy_description": ""}
+  }
+]"""
+        return prompt
+
+    def _parse_item(self, data: Dict) -> Optional[Dict]:
+        """
+        분석 항목 하나 검증/변환
+
+        Returns:
+            변환된 결과, 관련성 점수가 임계값 미만이면 None
+
+        Raises:
+            KeyError, ValueError, TypeError: 필수 필드 누락 또는 형식 오류
+        """
+        required_fields = ['relevance_score', 'affected_symbols', 'price_impact', 'importance']
+        missing = [field for field in required_fields if field not in data]
+        if missing:
+            raise KeyError(f"Missing required fields: {', '.join(missing)}")
+
+        score = int(data['relevance_score'])
+        if not isinstance(data['affected_symbols'], list):
+            raise TypeError("affected_symbols must be a list")
+        result = {
+            'relevance_score': score,
+            'affected_symbols': data['affected_symbols'],
+            'price_impact': PriceImpact(data['price_impact']),
+            'importance': Importance(data['importance']),
+            'reasoning': data.get('reasoning', ''),
+            'key_points': data.get('key_points', [])
+        }
+
+        # 관련성 점수가 임계값 이하면 필터링
+        if score < MIN_RELEVANCE_SCORE:
+            logger.info(f"Filtered out (score: {score})")
+            return None
+        return result
+
     def _parse_response(self, response_text: str) -> Dict:
         """Claude Code 응답 파싱"""
         try:
@@ -146,39 +255,34 @@ class RelevanceAnalyzer:
                 json_str = response_text[json_start:json_end]
                 data = json.loads(json_str)
 
-                # 유효성 검증
-                required_fields = ['relevance_score', 'affected_symbols', 'price_impact', 'importance']
-                if not all(field in data for field in required_fields):
-                    logger.error("Missing required fields in response")
-                    return None
-
-                # 관련성 점수가 임계값 이하면 필터링
-                if int(data['relevance_score']) < MIN_RELEVANCE_SCORE:
-                    logger.info(f"Filtered out (score: {data['relevance_score']})")
-                    return None
-
-                # 타입 변환
-                result = {
-                    'relevance_score': int(data['relevance_score']),
-                    'affected_symbols': data['affected_symbols'],
-                    'price_impact': PriceImpact(data['price_impact']),
-                    'importance': Importance(data['importance']),
-                    'reasoning': data.get('reasoning', ''),
-                    'key_points': data.get('key_points', [])
-                }
-
-                logger.info(f"✅ Analysis loaded: score {result['relevance_score']}")
+                # 유효성 검증 + 타입 변환
+                result = self._parse_item(data)
+                if result:
+                    logger.info(f"✅ Analysis loaded: score {result['relevance_score']}")
                 return result
 
         except json.JSONDecodeError as e:
             logger.error(f"JSON parsing error: {e}")
+        except KeyError as e:
+            logger.error(f"{e.args[0] if e.args else e} in response")
         except Exception as e:
             logger.error(f"Response parsing error: {e}")
 
         return None
 
-    def batch_analyze(self, news_list: List[Dict], batch_size: int = 5) -> List[Dict]:
-        """📝 뉴스 분석 프롬프트 일괄 생성 (Claude Code가 분석)"""
+    def batch_analyze(self, news_list: List[Dict], batch_size: Optional[int] = None) -> List[Dict]:
+        """
+        뉴스 일괄 분석
+
+        LLM 백엔드가 있으면 BatchAnalysisWorker 로 바로 분석해 결과를 돌려주고,
+        없으면 📝 분석 프롬프트만 생성합니다 (Claude Code가 분석, 결과는 [])
+        """
+        if self.backend:
+            from analyzers.batch_worker import BatchAnalysisWorker
+            return BatchAnalysisWorker(
+                self, self.backend, batch_size=batch_size, screened=self._screened_ids
+            ).analyze(news_list)
+
         logger.info(f"📝 Generating analysis prompts for {len(news_list)} news items...")
 
         prompt_files = []
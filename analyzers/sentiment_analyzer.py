@@ -1,23 +1,21 @@
 """
 감성 분석기 - VADER (빠름) + FinBERT (정확) 하이브리드
 """
+import importlib.util
 from typing import Dict, List, Literal
 from loguru import logger
 
-try:
-    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-    VADER_AVAILABLE = True
-except ImportError:
-    VADER_AVAILABLE = False
-    logger.warning("VADER not installed. Install: pip install vaderSentiment")
+# 설치 여부만 확인 (transformers/torch 는 수 초가 걸리므로 FinBERT 를 켤 때만 import)
+VADER_AVAILABLE = importlib.util.find_spec("vaderSentiment") is not None
+TRANSFORMERS_AVAILABLE = (
+    importlib.util.find_spec("transformers") is not None
+    and importlib.util.find_spec("torch") is not None
+)
+
+FINBERT_BATCH_SIZE = 32
 
-try:
-    from transformers import AutoTokenizer, AutoModelForSequenceClassification
-    import torch
-    TRANSFORMERS_AVAILABLE = True
-except ImportError:
-    TRANSFORMERS_AVAILABLE = False
-    logger.warning("Transformers not installed. Install: pip install transformers torch")
+if not VADER_AVAILABLE:
+    logger.warning("VADER not installed. Install: pip install vaderSentiment")
 
 
 class SentimentAnalyzer:
@@ -36,17 +34,27 @@ class SentimentAnalyzer:
         self.vader = None
         self.finbert_model = None
         self.finbert_tokenizer = None
+        self._torch = None
 
         # VADER 초기화
         if VADER_AVAILABLE:
+            from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
             self.vader = SentimentIntensityAnalyzer()
             logger.info("✅ VADER initialized")
         else:
             logger.warning("⚠️  VADER not available")
 
         # FinBERT 초기화 (선택)
-        if use_finbert and TRANSFORMERS_AVAILABLE:
+        if use_finbert and not TRANSFORMERS_AVAILABLE:
+            logger.warning("Transformers not installed. Install: pip install transformers torch")
+            use_finbert = False
+
+        if use_finbert:
             try:
+                import torch
+                from transformers import AutoTokenizer, AutoModelForSequenceClassification
+
+                self._torch = torch
                 model_name = "ProsusAI/finbert"
                 self.finbert_tokenizer = AutoTokenizer.from_pretrained(model_name)
                 self.finbert_model = AutoModelForSequenceClassification.from_pretrained(model_name)
@@ -139,45 +147,42 @@ class SentimentAnalyzer:
             )
 
             # 추론
-            with torch.no_grad():
+            with self._torch.no_grad():
                 outputs = self.finbert_model(**inputs)
                 logits = outputs.logits
-                probs = torch.softmax(logits, dim=1).squeeze()
+                probs = self._torch.softmax(logits, dim=1).squeeze()
 
             # FinBERT labels: [negative, neutral, positive]
-            negative_prob = probs[0].item()
-            neutral_prob = probs[1].item()
-            positive_prob = probs[2].item()
-
-            # 가장 높은 확률의 레이블
-            max_prob = max(negative_prob, neutral_prob, positive_prob)
-
-            if max_prob == positive_prob:
-                sentiment = 'positive'
-                score = positive_prob - negative_prob  # -1 ~ +1로 정규화
-            elif max_prob == negative_prob:
-                sentiment = 'negative'
-                score = positive_prob - negative_prob
-            else:
-                sentiment = 'neutral'
-                score = positive_prob - negative_prob
-
-            return {
-                'sentiment': sentiment,
-                'score': score,
-                'confidence': max_prob,
-                'method': 'finbert',
-                'details': {
-                    'positive': positive_prob,
-                    'negative': negative_prob,
-                    'neutral': neutral_prob
-                }
-            }
+            return self._finbert_result(*probs.tolist())
 
         except Exception as e:
             logger.error(f"FinBERT analysis error: {e}")
             return self._analyze_vader(text)
 
+    def _finbert_result(self, negative_prob: float, neutral_prob: float, positive_prob: float) -> Dict:
+        """FinBERT 확률 → 결과 (score: -1 ~ +1)"""
+        max_prob = max(negative_prob, neutral_prob, positive_prob)
+
+        # 가장 높은 확률의 레이블
+        if max_prob == positive_prob:
+            sentiment = 'positive'
+        elif max_prob == negative_prob:
+            sentiment = 'negative'
+        else:
+            sentiment = 'neutral'
+
+        return {
+            'sentiment': sentiment,
+            'score': positive_prob - negative_prob,
+            'confidence': max_prob,
+            'method': 'finbert',
+            'details': {
+                'positive': positive_prob,
+                'negative': negative_prob,
+                'neutral': neutral_prob
+            }
+        }
+
     def _neutral_result(self, method: str) -> Dict:
         """중립 기본값"""
         return {
@@ -188,5 +193,38 @@ class SentimentAnalyzer:
         }
 
     def batch_analyze(self, texts: List[str], method='auto') -> List[Dict]:
-        """배치 분석"""
-        return [self.analyze(text, method=method) for text in texts]
+        """배치 분석 (FinBERT 대상 텍스트는 FINBERT_BATCH_SIZE 개씩 한 번에 추론)"""
+        results: List[Dict] = [None] * len(texts)
+        finbert_idx = []
+        for i, text in enumerate(texts):
+            use_finbert = self.use_finbert and self.finbert_model and (
+                method == 'finbert' or (method == 'auto' and len(text) >= 100)
+            )
+            if use_finbert:
+                finbert_idx.append(i)
+            else:
+                results[i] = self._analyze_vader(text)
+
+        for start in range(0, len(finbert_idx), FINBERT_BATCH_SIZE):
+            chunk = finbert_idx[start:start + FINBERT_BATCH_SIZE]
+            for i, result in zip(chunk, self._analyze_finbert_many([texts[i] for i in chunk])):
+                results[i] = result
+        return results
+
+    def _analyze_finbert_many(self, texts: List[str]) -> List[Dict]:
+        """FinBERT 배치 추론 (실패 시 텍스트별 분석으로 대체)"""
+        try:
+            inputs = self.finbert_tokenizer(
+                texts,
+                return_tensors="pt",
+                truncation=True,
+                max_length=512,
+                padding=True
+            )
+            with self._torch.no_grad():
+                probs = self._torch.softmax(self.finbert_model(**inputs).logits, dim=1)
+        except Exception as e:
+            logger.error(f"FinBERT batch error: {e}")
+            return [self._analyze_finbert(text) for text in texts]
+
+        return [self._finbert_result(*row.tolist()) for row in probs]
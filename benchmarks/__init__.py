@@ -0,0 +1,3 @@
+"""
+재현 가능한 처리량 벤치마크 (python -m benchmarks.run_benchmarks)
+"""
@@ -0,0 +1,113 @@
+"""
+결정적(재현 가능한) 합성 뉴스 코퍼스
+Deterministic synthetic RawNews corpus
+
+체크인된 batch_*.json 의 모양(출처 분포, 본문 길이 0~860자, category 메타데이터,
+심볼 1~3개)을 따라 생성합니다. 같은 size/seed 면 항상 같은 기사 목록이 나오며,
+발행 시각만 생성 시점(anchor) 기준 최근 48시간 안으로 배치됩니다.
+"""
+
+import random
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from database.models import RawNews
+
+SIZES = {"1k": 1_000, "10k": 10_000, "100k": 100_000}
+DEFAULT_SEED = 42
+
+# Layer 1 (Core Signal) / Layer 2 (Sentiment & Momentum) / 기타 API 출처와 비율
+LAYER1_SOURCES = ("Bloomberg", "Reuters", "WSJ")
+LAYER2_SOURCES = ("Fox Business", "CNN Business", "Yahoo Finance")
+SOURCE_WEIGHTS = {
+    "Finnhub": 30, "Alpha Vantage": 20, "Seeking Alpha": 5,
+    "Bloomberg": 8, "Reuters": 8, "WSJ": 6,
+    "Fox Business": 8, "CNN Business": 7, "Yahoo Finance": 8,
+}
+CATEGORIES = {"company": 50, None: 35, "analysis": 10, "general": 5}
+
+COMPANIES = {
+    "AAPL": "Apple", "MSFT": "Microsoft", "GOOGL": "Google", "AMZN": "Amazon",
+    "META": "Meta", "TSLA": "Tesla", "NVDA": "NVIDIA", "AMD": "AMD",
+    "INTC": "Intel", "NFLX": "Netflix", "JPM": "JPMorgan", "GS": "Goldman Sachs",
+    "PFE": "Pfizer", "MRNA": "Moderna", "WMT": "Walmart", "XOM": "Exxon Mobil",
+    "COIN": "Coinbase", "PLTR": "Palantir", "AVGO": "Broadcom", "ORCL": "Oracle",
+}
+
+TITLE_TEMPLATES = [
+    "{company} Shares Surge After Strong Quarterly Earnings Beat",
+    "{company} Stock Falls as Guidance Disappoints Investors",
+    "{company} ({symbol}) Announces New AI Partnership With {other}",
+    "Why {company} Could Be the Best Stock to Buy Right Now",
+    "{company} Faces SEC Probe Over Accounting Practices",
+    "Analysts Raise Price Target on {symbol} Ahead of Product Launch",
+    "{company} and {other} Compete for Cloud Market Share",
+    "Federal Reserve Decision Weighs on {company} and Tech Stocks",
+    "{company} Announces $10 Billion Share Buyback Program",
+    "Is {symbol} Overvalued? A Closer Look at {company} Valuation",
+]
+
+SENTENCES = [
+    "Revenue grew {pct}% year over year, beating consensus estimates.",
+    "The company reported earnings of ${eps} per share for the quarter.",
+    "Shares of {company} rose {pct}% in premarket trading on Tuesday.",
+    "Investors remain cautious amid concerns about slowing demand.",
+    "Management reiterated its full-year outlook despite macro headwinds.",
+    "{company} said data center sales were the main growth driver.",
+    "Analysts at Morgan Stanley upgraded the stock to overweight.",
+    "The stock has gained {pct}% so far this year, outperforming the S&P 500.",
+    "Competition from {other} continues to pressure margins.",
+    "Supply chain constraints eased during the quarter, the company said.",
+    "The Federal Reserve raises interest rate by 25 basis points, pressuring growth stocks.",
+    "The White House signs executive order restricting chip exports to China.",
+    "Congress passes bill introducing new regulation on AI model disclosures.",
+    "Treasury announces policy to provide subsidy for domestic semiconductor plants.",
+    "The SEC eases restrictions on crypto custody for banks.",
+    "Regulators lifts ban on the drug after a new FDA review.",
+]
+
+
+def _render(template: str, rng: random.Random, symbol: str, other: str) -> str:
+    return template.format(
+        company=COMPANIES[symbol], symbol=symbol, other=COMPANIES[other],
+        pct=rng.randint(1, 40), eps=f"{rng.uniform(0.1, 6):.2f}",
+    )
+
+
+def generate_corpus(size: int, seed: int = DEFAULT_SEED, anchor: Optional[datetime] = None) -> List[RawNews]:
+    """size 개의 합성 RawNews 생성 (같은 size/seed 면 같은 내용)"""
+    rng = random.Random(seed)
+    anchor = anchor or datetime.now()
+    sources, source_weights = zip(*SOURCE_WEIGHTS.items())
+    categories, category_weights = zip(*CATEGORIES.items())
+    symbols = list(COMPANIES)
+
+    corpus = []
+    for i in range(size):
+        picked = rng.sample(symbols, rng.choices((1, 2, 3), weights=(70, 20, 10))[0])
+        symbol = picked[0]
+        other = picked[1] if len(picked) > 1 else rng.choice(symbols)
+        source = rng.choices(sources, weights=source_weights)[0]
+
+        content = ""
+        target_length = rng.choice((0, 80, 160, 160, 320, 500, 860))
+        while len(content) < target_length:
+            content += _render(rng.choice(SENTENCES), rng, symbol, other) + " "
+
+        corpus.append(RawNews(
+            source=source,
+            title=_render(rng.choice(TITLE_TEMPLATES), rng, symbol, other),
+            url=f"https://synthetic.example/{seed}/{i}",
+            content=content.strip()[:target_length] or None,
+            published_at=anchor - timedelta(seconds=rng.randint(0, 48 * 3600)),
+            symbols=picked,
+            metadata={"category": rng.choices(categories, weights=category_weights)[0], "source": source},
+        ))
+    return corpus
+
+
+def split_layers(corpus: List[RawNews]):
+    """Layer 1 / Layer 2 출처 기사로 분리 (그 밖의 출처는 Layer 2로 취급)"""
+    layer1 = [news for news in corpus if news.source in LAYER1_SOURCES]
+    layer2 = [news for news in corpus if news.source not in LAYER1_SOURCES]
+    return layer1, layer2
@@ -0,0 +1,245 @@
+"""
+분석 단계 처리량 벤치마크
+Throughput benchmark suite
+
+합성 코퍼스(1k/10k/100k)로 NER, 감성, 정책, 증폭, NewsPipeline.run 을 측정합니다.
+각 (단계, 크기) 조합은 새 프로세스에서 실행하여 최대 RSS를 따로 잽니다.
+네트워크/DB 없이 실행됩니다 (수집기는 코퍼스를 돌려주는 스텁, 저장은 생략).
+
+사용법:
+    python -m benchmarks.run_benchmarks
+    python -m benchmarks.run_benchmarks --sizes 1k,10k --stages ner,policy
+    python -m benchmarks.run_benchmarks --compare .build/benchmarks/<commit>.json --fail-over 10
+
+결과는 .build/benchmarks/<commit>.json 과 latest.json 에 저장됩니다.
+"""
+
+import argparse
+import json
+import platform
+import resource
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.corpus import DEFAULT_SEED, SIZES, generate_corpus, split_layers  # noqa: E402
+
+RESULTS_DIR = PROJECT_ROOT / ".build" / "benchmarks"
+STAGES = ("ner", "sentiment", "policy", "amplification", "pipeline")
+DEFAULT_SIZES = ("1k", "10k", "100k")
+
+
+def percentile(samples: List[float], q: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))]
+
+
+def _time_each(items, fn: Callable) -> Tuple[float, List[float]]:
+    """항목별 지연(초)과 전체 소요 시간"""
+    latencies = []
+    start = time.perf_counter()
+    for item in items:
+        t0 = time.perf_counter()
+        fn(item)
+        latencies.append(time.perf_counter() - t0)
+    return time.perf_counter() - start, latencies
+
+
+def _texts(corpus) -> List[str]:
+    return [f"{news.title} {news.content or ''}" for news in corpus]
+
+
+def bench_ner(corpus):
+    from analyzers.ner_extractor import NERExtractor
+    ner = NERExtractor(use_spacy=False)
+    return _time_each(_texts(corpus), ner.extract_symbols)
+
+
+def bench_sentiment(corpus):
+    from analyzers.sentiment_analyzer import SentimentAnalyzer
+    sentiment = SentimentAnalyzer(use_finbert=False)
+    if sentiment.vader is None:
+        # 중립 결과만 즉시 반환하므로 측정값이 의미 없음
+        raise RuntimeError("VADER not installed")
+    return _time_each(_texts(corpus), lambda text: sentiment.analyze(text, method='vader'))
+
+
+def bench_policy(corpus):
+    from analyzers.policy_detector import PolicyDetector
+    policy = PolicyDetector()
+    return _time_each(_texts(corpus), policy.detect)
+
+
+def bench_amplification(corpus):
+    """종목별 detect_amplification 호출 지연 (전체 소요 시간 = 모든 종목 한 바퀴)"""
+    from analyzers.amplification_detector import AmplificationDetector
+
+    def to_dict(news):
+        return {
+            'title': news.title,
+            'source': news.source,
+            'symbols': news.symbols,
+            'published_at': news.published_at.isoformat(),
+            'metadata': news.metadata,
+        }
+
+    detector = AmplificationDetector(time_window_hours=24)
+    layer1, layer2 = split_layers(corpus)
+    layer1, layer2 = [to_dict(n) for n in layer1], [to_dict(n) for n in layer2]
+    symbols = sorted({s for news in corpus for s in news.symbols})
+    return _time_each(symbols, lambda symbol: detector.detect_amplification(layer1, layer2, [symbol]))
+
+
+class _StubCollector:
+    """네트워크 대신 코퍼스를 돌려주는 수집기"""
+
+    def __init__(self, source_name: str, articles):
+        self.source_name = source_name
+        self.articles = articles
+
+    def fetch_news(self):
+        return list(self.articles)
+
+
+def bench_pipeline(corpus, repeat: int = 3):
+    """NewsPipeline.run 전체 (지연 표본 = 실행 1회당 소요 시간)"""
+    from pipeline.news_pipeline import NewsPipeline
+
+    layer1, layer2 = split_layers(corpus)
+    pipeline = NewsPipeline(db_client=None, use_finbert=False)
+    pipeline.layer1_collectors = [_StubCollector("synthetic-layer1", layer1)]
+    pipeline.layer2_collectors = [_StubCollector("synthetic-layer2", layer2)]
+    return _time_each(range(repeat), lambda _: pipeline.run(save_to_db=False))
+
+
+BENCHMARKS: Dict[str, Callable] = {
+    "ner": bench_ner,
+    "sentiment": bench_sentiment,
+    "policy": bench_policy,
+    "amplification": bench_amplification,
+    "pipeline": bench_pipeline,
+}
+
+
+def run_case(stage: str, size_label: str, seed: int) -> Dict:
+    """한 (단계, 크기) 조합 실행 (자식 프로세스에서 호출)"""
+    from loguru import logger
+    logger.remove()
+    logger.add(sys.stderr, level="ERROR")
+
+    size = SIZES[size_label]
+    result = {"stage": stage, "size": size_label, "articles": size}
+    try:
+        corpus = generate_corpus(size, seed=seed)
+        total, latencies = BENCHMARKS[stage](corpus)
+        runs = len(latencies) if stage == "pipeline" else 1
+        result.update({
+            "seconds": round(total, 4),
+            "articles_per_sec": round(size * runs / total, 1) if total else None,
+            "calls": len(latencies),
+            "p50_ms": round(percentile(latencies, 50) * 1000, 4),
+            "p99_ms": round(percentile(latencies, 99) * 1000, 4),
+        })
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["peak_rss_mb"] = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    return result
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+def compare(current: List[Dict], baseline_path: Path) -> List[Dict]:
+    """기준 결과 대비 처리량 변화율(%)"""
+    baseline = {
+        (case["stage"], case["size"]): case
+        for case in json.loads(baseline_path.read_text())["results"]
+    }
+    changes = []
+    for case in current:
+        base = baseline.get((case["stage"], case["size"]))
+        if not base or not base.get("articles_per_sec") or not case.get("articles_per_sec"):
+            continue
+        changes.append({
+            "stage": case["stage"],
+            "size": case["size"],
+            "throughput_change_pct": round((case["articles_per_sec"] / base["articles_per_sec"] - 1) * 100, 1),
+            "p99_change_pct": round((case["p99_ms"] / base["p99_ms"] - 1) * 100, 1) if base.get("p99_ms") else None,
+        })
+    return changes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="분석 단계 처리량 벤치마크")
+    parser.add_argument("--sizes", default=",".join(DEFAULT_SIZES), help=f"코퍼스 크기: {', '.join(SIZES)}")
+    parser.add_argument("--stages", default=",".join(STAGES), help=f"측정 단계: {', '.join(STAGES)}")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--output", type=Path, default=RESULTS_DIR, help="결과 JSON 디렉토리")
+    parser.add_argument("--compare", type=Path, help="비교할 이전 결과 JSON")
+    parser.add_argument("--fail-over", type=float, help="처리량이 이 비율(%%) 이상 떨어지면 종료 코드 1")
+    args = parser.parse_args()
+
+    sizes, stages = args.sizes.split(","), args.stages.split(",")
+    unknown = [s for s in sizes if s not in SIZES] + [s for s in stages if s not in BENCHMARKS]
+    if unknown:
+        parser.error(f"알 수 없는 값: {', '.join(unknown)}")
+
+    results = []
+    for size in sizes:
+        for stage in stages:
+            # 케이스마다 새 프로세스 → 최대 RSS가 서로 섞이지 않음
+            with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+                case = executor.submit(run_case, stage, size, args.seed).result()
+            results.append(case)
+            if "error" in case:
+                print(f"{stage:>14} {size:>5}  ERROR {case['error']}")
+            else:
+                print(f"{stage:>14} {size:>5}  {case['articles_per_sec']:>12,.1f} art/s  "
+                      f"p50 {case['p50_ms']:>9.3f}ms  p99 {case['p99_ms']:>9.3f}ms  "
+                      f"rss {case['peak_rss_mb']:>7.1f}MB")
+
+    commit = git_commit()
+    report = {
+        "commit": commit,
+        "created_at": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "results": results,
+    }
+
+    exit_code = 0
+    if args.compare:
+        report["comparison"] = {"baseline": str(args.compare), "changes": compare(results, args.compare)}
+        for change in report["comparison"]["changes"]:
+            print(f"{change['stage']:>14} {change['size']:>5}  throughput {change['throughput_change_pct']:+.1f}%")
+            if args.fail_over is not None and change["throughput_change_pct"] <= -args.fail_over:
+                exit_code = 1
+
+    args.output.mkdir(parents=True, exist_ok=True)
+    payload = json.dumps(report, indent=2, ensure_ascii=False)
+    (args.output / f"{commit}.json").write_text(payload)
+    (args.output / "latest.json").write_text(payload)
+    print(f"결과 저장: {args.output / f'{commit}.json'}")
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
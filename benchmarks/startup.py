@@ -0,0 +1,158 @@
+"""
+CLI 모드별 시작 시간 벤치마크
+Startup-time benchmark per main.py mode
+
+각 모드(collect/analyze/generate)마다 새 인터프리터를 띄워 JobScheduler 를 만들고
+그 모드가 쓰는 컴포넌트를 로드(JobScheduler.load)하기까지 걸린 시간을 잽니다.
+작업 자체(수집/분석/생성)는 실행하지 않으며, 저장소는 기본으로 local(SQLite)을 씁니다.
+
+- wall_ms:   프로세스 시작 → 종료 (인터프리터 기동 포함, 크론 호출이 실제로 기다리는 시간)
+- import_ms: JobScheduler import + 모드 컴포넌트 로드
+- heavy:     로드된 무거운 모듈 (torch, transformers, spaCy 등 — 비어 있어야 정상)
+
+사용법:
+    python -m benchmarks.startup
+    python -m benchmarks.startup --modes collect,analyze --repeat 10
+    python -m benchmarks.startup --max-ms 1500      # 어느 모드든 중앙값이 넘으면 종료 코드 1
+
+결과는 .build/benchmarks/startup_<commit>.json 과 startup_latest.json 에 저장됩니다.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.run_benchmarks import RESULTS_DIR, git_commit  # noqa: E402
+
+DEFAULT_MODES = ("collect", "analyze", "generate")
+DEFAULT_REPEAT = 5
+
+# 자식 프로세스에서 실행 (마지막 줄에 JSON 출력)
+_CHILD = """
+import json, sys, time
+start = time.perf_counter()
+sys.path.insert(0, {root!r})
+from loguru import logger
+logger.remove()
+from pipeline.registry import HEAVY_MODULES
+error = None
+try:
+    from scheduler.jobs import JobScheduler
+    JobScheduler().load({mode!r})
+except Exception as e:
+    error = f"{{type(e).__name__}}: {{e}}"
+print(json.dumps({{
+    "import_ms": (time.perf_counter() - start) * 1000,
+    "modules": len(sys.modules),
+    "heavy": [name for name in HEAVY_MODULES if name in sys.modules],
+    "error": error,
+}}))
+"""
+
+
+def run_mode(mode: str, env: Dict[str, str]) -> Dict:
+    """새 인터프리터에서 모드 하나 로드 → 측정값"""
+    code = _CHILD.format(root=str(PROJECT_ROOT), mode=mode)
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT, env=env,
+                          capture_output=True, text=True)
+    wall_ms = (time.perf_counter() - start) * 1000
+    lines = proc.stdout.strip().splitlines()
+    if proc.returncode or not lines:
+        return {"wall_ms": wall_ms, "error": (proc.stderr.strip().splitlines() or ["no output"])[-1]}
+    sample = json.loads(lines[-1])
+    sample["wall_ms"] = wall_ms
+    return sample
+
+
+def run_mode_baseline(env: Dict[str, str], repeat: int) -> float:
+    """빈 인터프리터 + loguru import 시간 (모드별 수치의 하한)"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "import loguru"], cwd=PROJECT_ROOT, env=env, capture_output=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return round(statistics.median(samples), 1)
+
+
+def bench_mode(mode: str, repeat: int, env: Dict[str, str]) -> Dict:
+    samples = [run_mode(mode, env) for _ in range(repeat)]
+    ok = [s for s in samples if not s.get("error")]
+    result = {"mode": mode, "runs": len(samples)}
+    if not ok:
+        result["error"] = samples[-1]["error"]
+        return result
+    result.update({
+        "wall_ms": round(statistics.median(s["wall_ms"] for s in ok), 1),
+        "wall_min_ms": round(min(s["wall_ms"] for s in ok), 1),
+        "import_ms": round(statistics.median(s["import_ms"] for s in ok), 1),
+        "modules": ok[-1]["modules"],
+        "heavy": ok[-1]["heavy"],
+    })
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="main.py 모드별 시작 시간 벤치마크")
+    parser.add_argument("--modes", default=",".join(DEFAULT_MODES), help="측정 모드: collect, analyze, generate, once, run")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="모드별 반복 횟수 (중앙값 사용)")
+    parser.add_argument("--storage", default="local", help="자식 프로세스 STORAGE_BACKEND (기본: local)")
+    parser.add_argument("--output", type=Path, default=RESULTS_DIR, help="결과 JSON 디렉토리")
+    parser.add_argument("--max-ms", type=float, help="어느 모드든 wall 중앙값이 이 값(ms)을 넘으면 종료 코드 1")
+    args = parser.parse_args()
+
+    from pipeline.registry import MODE_COMPONENTS
+    modes = args.modes.split(",")
+    unknown = [m for m in modes if m not in MODE_COMPONENTS]
+    if unknown:
+        parser.error(f"알 수 없는 모드: {', '.join(unknown)}")
+
+    env = {**os.environ, "STORAGE_BACKEND": args.storage}
+    baseline = run_mode_baseline(env, args.repeat)
+    print(f"{'python':>10}  wall {baseline:>8.1f}ms  (인터프리터 + loguru)")
+
+    results: List[Dict] = []
+    exit_code = 0
+    for mode in modes:
+        case = bench_mode(mode, args.repeat, env)
+        results.append(case)
+        if "error" in case:
+            print(f"{mode:>10}  ERROR {case['error']}")
+            exit_code = 1
+            continue
+        heavy = ", ".join(case["heavy"]) or "-"
+        print(f"{mode:>10}  wall {case['wall_ms']:>8.1f}ms  import {case['import_ms']:>8.1f}ms  "
+              f"modules {case['modules']:>5}  heavy {heavy}")
+        if args.max_ms is not None and case["wall_ms"] > args.max_ms:
+            exit_code = 1
+
+    commit = git_commit()
+    report = {
+        "commit": commit,
+        "created_at": datetime.now().isoformat(),
+        "python": sys.version.split()[0],
+        "storage": args.storage,
+        "repeat": args.repeat,
+        "baseline_wall_ms": baseline,
+        "results": results,
+    }
+    args.output.mkdir(parents=True, exist_ok=True)
+    payload = json.dumps(report, indent=2, ensure_ascii=False)
+    (args.output / f"startup_{commit}.json").write_text(payload)
+    (args.output / "startup_latest.json").write_text(payload)
+    print(f"결과 저장: {args.output / f'startup_{commit}.json'}")
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
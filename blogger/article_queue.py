@@ -10,8 +10,11 @@ from enum import Enum
 from loguru import logger
 
 sys.path.append('..')
-from database.supabase_client import SupabaseClient
-from dashboard.signal_api import SignalAPI
+from database.storage import get_storage
+from dashboard.signal_api import ARTICLE_TIERS, SignalAPI
+
+# 스마트 추천에서 레벨별로 훑는 미발행 시그널 최대 개수 (최근 7일)
+SMART_SCAN_LIMIT = 1000
 
 
 class QueueStatus(Enum):
@@ -27,7 +30,7 @@ class ArticleQueueManager:
     """블로거 글쓰기 큐 관리자"""
 
     def __init__(self):
-        self.db = SupabaseClient()
+        self.db = get_storage()
         self.signal_api = SignalAPI()
         logger.info("Article queue manager initialized")
 
@@ -39,7 +42,7 @@ class ArticleQueueManager:
         Args:
             tier: 글 등급 (tier_1, tier_2, tier_3)
             hours: 최근 N시간
-            limit: 최대 개수
+            limit: 레벨별 최대 개수
 
         Returns:
             추천 시그널 리스트
@@ -47,28 +50,14 @@ class ArticleQueueManager:
         try:
             logger.info(f"Getting recommended signals for {tier}")
 
-            if tier == "tier_1":
-                # Tier 1: 긴급 + 높음 시그널만 (Level 1-2)
-                signals = self.signal_api.get_signals_by_level(1, hours=hours, limit=limit)
-                signals.extend(self.signal_api.get_signals_by_level(2, hours=hours, limit=limit//2))
-            elif tier == "tier_2":
-                # Tier 2: 높음 + 중간 시그널 (Level 2-3)
-                signals = self.signal_api.get_signals_by_level(2, hours=hours, limit=limit)
-                signals.extend(self.signal_api.get_signals_by_level(3, hours=hours, limit=limit//2))
-            else:  # tier_3
-                # Tier 3: 모든 시그널 (확장된 기간)
-                signals = []
-                for level in [1, 2, 3, 4]:
-                    signals.extend(self.signal_api.get_signals_by_level(
-                        level, hours=hours*7, limit=limit//4
-                    ))
-
-            # 이미 발행된 신호 제외
-            published_ids = self._get_published_signal_ids()
-            new_signals = [s for s in signals if s.get('id') not in published_ids]
+            # 티어의 레벨을 한 번에 조회 (레벨마다 limit 개), 이미 발행된 신호는 서버에서 제외
+            levels, hours_factor, _ = ARTICLE_TIERS.get(tier, ARTICLE_TIERS["tier_3"])
+            new_signals = self.db.get_signals_per_level(
+                levels, hours=hours * hours_factor, limit=limit, unpublished_only=True
+            )
 
             logger.info(f"Found {len(new_signals)} new recommendations for {tier}")
-            return new_signals[:limit]
+            return new_signals
 
         except Exception as e:
             logger.error(f"Error getting recommended signals: {e}")
@@ -106,9 +95,9 @@ class ArticleQueueManager:
         특정 종목의 글쓰기 신호 조회
         """
         try:
-            signals = self.signal_api.get_signals_by_symbol(symbol, hours=hours, limit=limit)
-            published_ids = self._get_published_signal_ids()
-            new_signals = [s for s in signals if s.get('id') not in published_ids]
+            new_signals = self.db.get_signals_by_levels(
+                [1, 2, 3, 4], hours=hours, limit=limit, symbol=symbol, unpublished_only=True
+            )
 
             logger.info(f"Found {len(new_signals)} unpublished signals for {symbol}")
             return new_signals
@@ -120,9 +109,7 @@ class ArticleQueueManager:
     def get_urgent_recommendations(self) -> List[Dict]:
         """긴급 추천 (Level 1 신호만)"""
         try:
-            signals = self.signal_api.get_urgent_signals(hours=24, limit=20)
-            published_ids = self._get_published_signal_ids()
-            new_signals = [s for s in signals if s.get('id') not in published_ids]
+            new_signals = self.db.get_signals_by_levels([1], hours=24, limit=20, unpublished_only=True)
 
             logger.info(f"Found {len(new_signals)} urgent recommendations")
             return new_signals
@@ -178,45 +165,19 @@ class ArticleQueueManager:
             logger.error(f"Error marking signal published: {e}")
             return False
 
-    def _get_published_signal_ids(self) -> set:
-        """이미 발행된 신호 ID 목록"""
-        try:
-            result = self.db.client.table("published_articles")\
-                .select("analyzed_news_ids")\
-                .execute()
-
-            all_ids = set()
-            for item in result.data:
-                all_ids.update(item.get("analyzed_news_ids", []))
-
-            return all_ids
-
-        except Exception as e:
-            logger.error(f"Error getting published signal IDs: {e}")
-            return set()
-
     def get_statistics(self) -> Dict:
         """큐 통계 조회"""
         try:
             # 최근 7일간 데이터
             cutoff_time = (datetime.now() - timedelta(days=7)).isoformat()
 
-            # 분석된 신호
-            analyzed = self.db.client.table("analyzed_news")\
-                .select("count()", method="count")\
-                .gte("created_at", cutoff_time)\
-                .execute()
-
-            # 발행된 글
-            published = self.db.client.table("published_articles")\
-                .select("count()", method="count")\
-                .gte("created_at", cutoff_time)\
-                .execute()
+            analyzed = self.db.count_since("analyzed_news", cutoff_time)
+            published = self.db.count_since("published_articles", cutoff_time)
 
             return {
                 "period_days": 7,
-                "analyzed_signals": analyzed.count if hasattr(analyzed, 'count') else 0,
-                "published_articles": published.count if hasattr(published, 'count') else 0,
+                "analyzed_signals": analyzed,
+                "published_articles": published,
                 "conversion_rate": "N/A"  # 향후 계산
             }
 
@@ -225,23 +186,80 @@ class ArticleQueueManager:
             return {}
 
     def get_smart_recommendations(self) -> Dict:
-        """스마트 추천 (다양한 관점)"""
+        """
+        스마트 추천 (다양한 관점)
+
+        최근 7일 미발행 시그널을 한 번에(레벨마다 SMART_SCAN_LIMIT 개) 조회해 긴급 추천, 오늘의 제안,
+        티어별 대기 개수를 모두 계산합니다. 트렌딩 종목만 별도 쿼리입니다.
+        """
         try:
+            signals = self.db.get_signals_per_level(
+                [1, 2, 3, 4], hours=24 * 7, limit=SMART_SCAN_LIMIT, unpublished_only=True
+            )
+            now = datetime.now()
+            day_ago = now - timedelta(hours=24)
+            recent = [s for s in signals if _created_at(s) >= day_ago]
+
+            def pending(tier: str, limit: int) -> int:
+                levels, hours_factor, _ = ARTICLE_TIERS[tier]
+                pool = signals if hours_factor > 1 else recent
+                return min(limit, sum(1 for s in pool if s.get("signal_level") in levels))
+
             recommendations = {
-                "timestamp": datetime.now().isoformat(),
-                "tier_1_urgent": self.get_urgent_recommendations(),
-                "daily_suggestions": self.get_daily_article_suggestions(),
+                "timestamp": now.isoformat(),
+                "tier_1_urgent": [s for s in recent if s.get("signal_level") == 1][:20],
+                "daily_suggestions": _daily_suggestions(recent, now),
                 "trending_symbols": self.signal_api.get_trending_symbols(limit=10),
                 "queue_summary": {
-                    "tier_1_pending": len(self.get_recommended_signals("tier_1", limit=50)),
-                    "tier_2_pending": len(self.get_recommended_signals("tier_2", limit=50)),
-                    "tier_3_pending": len(self.get_recommended_signals("tier_3", limit=100))
+                    "tier_1_pending": pending("tier_1", 50),
+                    "tier_2_pending": pending("tier_2", 50),
+                    "tier_3_pending": pending("tier_3", 100)
                 }
             }
 
-            logger.info("Generated smart recommendations")
+            logger.info(f"Generated smart recommendations from {len(signals)} unpublished signals")
             return recommendations
 
         except Exception as e:
             logger.error(f"Error generating smart recommendations: {e}")
             return {}
+
+
+def _created_at(signal: Dict) -> datetime:
+    """created_at → 로컬 naive datetime (Supabase 는 타임존 포함, SQLite 는 naive)"""
+    created_at = datetime.fromisoformat(signal["created_at"])
+    if created_at.tzinfo is not None:
+        created_at = created_at.astimezone().replace(tzinfo=None)
+    return created_at
+
+
+def _daily_suggestions(recent: List[Dict], now: datetime, limit: int = 5) -> List[Dict]:
+    """최근 24시간 미발행 시그널에서 오늘 작성할 글 제안 (get_daily_article_suggestions 와 같은 기준)"""
+    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    symbols = {}
+    for signal in recent:
+        if signal.get("signal_level") not in (1, 2) or _created_at(signal) < today:
+            continue
+        for symbol in signal.get("affected_symbols") or []:
+            info = symbols.setdefault(symbol, {"symbol": symbol, "signals": 0, "max_score": 0, "urgent_count": 0})
+            info["signals"] += 1
+            info["max_score"] = max(info["max_score"], signal.get("relevance_score", 0))
+            if signal.get("signal_level") == 1:
+                info["urgent_count"] += 1
+
+    important = sorted(
+        symbols.values(),
+        key=lambda x: (x["urgent_count"], x["signals"], x["max_score"]),
+        reverse=True
+    )[:limit]
+
+    return [
+        {
+            "symbol": info["symbol"],
+            "urgent_count": info["urgent_count"],
+            "signal_count": info["signals"],
+            "sample_signals": [s for s in recent if info["symbol"] in (s.get("affected_symbols") or [])][:2]
+        }
+        for info in important
+    ]
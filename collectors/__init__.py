@@ -1,11 +1,14 @@
-from .base import BaseCollector
-from .finnhub_collector import FinnhubCollector
-from .alpha_vantage_collector import AlphaVantageCollector
-from .rss_collector import RSSCollector
+from utils.lazy import lazy_exports
 
-__all__ = [
-    'BaseCollector',
-    'FinnhubCollector',
-    'AlphaVantageCollector',
-    'RSSCollector'
-]
+# 수집기마다 외부 SDK(finnhub 등)를 import 하므로 실제로 쓰는 것만 로드
+_EXPORTS = {
+    'BaseCollector': '.base',
+    'FinnhubCollector': '.finnhub_collector',
+    'AlphaVantageCollector': '.alpha_vantage_collector',
+    'RSSCollector': '.rss_collector',
+    'QuotaPlanner': '.quota_planner'
+}
+
+__getattr__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
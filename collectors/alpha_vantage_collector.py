@@ -4,11 +4,23 @@ from datetime import datetime, timedelta
 from loguru import logger
 import requests
 import sys
+import time
 
 sys.path.append('..')
-from config.settings import ALPHA_VANTAGE_API_KEY, TRACKED_SYMBOLS
+from config.settings import (
+    ALPHA_VANTAGE_API_KEY,
+    TRACKED_SYMBOLS,
+    ALPHA_VANTAGE_CALLS_PER_MINUTE,
+    ALPHA_VANTAGE_CALLS_PER_DAY,
+    ALPHA_VANTAGE_TICKERS_PER_CALL
+)
 from database.models import RawNews
 from collectors.base import BaseCollector
+from collectors.quota_planner import QuotaPlanner, signal_activity
+
+MARKET_FEED = "__market__"
+MARKET_FEED_INTERVAL = 3 * 60 * 60  # 시장 전체 피드는 3시간마다 (무료 한도 25회/일 중 8회)
+MARKET_FEED_LIMIT = 200
 
 class AlphaVantageCollector(BaseCollector):
     """Alpha Vantage API를 사용한 뉴스 수집기"""
@@ -17,6 +29,12 @@ class AlphaVantageCollector(BaseCollector):
         super().__init__(db_client)
         self.api_key = ALPHA_VANTAGE_API_KEY
         self.base_url = "https://www.alphavantage.co/query"
+        self.planner = QuotaPlanner(
+            "alpha_vantage",
+            per_minute=ALPHA_VANTAGE_CALLS_PER_MINUTE,
+            per_day=ALPHA_VANTAGE_CALLS_PER_DAY,
+            tickers_per_call=ALPHA_VANTAGE_TICKERS_PER_CALL
+        )
         logger.info("Alpha Vantage collector initialized")
 
     def fetch_news(self) -> List[RawNews]:
@@ -25,28 +43,38 @@ class AlphaVantageCollector(BaseCollector):
 
         try:
             # 시장 뉴스 & 감성 분석
-            market_news = self._fetch_news_sentiment()
-            news_items.extend(market_news)
-
-            # 종목별 뉴스
-            for symbol in TRACKED_SYMBOLS[:3]:  # API 제한 고려 (무료: 25 req/day)
-                symbol_news = self._fetch_news_sentiment(symbol)
+            last_market = self.planner.last_covered.get(MARKET_FEED, 0)
+            if time.time() - last_market >= MARKET_FEED_INTERVAL and self.planner.available() > 0:
+                self.planner.record_call([MARKET_FEED])
+                market_news = self._fetch_news_sentiment(limit=MARKET_FEED_LIMIT)
+                news_items.extend(market_news)
+
+            # 종목별 뉴스 (일일 한도를 고르게 나눠 오래된/신호 많은 종목부터 순환)
+            batches = self.planner.plan(TRACKED_SYMBOLS, signal_activity(self.db))
+            for batch in batches:
+                self.planner.record_call(batch)
+                symbol_news = self._fetch_news_sentiment(",".join(batch))
                 news_items.extend(symbol_news)
 
+            if batches:
+                logger.info(f"Alpha Vantage ticker news: {', '.join(s for b in batches for s in b)}")
+
         except Exception as e:
             logger.error(f"Alpha Vantage fetch error: {e}")
+        finally:
+            self.planner.save()
 
         return news_items
 
-    def _fetch_news_sentiment(self, ticker: str = None) -> List[RawNews]:
-        """뉴스 & 감성 분석 데이터 수집"""
+    def _fetch_news_sentiment(self, ticker: str = None, limit: int = 50) -> List[RawNews]:
+        """뉴스 & 감성 분석 데이터 수집 (ticker는 쉼표로 여러 개 지정 가능)"""
         news_items = []
 
         try:
             params = {
                 "function": "NEWS_SENTIMENT",
                 "apikey": self.api_key,
-                "limit": 50
+                "limit": limit
             }
 
             if ticker:
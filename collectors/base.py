@@ -6,12 +6,13 @@ import sys
 
 sys.path.append('..')
 from database.models import RawNews
-from database.supabase_client import SupabaseClient
+from database.storage import StorageBackend
+from monitoring.metrics import inc, timer
 
 class BaseCollector(ABC):
     """뉴스 수집기 기본 클래스"""
 
-    def __init__(self, db_client: SupabaseClient):
+    def __init__(self, db_client: StorageBackend):
         self.db = db_client
         self.source_name = self.__class__.__name__
 
@@ -24,7 +25,9 @@ class BaseCollector(ABC):
         """뉴스를 수집하고 저장"""
         try:
             logger.info(f"Starting news collection from {self.source_name}")
-            news_items = self.fetch_news()
+            with timer("collector_fetch_seconds", source=self.source_name):
+                news_items = self.fetch_news()
+            inc("collector_articles_total", len(news_items), source=self.source_name)
 
             saved_count = 0
             for news in news_items:
@@ -40,9 +43,11 @@ class BaseCollector(ABC):
                     saved_count += 1
 
             logger.info(f"{self.source_name} collected {saved_count} new news items")
+            inc("collector_saved_total", saved_count, source=self.source_name)
             return saved_count
 
         except Exception as e:
+            inc("collector_errors_total", source=self.source_name)
             logger.error(f"Error in {self.source_name} collector: {e}")
             return 0
 
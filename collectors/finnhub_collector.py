@@ -5,9 +5,15 @@ from loguru import logger
 import sys
 
 sys.path.append('..')
-from config.settings import FINNHUB_API_KEY, TRACKED_SYMBOLS
+from config.settings import (
+    FINNHUB_API_KEY,
+    TRACKED_SYMBOLS,
+    FINNHUB_CALLS_PER_MINUTE,
+    FINNHUB_CALLS_PER_DAY
+)
 from database.models import RawNews
 from collectors.base import BaseCollector
+from collectors.quota_planner import QuotaPlanner, signal_activity
 
 class FinnhubCollector(BaseCollector):
     """Finnhub API를 사용한 뉴스 수집기"""
@@ -15,6 +21,11 @@ class FinnhubCollector(BaseCollector):
     def __init__(self, db_client):
         super().__init__(db_client)
         self.client = finnhub.Client(api_key=FINNHUB_API_KEY)
+        self.planner = QuotaPlanner(
+            "finnhub",
+            per_minute=FINNHUB_CALLS_PER_MINUTE,
+            per_day=FINNHUB_CALLS_PER_DAY
+        )
         logger.info("Finnhub collector initialized")
 
     def fetch_news(self) -> List[RawNews]:
@@ -23,16 +34,24 @@ class FinnhubCollector(BaseCollector):
 
         try:
             # 일반 시장 뉴스
-            market_news = self._fetch_market_news()
-            news_items.extend(market_news)
-
-            # 종목별 뉴스 (주요 종목만 샘플링)
-            for symbol in TRACKED_SYMBOLS[:5]:  # API 제한 고려
+            if self.planner.available() > 0:
+                self.planner.record_call()
+                market_news = self._fetch_market_news()
+                news_items.extend(market_news)
+
+            # 종목별 뉴스 (API 한도 안에서 오래된/신호 많은 종목 우선 순환)
+            batches = self.planner.plan(TRACKED_SYMBOLS, signal_activity(self.db))
+            for (symbol,) in batches:
+                self.planner.record_call([symbol])
                 company_news = self._fetch_company_news(symbol)
                 news_items.extend(company_news)
 
+            logger.info(f"Finnhub company news: {len(batches)}/{len(TRACKED_SYMBOLS)} symbols this cycle")
+
         except Exception as e:
             logger.error(f"Finnhub fetch error: {e}")
+        finally:
+            self.planner.save()
 
         return news_items
 
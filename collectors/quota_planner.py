@@ -0,0 +1,149 @@
+import json
+import math
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+from loguru import logger
+
+DEFAULT_STATE_FILE = Path(__file__).parent.parent / ".cache" / "collector_quota.json"
+MINUTE = 60
+DAY = 24 * 60 * 60
+UNLIMITED = 10 ** 9
+
+
+class QuotaPlanner:
+    """
+    API 호출 예산 계획기
+
+    제공자별 분당/일일 호출 한도를 지키면서 이번 수집 주기에 호출할 종목을
+    고릅니다. 오래 수집하지 않은 종목일수록, 최근 신호가 많은 종목일수록 먼저
+    선택되므로 여러 주기에 걸쳐 전체 종목이 순환 수집됩니다.
+    사용한 예산과 종목별 마지막 수집 시각은 파일에 저장되어 재시작 후에도 유지됩니다.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        per_minute: int = 0,
+        per_day: int = 0,
+        tickers_per_call: int = 1,
+        state_file: Path = DEFAULT_STATE_FILE
+    ):
+        self.provider = provider
+        self.per_minute = per_minute
+        self.per_day = per_day
+        self.tickers_per_call = max(1, tickers_per_call)
+        self.state_file = Path(state_file)
+        self.calls: List[float] = []
+        self.last_covered: Dict[str, float] = {}
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f).get(self.provider, {})
+            self.calls = [float(t) for t in state.get("calls", [])]
+            self.last_covered = {k: float(v) for k, v in state.get("last_covered", {}).items()}
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to load quota state ({self.state_file}): {e}")
+        self._prune(time.time())
+
+    def save(self):
+        """다른 제공자의 상태를 보존하면서 원자적으로 저장"""
+        try:
+            state = {}
+            if self.state_file.exists():
+                with open(self.state_file, 'r', encoding='utf-8') as f:
+                    state = json.load(f)
+            state[self.provider] = {"calls": self.calls, "last_covered": self.last_covered}
+
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.state_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.state_file)
+        except Exception as e:
+            logger.error(f"Failed to save quota state ({self.state_file}): {e}")
+
+    def _prune(self, now: float):
+        self.calls = [t for t in self.calls if now - t < DAY]
+
+    def available(self, now: Optional[float] = None) -> int:
+        """지금 쓸 수 있는 호출 수"""
+        now = now or time.time()
+        self._prune(now)
+        limits = []
+
+        if self.per_minute:
+            limits.append(self.per_minute - sum(1 for t in self.calls if now - t < MINUTE))
+
+        if self.per_day:
+            limits.append(self.per_day - len(self.calls))
+            # 하루 예산을 고르게 분배 (한 번에 소진하지 않도록)
+            spacing = DAY / self.per_day
+            if self.calls:
+                limits.append(math.floor((now - max(self.calls)) / spacing))
+
+        if not limits:
+            return UNLIMITED
+        return max(0, min(limits))
+
+    def plan(
+        self,
+        symbols: List[str],
+        activity: Optional[Dict[str, float]] = None,
+        reserve: int = 0
+    ) -> List[List[str]]:
+        """
+        이번 주기에 호출할 종목 묶음 목록
+
+        Args:
+            symbols: 전체 종목 목록
+            activity: 종목별 최근 신호 가중치 (클수록 자주 수집)
+            reserve: 종목 호출 외에 따로 쓸 호출 수 (예: 시장 전체 뉴스)
+        """
+        now = time.time()
+        calls = self.available(now) - reserve
+        if calls <= 0 or not symbols:
+            return []
+
+        activity = activity or {}
+
+        def priority(item):
+            index, symbol = item
+            staleness = now - self.last_covered.get(symbol, 0)
+            return (-staleness * (1 + activity.get(symbol, 0)), index)
+
+        ranked = [symbol for _, symbol in sorted(enumerate(symbols), key=priority)]
+        selected = ranked[:calls * self.tickers_per_call]
+        return [
+            selected[i:i + self.tickers_per_call]
+            for i in range(0, len(selected), self.tickers_per_call)
+        ]
+
+    def record_call(self, symbols: Optional[List[str]] = None):
+        """호출 1회 사용 기록 (symbols는 수집 완료로 표시)"""
+        now = time.time()
+        self.calls.append(now)
+        self.mark_covered(symbols or [], now)
+
+    def mark_covered(self, symbols: List[str], now: Optional[float] = None):
+        now = now or time.time()
+        for symbol in symbols:
+            self.last_covered[symbol] = now
+
+
+def signal_activity(db_client, hours: int = 24) -> Dict[str, float]:
+    """최근 시그널 기준 종목별 가중치 (긴급 시그널은 2배)"""
+    try:
+        trending = db_client.get_trending_symbols(hours=hours, limit=1000)
+        return {
+            item["symbol"]: item["count"] + item["urgency_count"]
+            for item in trending
+        }
+    except Exception as e:
+        logger.warning(f"Failed to load signal activity: {e}")
+        return {}
@@ -1,4 +1,5 @@
 import os
+from pathlib import Path
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -7,6 +8,9 @@ load_dotenv()
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_KEY = os.getenv("SUPABASE_KEY")
 
+# Storage backend: supabase | local | cached (Supabase write-through + local reads)
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "supabase")
+
 # News APIs
 FINNHUB_API_KEY = os.getenv("FINNHUB_API_KEY")
 ALPHA_VANTAGE_API_KEY = os.getenv("ALPHA_VANTAGE_API_KEY")
@@ -25,9 +29,31 @@ NEWS_COLLECTION_INTERVAL = int(os.getenv("NEWS_COLLECTION_INTERVAL", 900))
 ANALYSIS_INTERVAL = int(os.getenv("ANALYSIS_INTERVAL", 1800))
 ARTICLE_GENERATION_INTERVAL = int(os.getenv("ARTICLE_GENERATION_INTERVAL", 3600))
 
+# API Quotas (free tier defaults, 0 = unlimited)
+FINNHUB_CALLS_PER_MINUTE = int(os.getenv("FINNHUB_CALLS_PER_MINUTE", 60))
+FINNHUB_CALLS_PER_DAY = int(os.getenv("FINNHUB_CALLS_PER_DAY", 0))
+ALPHA_VANTAGE_CALLS_PER_MINUTE = int(os.getenv("ALPHA_VANTAGE_CALLS_PER_MINUTE", 5))
+ALPHA_VANTAGE_CALLS_PER_DAY = int(os.getenv("ALPHA_VANTAGE_CALLS_PER_DAY", 25))
+# Alpha Vantage tickers= 는 AND 조건 (모든 티커를 언급한 기사만 반환) 이므로 기본 1
+ALPHA_VANTAGE_TICKERS_PER_CALL = int(os.getenv("ALPHA_VANTAGE_TICKERS_PER_CALL", 1))
+
 # Thresholds
 MIN_RELEVANCE_SCORE = int(os.getenv("MIN_RELEVANCE_SCORE", 70))
 
+# LLM 자동 분석 (비어 있으면 기존 프롬프트 파일 모드: anthropic | openai | stub)
+ANALYSIS_LLM_BACKEND = os.getenv("ANALYSIS_LLM_BACKEND", "")
+ANALYSIS_BATCH_SIZE = int(os.getenv("ANALYSIS_BATCH_SIZE", 10))        # 프롬프트 하나에 담는 뉴스 수
+ANALYSIS_CONCURRENCY = int(os.getenv("ANALYSIS_CONCURRENCY", 4))       # 동시 LLM 호출 수
+ANALYSIS_MAX_RETRIES = int(os.getenv("ANALYSIS_MAX_RETRIES", 2))       # 실패 항목 재시도 횟수
+
+# 상주 분석 서비스 (NER/감성/정책 모델을 한 번만 로드, python -m analyzers.analysis_service serve)
+ANALYSIS_SERVICE_SOCKET = os.getenv("ANALYSIS_SERVICE_SOCKET", str(Path(__file__).parent.parent / ".cache" / "analysis.sock"))
+ANALYSIS_SERVICE_TIMEOUT = float(os.getenv("ANALYSIS_SERVICE_TIMEOUT", 60))   # 응답 대기 (초), 넘으면 프로세스 내 분석
+
+# 뉴스 아카이브 (cleanup_old_news 가 지우기 전에 Parquet 으로 보관, pyarrow 필요)
+NEWS_ARCHIVE_ENABLED = os.getenv("NEWS_ARCHIVE_ENABLED", "true").lower() in ("1", "true", "yes")
+NEWS_ARCHIVE_DIR = os.getenv("NEWS_ARCHIVE_DIR", str(Path(__file__).parent.parent / ".cache" / "archive"))
+
 # Article Generation Criteria (Analyzed: 2025-11-13)
 # Tier 1: Primary (높은 중요도 뉴스 3개 이상) - Auto generation
 ARTICLE_TIER_1_MIN_HIGH_IMPORTANCE = 3      # 높은 중요도 뉴스 최소 3개
@@ -0,0 +1,241 @@
+"""
+대시보드 실시간 이벤트 스트림 (Server-Sent Events)
+Dashboard push channel
+
+분석 단계가 새 시그널과 갱신된 집계값을 이벤트 로그(SQLite)에 한 번 기록하면,
+각 대시보드 서버 프로세스는 로그를 꼬리 읽기(tail)하여 연결된 모든 클라이언트에
+SSE로 전달합니다. 클라이언트 수와 관계없이 Supabase 조회는 변경 1회당 1번입니다.
+
+- 이벤트 ID는 로그의 증가하는 정수 ID이며, 재연결 시 Last-Event-ID 이후만 재전송
+- 집계값(summary/trending/price_impact/stats)은 값이 바뀐 경우에만 발행 (델타)
+- 새로 연결한 클라이언트에는 각 집계의 최신 이벤트를 먼저 보내 초기 상태를 맞춤
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from loguru import logger
+
+EVENT_LOG_PATH = Path(__file__).parent.parent / ".cache" / "dashboard_events.sqlite"
+MAX_EVENTS = 2000           # 로그에 보관할 최대 이벤트 수
+REPLAY_BUFFER = 500         # 프로세스 메모리에 보관할 최근 이벤트 수
+POLL_INTERVAL = 1.0         # 로그 꼬리 읽기 간격 (초)
+HEARTBEAT_INTERVAL = 15.0   # 프록시 타임아웃 방지용 주석 전송 간격 (초)
+AGGREGATE_EVENTS = ("summary", "trending", "price_impact", "stats")
+
+Event = Tuple[int, str, str]  # (id, event, data JSON)
+
+
+class EventLog:
+    """프로세스 간 공유하는 추가 전용 이벤트 로그"""
+
+    def __init__(self, path: Path = EVENT_LOG_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS events (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                event TEXT NOT NULL,
+                data TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_events_event ON events (event, id)")
+        self._conn.commit()
+
+    def publish(self, event: str, data: Any) -> int:
+        payload = json.dumps(data, ensure_ascii=False, default=str)
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO events (event, data, created_at) VALUES (?, ?, ?)",
+                (event, payload, time.time())
+            )
+            event_id = cursor.lastrowid
+            self._conn.execute("DELETE FROM events WHERE id <= ?", (event_id - MAX_EVENTS,))
+            self._conn.commit()
+        return event_id
+
+    def since(self, last_id: int, limit: int = REPLAY_BUFFER) -> List[Event]:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT id, event, data FROM events WHERE id > ? ORDER BY id LIMIT ?",
+                (last_id, limit)
+            ).fetchall()
+
+    def latest(self, event: str) -> Optional[Event]:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT id, event, data FROM events WHERE event = ? ORDER BY id DESC LIMIT 1",
+                (event,)
+            ).fetchone()
+
+    def last_id(self) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT MAX(id) FROM events").fetchone()
+        return row[0] or 0
+
+
+def format_sse(event_id: int, event: str, data: str) -> str:
+    return f"id: {event_id}\nevent: {event}\ndata: {data}\n\n"
+
+
+class EventBroadcaster:
+    """
+    이벤트 로그를 한 스레드에서 꼬리 읽기하고 연결된 클라이언트에 분배
+
+    프로세스당 하나(get_broadcaster)만 사용합니다.
+    """
+
+    def __init__(self, log: Optional[EventLog] = None):
+        self.log = log or EventLog()
+        self._buffer: deque = deque(maxlen=REPLAY_BUFFER)
+        self._cond = threading.Condition()
+        self._last_id = self.log.last_id()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._tail, name="dashboard-events", daemon=True)
+            self._thread.start()
+
+    def _tail(self):
+        while True:
+            try:
+                events = self.log.since(self._last_id)
+                if events:
+                    with self._cond:
+                        self._buffer.extend(events)
+                        self._last_id = events[-1][0]
+                        self._cond.notify_all()
+            except Exception as e:
+                logger.error(f"Dashboard event tail error: {e}")
+            time.sleep(POLL_INTERVAL)
+
+    def _replay(self, last_event_id: Optional[int]) -> List[Event]:
+        """재연결이면 그 이후 이벤트, 새 연결이면 집계별 최신 스냅샷"""
+        if last_event_id is None:
+            snapshot = [self.log.latest(name) for name in AGGREGATE_EVENTS]
+            return sorted(e for e in snapshot if e)
+
+        with self._cond:
+            buffered = [e for e in self._buffer if e[0] > last_event_id]
+            oldest = self._buffer[0][0] if self._buffer else self._last_id + 1
+        if last_event_id + 1 >= oldest:
+            return buffered
+        # 메모리 버퍼보다 오래된 위치에서 재개하는 경우 로그에서 읽음
+        return self.log.since(last_event_id, limit=MAX_EVENTS)
+
+    def stream(self, last_event_id: Optional[int] = None) -> Iterator[str]:
+        """SSE 응답 본문 생성기"""
+        self.start()
+        yield "retry: 5000\n\n"
+
+        cursor = last_event_id or 0
+        for event_id, event, data in self._replay(last_event_id):
+            yield format_sse(event_id, event, data)
+            cursor = max(cursor, event_id)
+        cursor = max(cursor, self._last_id) if last_event_id is None else cursor
+
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._last_id > cursor, timeout=HEARTBEAT_INTERVAL)
+                pending = [e for e in self._buffer if e[0] > cursor]
+
+            if not pending:
+                yield ": keep-alive\n\n"
+                continue
+
+            for event_id, event, data in pending:
+                yield format_sse(event_id, event, data)
+                cursor = event_id
+
+
+_broadcaster: Optional[EventBroadcaster] = None
+_broadcaster_lock = threading.Lock()
+
+
+def get_broadcaster() -> EventBroadcaster:
+    global _broadcaster
+    with _broadcaster_lock:
+        if _broadcaster is None:
+            _broadcaster = EventBroadcaster()
+        return _broadcaster
+
+
+def parse_last_event_id(value: Optional[str]) -> Optional[int]:
+    try:
+        return int(value) if value else None
+    except ValueError:
+        return None
+
+
+# ==================== 발행 (분석 단계) ====================
+
+def compute_aggregates(db, hours: int = 24) -> Dict[str, Any]:
+    """대시보드 집계값 (변경 1회당 한 번만 계산)"""
+    return {
+        "summary": {
+            "period_hours": hours,
+            "urgent_count": len(db.get_signals_by_level(1, hours=hours)),
+            "high_count": len(db.get_signals_by_level(2, hours=hours)),
+            "medium_count": len(db.get_signals_by_level(3, hours=hours)),
+            "low_count": len(db.get_signals_by_level(4, hours=hours)),
+        },
+        "trending": db.get_trending_symbols(hours=hours, limit=10),
+        "price_impact": db.get_price_impact_summary(hours=hours),
+        "stats": db.get_dashboard_stats(),
+    }
+
+
+def _comparable(data: Any) -> str:
+    """타임스탬프 필드를 제외한 비교용 직렬화"""
+    if isinstance(data, dict):
+        data = {k: v for k, v in data.items() if k not in ("last_updated", "timestamp")}
+    return json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+
+
+_event_log: Optional[EventLog] = None
+_event_log_lock = threading.Lock()
+
+
+def get_event_log() -> EventLog:
+    """발행용 이벤트 로그 (프로세스당 연결 하나를 재사용)"""
+    global _event_log
+    with _event_log_lock:
+        if _event_log is None:
+            _event_log = EventLog()
+        return _event_log
+
+
+def publish_analysis_update(db, new_signals: List[Dict], log: Optional[EventLog] = None) -> List[int]:
+    """
+    새로 분석된 시그널과 바뀐 집계값을 발행
+
+    signals 이벤트 본문은 대시보드가 REST 재조회 없이 카드로 그릴 수 있도록
+    제목/URL/출처/발행 시각을 포함합니다.
+
+    Returns:
+        발행한 이벤트 ID 목록
+    """
+    log = log or get_event_log()
+    published = []
+
+    if new_signals:
+        published.append(log.publish("signals", new_signals))
+
+    for name, data in compute_aggregates(db).items():
+        previous = log.latest(name)
+        if previous and _comparable(json.loads(previous[2])) == _comparable(data):
+            continue
+        published.append(log.publish(name, data))
+
+    if published:
+        logger.info(f"Dashboard events published: {published[0]}..{published[-1]} ({len(published)})")
+    return published
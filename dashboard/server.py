@@ -11,7 +11,7 @@ from loguru import logger
 sys.path.append('..')
 
 try:
-    from flask import Flask, jsonify, request, send_from_directory
+    from flask import Flask, Response, jsonify, request, send_from_directory, stream_with_context
     from flask_cors import CORS
     FLASK_AVAILABLE = True
 except ImportError:
@@ -19,6 +19,9 @@ except ImportError:
     logger.warning("Flask not installed - dashboard server unavailable")
 
 from dashboard.signal_api import SignalAPI
+from dashboard.event_stream import get_broadcaster, parse_last_event_id
+from database.search_index import DOC_KINDS, get_search_index
+from monitoring.metrics import render_prometheus, start_snapshot_writer
 
 
 def create_app():
@@ -52,60 +55,52 @@ def create_app():
             "service": "Investment Signal Dashboard"
         })
 
+    @app.route('/metrics', methods=['GET'])
+    def metrics():
+        """Prometheus 메트릭 (스케줄러 등 다른 프로세스 스냅샷 포함)"""
+        return Response(render_prometheus(), mimetype='text/plain; version=0.0.4')
+
+    def signal_page(body: dict, default_limit: int, levels=None, symbol=None):
+        """시그널 목록 응답 (최신순, ?cursor= 로 다음 페이지)"""
+        limit = request.args.get('limit', default_limit, type=int)
+        try:
+            page = signal_api.get_signal_page(
+                levels=levels,
+                symbol=symbol,
+                hours=request.args.get('hours', 24, type=int),
+                limit=limit,
+                cursor=request.args.get('cursor', None, type=str)
+            )
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        return jsonify({
+            **body,
+            "count": len(page["signals"]),
+            "signals": page["signals"],
+            "next_cursor": page["next_cursor"]
+        })
+
     @app.route('/api/signals/urgent', methods=['GET'])
     def get_urgent_signals():
         """긴급 시그널 (Level 1)"""
-        hours = request.args.get('hours', 24, type=int)
-        limit = request.args.get('limit', 20, type=int)
-
-        signals = signal_api.get_urgent_signals(hours=hours, limit=limit)
-        return jsonify({
-            "level": 1,
-            "count": len(signals),
-            "signals": signals
-        })
+        return signal_page({"level": 1}, 20, levels=[1])
 
     @app.route('/api/signals/high-priority', methods=['GET'])
     def get_high_priority_signals():
         """높은 우선순위 시그널 (Level 1-2)"""
-        hours = request.args.get('hours', 24, type=int)
-        limit = request.args.get('limit', 30, type=int)
-
-        signals = signal_api.get_high_priority_signals(hours=hours, limit=limit)
-        return jsonify({
-            "levels": [1, 2],
-            "count": len(signals),
-            "signals": signals
-        })
+        return signal_page({"levels": [1, 2]}, 30, levels=[1, 2])
 
     @app.route('/api/signals/by-level/<int:level>', methods=['GET'])
     def get_signals_by_level(level):
         """레벨별 시그널"""
         if level not in [1, 2, 3, 4]:
             return jsonify({"error": "Invalid level. Must be 1-4"}), 400
-
-        hours = request.args.get('hours', 24, type=int)
-        limit = request.args.get('limit', 50, type=int)
-
-        signals = signal_api.get_signals_by_level(level, hours=hours, limit=limit)
-        return jsonify({
-            "level": level,
-            "count": len(signals),
-            "signals": signals
-        })
+        return signal_page({"level": level}, 50, levels=[level])
 
     @app.route('/api/signals/by-symbol/<symbol>', methods=['GET'])
     def get_signals_by_symbol(symbol):
         """종목별 시그널"""
-        hours = request.args.get('hours', 24, type=int)
-        limit = request.args.get('limit', 20, type=int)
-
-        signals = signal_api.get_signals_by_symbol(symbol, hours=hours, limit=limit)
-        return jsonify({
-            "symbol": symbol,
-            "count": len(signals),
-            "signals": signals
-        })
+        return signal_page({"symbol": symbol}, 20, symbol=symbol)
 
     @app.route('/api/trending-symbols', methods=['GET'])
     def get_trending_symbols():
@@ -170,6 +165,46 @@ def create_app():
             "processed": success
         })
 
+    @app.route('/api/stream', methods=['GET'])
+    def stream_events():
+        """실시간 시그널/집계 스트림 (SSE, Last-Event-ID로 재개)"""
+        last_event_id = parse_last_event_id(
+            request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+        )
+        return Response(
+            stream_with_context(get_broadcaster().stream(last_event_id)),
+            mimetype='text/event-stream',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        )
+
+    @app.route('/api/search', methods=['GET'])
+    def search():
+        """뉴스/분석/기사 전문 검색 (bm25 순위, 스니펫, 기간/레벨 필터)"""
+        query = request.args.get('q', '', type=str).strip()
+        kind = request.args.get('type', None, type=str)
+        if not query:
+            return jsonify({"error": "q parameter is required"}), 400
+        if kind and kind not in DOC_KINDS:
+            return jsonify({"error": f"type must be one of {', '.join(DOC_KINDS)}"}), 400
+
+        results = get_search_index().search(
+            query,
+            kind=kind,
+            hours=request.args.get('hours', None, type=float),
+            since=request.args.get('since', None, type=str),
+            until=request.args.get('until', None, type=str),
+            level=request.args.get('level', None, type=int),
+            max_level=request.args.get('max_level', None, type=int),
+            symbol=request.args.get('symbol', None, type=str),
+            limit=request.args.get('limit', 20, type=int),
+            offset=request.args.get('offset', 0, type=int)
+        )
+        return jsonify({
+            "query": query,
+            "count": len(results),
+            "results": results
+        })
+
     # ==================== 기사 API ====================
 
     @app.route('/api/articles', methods=['GET'])
@@ -225,6 +260,7 @@ if __name__ == '__main__':
         sys.exit(1)
 
     app = create_app()
+    start_snapshot_writer("dashboard")
     logger.info("Starting Investment Signal Dashboard Server...")
     logger.info("API docs available at: http://localhost:5000/api/*")
 
@@ -13,7 +13,15 @@ from pathlib import Path
 from loguru import logger
 
 sys.path.append('..')
-from database.supabase_client import SupabaseClient
+from database.queries import next_cursor
+from database.storage import get_storage
+
+# 글 작성 티어별 시그널 범위: (레벨, 조회 기간 배수, 레벨별 최대 개수)
+ARTICLE_TIERS = {
+    "tier_1": ([1, 2], 1, 50),        # 긴급 + 높음
+    "tier_2": ([2, 3], 1, 50),        # 높음 + 중간
+    "tier_3": ([1, 2, 3, 4], 7, 200), # 모든 시그널 (주간)
+}
 
 
 class SignalAPI:
@@ -21,7 +29,7 @@ class SignalAPI:
 
     def __init__(self):
         try:
-            self.db = SupabaseClient()
+            self.db = get_storage()
         except Exception as e:
             logger.warning(f"Supabase client initialization failed: {e}. Article features will still work.")
             self.db = None
@@ -54,23 +62,41 @@ class SignalAPI:
         return metadata
 
     def _get_article_score(self, filename: str) -> Dict:
-        """validation_report.json에서 기사 점수 조회"""
+        """validation_report.jsonl(없으면 validation_report.json)에서 기사 점수 조회
+
+        JSONL은 기사별 결과가 한 줄씩 기록되므로 파일명이 포함된 줄만 파싱합니다.
+        """
+        report_path = os.path.join(os.path.dirname(__file__), '..', 'validation_report.json')
+        stream_path = os.path.splitext(report_path)[0] + '.jsonl'
+        result = None
+
         try:
-            report_path = os.path.join(os.path.dirname(__file__), '..', 'validation_report.json')
-            if os.path.exists(report_path):
+            if os.path.exists(stream_path):
+                needle = json.dumps(filename, ensure_ascii=False)
+                with open(stream_path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        if needle in line:
+                            candidate = json.loads(line)
+                            if candidate.get('file') == filename:
+                                result = candidate
+            elif os.path.exists(report_path):
                 with open(report_path, 'r', encoding='utf-8') as f:
                     report = json.load(f)
-                    for result in report.get('results', []):
-                        if result.get('file') == filename:
-                            return {
-                                'score': result.get('score', 0),
-                                'completion_rate': result.get('completion_rate', '0%'),
-                                'sections_passed': result.get('sections_passed', 0),
-                                'total_sections': result.get('total_sections', 0)
-                            }
+                    for candidate in report.get('results', []):
+                        if candidate.get('file') == filename:
+                            result = candidate
+                            break
         except Exception as e:
             logger.error(f"Error reading validation report: {e}")
 
+        if result:
+            return {
+                'score': result.get('score', 0),
+                'completion_rate': result.get('completion_rate', '0%'),
+                'sections_passed': result.get('sections_passed', 0),
+                'total_sections': result.get('total_sections', 0)
+            }
+
         return {'score': 0, 'completion_rate': '0%', 'sections_passed': 0, 'total_sections': 0}
 
     def get_signals_by_level(
@@ -110,10 +136,14 @@ class SignalAPI:
 
     def get_high_priority_signals(self, hours: int = 24, limit: int = 30) -> List[Dict]:
         """높은 우선순위 시그널 (Level 1-2) 조회"""
-        signals = []
-        signals.extend(self.get_signals_by_level(1, hours=hours, limit=limit))
-        signals.extend(self.get_signals_by_level(2, hours=hours, limit=limit))
-        return signals
+        try:
+            if self.db is None:
+                return []
+            return self.db.get_signals_per_level([1, 2], hours=hours, limit=limit)
+
+        except Exception as e:
+            logger.error(f"Error fetching high priority signals: {e}")
+            return []
 
     def get_signals_by_symbol(
         self,
@@ -133,6 +163,27 @@ class SignalAPI:
             logger.error(f"Error fetching signals for {symbol}: {e}")
             return []
 
+    def get_signal_page(
+        self,
+        levels: Optional[List[int]] = None,
+        symbol: Optional[str] = None,
+        hours: int = 24,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> Dict:
+        """대시보드 시그널 페이지 (최신순, 키셋 커서)
+
+        Returns:
+            {"signals": [...], "next_cursor": 다음 페이지 커서 또는 None}
+
+        Raises:
+            ValueError: 잘못된 커서
+        """
+        if self.db is None:
+            return {"signals": [], "next_cursor": None}
+        signals = self.db.get_signal_feed(levels=levels, symbol=symbol, hours=hours, limit=limit, cursor=cursor)
+        return {"signals": signals, "next_cursor": next_cursor(signals, limit)}
+
     def get_trending_symbols(self, hours: int = 24, limit: int = 15) -> List[Dict]:
         """트렌딩 종목 조회 (가장 많은 시그널 나온 종목)"""
         try:
@@ -204,26 +255,15 @@ class SignalAPI:
         tier: str = "tier_1",
         hours: int = 24
     ) -> List[Dict]:
-        """글 작성용 시그널 조회"""
+        """글 작성용 시그널 조회 (티어당 한 번의 쿼리, 레벨마다 티어 limit 개, 이미 발행된 시그널 제외)"""
         try:
             if self.db is None:
                 return []
 
-            if tier == "tier_1":
-                # 긴급 + 높음 시그널만
-                signals = self.get_signals_by_level(1, hours=hours, limit=30)
-                signals.extend(self.get_signals_by_level(2, hours=hours, limit=20))
-            elif tier == "tier_2":
-                # 높음 + 중간 시그널
-                signals = self.get_signals_by_level(2, hours=hours, limit=30)
-                signals.extend(self.get_signals_by_level(3, hours=hours, limit=20))
-            else:  # tier_3
-                # 모든 시그널
-                signals = []
-                for level in [1, 2, 3, 4]:
-                    signals.extend(self.get_signals_by_level(level, hours=hours*7, limit=50))
-
-            return signals
+            levels, hours_factor, limit = ARTICLE_TIERS.get(tier, ARTICLE_TIERS["tier_3"])
+            return self.db.get_signals_per_level(
+                levels, hours=hours * hours_factor, limit=limit, unpublished_only=True
+            )
 
         except Exception as e:
             logger.error(f"Error getting signals for article: {e}")
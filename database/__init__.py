@@ -1,6 +1,10 @@
-from .supabase_client import SupabaseClient
+from utils.lazy import lazy_exports
+
 from .models import RawNews, AnalyzedNews, PublishedArticle, PriceImpact, Importance
 
+# supabase SDK 는 SupabaseClient 를 실제로 쓸 때만 로드 (local 저장소는 필요 없음)
+__getattr__ = lazy_exports(__name__, {'SupabaseClient': '.supabase_client'})
+
 __all__ = [
     'SupabaseClient',
     'RawNews',
@@ -0,0 +1,528 @@
+"""
+뉴스 아카이브 (Parquet, 날짜/출처 파티션)
+Partitioned columnar news archive
+
+cleanup_old_news 가 24시간 지난 news_raw (와 CASCADE 로 함께 지워지는 analyzed_news)를
+삭제하기 전에, 같은 행을 로컬 Parquet 데이터셋으로 옮깁니다. tier_3 월간 리포트,
+증폭 추이, 백테스트는 Postgres 를 키우지 않고 이 아카이브를 읽습니다.
+
+레이아웃 (NEWS_ARCHIVE_DIR, Hive 파티션, zstd 압축):
+    news_raw/date=2025-11-12/source=Reuters/part-<run>-0.parquet
+    analyzed_news/date=2025-11-12/source=Reuters/part-<run>-0.parquet
+    analyzed_news_symbols/date=2025-11-12/part-<run>-0.parquet     (종목당 한 행, symbol 순 정렬)
+
+읽기는 pyarrow.dataset 필터를 씁니다. date/source 조건은 파티션 디렉토리 단위로,
+signal_level/relevance_score/symbol 조건은 Parquet row group 통계로 건너뜁니다.
+종목 조건은 analyzed_news_symbols 에서 ID 를 먼저 고른 뒤 analyzed_news 를 읽습니다
+(analyzed_news_symbols 테이블과 같은 구조).
+
+마지막으로 보관한 (created_at, id) 커서를 _state.json 에 남기므로, 아카이브 뒤 삭제가
+실패해 같은 행이 다시 조회되어도 두 번 기록하지 않습니다. 정리는 15분마다 돌기 때문에
+작은 파일이 쌓이며, compact() (매일 cleanup_job) 가 지난 날짜 파티션을 파일 하나로 합칩니다.
+
+사용법:
+    archive = NewsArchive()
+    signals = archive.read_signals(start="2025-10-01", symbols=["NVDA"], levels=[1, 2])   # pyarrow.Table
+    rows = archive.read_raw(start="2025-11-01", symbols=["TSLA"]).to_pylist()
+
+    python -m database.archive run          # 24시간 이전 뉴스 보관 (삭제는 하지 않음)
+    python -m database.archive compact
+    python -m database.archive signals --start 2025-10-01 --symbols NVDA,AMD --levels 1,2
+    python -m database.archive stats
+"""
+
+import fcntl
+import importlib.util
+import json
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+from loguru import logger
+
+from config.settings import NEWS_ARCHIVE_DIR, NEWS_ARCHIVE_ENABLED
+from database.queries import encode_cursor
+from monitoring.metrics import inc, timer
+
+# pyarrow 는 아카이브를 쓰거나 읽을 때만 import (CLI 시작 시간)
+ARCHIVE_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+DATASETS = ("news_raw", "analyzed_news", "analyzed_news_symbols")
+PARTITIONS = {
+    "news_raw": ("date", "source"),
+    "analyzed_news": ("date", "source"),
+    "analyzed_news_symbols": ("date",),
+}
+SORT_KEYS = {
+    "news_raw": [("created_at", "ascending")],
+    "analyzed_news": [("created_at", "ascending")],
+    "analyzed_news_symbols": [("symbol", "ascending"), ("created_at", "ascending")],
+}
+PAGE_SIZE = 500
+FLUSH_ROWS = 20000            # 이만큼 모이면 파일로 쓰고 커서 저장 (첫 실행의 대량 백로그 대비)
+ROW_GROUP_SIZE = 50000
+COMPRESSION = "zstd"
+
+DateLike = Union[str, date, None]
+
+
+def _schemas() -> Dict:
+    import pyarrow as pa
+
+    ts = pa.timestamp("us", tz="UTC")
+    return {
+        "news_raw": pa.schema([
+            ("id", pa.string()),
+            ("source", pa.string()),
+            ("title", pa.string()),
+            ("url", pa.string()),
+            ("content", pa.string()),
+            ("published_at", ts),
+            ("created_at", ts),
+            ("symbols", pa.list_(pa.string())),
+            ("metadata", pa.string()),
+            ("date", pa.string()),
+        ]),
+        "analyzed_news": pa.schema([
+            ("id", pa.string()),
+            ("raw_news_id", pa.string()),
+            ("source", pa.string()),
+            ("relevance_score", pa.int16()),
+            ("signal_level", pa.int8()),
+            ("affected_symbols", pa.list_(pa.string())),
+            ("price_impact", pa.string()),
+            ("importance", pa.string()),
+            ("analysis", pa.string()),
+            ("sentiment", pa.string()),
+            ("sentiment_score", pa.float64()),
+            ("has_policy_change", pa.bool_()),
+            ("policy_type", pa.string()),
+            ("created_at", ts),
+            ("date", pa.string()),
+        ]),
+        "analyzed_news_symbols": pa.schema([
+            ("symbol", pa.string()),
+            ("analyzed_id", pa.string()),
+            ("raw_news_id", pa.string()),
+            ("relevance_score", pa.int16()),
+            ("signal_level", pa.int8()),
+            ("price_impact", pa.string()),
+            ("importance", pa.string()),
+            ("created_at", ts),
+            ("date", pa.string()),
+        ]),
+    }
+
+
+def _timestamp(value) -> Optional[datetime]:
+    """ISO 문자열 → UTC datetime (시간대 없는 값은 LocalStore 처럼 로컬 시각으로 간주)"""
+    if not value:
+        return None
+    if not isinstance(value, datetime):
+        value = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    return value.astimezone(timezone.utc)
+
+
+def _json_text(value) -> Optional[str]:
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+def _date_text(value: DateLike) -> Optional[str]:
+    if value is None:
+        return None
+    return value.isoformat()[:10] if isinstance(value, (date, datetime)) else str(value)[:10]
+
+
+def to_records(row: Dict) -> Dict[str, List[Dict]]:
+    """get_news_before 행 하나 → 데이터셋별 레코드"""
+    created = _timestamp(row.get("created_at"))
+    source = row.get("source") or "unknown"
+    records = {name: [] for name in DATASETS}
+    records["news_raw"].append({
+        "id": str(row["id"]),
+        "source": source,
+        "title": row.get("title"),
+        "url": row.get("url"),
+        "content": row.get("content"),
+        "published_at": _timestamp(row.get("published_at")),
+        "created_at": created,
+        "symbols": list(row.get("symbols") or []),
+        "metadata": _json_text(row.get("metadata")),
+        "date": created.date().isoformat(),
+    })
+
+    for analyzed in row.get("analyzed_news") or []:
+        analyzed_at = _timestamp(analyzed.get("created_at")) or created
+        symbols = list(dict.fromkeys(analyzed.get("affected_symbols") or []))
+        base = {
+            "raw_news_id": str(row["id"]),
+            "relevance_score": analyzed.get("relevance_score"),
+            "signal_level": analyzed.get("signal_level") or 4,
+            "price_impact": analyzed.get("price_impact"),
+            "importance": analyzed.get("importance"),
+            "created_at": analyzed_at,
+            "date": analyzed_at.date().isoformat(),
+        }
+        records["analyzed_news"].append({
+            **base,
+            "id": str(analyzed["id"]),
+            "source": source,
+            "affected_symbols": symbols,
+            "analysis": _json_text(analyzed.get("analysis")),
+            "sentiment": analyzed.get("sentiment"),
+            "sentiment_score": analyzed.get("sentiment_score"),
+            "has_policy_change": analyzed.get("has_policy_change"),
+            "policy_type": analyzed.get("policy_type"),
+        })
+        records["analyzed_news_symbols"].extend(
+            {**base, "symbol": symbol, "analyzed_id": str(analyzed["id"])} for symbol in symbols
+        )
+    return records
+
+
+class NewsArchive:
+    """Parquet 아카이브 쓰기/읽기"""
+
+    def __init__(self, root: Union[str, Path] = NEWS_ARCHIVE_DIR):
+        if not ARCHIVE_AVAILABLE:
+            raise ImportError("pyarrow is required for the news archive. Install: pip install pyarrow")
+        import pyarrow.dataset as ds
+
+        self._ds = ds
+        self.root = Path(root)
+        self.schemas = _schemas()
+        self.state_path = self.root / "_state.json"
+
+    # ==================== 쓰기 ====================
+
+    def archive(self, db, cutoff: str) -> Dict[str, int]:
+        """
+        cutoff 이전 뉴스(+분석 결과)를 아카이브 (삭제는 호출자가 함)
+
+        Returns:
+            데이터셋별 기록한 행 수
+        """
+        counts = dict.fromkeys(DATASETS, 0)
+        started = time.perf_counter()
+        with self._locked():
+            state = self._load_state()
+            cursor = state.get("cursor")
+            buffers: Dict[str, List[Dict]] = {name: [] for name in DATASETS}
+
+            while True:
+                rows = db.get_news_before(cutoff, cursor=cursor, limit=PAGE_SIZE)
+                for row in rows:
+                    for name, records in to_records(row).items():
+                        buffers[name].extend(records)
+                if rows:
+                    cursor = encode_cursor(str(rows[-1]["created_at"]), str(rows[-1]["id"]))
+
+                done = len(rows) < PAGE_SIZE
+                if done or sum(len(records) for records in buffers.values()) >= FLUSH_ROWS:
+                    run_id = uuid.uuid4().hex[:12]
+                    for name in DATASETS:
+                        counts[name] += self._write(name, buffers[name], run_id)
+                        buffers[name] = []
+                    state["cursor"] = cursor
+                    self._save_state(state)
+                if done:
+                    break
+
+        for name, count in counts.items():
+            inc("archive_rows_total", count, dataset=name)
+        if counts["news_raw"]:
+            logger.info(
+                f"🗄️  Archived {counts['news_raw']} raw / {counts['analyzed_news']} analyzed news "
+                f"to {self.root} in {time.perf_counter() - started:.1f}s"
+            )
+        return counts
+
+    def _write(self, name: str, records: List[Dict], run_id: str) -> int:
+        if not records:
+            return 0
+        import pyarrow as pa
+
+        table = pa.Table.from_pylist(records, schema=self.schemas[name]).sort_by(SORT_KEYS[name])
+        self._ds.write_dataset(
+            table,
+            self.root / name,
+            format="parquet",
+            partitioning=self._partitioning(name),
+            basename_template=f"part-{run_id}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore",
+            file_options=self._ds.ParquetFileFormat().make_write_options(compression=COMPRESSION),
+            max_rows_per_group=ROW_GROUP_SIZE,
+        )
+        return table.num_rows
+
+    def compact(self, before: DateLike = None) -> int:
+        """
+        before(기본: 오늘, UTC) 이전 날짜 파티션의 여러 파일을 하나로 합침
+
+        새 파일을 숨김 이름(.compact-<id>.parquet)으로 쓰고, 합친 원본 파일 목록을
+        .compact-<id>.json 에 남긴 뒤 원본을 지우고 part-<id>-0.parquet 으로 이름을 바꿉니다.
+        중간에 멈추면 다음 compact 가 _recover() 로 먼저 마무리하거나 되돌립니다.
+
+        Returns:
+            합친 파티션 수
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        before = _date_text(before) or datetime.now(timezone.utc).date().isoformat()
+        compacted = 0
+        with self._locked():
+            for name in DATASETS:
+                base = self.root / name
+                if not base.exists():
+                    continue
+                for partition in sorted(p for p in base.glob("date=*") if p.is_dir()):
+                    if partition.name[len("date="):] >= before:
+                        continue
+                    leaves = [partition] if name == "analyzed_news_symbols" else [p for p in partition.iterdir() if p.is_dir()]
+                    for leaf in leaves:
+                        self._recover(leaf)
+                        files = sorted(leaf.glob("part-*.parquet"))
+                        if len(files) < 2:
+                            continue
+                        table = pa.concat_tables(pq.ParquetFile(file).read() for file in files)
+                        compact_id = uuid.uuid4().hex[:12]
+                        tmp = leaf / f".compact-{compact_id}.parquet"
+                        manifest = leaf / f".compact-{compact_id}.json"
+                        pq.write_table(table.sort_by(SORT_KEYS[name]), tmp, compression=COMPRESSION,
+                                       row_group_size=ROW_GROUP_SIZE)
+                        manifest_tmp = manifest.with_suffix(".tmp")
+                        manifest_tmp.write_text(json.dumps([file.name for file in files]), encoding="utf-8")
+                        manifest_tmp.replace(manifest)
+                        for file in files:
+                            file.unlink()
+                        tmp.rename(leaf / f"part-{compact_id}-0.parquet")
+                        manifest.unlink()
+                        compacted += 1
+        if compacted:
+            logger.info(f"🗄️  Compacted {compacted} archive partitions")
+        return compacted
+
+    def _recover(self, leaf: Path):
+        """
+        중단된 compact 정리
+
+        매니페스트가 없으면 원본을 지우기 전에 멈춘 것이므로 임시 파일을 버립니다.
+        매니페스트의 원본이 모두 남아 있으면 임시 파일을 버리고, 일부라도 지워졌으면
+        남은 원본을 마저 지운 뒤 임시 파일을 part-<id>-0.parquet 으로 옮깁니다.
+        """
+        for manifest in leaf.glob(".compact-*.json"):
+            compact_id = manifest.stem[len(".compact-"):]
+            pending = leaf / f".compact-{compact_id}.parquet"
+            sources = [leaf / source for source in json.loads(manifest.read_text(encoding="utf-8"))]
+            if pending.exists():
+                if all(source.exists() for source in sources):
+                    pending.unlink()
+                else:
+                    for source in sources:
+                        source.unlink(missing_ok=True)
+                    pending.rename(leaf / f"part-{compact_id}-0.parquet")
+                    logger.info(f"🗄️  Finished interrupted compaction in {leaf}")
+            manifest.unlink()
+        for leftover in leaf.glob(".compact-*"):
+            leftover.unlink()
+
+    # ==================== 읽기 ====================
+
+    def scan(self, name: str, filter=None, columns: Optional[List[str]] = None):
+        """데이터셋 읽기 (filter: pyarrow.dataset 식, 파티션/row group 단위로 건너뜀)"""
+        path = self.root / name
+        if not path.exists():
+            empty = self.schemas[name].empty_table()
+            return empty.select(columns) if columns else empty
+        with self._locked(shared=True), timer("archive_scan_seconds", dataset=name):
+            dataset = self._ds.dataset(path, format="parquet", partitioning=self._partitioning(name))
+            return dataset.to_table(columns=columns, filter=filter)
+
+    def read_raw(self, start: DateLike = None, end: DateLike = None, sources: Optional[Iterable[str]] = None,
+                 symbols: Optional[Iterable[str]] = None, columns: Optional[List[str]] = None, ids=None):
+        """원본 뉴스 (start/end: 날짜, 양 끝 포함, ids: news_raw.id 목록) → pyarrow.Table"""
+        field = self._ds.field
+        condition = self._date_filter(start, end)
+        if sources:
+            condition = _and(condition, field("source").isin(list(sources)))
+        if ids is not None:
+            condition = _and(condition, field("id").isin(ids))
+        if not symbols:
+            return self.scan("news_raw", condition, columns)
+
+        # symbols 는 리스트 컬럼이라 통계로 거를 수 없으므로 읽은 뒤 거름
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        wanted = [s.upper() for s in symbols]
+        read_columns = None if columns is None else list(dict.fromkeys(columns + ["symbols"]))
+        table = self.scan("news_raw", condition, read_columns)
+        flat = pc.list_flatten(table.column("symbols"))
+        parents = pc.list_parent_indices(table.column("symbols"))
+        rows = pc.unique(pc.filter(parents, pc.is_in(flat, value_set=pa.array(wanted))))
+        table = table.take(pc.sort_indices(rows))
+        return table.select(columns) if columns else table
+
+    def read_signals(self, start: DateLike = None, end: DateLike = None, symbols: Optional[Iterable[str]] = None,
+                     levels: Optional[Iterable[int]] = None, min_score: Optional[int] = None,
+                     sources: Optional[Iterable[str]] = None, columns: Optional[List[str]] = None):
+        """분석 결과 (날짜/종목/시그널 레벨/점수 조건) → pyarrow.Table"""
+        field = self._ds.field
+        condition = self._date_filter(start, end)
+        if levels:
+            condition = _and(condition, field("signal_level").isin(list(levels)))
+        if min_score is not None:
+            condition = _and(condition, field("relevance_score") >= min_score)
+
+        if symbols:
+            symbol_condition = _and(condition, field("symbol").isin([s.upper() for s in symbols]))
+            ids = self.scan("analyzed_news_symbols", symbol_condition, ["analyzed_id"]).column("analyzed_id")
+            import pyarrow.compute as pc
+            condition = _and(condition, field("id").isin(pc.unique(ids)))
+        if sources:
+            condition = _and(condition, field("source").isin(list(sources)))
+        return self.scan("analyzed_news", condition, columns)
+
+    def stats(self) -> Dict[str, Dict]:
+        """데이터셋별 파일 수/크기/행 수/날짜 범위"""
+        result = {}
+        for name in DATASETS:
+            path = self.root / name
+            with self._locked(shared=True):
+                files = list(path.rglob("part-*.parquet")) if path.exists() else []
+                size = sum(f.stat().st_size for f in files)
+            dates = sorted({f.relative_to(path).parts[0][len("date="):] for f in files})
+            result[name] = {
+                "files": len(files),
+                "bytes": size,
+                "rows": self.scan(name, columns=[]).num_rows if files else 0,
+                "first_date": dates[0] if dates else None,
+                "last_date": dates[-1] if dates else None,
+            }
+        return result
+
+    # ==================== 내부 ====================
+
+    def _partitioning(self, name: str):
+        import pyarrow as pa
+        return self._ds.partitioning(
+            pa.schema([(field, pa.string()) for field in PARTITIONS[name]]), flavor="hive"
+        )
+
+    def _date_filter(self, start: DateLike, end: DateLike):
+        field = self._ds.field
+        condition = None
+        if start is not None:
+            condition = field("date") >= _date_text(start)
+        if end is not None:
+            condition = _and(condition, field("date") <= _date_text(end))
+        return condition
+
+    def _load_state(self) -> Dict:
+        try:
+            return json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save_state(self, state: Dict):
+        tmp = self.state_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(state, indent=2), encoding="utf-8")
+        tmp.replace(self.state_path)
+
+    @contextmanager
+    def _locked(self, shared: bool = False):
+        """
+        여러 프로세스(스케줄러, 수동 실행, 대시보드)가 겹치지 않도록 파일 잠금
+
+        쓰기(archive/compact)는 배타 잠금, 읽기(scan)는 공유 잠금이라 compact 가 지우는
+        파일을 읽거나 원본과 합친 파일을 함께 읽지 않습니다.
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.root / "_lock", "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def _and(left, right):
+    return right if left is None else left & right
+
+
+def archive_expiring_news(db, cutoff: str) -> bool:
+    """
+    cleanup_old_news 에서 삭제 직전에 호출
+
+    Returns:
+        True 면 삭제 진행 (보관 성공, 아카이브 비활성, pyarrow 미설치), False 면 이번 삭제를 건너뜀
+    """
+    if not NEWS_ARCHIVE_ENABLED:
+        return True
+    if not ARCHIVE_AVAILABLE:
+        logger.warning("pyarrow not installed, deleting old news without archiving. Install: pip install pyarrow")
+        return True
+    try:
+        with timer("archive_seconds"):
+            NewsArchive().archive(db, cutoff)
+        return True
+    except Exception as e:
+        inc("archive_errors_total")
+        logger.error(f"News archive failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+
+    parser = argparse.ArgumentParser(description="뉴스 Parquet 아카이브")
+    parser.add_argument("--root", default=NEWS_ARCHIVE_DIR, help="아카이브 디렉토리")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = sub.add_parser("run", help="cutoff 이전 뉴스 보관 (삭제하지 않음)")
+    run_parser.add_argument("--storage", help="supabase | local | cached (기본: STORAGE_BACKEND)")
+    run_parser.add_argument("--hours", type=int, default=24, help="이보다 오래된 뉴스 보관")
+
+    compact_parser = sub.add_parser("compact", help="지난 날짜 파티션 파일 합치기")
+    compact_parser.add_argument("--before", help="이 날짜 이전 파티션만 (기본: 오늘)")
+
+    signals_parser = sub.add_parser("signals", help="보관된 시그널 조회")
+    signals_parser.add_argument("--start")
+    signals_parser.add_argument("--end")
+    signals_parser.add_argument("--symbols", help="쉼표 구분")
+    signals_parser.add_argument("--levels", help="쉼표 구분 (예: 1,2)")
+    signals_parser.add_argument("--min-score", type=int)
+    signals_parser.add_argument("--limit", type=int, default=20, help="출력할 행 수")
+
+    sub.add_parser("stats", help="데이터셋 요약")
+    args = parser.parse_args()
+
+    archive = NewsArchive(args.root)
+    if args.command == "run":
+        from database.storage import cleanup_cutoff, get_storage
+        print(json.dumps(archive.archive(get_storage(args.storage), cleanup_cutoff(args.hours)), indent=2))
+    elif args.command == "compact":
+        print(f"Compacted {archive.compact(args.before)} partitions")
+    elif args.command == "signals":
+        started = time.perf_counter()
+        table = archive.read_signals(
+            start=args.start, end=args.end,
+            symbols=args.symbols.split(",") if args.symbols else None,
+            levels=[int(level) for level in args.levels.split(",")] if args.levels else None,
+            min_score=args.min_score,
+            columns=["created_at", "signal_level", "relevance_score", "affected_symbols", "price_impact", "source"],
+        )
+        print(f"{table.num_rows} signals in {time.perf_counter() - started:.2f}s")
+        for row in table.slice(0, args.limit).to_pylist():
+            print(json.dumps(row, default=str, ensure_ascii=False))
+    else:
+        print(json.dumps(archive.stats(), indent=2))
@@ -0,0 +1,618 @@
+"""
+내장 SQLite 저장소
+Embedded local storage backend
+
+database/schema.sql 을 SQLite 문법으로 변환해 적용하고, SupabaseClient와 같은
+메서드를 로컬 디스크에서 제공합니다.
+
+- 배열/JSONB 컬럼은 JSON 텍스트로 저장
+- 종목 조회용 보조 테이블(analyzed_news_symbols)과 (symbol, created_at) 인덱스
+  → Postgres GIN 인덱스 대신 종목별 조회/트렌딩 집계가 인덱스를 탐
+- insert_*_many 는 한 트랜잭션으로 일괄 기록
+
+단독 저장소(STORAGE_BACKEND=local)나 Supabase 앞단 캐시(STORAGE_BACKEND=cached)로 사용합니다.
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+from loguru import logger
+
+from database.models import RawNews, AnalyzedNews, PublishedArticle
+from database.queries import (
+    ARTICLE_COLUMNS, HIGH_RELEVANCE_COLUMNS, RAW_SUMMARY_COLUMNS, SIGNAL_COLUMNS,
+    decode_cursor, format_dashboard_article, sql_columns,
+)
+from database.storage import COUNTABLE_TABLES, StorageBackend, cleanup_cutoff
+
+SCHEMA_PATH = Path(__file__).parent / "schema.sql"
+DEFAULT_PATH = Path(__file__).parent.parent / ".cache" / "local_store.sqlite"
+
+# schema.sql 에 없지만 분석/대시보드가 사용하는 컬럼
+EXTRA_COLUMNS = {
+    "analyzed_news": {
+        "signal_level": "INTEGER DEFAULT 4",
+        "sentiment": "TEXT",
+        "sentiment_score": "REAL",
+        "has_policy_change": "INTEGER DEFAULT 0",
+        "policy_type": "TEXT",
+    },
+}
+
+EXTRA_DDL = """
+CREATE TABLE IF NOT EXISTS analyzed_news_symbols (
+  analyzed_id TEXT NOT NULL REFERENCES analyzed_news(id) ON DELETE CASCADE,
+  symbol TEXT NOT NULL,
+  created_at TEXT NOT NULL,
+  PRIMARY KEY (analyzed_id, symbol)
+);
+CREATE INDEX IF NOT EXISTS idx_analyzed_news_symbols_symbol ON analyzed_news_symbols(symbol, created_at);
+CREATE INDEX IF NOT EXISTS idx_analyzed_news_symbols_keyset
+  ON analyzed_news_symbols(symbol, created_at DESC, analyzed_id DESC);
+CREATE INDEX IF NOT EXISTS idx_analyzed_news_symbols_created ON analyzed_news_symbols(created_at);
+CREATE INDEX IF NOT EXISTS idx_analyzed_news_level ON analyzed_news(signal_level, created_at);
+
+-- analyzed_news_ids 배열 → published_article_signals 동기화 (Postgres 트리거와 동일)
+CREATE TRIGGER IF NOT EXISTS trg_published_article_signals
+AFTER INSERT ON published_articles
+BEGIN
+  INSERT OR IGNORE INTO published_article_signals (article_id, analyzed_news_id, created_at)
+  SELECT NEW.id, j.value, NEW.created_at FROM json_each(COALESCE(NEW.analyzed_news_ids, '[]')) j;
+END;
+"""
+
+# 기존 데이터를 한 번만 고치는 마이그레이션 (전체 테이블 스캔, PRAGMA user_version 으로 적용 여부 기록)
+MIGRATIONS = [
+    # 1: 원본 뉴스당 분석 결과 한 행 (upsert 키, 이전 비고유 인덱스/중복 정리)
+    """
+    DROP INDEX IF EXISTS idx_analyzed_news_raw;
+    DELETE FROM analyzed_news WHERE rowid NOT IN (SELECT MAX(rowid) FROM analyzed_news GROUP BY raw_news_id);
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_analyzed_news_raw_unique ON analyzed_news(raw_news_id);
+    """,
+    # 2: 트리거 이전에 발행된 글의 published_article_signals 채우기
+    """
+    INSERT OR IGNORE INTO published_article_signals (article_id, analyzed_news_id, created_at)
+    SELECT p.id, j.value, p.created_at FROM published_articles p, json_each(COALESCE(p.analyzed_news_ids, '[]')) j;
+    """,
+]
+
+# 글로 발행되지 않은 분석 뉴스 (a = analyzed_news 별칭)
+UNPUBLISHED_CONDITION = (
+    "NOT EXISTS (SELECT 1 FROM published_article_signals p WHERE p.analyzed_news_id = a.id)"
+)
+
+JSON_COLUMNS = {
+    "news_raw": ("symbols", "metadata"),
+    "analyzed_news": ("affected_symbols", "analysis"),
+    "published_articles": ("analyzed_news_ids", "metadata"),
+}
+
+_TYPE_REPLACEMENTS = [
+    (re.compile(r"\s+DEFAULT gen_random_uuid\(\)", re.I), ""),
+    (re.compile(r"DEFAULT NOW\(\)", re.I), "DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime'))"),
+    (re.compile(r"\b(?:UUID|TEXT)\[\]", re.I), "TEXT"),
+    (re.compile(r"\b(?:UUID|TIMESTAMPTZ|JSONB)\b", re.I), "TEXT"),
+    (re.compile(r"\bDECIMAL\(\d+,\s*\d+\)", re.I), "REAL"),
+    (re.compile(r"USING GIN\s*\(", re.I), "("),
+    (re.compile(r"\s+INCLUDE\s*\([^)]*\)", re.I), ""),  # 커버링 컬럼은 SQLite 미지원 (키만 사용)
+]
+
+
+def translate_schema(sql: str) -> List[str]:
+    """
+    Postgres 스키마에서 테이블/인덱스 정의만 골라 SQLite 문법으로 변환
+
+    함수, 뷰, RLS 정책, DO 블록처럼 SQLite에 대응 개념이 없는 구문은 건너뜁니다.
+    """
+    sql = re.sub(r"\$\$.*?\$\$", "", sql, flags=re.S)
+    sql = re.sub(r"--[^\n]*", "", sql)
+
+    statements, tables = [], set()
+    for statement in (s.strip() for s in sql.split(";")):
+        table = re.match(r"CREATE TABLE IF NOT EXISTS (\w+)", statement, re.I)
+        index = re.match(r"CREATE INDEX IF NOT EXISTS \w+ ON (\w+)", statement, re.I)
+        if table:
+            tables.add(table.group(1))
+        elif not (index and index.group(1) in tables):
+            continue
+        for pattern, replacement in _TYPE_REPLACEMENTS:
+            statement = pattern.sub(replacement, statement)
+        statements.append(statement)
+    return statements
+
+
+def _now() -> str:
+    return datetime.now().isoformat()
+
+
+def _json(value: Any) -> Optional[str]:
+    return None if value is None else json.dumps(value, ensure_ascii=False, default=str)
+
+
+class LocalStore(StorageBackend):
+    """SQLite 기반 저장소 (SupabaseClient와 같은 메서드)"""
+
+    def __init__(self, path: Path = DEFAULT_PATH, schema_path: Path = SCHEMA_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._batch_depth = 0
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._apply_schema(Path(schema_path))
+        logger.info(f"Local store initialized ({self.path})")
+
+    def _apply_schema(self, schema_path: Path):
+        statements = translate_schema(schema_path.read_text(encoding="utf-8"))
+        tables = [s for s in statements if s.upper().startswith("CREATE TABLE")]
+        indexes = [s for s in statements if not s.upper().startswith("CREATE TABLE")]
+        with self._lock:
+            for statement in tables:
+                self._conn.execute(statement)
+            # 인덱스가 signal_level 등 추가 컬럼을 참조하므로 컬럼을 먼저 추가
+            for table, columns in EXTRA_COLUMNS.items():
+                existing = {row["name"] for row in self._conn.execute(f"PRAGMA table_info({table})")}
+                for name, ddl in columns.items():
+                    if name not in existing:
+                        self._conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {ddl}")
+            for statement in indexes:
+                self._conn.execute(statement)
+            self._conn.executescript(EXTRA_DDL)
+            self._conn.commit()
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            for number, script in enumerate(MIGRATIONS[version:], version + 1):
+                self._conn.executescript(f"BEGIN;\n{script}\nPRAGMA user_version = {number};\nCOMMIT;")
+                logger.info(f"Local store migrated to version {number}")
+
+    # ==================== 내부 도우미 ====================
+
+    @contextmanager
+    def batch(self):
+        """블록 안의 쓰기를 한 트랜잭션으로 묶음"""
+        with self._lock:
+            self._batch_depth += 1
+            try:
+                yield self
+            except Exception:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self._conn.rollback()
+                raise
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._conn.commit()
+
+    def _commit(self):
+        if self._batch_depth == 0:
+            self._conn.commit()
+
+    def _query(self, sql: str, params: Iterable = ()) -> List[Dict]:
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, tuple(params))]
+
+    @staticmethod
+    def _decode(table: str, row: Dict) -> Dict:
+        for column in JSON_COLUMNS.get(table, ()):
+            if row.get(column) is not None:
+                row[column] = json.loads(row[column])
+        if "has_policy_change" in row and row["has_policy_change"] is not None:
+            row["has_policy_change"] = bool(row["has_policy_change"])
+        return row
+
+    def _select_analyzed(self, where: str = "1=1", params: Iterable = (), order: str = "a.created_at DESC",
+                         limit: Optional[int] = None, join: str = "", columns: Optional[Iterable[str]] = None,
+                         raw_columns: Optional[Iterable[str]] = None) -> List[Dict]:
+        """
+        analyzed_news 조회 + news_raw 내장 (Supabase의 select("..., news_raw(...)")와 같은 모양)
+
+        columns/raw_columns 를 주면 해당 컬럼만 읽습니다 (None 이면 전체).
+        """
+        projection = sql_columns(columns, "a") if columns else "a.*"
+        if columns and "raw_news_id" not in columns:
+            projection += ", a.raw_news_id"
+        raw_projection = ", ".join(raw_columns) if raw_columns else "*"
+
+        sql = f"SELECT {projection} FROM analyzed_news a {join} WHERE {where} ORDER BY {order}"
+        params = list(params)
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        rows = [self._decode("analyzed_news", row) for row in self._query(sql, params)]
+
+        raw_ids = list({row["raw_news_id"] for row in rows if row.get("raw_news_id")})
+        raw_by_id = {}
+        if raw_ids:
+            placeholders = ", ".join("?" * len(raw_ids))
+            raw_by_id = {
+                raw["id"]: self._decode("news_raw", raw)
+                for raw in self._query(f"SELECT {raw_projection} FROM news_raw WHERE id IN ({placeholders})", raw_ids)
+            }
+        for row in rows:
+            row["news_raw"] = raw_by_id.get(row.get("raw_news_id"))
+        return rows
+
+    # ==================== Raw News Operations ====================
+
+    def insert_raw_news(self, news: RawNews, news_id: Optional[str] = None) -> Optional[str]:
+        """원본 뉴스 저장"""
+        try:
+            data = news.to_dict()
+            news_id = news_id or str(uuid.uuid4())
+            with self._lock:
+                self._conn.execute(
+                    "INSERT INTO news_raw (id, source, title, url, content, published_at, created_at, symbols, metadata) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (news_id, data["source"], data["title"], data["url"], data["content"], data["published_at"],
+                     _now(), _json(data["symbols"]), _json(data["metadata"]))
+                )
+                self._commit()
+            self._update_search_index("index_raw_news", data, news_id)
+            return news_id
+        except Exception as e:
+            logger.error(f"Failed to insert raw news locally: {e}")
+            return None
+
+    def insert_raw_news_many(self, news_list: List[RawNews]) -> List[Optional[str]]:
+        """원본 뉴스 일괄 저장 (한 트랜잭션)"""
+        with self.batch():
+            ids = [self.insert_raw_news(news) for news in news_list]
+        logger.info(f"Inserted {sum(1 for i in ids if i)} raw news locally")
+        return ids
+
+    def get_raw_news_by_url(self, url: str) -> Optional[Dict]:
+        """URL로 뉴스 중복 확인"""
+        rows = self._query("SELECT * FROM news_raw WHERE url = ?", (url,))
+        return self._decode("news_raw", rows[0]) if rows else None
+
+    def get_unanalyzed_news(self, limit: int = 50) -> List[Dict]:
+        """분석되지 않은 뉴스 (24시간 이내)"""
+        cutoff_time = (datetime.now() - timedelta(hours=24)).isoformat()
+        rows = self._query(
+            "SELECT r.* FROM news_raw r WHERE r.created_at >= ? "
+            "AND NOT EXISTS (SELECT 1 FROM analyzed_news a WHERE a.raw_news_id = r.id) "
+            "ORDER BY r.created_at LIMIT ?",
+            (cutoff_time, limit)
+        )
+        logger.info(f"Found {len(rows)} unanalyzed news items")
+        return [self._decode("news_raw", row) for row in rows]
+
+    def get_news_before(self, cutoff: str, cursor: Optional[str] = None, limit: int = 500) -> List[Dict]:
+        """cutoff 이전 원본 뉴스 + 분석 결과 (아카이브용, 키셋 오름차순)"""
+        where, params = "created_at < ?", [cutoff]
+        if cursor:
+            created_at, row_id = decode_cursor(cursor)
+            where += " AND (created_at > ? OR (created_at = ? AND id > ?))"
+            params += [created_at, created_at, row_id]
+        rows = [
+            self._decode("news_raw", row)
+            for row in self._query(f"SELECT * FROM news_raw WHERE {where} ORDER BY created_at, id LIMIT ?", params + [limit])
+        ]
+
+        analyzed: Dict[str, List[Dict]] = {}
+        if rows:
+            ids = [row["id"] for row in rows]
+            placeholders = ", ".join("?" * len(ids))
+            for row in self._query(f"SELECT * FROM analyzed_news WHERE raw_news_id IN ({placeholders})", ids):
+                analyzed.setdefault(row["raw_news_id"], []).append(self._decode("analyzed_news", row))
+        for row in rows:
+            row["analyzed_news"] = analyzed.get(row["id"], [])
+        return rows
+
+    def cleanup_old_news(self, cutoff: Optional[str] = None, archive: bool = True):
+        """24시간 이상 된 원본 뉴스 삭제 (분석 결과는 FK CASCADE로 함께 삭제, archive=True 면 먼저 보관)"""
+        cutoff_time = cutoff or cleanup_cutoff()
+        if archive and not self._archive_before_cleanup(cutoff_time):
+            return
+        with self._lock:
+            count = self._conn.execute("DELETE FROM news_raw WHERE created_at < ?", (cutoff_time,)).rowcount
+            self._commit()
+        logger.info(f"Cleaned up {count} old news items (local)")
+
+    # ==================== Analyzed News Operations ====================
+
+    def insert_analyzed_news(self, news: AnalyzedNews, news_id: Optional[str] = None) -> Optional[str]:
+        """분석된 뉴스 저장"""
+        try:
+            data = news.to_dict()
+            news_id = news_id or str(uuid.uuid4())
+            created_at = _now()
+            with self._lock:
+                self._conn.execute(
+                    "INSERT INTO analyzed_news (id, raw_news_id, relevance_score, affected_symbols, price_impact, "
+                    "importance, analysis, signal_level, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (news_id, data["raw_news_id"], data["relevance_score"], _json(data["affected_symbols"]),
+                     data["price_impact"], data["importance"], _json(data["analysis"]), data["signal_level"],
+                     created_at)
+                )
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO analyzed_news_symbols (analyzed_id, symbol, created_at) VALUES (?, ?, ?)",
+                    [(news_id, symbol, created_at) for symbol in data["affected_symbols"] or []]
+                )
+                self._commit()
+            self._update_search_index("index_analysis", data)
+            return news_id
+        except Exception as e:
+            logger.error(f"Failed to insert analyzed news locally: {e}")
+            return None
+
+    def insert_analyzed_news_many(self, news_list: List[AnalyzedNews]) -> List[Optional[str]]:
+        """분석 결과 일괄 저장 (한 트랜잭션)"""
+        with self.batch():
+            ids = [self.insert_analyzed_news(news) for news in news_list]
+        logger.info(f"Inserted {sum(1 for i in ids if i)} analyzed news locally")
+        return ids
+
+    def upsert_analyzed_news(self, news: AnalyzedNews, news_id: Optional[str] = None) -> Optional[str]:
+        """
+        분석 결과 저장 또는 갱신 (raw_news_id 기준, 처음 저장 시각 유지)
+
+        news_id 를 주면 (캐시 미러) 같은 원본 뉴스의 다른 ID 행을 지우고 그 ID 로 저장합니다.
+        """
+        try:
+            data = news.to_dict()
+            with self._lock:
+                if news_id:
+                    self._conn.execute("DELETE FROM analyzed_news WHERE raw_news_id = ? AND id != ?",
+                                       (data["raw_news_id"], news_id))
+                row = self._conn.execute(
+                    "INSERT INTO analyzed_news (id, raw_news_id, relevance_score, affected_symbols, price_impact, "
+                    "importance, analysis, signal_level, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(raw_news_id) DO UPDATE SET relevance_score = excluded.relevance_score, "
+                    "affected_symbols = excluded.affected_symbols, price_impact = excluded.price_impact, "
+                    "importance = excluded.importance, analysis = excluded.analysis, "
+                    "signal_level = excluded.signal_level "
+                    "RETURNING id, created_at",
+                    (news_id or str(uuid.uuid4()), data["raw_news_id"], data["relevance_score"],
+                     _json(data["affected_symbols"]), data["price_impact"], data["importance"],
+                     _json(data["analysis"]), data["signal_level"], _now())
+                ).fetchone()
+                self._conn.execute("DELETE FROM analyzed_news_symbols WHERE analyzed_id = ?", (row["id"],))
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO analyzed_news_symbols (analyzed_id, symbol, created_at) VALUES (?, ?, ?)",
+                    [(row["id"], symbol, row["created_at"]) for symbol in data["affected_symbols"] or []]
+                )
+                self._commit()
+            self._update_search_index("index_analysis", data)
+            return row["id"]
+        except Exception as e:
+            logger.error(f"Failed to upsert analyzed news locally ({news.raw_news_id}): {e}")
+            return None
+
+    def upsert_analyzed_news_many(self, news_list: List[AnalyzedNews]) -> List[Optional[str]]:
+        """분석 결과 일괄 upsert (한 트랜잭션)"""
+        with self.batch():
+            return [self.upsert_analyzed_news(news) for news in news_list]
+
+    def get_high_relevance_news(self, min_score: int = 70, limit: int = 20) -> List[Dict]:
+        """높은 관련성 점수의 뉴스"""
+        return self._select_analyzed("a.relevance_score >= ?", (min_score,),
+                                     order="a.relevance_score DESC", limit=limit,
+                                     columns=HIGH_RELEVANCE_COLUMNS, raw_columns=RAW_SUMMARY_COLUMNS)
+
+    def get_unpublished_news_by_symbol(self, symbol: str, limit: int = 5) -> List[Dict]:
+        """특정 종목 관련 미발행 뉴스"""
+        return self._select_analyzed(
+            f"s.symbol = ? AND {UNPUBLISHED_CONDITION}",
+            (symbol,),
+            join="JOIN analyzed_news_symbols s ON s.analyzed_id = a.id",
+            limit=limit
+        )
+
+    # ==================== Published Articles Operations ====================
+
+    def insert_published_article(self, article: PublishedArticle,
+                                 article_id: Optional[str] = None) -> Optional[str]:
+        """블로그 글 저장"""
+        try:
+            data = article.to_dict()
+            article_id = article_id or str(uuid.uuid4())
+            with self._lock:
+                self._conn.execute(
+                    "INSERT INTO published_articles (id, title, content, analyzed_news_ids, wordpress_id, "
+                    "published_at, views, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (article_id, data["title"], data["content"], _json(data["analyzed_news_ids"]),
+                     data["wordpress_id"], data["published_at"], data["views"], _now())
+                )
+                self._commit()
+            return article_id
+        except Exception as e:
+            logger.error(f"Failed to insert published article locally: {e}")
+            return None
+
+    def get_recent_articles(self, days: int = 7, limit: int = 10) -> List[Dict]:
+        """최근 발행된 글"""
+        cutoff_time = (datetime.now() - timedelta(days=days)).isoformat()
+        rows = self._query(
+            "SELECT * FROM published_articles WHERE created_at >= ? ORDER BY created_at DESC LIMIT ?",
+            (cutoff_time, limit)
+        )
+        return [self._decode("published_articles", row) for row in rows]
+
+    # ==================== Investment Signal Dashboard Operations ====================
+
+    def get_signals_by_level(self, level: int, hours: int = 24, limit: int = 50) -> List[Dict]:
+        """신호 레벨별 조회"""
+        cutoff_time = (datetime.now() - timedelta(hours=hours)).isoformat()
+        return self._select_analyzed("a.signal_level = ? AND a.created_at >= ?", (level, cutoff_time),
+                                     order="a.relevance_score DESC", limit=limit,
+                                     columns=SIGNAL_COLUMNS, raw_columns=RAW_SUMMARY_COLUMNS)
+
+    def get_signals_by_symbol(self, symbol: str, hours: int = 24, limit: int = 20) -> List[Dict]:
+        """종목별 신호 조회"""
+        cutoff_time = (datetime.now() - timedelta(hours=hours)).isoformat()
+        return self._select_analyzed(
+            "s.symbol = ? AND s.created_at >= ?", (symbol, cutoff_time),
+            join="JOIN analyzed_news_symbols s ON s.analyzed_id = a.id",
+            order="a.signal_level DESC, a.relevance_score DESC",
+            limit=limit,
+            columns=SIGNAL_COLUMNS,
+            raw_columns=RAW_SUMMARY_COLUMNS
+        )
+
+    def get_signals_by_levels(self, levels: List[int], hours: int = 24, limit: int = 50,
+                              symbol: Optional[str] = None, unpublished_only: bool = False) -> List[Dict]:
+        """여러 레벨의 시그널 (레벨 → 관련성 순, 한 번의 쿼리)"""
+        cutoff_time = (datetime.now() - timedelta(hours=hours)).isoformat()
+        conditions = [f"a.signal_level IN ({', '.join('?' * len(levels))})", "a.created_at >= ?"]
+        params, join = [*levels, cutoff_time], ""
+        if symbol:
+            join = "JOIN analyzed_news_symbols s ON s.analyzed_id = a.id"
+            conditions.append("s.symbol = ?")
+            params.append(symbol)
+        if unpublished_only:
+            conditions.append(UNPUBLISHED_CONDITION)
+
+        return self._select_analyzed(
+            " AND ".join(conditions), params, join=join,
+            order="a.signal_level, a.relevance_score DESC", limit=limit,
+            columns=SIGNAL_COLUMNS, raw_columns=RAW_SUMMARY_COLUMNS
+        )
+
+    def get_signals_per_level(self, levels: List[int], hours: int = 24, limit: int = 50,
+                              symbol: Optional[str] = None, unpublished_only: bool = False) -> List[Dict]:
+        """레벨마다 관련성 상위 limit 개 (ROW_NUMBER 윈도, 한 번의 쿼리)"""
+        cutoff_time = (datetime.now() - timedelta(hours=hours)).isoformat()
+        conditions = [f"a.signal_level IN ({', '.join('?' * len(levels))})", "a.created_at >= ?"]
+        params, join = [*levels, cutoff_time], ""
+        if symbol:
+            join = "JOIN analyzed_news_symbols s ON s.analyzed_id = a.id"
+            conditions.append("s.symbol = ?")
+            params.append(symbol)
+        if unpublished_only:
+            conditions.append(UNPUBLISHED_CONDITION)
+
+        ranked = (
+            "SELECT a.id, ROW_NUMBER() OVER (PARTITION BY a.signal_level "
+            "ORDER BY a.relevance_score DESC, a.created_at DESC) AS level_rank "
+            f"FROM analyzed_news a {join} WHERE {' AND '.join(conditions)}"
+        )
+        return self._select_analyzed(
+            f"a.id IN (SELECT id FROM ({ranked}) WHERE level_rank <= ?)", [*params, limit],
+            order="a.signal_level, a.relevance_score DESC",
+            columns=SIGNAL_COLUMNS, raw_columns=RAW_SUMMARY_COLUMNS
+        )
+
+    def get_signal_feed(self, levels: Optional[List[int]] = None, symbol: Optional[str] = None,
+                        hours: int = 24, limit: int = 50, cursor: Optional[str] = None) -> List[Dict]:
+        """대시보드 시그널 목록 (최신순, 키셋 커서)"""
+        cutoff_time = (datetime.now() - timedelta(hours=hours)).isoformat()
+        # 종목 필터는 보조 테이블의 (symbol, created_at, analyzed_id) 인덱스로 키셋 탐색
+        key = ("s.created_at", "s.analyzed_id") if symbol else ("a.created_at", "a.id")
+        conditions, params, join = [f"{key[0]} >= ?"], [cutoff_time], ""
+        if symbol:
+            join = "JOIN analyzed_news_symbols s ON s.analyzed_id = a.id"
+            conditions.append("s.symbol = ?")
+            params.append(symbol)
+        if levels:
+            conditions.append(f"a.signal_level IN ({', '.join('?' * len(levels))})")
+            params.extend(levels)
+        if cursor:
+            conditions.append(f"({', '.join(key)}) < (?, ?)")
+            params.extend(decode_cursor(cursor))
+
+        return self._select_analyzed(
+            " AND ".join(conditions), params, join=join,
+            order=", ".join(f"{column} DESC" for column in key),
+            limit=limit, columns=SIGNAL_COLUMNS, raw_columns=RAW_SUMMARY_COLUMNS
+        )
+
+    def get_trending_symbols(self, hours: int = 24, limit: int = 15) -> List[Dict]:
+        """트렌딩 종목 (가장 많은 시그널)"""
+        cutoff_time = (datetime.now() - timedelta(hours=hours)).isoformat()
+        return self._query(
+            """SELECT s.symbol AS symbol,
+                      COUNT(*) AS count,
+                      AVG(COALESCE(a.relevance_score, 0)) AS avg_score,
+                      SUM(a.signal_level = 1) AS urgency_count
+               FROM analyzed_news_symbols s JOIN analyzed_news a ON a.id = s.analyzed_id
+               WHERE s.created_at >= ?
+               GROUP BY s.symbol
+               ORDER BY urgency_count DESC, count DESC, avg_score DESC
+               LIMIT ?""",
+            (cutoff_time, limit)
+        )
+
+    def get_price_impact_summary(self, hours: int = 24) -> Dict:
+        """가격 영향도 요약"""
+        cutoff_time = (datetime.now() - timedelta(hours=hours)).isoformat()
+        summary = {"up": 0, "down": 0, "neutral": 0}
+        for row in self._query(
+            "SELECT price_impact, COUNT(*) AS n FROM analyzed_news WHERE created_at >= ? GROUP BY price_impact",
+            (cutoff_time,)
+        ):
+            if row["price_impact"] in summary:
+                summary[row["price_impact"]] = row["n"]
+        return summary
+
+    def get_important_symbols_today(self) -> List[Dict]:
+        """오늘 주목할 종목 (Level 1-2 신호 있는 종목)"""
+        cutoff_time = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0).isoformat()
+        return self._query(
+            """SELECT s.symbol AS symbol,
+                      COUNT(*) AS signals,
+                      MAX(COALESCE(a.relevance_score, 0)) AS max_score,
+                      SUM(a.signal_level = 1) AS urgent_count
+               FROM analyzed_news_symbols s JOIN analyzed_news a ON a.id = s.analyzed_id
+               WHERE s.created_at >= ? AND a.signal_level IN (1, 2)
+               GROUP BY s.symbol
+               ORDER BY urgent_count DESC, signals DESC, max_score DESC
+               LIMIT 10""",
+            (cutoff_time,)
+        )
+
+    def mark_signal_as_processed(self, signal_id: str) -> bool:
+        """시그널 처리 표시 (향후 추가 필드)"""
+        logger.info(f"Marked signal {signal_id} as processed")
+        return True
+
+    def get_dashboard_stats(self) -> Dict:
+        """대시보드 실시간 통계 (한 번의 스캔)"""
+        one_hour_ago = (datetime.now() - timedelta(hours=1)).isoformat()
+        row = self._query(
+            """SELECT COUNT(*) AS total_articles,
+                      COALESCE(SUM(relevance_score >= 80), 0) AS high_priority_count,
+                      COALESCE(SUM(has_policy_change = 1), 0) AS policy_signals,
+                      COALESCE(SUM(created_at >= ?), 0) AS last_1h_count
+               FROM analyzed_news""",
+            (one_hour_ago,)
+        )[0]
+        return {**row, "last_updated": datetime.now().isoformat()}
+
+    def count_since(self, table: str, cutoff: str) -> int:
+        """created_at >= cutoff 인 행 수"""
+        if table not in COUNTABLE_TABLES:
+            raise ValueError(f"Unknown table: {table}")
+        return self._query(f"SELECT COUNT(*) AS n FROM {table} WHERE created_at >= ?", (cutoff,))[0]["n"]
+
+    def get_articles_for_dashboard(self, limit: int = 50, min_priority: int = 0,
+                                   symbol: Optional[str] = None, cursor: Optional[str] = None) -> List[Dict]:
+        """대시보드용 기사 목록 (최신순, 키셋 커서)"""
+        key = ("a.created_at", "a.id")
+        conditions, params, join = ["1=1"], [], ""
+        if min_priority > 0:
+            conditions.append("a.relevance_score >= ?")
+            params.append(min_priority)
+        if symbol:
+            key = ("s.created_at", "s.analyzed_id")
+            join = "JOIN analyzed_news_symbols s ON s.analyzed_id = a.id"
+            conditions.append("s.symbol = ?")
+            params.append(symbol)
+        if cursor:
+            conditions.append(f"({', '.join(key)}) < (?, ?)")
+            params.extend(decode_cursor(cursor))
+
+        rows = self._select_analyzed(
+            " AND ".join(conditions), params, join=join,
+            order=", ".join(f"{column} DESC" for column in key),
+            limit=limit, columns=ARTICLE_COLUMNS, raw_columns=RAW_SUMMARY_COLUMNS
+        )
+        return [format_dashboard_article(item) for item in rows]
@@ -0,0 +1,103 @@
+-- 6대 뉴스 카테고리 테이블 자연 키 마이그레이션 (이미 배포된 DB 용)
+--
+-- news_tables_schema.sql 은 새 프로젝트용이라 기존 DB 에 다시 실행하면
+-- CREATE INDEX / CREATE POLICY 에서 멈춥니다. 이 파일은 몇 번 실행해도 안전합니다.
+--   1. event_date 컬럼 추가 + created_at 날짜로 채움
+--   2. 자연 키가 같은 중복 행 정리 (가장 최근 행만 남김)
+--   3. 자연 키 UNIQUE 인덱스 (scripts/news_collectors/upsert_writer.py NATURAL_KEYS 와 일치)
+--   4. upsert(ON CONFLICT DO UPDATE)용 UPDATE 정책
+--
+-- 실행: Supabase SQL Editor 에 붙여넣고 Run, 또는
+--   psql "$DATABASE_URL" -f database/news_tables_natural_keys_migration.sql
+--
+-- 주의: sector_news (sector, event_type, event_date), geopolitical_news (region, event_type, event_date)
+-- 키는 같은 날 같은 유형의 서로 다른 이벤트를 한 행으로 합칩니다 (중복 정리 시 최근 행만 남고,
+-- 이후 수집에서는 나중 값으로 덮어씀).
+
+BEGIN;
+
+-- ============================================================
+-- 1. event_date 컬럼 (CREATE TABLE IF NOT EXISTS는 컬럼을 추가하지 않음)
+-- ============================================================
+ALTER TABLE macro_news ADD COLUMN IF NOT EXISTS event_date DATE;
+UPDATE macro_news SET event_date = COALESCE(created_at::date, CURRENT_DATE) WHERE event_date IS NULL;
+ALTER TABLE macro_news ALTER COLUMN event_date SET DEFAULT CURRENT_DATE;
+ALTER TABLE macro_news ALTER COLUMN event_date SET NOT NULL;
+
+ALTER TABLE sector_news ADD COLUMN IF NOT EXISTS event_date DATE;
+UPDATE sector_news SET event_date = COALESCE(created_at::date, CURRENT_DATE) WHERE event_date IS NULL;
+ALTER TABLE sector_news ALTER COLUMN event_date SET DEFAULT CURRENT_DATE;
+ALTER TABLE sector_news ALTER COLUMN event_date SET NOT NULL;
+
+ALTER TABLE corporate_events ADD COLUMN IF NOT EXISTS event_date DATE;
+UPDATE corporate_events SET event_date = COALESCE(created_at::date, CURRENT_DATE) WHERE event_date IS NULL;
+ALTER TABLE corporate_events ALTER COLUMN event_date SET DEFAULT CURRENT_DATE;
+ALTER TABLE corporate_events ALTER COLUMN event_date SET NOT NULL;
+
+ALTER TABLE geopolitical_news ADD COLUMN IF NOT EXISTS event_date DATE;
+UPDATE geopolitical_news SET event_date = COALESCE(created_at::date, CURRENT_DATE) WHERE event_date IS NULL;
+ALTER TABLE geopolitical_news ALTER COLUMN event_date SET DEFAULT CURRENT_DATE;
+ALTER TABLE geopolitical_news ALTER COLUMN event_date SET NOT NULL;
+
+
+-- ============================================================
+-- 2. 중복 정리 + 3. 자연 키 인덱스
+-- ============================================================
+DELETE FROM macro_news a USING macro_news b
+WHERE (a.created_at, a.id) < (b.created_at, b.id)
+  AND a.event_type IS NOT DISTINCT FROM b.event_type
+  AND a.event_date IS NOT DISTINCT FROM b.event_date;
+CREATE UNIQUE INDEX IF NOT EXISTS uq_macro_news_natural_key ON macro_news(event_type, event_date);
+
+DELETE FROM earnings_news a USING earnings_news b
+WHERE (a.created_at, a.id) < (b.created_at, b.id)
+  AND a.symbol IS NOT DISTINCT FROM b.symbol
+  AND a.quarter IS NOT DISTINCT FROM b.quarter;
+CREATE UNIQUE INDEX IF NOT EXISTS uq_earnings_news_natural_key ON earnings_news(symbol, quarter) NULLS NOT DISTINCT;
+
+DELETE FROM sector_news a USING sector_news b
+WHERE (a.created_at, a.id) < (b.created_at, b.id)
+  AND a.sector IS NOT DISTINCT FROM b.sector
+  AND a.event_type IS NOT DISTINCT FROM b.event_type
+  AND a.event_date IS NOT DISTINCT FROM b.event_date;
+CREATE UNIQUE INDEX IF NOT EXISTS uq_sector_news_natural_key ON sector_news(sector, event_type, event_date) NULLS NOT DISTINCT;
+
+DELETE FROM corporate_events a USING corporate_events b
+WHERE (a.created_at, a.id) < (b.created_at, b.id)
+  AND a.symbol IS NOT DISTINCT FROM b.symbol
+  AND a.event_type IS NOT DISTINCT FROM b.event_type
+  AND a.event_date IS NOT DISTINCT FROM b.event_date
+  AND a.event_description IS NOT DISTINCT FROM b.event_description;
+CREATE UNIQUE INDEX IF NOT EXISTS uq_corporate_events_natural_key ON corporate_events(symbol, event_type, event_date, event_description) NULLS NOT DISTINCT;
+
+-- source_url 이 없는 행은 서로 다른 기사이므로 남김 (인덱스도 NULL 을 서로 다르게 봄)
+DELETE FROM tech_trends a USING tech_trends b
+WHERE (a.created_at, a.id) < (b.created_at, b.id)
+  AND a.source_url = b.source_url;
+CREATE UNIQUE INDEX IF NOT EXISTS uq_tech_trends_natural_key ON tech_trends(source_url);
+
+DELETE FROM geopolitical_news a USING geopolitical_news b
+WHERE (a.created_at, a.id) < (b.created_at, b.id)
+  AND a.region IS NOT DISTINCT FROM b.region
+  AND a.event_type IS NOT DISTINCT FROM b.event_type
+  AND a.event_date IS NOT DISTINCT FROM b.event_date;
+CREATE UNIQUE INDEX IF NOT EXISTS uq_geopolitical_news_natural_key ON geopolitical_news(region, event_type, event_date);
+
+
+-- ============================================================
+-- 4. upsert 용 UPDATE 정책
+-- ============================================================
+DROP POLICY IF EXISTS "Enable update for authenticated users" ON macro_news;
+CREATE POLICY "Enable update for authenticated users" ON macro_news FOR UPDATE USING (true);
+DROP POLICY IF EXISTS "Enable update for authenticated users" ON earnings_news;
+CREATE POLICY "Enable update for authenticated users" ON earnings_news FOR UPDATE USING (true);
+DROP POLICY IF EXISTS "Enable update for authenticated users" ON sector_news;
+CREATE POLICY "Enable update for authenticated users" ON sector_news FOR UPDATE USING (true);
+DROP POLICY IF EXISTS "Enable update for authenticated users" ON corporate_events;
+CREATE POLICY "Enable update for authenticated users" ON corporate_events FOR UPDATE USING (true);
+DROP POLICY IF EXISTS "Enable update for authenticated users" ON tech_trends;
+CREATE POLICY "Enable update for authenticated users" ON tech_trends FOR UPDATE USING (true);
+DROP POLICY IF EXISTS "Enable update for authenticated users" ON geopolitical_news;
+CREATE POLICY "Enable update for authenticated users" ON geopolitical_news FOR UPDATE USING (true);
+
+COMMIT;
@@ -1,4 +1,6 @@
 -- 6대 뉴스 카테고리 Supabase 데이터베이스 스키마
+-- 새 프로젝트용입니다. 이미 배포된 DB 에는 다시 실행하지 말고
+-- database/news_tables_natural_keys_migration.sql 을 실행하세요 (event_date, 자연 키, UPDATE 정책).
 
 -- ============================================================
 -- 1. 거시경제(Macro) 뉴스 테이블
@@ -12,12 +14,16 @@ CREATE TABLE IF NOT EXISTS macro_news (
     impact TEXT CHECK (impact IN ('LOW', 'MEDIUM', 'HIGH', 'CRITICAL')),
     affected_sectors JSONB,  -- ['TECH', 'GROWTH_STOCKS']
     signal TEXT,  -- 'TECH_GROWTH_SHORT_TERM_DOWN'
+    event_date DATE NOT NULL DEFAULT CURRENT_DATE,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
 CREATE INDEX idx_macro_news_event_type ON macro_news(event_type);
 CREATE INDEX idx_macro_news_created_at ON macro_news(created_at DESC);
 
+-- 자연 키 (scripts/news_collectors/upsert_writer.py NATURAL_KEYS 와 일치)
+CREATE UNIQUE INDEX IF NOT EXISTS uq_macro_news_natural_key ON macro_news(event_type, event_date);
+
 
 -- ============================================================
 -- 2. 실적(Earnings) 뉴스 테이블
@@ -41,6 +47,9 @@ CREATE TABLE IF NOT EXISTS earnings_news (
 CREATE INDEX idx_earnings_news_symbol ON earnings_news(symbol);
 CREATE INDEX idx_earnings_news_created_at ON earnings_news(created_at DESC);
 
+-- 자연 키 (scripts/news_collectors/upsert_writer.py NATURAL_KEYS 와 일치)
+CREATE UNIQUE INDEX IF NOT EXISTS uq_earnings_news_natural_key ON earnings_news(symbol, quarter) NULLS NOT DISTINCT;
+
 
 -- ============================================================
 -- 3. 산업군(섹터) 뉴스 테이블
@@ -53,12 +62,17 @@ CREATE TABLE IF NOT EXISTS sector_news (
     impact_level TEXT CHECK (impact_level IN ('LOW', 'MEDIUM', 'HIGH', 'CRITICAL')),
     affected_stocks JSONB,  -- ['NVDA', 'AMD', 'INTC']
     signal TEXT,  -- 'SEMICONDUCTOR_RALLY'
+    event_date DATE NOT NULL DEFAULT CURRENT_DATE,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
 CREATE INDEX idx_sector_news_sector ON sector_news(sector);
 CREATE INDEX idx_sector_news_created_at ON sector_news(created_at DESC);
 
+-- 자연 키 (scripts/news_collectors/upsert_writer.py NATURAL_KEYS 와 일치)
+-- 같은 날 같은 유형의 서로 다른 이벤트(예: 같은 섹터의 POLICY 뉴스 두 건)는 한 행으로 합쳐짐 (나중 값 우선)
+CREATE UNIQUE INDEX IF NOT EXISTS uq_sector_news_natural_key ON sector_news(sector, event_type, event_date) NULLS NOT DISTINCT;
+
 
 -- ============================================================
 -- 4. 기업 이슈(Corporate Events) 테이블
@@ -71,6 +85,7 @@ CREATE TABLE IF NOT EXISTS corporate_events (
     signal TEXT,  -- 'IMMEDIATE_SELL', 'SHORT_TERM_DOWN', 'MA_ANNOUNCEMENT'
     severity TEXT CHECK (severity IN ('LOW', 'MEDIUM', 'HIGH', 'CRITICAL')),
     source_url TEXT,
+    event_date DATE NOT NULL DEFAULT CURRENT_DATE,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
@@ -78,6 +93,9 @@ CREATE INDEX idx_corporate_events_symbol ON corporate_events(symbol);
 CREATE INDEX idx_corporate_events_event_type ON corporate_events(event_type);
 CREATE INDEX idx_corporate_events_created_at ON corporate_events(created_at DESC);
 
+-- 자연 키 (scripts/news_collectors/upsert_writer.py NATURAL_KEYS 와 일치)
+CREATE UNIQUE INDEX IF NOT EXISTS uq_corporate_events_natural_key ON corporate_events(symbol, event_type, event_date, event_description) NULLS NOT DISTINCT;
+
 
 -- ============================================================
 -- 5. AI/테크 트렌드 테이블
@@ -98,6 +116,9 @@ CREATE INDEX idx_tech_trends_trend_type ON tech_trends(trend_type);
 CREATE INDEX idx_tech_trends_impact_score ON tech_trends(impact_score DESC);
 CREATE INDEX idx_tech_trends_created_at ON tech_trends(created_at DESC);
 
+-- 자연 키 (scripts/news_collectors/upsert_writer.py NATURAL_KEYS 와 일치)
+CREATE UNIQUE INDEX IF NOT EXISTS uq_tech_trends_natural_key ON tech_trends(source_url);
+
 
 -- ============================================================
 -- 6. 지정학적(Geopolitical) 뉴스 테이블
@@ -111,6 +132,7 @@ CREATE TABLE IF NOT EXISTS geopolitical_news (
     affected_stocks JSONB,  -- ['AAPL', 'TSLA', 'XOM']
     signal TEXT,  -- 'CHINA_MARKET_DOWN', 'OIL_SURGE_ENERGY_UP'
     impact_level TEXT CHECK (impact_level IN ('LOW', 'MEDIUM', 'HIGH', 'CRITICAL')),
+    event_date DATE NOT NULL DEFAULT CURRENT_DATE,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
@@ -118,6 +140,10 @@ CREATE INDEX idx_geopolitical_news_region ON geopolitical_news(region);
 CREATE INDEX idx_geopolitical_news_event_type ON geopolitical_news(event_type);
 CREATE INDEX idx_geopolitical_news_created_at ON geopolitical_news(created_at DESC);
 
+-- 자연 키 (scripts/news_collectors/upsert_writer.py NATURAL_KEYS 와 일치)
+-- 같은 날 같은 유형의 서로 다른 이벤트(예: 같은 섹터의 POLICY 뉴스 두 건)는 한 행으로 합쳐짐 (나중 값 우선)
+CREATE UNIQUE INDEX IF NOT EXISTS uq_geopolitical_news_natural_key ON geopolitical_news(region, event_type, event_date);
+
 
 -- ============================================================
 -- 통합 시그널 뷰 (All Signals Combined)
@@ -209,31 +235,37 @@ ORDER BY created_at DESC;
 ALTER TABLE macro_news ENABLE ROW LEVEL SECURITY;
 CREATE POLICY "Enable read access for all users" ON macro_news FOR SELECT USING (true);
 CREATE POLICY "Enable insert for authenticated users" ON macro_news FOR INSERT WITH CHECK (true);
+CREATE POLICY "Enable update for authenticated users" ON macro_news FOR UPDATE USING (true);
 
 -- Earnings News
 ALTER TABLE earnings_news ENABLE ROW LEVEL SECURITY;
 CREATE POLICY "Enable read access for all users" ON earnings_news FOR SELECT USING (true);
 CREATE POLICY "Enable insert for authenticated users" ON earnings_news FOR INSERT WITH CHECK (true);
+CREATE POLICY "Enable update for authenticated users" ON earnings_news FOR UPDATE USING (true);
 
 -- Sector News
 ALTER TABLE sector_news ENABLE ROW LEVEL SECURITY;
 CREATE POLICY "Enable read access for all users" ON sector_news FOR SELECT USING (true);
 CREATE POLICY "Enable insert for authenticated users" ON sector_news FOR INSERT WITH CHECK (true);
+CREATE POLICY "Enable update for authenticated users" ON sector_news FOR UPDATE USING (true);
 
 -- Corporate Events
 ALTER TABLE corporate_events ENABLE ROW LEVEL SECURITY;
 CREATE POLICY "Enable read access for all users" ON corporate_events FOR SELECT USING (true);
 CREATE POLICY "Enable insert for authenticated users" ON corporate_events FOR INSERT WITH CHECK (true);
+CREATE POLICY "Enable update for authenticated users" ON corporate_events FOR UPDATE USING (true);
 
 -- Tech Trends
 ALTER TABLE tech_trends ENABLE ROW LEVEL SECURITY;
 CREATE POLICY "Enable read access for all users" ON tech_trends FOR SELECT USING (true);
 CREATE POLICY "Enable insert for authenticated users" ON tech_trends FOR INSERT WITH CHECK (true);
+CREATE POLICY "Enable update for authenticated users" ON tech_trends FOR UPDATE USING (true);
 
 -- Geopolitical News
 ALTER TABLE geopolitical_news ENABLE ROW LEVEL SECURITY;
 CREATE POLICY "Enable read access for all users" ON geopolitical_news FOR SELECT USING (true);
 CREATE POLICY "Enable insert for authenticated users" ON geopolitical_news FOR INSERT WITH CHECK (true);
+CREATE POLICY "Enable update for authenticated users" ON geopolitical_news FOR UPDATE USING (true);
 
 
 -- ============================================================
@@ -0,0 +1,119 @@
+"""
+대시보드 조회 계층
+Dashboard query layer: per-endpoint projections and keyset cursors
+
+목록 API 는 news_raw 의 본문(content)/메타데이터를 쓰지 않으므로 엔드포인트별로
+필요한 컬럼만 가져옵니다. 페이지네이션은 (created_at, id) 키셋 커서로,
+OFFSET 없이 schema.sql 의 *_keyset 인덱스를 따라 다음 페이지를 읽습니다.
+
+사용법:
+    rows = db.get_signal_feed(levels=[1], limit=20, cursor=request.args.get('cursor'))
+    return {"signals": rows, "next_cursor": next_cursor(rows, 20)}
+"""
+
+import base64
+import json
+import re
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# news_raw 요약 (목록 화면: 제목/링크/출처/날짜)
+RAW_SUMMARY_COLUMNS = ("id", "title", "url", "source", "published_at", "created_at")
+
+# 시그널 목록/알림 (analysis 는 알림 메시지의 reasoning/key_points 용)
+SIGNAL_COLUMNS = (
+    "id", "raw_news_id", "relevance_score", "signal_level", "affected_symbols",
+    "price_impact", "importance", "analysis", "created_at",
+)
+
+# 대시보드 기사 목록 (get_articles_for_dashboard 응답 필드)
+ARTICLE_COLUMNS = (
+    "id", "raw_news_id", "relevance_score", "affected_symbols", "sentiment", "sentiment_score",
+    "has_policy_change", "policy_type", "created_at",
+)
+
+# 고관련성 뉴스 (트렌딩 집계용)
+HIGH_RELEVANCE_COLUMNS = (
+    "id", "raw_news_id", "relevance_score", "signal_level", "affected_symbols",
+    "price_impact", "importance", "created_at",
+)
+
+_ID_PATTERN = re.compile(r"^[0-9A-Za-z-]{1,64}$")
+
+
+def supabase_select(columns: Sequence[str], raw_columns: Sequence[str] = RAW_SUMMARY_COLUMNS) -> str:
+    """PostgREST select 문자열 (news_raw 임베드 포함)"""
+    return f"{', '.join(columns)}, news_raw({', '.join(raw_columns)})"
+
+
+def sql_columns(columns: Sequence[str], alias: str) -> str:
+    """SQLite SELECT 컬럼 목록"""
+    return ", ".join(f"{alias}.{column}" for column in columns)
+
+
+# ==================== 키셋 커서 ====================
+
+def encode_cursor(created_at: str, row_id: str) -> str:
+    """(created_at, id) → 불투명 커서 문자열"""
+    payload = json.dumps([created_at, row_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """
+    커서 → (created_at, id)
+
+    PostgREST 필터 문자열에 그대로 들어가므로 형식을 엄격히 검사합니다.
+
+    Raises:
+        ValueError: 형식이 잘못된 커서
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        datetime.fromisoformat(created_at)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(row_id, str) or not _ID_PATTERN.match(row_id):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return created_at, row_id
+
+
+def next_cursor(rows: List[Dict], limit: int) -> Optional[str]:
+    """마지막 행 기준 다음 페이지 커서 (페이지가 덜 찼으면 None)"""
+    if not rows or len(rows) < limit:
+        return None
+    last = rows[-1]
+    return encode_cursor(last["created_at"], last["id"])
+
+
+def postgrest_keyset_filter(cursor: str) -> str:
+    """created_at DESC, id DESC 정렬에서 커서 다음 행만 고르는 or() 필터"""
+    created_at, row_id = decode_cursor(cursor)
+    return f'created_at.lt."{created_at}",and(created_at.eq."{created_at}",id.lt.{row_id})'
+
+
+def postgrest_keyset_after_filter(cursor: str) -> str:
+    """created_at ASC, id ASC 정렬에서 커서 다음 행만 고르는 or() 필터"""
+    created_at, row_id = decode_cursor(cursor)
+    return f'created_at.gt."{created_at}",and(created_at.eq."{created_at}",id.gt.{row_id})'
+
+
+def format_dashboard_article(item: Dict) -> Dict:
+    """analyzed_news 행(+news_raw 요약) → 대시보드 기사 응답"""
+    raw_news = item.get("news_raw") or {}
+    return {
+        "id": item.get("id"),
+        "title": raw_news.get("title", "Untitled"),
+        "url": raw_news.get("url", ""),
+        "source": raw_news.get("source", "Unknown"),
+        "symbols": item.get("affected_symbols", []),
+        "priority_score": item.get("relevance_score", 0),
+        "sentiment": item.get("sentiment") or "neutral",
+        "sentiment_score": item.get("sentiment_score") or 0.0,
+        "has_policy_change": item.get("has_policy_change", False),
+        "policy_type": item.get("policy_type", None),
+        "published_at": raw_news.get("published_at", None),
+        "collected_at": raw_news.get("created_at", None),
+        "created_at": item.get("created_at", None)
+    }
@@ -49,6 +49,26 @@ CREATE INDEX IF NOT EXISTS idx_analyzed_news_symbols ON analyzed_news USING GIN(
 CREATE INDEX IF NOT EXISTS idx_analyzed_news_importance ON analyzed_news(importance);
 CREATE INDEX IF NOT EXISTS idx_analyzed_news_created ON analyzed_news(created_at);
 
+-- 신호/감성/정책 컬럼 (분석 파이프라인과 대시보드가 사용)
+ALTER TABLE analyzed_news ADD COLUMN IF NOT EXISTS signal_level INTEGER DEFAULT 4;
+ALTER TABLE analyzed_news ADD COLUMN IF NOT EXISTS sentiment TEXT;
+ALTER TABLE analyzed_news ADD COLUMN IF NOT EXISTS sentiment_score REAL;
+ALTER TABLE analyzed_news ADD COLUMN IF NOT EXISTS has_policy_change BOOLEAN DEFAULT FALSE;
+ALTER TABLE analyzed_news ADD COLUMN IF NOT EXISTS policy_type TEXT;
+
+-- 대시보드 키셋 페이지네이션 (created_at DESC, id DESC) 커버링 인덱스
+-- /api/articles, /api/signals/* 가 OFFSET 없이 이 순서로 다음 페이지를 읽음
+CREATE INDEX IF NOT EXISTS idx_analyzed_news_keyset ON analyzed_news(created_at DESC, id DESC) INCLUDE (raw_news_id, relevance_score, signal_level);
+CREATE INDEX IF NOT EXISTS idx_analyzed_news_level_keyset ON analyzed_news(signal_level, created_at DESC, id DESC) INCLUDE (raw_news_id, relevance_score);
+-- news_raw(...) 임베드는 요약 컬럼만 읽으므로 본문(content) 없이 인덱스에서 처리
+CREATE INDEX IF NOT EXISTS idx_news_raw_summary ON news_raw(id) INCLUDE (title, url, source, published_at, created_at);
+
+-- 원본 뉴스당 분석 결과 한 행 (save_analysis.py 가 raw_news_id 기준 upsert)
+-- 기존 중복은 가장 최근 행만 남김
+DELETE FROM analyzed_news a USING analyzed_news b
+WHERE a.raw_news_id = b.raw_news_id AND (a.created_at, a.id) < (b.created_at, b.id);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_analyzed_news_raw_unique ON analyzed_news(raw_news_id);
+
 -- 3. 발행된 블로그 글 테이블
 CREATE TABLE IF NOT EXISTS published_articles (
   id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
@@ -67,6 +87,91 @@ CREATE INDEX IF NOT EXISTS idx_published_articles_created ON published_articles(
 CREATE INDEX IF NOT EXISTS idx_published_articles_published ON published_articles(published_at);
 CREATE INDEX IF NOT EXISTS idx_published_articles_wordpress ON published_articles(wordpress_id);
 
+-- 발행 글 ↔ 분석 뉴스 연결 (analyzed_news_ids 배열 정규화)
+-- 미발행 시그널 조회가 배열 전체를 내려받지 않고 인덱스로 서버에서 제외
+CREATE TABLE IF NOT EXISTS published_article_signals (
+  article_id UUID NOT NULL REFERENCES published_articles(id) ON DELETE CASCADE,
+  analyzed_news_id UUID NOT NULL,
+  created_at TIMESTAMPTZ DEFAULT NOW(),
+  PRIMARY KEY (article_id, analyzed_news_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_published_article_signals_news ON published_article_signals(analyzed_news_id);
+
+-- analyzed_news_ids 저장/변경 시 연결 테이블 동기화 (테이블에 직접 insert 하는 스크립트 포함)
+CREATE OR REPLACE FUNCTION sync_published_article_signals()
+RETURNS trigger AS $$
+BEGIN
+  DELETE FROM published_article_signals WHERE article_id = NEW.id;
+  INSERT INTO published_article_signals (article_id, analyzed_news_id)
+  SELECT NEW.id, UNNEST(COALESCE(NEW.analyzed_news_ids, '{}'))
+  ON CONFLICT DO NOTHING;
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_sync_published_article_signals ON published_articles;
+CREATE TRIGGER trg_sync_published_article_signals
+AFTER INSERT OR UPDATE OF analyzed_news_ids ON published_articles
+FOR EACH ROW EXECUTE FUNCTION sync_published_article_signals();
+
+-- 기존 발행 글 백필
+INSERT INTO published_article_signals (article_id, analyzed_news_id)
+SELECT id, UNNEST(analyzed_news_ids) FROM published_articles WHERE analyzed_news_ids IS NOT NULL
+ON CONFLICT DO NOTHING;
+
+-- 아직 글로 발행되지 않은 분석 뉴스 (글쓰기 큐/추천용)
+CREATE OR REPLACE VIEW unpublished_signals AS
+SELECT a.*
+FROM analyzed_news a
+WHERE NOT EXISTS (
+  SELECT 1 FROM published_article_signals p WHERE p.analyzed_news_id = a.id
+);
+
+-- 레벨마다 관련성 상위 p_limit 개 시그널 (한 번의 쿼리, 상위 레벨이 많아도 하위 레벨이 밀려나지 않음)
+-- news_raw 는 요약 컬럼만 JSON 으로 내장 (PostgREST 임베드와 같은 모양)
+CREATE OR REPLACE FUNCTION signals_per_level(
+  p_levels INTEGER[],
+  p_since TIMESTAMPTZ,
+  p_limit INTEGER,
+  p_symbol TEXT DEFAULT NULL,
+  p_unpublished_only BOOLEAN DEFAULT FALSE
+)
+RETURNS TABLE (
+  id UUID,
+  raw_news_id UUID,
+  relevance_score INTEGER,
+  signal_level INTEGER,
+  affected_symbols TEXT[],
+  price_impact TEXT,
+  importance TEXT,
+  analysis JSONB,
+  created_at TIMESTAMPTZ,
+  news_raw JSONB
+) AS $$
+  SELECT r.id, r.raw_news_id, r.relevance_score, r.signal_level, r.affected_symbols,
+         r.price_impact, r.importance, r.analysis, r.created_at,
+         CASE WHEN n.id IS NULL THEN NULL ELSE jsonb_build_object(
+           'id', n.id, 'title', n.title, 'url', n.url, 'source', n.source,
+           'published_at', n.published_at, 'created_at', n.created_at
+         ) END
+  FROM (
+    SELECT a.*, ROW_NUMBER() OVER (
+      PARTITION BY a.signal_level ORDER BY a.relevance_score DESC, a.created_at DESC
+    ) AS level_rank
+    FROM analyzed_news a
+    WHERE a.signal_level = ANY(p_levels)
+      AND a.created_at >= p_since
+      AND (p_symbol IS NULL OR a.affected_symbols @> ARRAY[p_symbol])
+      AND (NOT p_unpublished_only OR NOT EXISTS (
+        SELECT 1 FROM published_article_signals p WHERE p.analyzed_news_id = a.id
+      ))
+  ) r
+  LEFT JOIN news_raw n ON n.id = r.raw_news_id
+  WHERE r.level_rank <= p_limit
+  ORDER BY r.signal_level, r.relevance_score DESC;
+$$ LANGUAGE sql STABLE;
+
 -- 4. 통계 뷰 (선택적)
 CREATE OR REPLACE VIEW news_statistics AS
 SELECT
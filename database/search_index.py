@@ -0,0 +1,391 @@
+"""
+로컬 전문 검색 인덱스 (SQLite FTS5)
+Full-text search over news, analysis and generated articles
+
+- news_raw 제목/본문, 분석 결과(reasoning/key_points), articles/*.md 를 하나의 인덱스에 저장
+- 뉴스/분석은 SupabaseClient 삽입 시점에 증분 반영, 기사는 파일 mtime 기준으로 증분 동기화
+- Supabase의 24시간 정리(cleanup_old_news)와 무관하게 로컬에 이력이 남음
+- bm25 순위 + snippet() 하이라이트, 기간/시그널 레벨/종류/종목 필터
+
+사용법:
+    from database.search_index import get_search_index
+
+    results = get_search_index().search("엔비디아 블랙웰", hours=24 * 90, max_level=2)
+
+전체 재색인:
+    python -m database.search_index --rebuild
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+from loguru import logger
+
+PROJECT_ROOT = Path(__file__).parent.parent
+INDEX_PATH = PROJECT_ROOT / ".cache" / "search_index.sqlite"
+ARTICLES_DIR = PROJECT_ROOT / "articles"
+ARTICLE_SYNC_INTERVAL = 30   # 기사 디렉토리 재확인 최소 간격 (초)
+BACKFILL_PAGE_SIZE = 1000
+SNIPPET_TOKENS = 16
+MAX_LIMIT = 100
+
+# bm25 컬럼 가중치 (title, content, analysis, symbols)
+BM25_WEIGHTS = (5.0, 1.0, 2.0, 3.0)
+DOC_KINDS = ("news", "article")
+
+_TOKEN_RE = re.compile(r'[^\s"*]+')
+
+
+def _to_epoch(value: Any) -> Optional[float]:
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, datetime):
+        return value.timestamp()
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def _join_symbols(symbols: Optional[Iterable[str]]) -> str:
+    return " ".join(sorted({s.upper() for s in symbols or [] if s}))
+
+
+def build_match_query(query: str) -> str:
+    """
+    사용자 입력을 FTS5 MATCH 식으로 변환
+
+    각 단어를 따옴표로 감싸 AND 검색하며 (FTS 문법 오류 방지), 한국어 조사가
+    붙은 어절('엔비디아가')도 찾도록 모든 단어를 접두어로 검색합니다.
+    """
+    terms = [f'"{word}"*' for word in _TOKEN_RE.findall(query or "")]
+    return " ".join(terms)
+
+
+class SearchIndex:
+    """뉴스/분석/기사 전문 검색 인덱스"""
+
+    def __init__(self, path: Path = INDEX_PATH, articles_dir: Path = ARTICLES_DIR):
+        self.path = Path(path)
+        self.articles_dir = Path(articles_dir)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._articles_synced_at = 0.0
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=10)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS docs (
+                id INTEGER PRIMARY KEY,
+                doc_key TEXT NOT NULL UNIQUE,
+                kind TEXT NOT NULL,
+                ref_id TEXT,
+                source TEXT,
+                url TEXT,
+                title TEXT NOT NULL DEFAULT '',
+                content TEXT NOT NULL DEFAULT '',
+                analysis TEXT NOT NULL DEFAULT '',
+                symbols TEXT NOT NULL DEFAULT '',
+                signal_level INTEGER,
+                relevance_score INTEGER,
+                published_at REAL,
+                mtime REAL
+            );
+            CREATE INDEX IF NOT EXISTS idx_docs_kind_time ON docs (kind, published_at);
+            CREATE INDEX IF NOT EXISTS idx_docs_level_time ON docs (signal_level, published_at);
+
+            CREATE VIRTUAL TABLE IF NOT EXISTS docs_fts USING fts5(
+                title, content, analysis, symbols,
+                content='docs', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+            );
+
+            CREATE TRIGGER IF NOT EXISTS docs_ai AFTER INSERT ON docs BEGIN
+                INSERT INTO docs_fts (rowid, title, content, analysis, symbols)
+                VALUES (new.id, new.title, new.content, new.analysis, new.symbols);
+            END;
+            CREATE TRIGGER IF NOT EXISTS docs_ad AFTER DELETE ON docs BEGIN
+                INSERT INTO docs_fts (docs_fts, rowid, title, content, analysis, symbols)
+                VALUES ('delete', old.id, old.title, old.content, old.analysis, old.symbols);
+            END;
+            CREATE TRIGGER IF NOT EXISTS docs_au AFTER UPDATE ON docs BEGIN
+                INSERT INTO docs_fts (docs_fts, rowid, title, content, analysis, symbols)
+                VALUES ('delete', old.id, old.title, old.content, old.analysis, old.symbols);
+                INSERT INTO docs_fts (rowid, title, content, analysis, symbols)
+                VALUES (new.id, new.title, new.content, new.analysis, new.symbols);
+            END;
+            """
+        )
+        self._conn.commit()
+
+    # ==================== 색인 ====================
+
+    def _upsert(self, doc_key: str, fields: Dict[str, Any]):
+        """doc_key 기준 upsert (None 값 필드는 기존 값 유지)"""
+        fields = {k: v for k, v in fields.items() if v is not None}
+        columns = ", ".join(["doc_key", *fields])
+        placeholders = ", ".join("?" * (len(fields) + 1))
+        updates = ", ".join(f"{k} = excluded.{k}" for k in fields)
+        self._conn.execute(
+            f"INSERT INTO docs ({columns}) VALUES ({placeholders}) "
+            f"ON CONFLICT (doc_key) DO UPDATE SET {updates}",
+            (doc_key, *fields.values())
+        )
+
+    def index_raw_news(self, news: Dict, news_id: Optional[str] = None):
+        """news_raw 행(또는 RawNews.to_dict()) 색인"""
+        news_id = str(news_id or news.get("id"))
+        with self._lock:
+            self._upsert(f"news:{news_id}", {
+                "kind": "news",
+                "ref_id": news_id,
+                "source": news.get("source"),
+                "url": news.get("url"),
+                "title": news.get("title") or "",
+                "content": news.get("content") or "",
+                "symbols": _join_symbols(news.get("symbols")) or None,
+                "published_at": _to_epoch(news.get("published_at") or news.get("created_at")),
+            })
+            self._conn.commit()
+
+    def index_analysis(self, analyzed: Dict):
+        """analyzed_news 행(또는 AnalyzedNews.to_dict())을 원본 뉴스 문서에 병합"""
+        raw_id = str(analyzed.get("raw_news_id"))
+        analysis = analyzed.get("analysis") or {}
+        if isinstance(analysis, str):
+            analysis = json.loads(analysis)
+        text = "\n".join([analysis.get("reasoning", ""), *analysis.get("key_points", [])]).strip()
+
+        with self._lock:
+            self._upsert(f"news:{raw_id}", {
+                "kind": "news",
+                "ref_id": raw_id,
+                "analysis": text,
+                "symbols": _join_symbols(analyzed.get("affected_symbols")) or None,
+                "signal_level": analyzed.get("signal_level"),
+                "relevance_score": analyzed.get("relevance_score"),
+            })
+            self._conn.commit()
+
+    def sync_articles(self, force: bool = False) -> int:
+        """articles/article_*.md 중 바뀐 파일만 색인하고 삭제된 파일은 제거"""
+        if not force and time.time() - self._articles_synced_at < ARTICLE_SYNC_INTERVAL:
+            return 0
+        self._articles_synced_at = time.time()
+        if not self.articles_dir.exists():
+            return 0
+
+        with self._lock:
+            known = {
+                row["ref_id"]: row["mtime"]
+                for row in self._conn.execute("SELECT ref_id, mtime FROM docs WHERE kind = 'article'")
+            }
+            seen = set()
+            changed = 0
+            for path in self.articles_dir.glob("article_*.md"):
+                seen.add(path.name)
+                mtime = path.stat().st_mtime
+                if known.get(path.name) == mtime:
+                    continue
+                self._upsert(f"article:{path.name}", self._parse_article(path, mtime))
+                changed += 1
+
+            removed = [(f"article:{name}",) for name in set(known) - seen]
+            self._conn.executemany("DELETE FROM docs WHERE doc_key = ?", removed)
+            self._conn.commit()
+
+        if changed or removed:
+            logger.info(f"Search index: {changed} articles indexed, {len(removed)} removed")
+        return changed
+
+    @staticmethod
+    def _parse_article(path: Path, mtime: float) -> Dict[str, Any]:
+        text = path.read_text(encoding="utf-8")
+        title, body = "", text
+        if "TITLE:" in text and "CONTENT:" in text:
+            title = text[text.find("TITLE:") + len("TITLE:"):text.find("CONTENT:")].strip()
+            body = text[text.find("CONTENT:") + len("CONTENT:"):].strip()
+        else:
+            heading = re.search(r"^# (.+)$", text, re.MULTILINE)
+            title = heading.group(1).strip() if heading else path.stem
+
+        symbol = re.match(r"article_([A-Z]+)_", path.name)
+        date = re.search(r"_(\d{8})\.md$", path.name)
+        published = datetime.strptime(date.group(1), "%Y%m%d").timestamp() if date else mtime
+        return {
+            "kind": "article",
+            "ref_id": path.name,
+            "source": "article",
+            "url": f"/article/{path.name}",
+            "title": title,
+            "content": body,
+            "symbols": symbol.group(1) if symbol else "",
+            "published_at": published,
+            "mtime": mtime,
+        }
+
+    # ==================== 검색 ====================
+
+    def search(
+        self,
+        query: str,
+        kind: Optional[str] = None,
+        hours: Optional[float] = None,
+        since: Optional[Any] = None,
+        until: Optional[Any] = None,
+        level: Optional[int] = None,
+        max_level: Optional[int] = None,
+        symbol: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> List[Dict]:
+        """
+        키워드 검색 (bm25 순위, 본문/분석 스니펫 포함)
+
+        Args:
+            query: 검색어 (공백 구분 AND, 단어별 접두어 일치)
+            kind: 'news' 또는 'article'
+            hours / since / until: 발행 시각 범위
+            level: 정확한 시그널 레벨, max_level: 이 레벨 이하(더 중요) 전체
+            symbol: 종목 필터
+        """
+        match = build_match_query(query)
+        if not match:
+            return []
+        if symbol:
+            match = f'({match}) AND symbols : "{symbol.upper().replace(chr(34), "")}"'
+        if kind in (None, "article"):
+            self.sync_articles()
+
+        conditions, params = ["docs_fts MATCH ?"], [match]
+        if kind:
+            conditions.append("d.kind = ?")
+            params.append(kind)
+        start = time.time() - hours * 3600 if hours else _to_epoch(since)
+        if start is not None:
+            conditions.append("d.published_at >= ?")
+            params.append(start)
+        end = _to_epoch(until)
+        if end is not None:
+            conditions.append("d.published_at < ?")
+            params.append(end)
+        if level is not None:
+            conditions.append("d.signal_level = ?")
+            params.append(level)
+        if max_level is not None:
+            conditions.append("d.signal_level <= ?")
+            params.append(max_level)
+
+        sql = f"""
+            SELECT d.kind, d.ref_id, d.source, d.url, d.title, d.symbols,
+                   d.signal_level, d.relevance_score, d.published_at,
+                   bm25(docs_fts, {', '.join(map(str, BM25_WEIGHTS))}) AS rank,
+                   snippet(docs_fts, 1, '<mark>', '</mark>', '…', {SNIPPET_TOKENS}) AS content_snippet,
+                   snippet(docs_fts, 2, '<mark>', '</mark>', '…', {SNIPPET_TOKENS}) AS analysis_snippet
+            FROM docs_fts JOIN docs d ON d.id = docs_fts.rowid
+            WHERE {' AND '.join(conditions)}
+            ORDER BY rank
+            LIMIT ? OFFSET ?
+        """
+        params += [min(limit, MAX_LIMIT), offset]
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+
+        results = []
+        for row in rows:
+            published = row["published_at"]
+            snippet = row["content_snippet"] or ""
+            if "<mark>" not in snippet and "<mark>" in (row["analysis_snippet"] or ""):
+                snippet = row["analysis_snippet"]
+            results.append({
+                "kind": row["kind"],
+                "id": row["ref_id"],
+                "source": row["source"],
+                "url": row["url"],
+                "title": row["title"],
+                "symbols": row["symbols"].split() if row["symbols"] else [],
+                "signal_level": row["signal_level"],
+                "relevance_score": row["relevance_score"],
+                "published_at": datetime.fromtimestamp(published).isoformat() if published else None,
+                "score": round(-row["rank"], 4),
+                "snippet": snippet,
+            })
+        return results
+
+    def count(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute("SELECT kind, COUNT(*) FROM docs GROUP BY kind").fetchall()
+        return {row[0]: row[1] for row in rows}
+
+    # ==================== 재색인 ====================
+
+    def backfill(self, client) -> Dict[str, int]:
+        """Supabase의 news_raw/analyzed_news 전체를 페이지 단위로 색인"""
+        totals = {}
+        for table, handler in (("news_raw", self.index_raw_news), ("analyzed_news", self.index_analysis)):
+            start, total = 0, 0
+            while True:
+                rows = client.table(table).select("*")\
+                    .order("created_at")\
+                    .range(start, start + BACKFILL_PAGE_SIZE - 1)\
+                    .execute().data or []
+                for row in rows:
+                    handler(row)
+                total += len(rows)
+                if len(rows) < BACKFILL_PAGE_SIZE:
+                    break
+                start += BACKFILL_PAGE_SIZE
+            totals[table] = total
+            logger.info(f"Search index backfill: {table} {total} rows")
+        totals["articles"] = self.sync_articles(force=True)
+        return totals
+
+    def rebuild(self):
+        """FTS 인덱스를 docs 테이블에서 다시 만들고 최적화"""
+        with self._lock:
+            self._conn.execute("INSERT INTO docs_fts (docs_fts) VALUES ('rebuild')")
+            self._conn.execute("INSERT INTO docs_fts (docs_fts) VALUES ('optimize')")
+            self._conn.commit()
+
+
+_index: Optional[SearchIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_search_index() -> SearchIndex:
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = SearchIndex()
+        return _index
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+    parser = argparse.ArgumentParser(description="로컬 전문 검색 인덱스")
+    parser.add_argument("--rebuild", action="store_true", help="Supabase에서 전체 재색인")
+    parser.add_argument("query", nargs="?", help="검색어")
+    args = parser.parse_args()
+
+    index = get_search_index()
+    if args.rebuild:
+        from database.supabase_client import SupabaseClient
+        index.backfill(SupabaseClient().client)
+        index.rebuild()
+    if args.query:
+        for result in index.search(args.query):
+            print(f"[{result['kind']}] {result['score']:.2f} {result['title']}\n    {result['snippet']}")
+    print(index.count())
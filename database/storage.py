@@ -0,0 +1,316 @@
+"""
+저장소 백엔드 인터페이스
+Pluggable storage backend
+
+수집기/분석 파이프라인/대시보드는 이 인터페이스(StorageBackend)에만 의존합니다.
+STORAGE_BACKEND 설정으로 구현을 고릅니다:
+
+- supabase: 원격 Supabase (기본값, 기존 동작)
+- local:    내장 SQLite (단일 노드 배포, 오프라인 벤치마크)
+- cached:   Supabase 쓰기 + 로컬 SQLite 동시 기록 (write-through), 조회는 로컬 디스크
+
+사용법:
+    from database.storage import get_storage
+
+    db = get_storage()            # 설정값 사용
+    db = get_storage("local")     # 명시
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from loguru import logger
+
+from database.models import RawNews, AnalyzedNews, PublishedArticle
+from monitoring import metrics
+
+BACKENDS = ("supabase", "local", "cached")
+COUNTABLE_TABLES = ("news_raw", "analyzed_news", "published_articles")
+
+
+def cleanup_cutoff(hours: int = 24) -> str:
+    """cleanup_old_news 기준 시각 (이보다 먼저 수집된 원본 뉴스를 삭제)"""
+    return (datetime.now() - timedelta(hours=hours)).isoformat()
+
+
+class StorageBackend(ABC):
+    """SupabaseClient와 같은 메서드 집합을 제공하는 저장소"""
+
+    def _update_search_index(self, method: str, *args):
+        """
+        로컬 검색 인덱스 반영 (method: SearchIndex 메서드 이름)
+
+        인덱스 열기까지 여기서 하므로, 인덱스 오류가 이미 끝난 저장을 실패로 만들지 않습니다.
+        """
+        try:
+            from database.search_index import get_search_index
+            getattr(get_search_index(), method)(*args)
+        except Exception as e:
+            logger.warning(f"Failed to update search index: {e}")
+
+    # ==================== Raw News ====================
+
+    @abstractmethod
+    def insert_raw_news(self, news: RawNews) -> Optional[str]: ...
+
+    def insert_raw_news_many(self, news_list: List[RawNews]) -> List[Optional[str]]:
+        """원본 뉴스 일괄 저장 (기본 구현은 한 건씩)"""
+        return [self.insert_raw_news(news) for news in news_list]
+
+    @abstractmethod
+    def get_raw_news_by_url(self, url: str) -> Optional[Dict]: ...
+
+    @abstractmethod
+    def get_unanalyzed_news(self, limit: int = 50) -> List[Dict]: ...
+
+    @abstractmethod
+    def get_news_before(self, cutoff: str, cursor: Optional[str] = None, limit: int = 500) -> List[Dict]:
+        """
+        cutoff 이전에 수집된 원본 뉴스 (정리 전 아카이브용)
+
+        (created_at, id) 오름차순 키셋 페이지이며, 각 행의 "analyzed_news" 에 분석 결과 목록이 들어 있습니다.
+        조회 실패를 빈 결과로 숨기지 않고 예외를 올립니다 (빈 결과면 아카이브 없이 삭제되므로).
+        """
+
+    @abstractmethod
+    def cleanup_old_news(self, cutoff: Optional[str] = None, archive: bool = True):
+        """cutoff(기본: 24시간 전) 이전 원본 뉴스 삭제 (archive=True 면 먼저 database.archive 로 보관)"""
+
+    def _archive_before_cleanup(self, cutoff: str) -> bool:
+        """삭제 전 아카이브 (실패하면 False → 이번 정리는 건너뛰고 다음 실행에서 다시 시도)"""
+        from database.archive import archive_expiring_news
+        if archive_expiring_news(self, cutoff):
+            return True
+        logger.warning("Skipping cleanup: news archive failed, old rows are kept until the next run")
+        return False
+
+    # ==================== Analyzed News ====================
+
+    @abstractmethod
+    def insert_analyzed_news(self, news: AnalyzedNews) -> Optional[str]: ...
+
+    def insert_analyzed_news_many(self, news_list: List[AnalyzedNews]) -> List[Optional[str]]:
+        """분석 결과 일괄 저장 (기본 구현은 한 건씩)"""
+        return [self.insert_analyzed_news(news) for news in news_list]
+
+    @abstractmethod
+    def upsert_analyzed_news_many(self, news_list: List[AnalyzedNews]) -> List[Optional[str]]:
+        """분석 결과 일괄 저장/갱신 (raw_news_id 기준, 재실행해도 중복 없음)"""
+
+    @abstractmethod
+    def get_high_relevance_news(self, min_score: int = 70, limit: int = 20) -> List[Dict]: ...
+
+    @abstractmethod
+    def get_unpublished_news_by_symbol(self, symbol: str, limit: int = 5) -> List[Dict]: ...
+
+    # ==================== Published Articles ====================
+
+    @abstractmethod
+    def insert_published_article(self, article: PublishedArticle) -> Optional[str]: ...
+
+    @abstractmethod
+    def get_recent_articles(self, days: int = 7, limit: int = 10) -> List[Dict]: ...
+
+    # ==================== Dashboard ====================
+
+    @abstractmethod
+    def get_signals_by_level(self, level: int, hours: int = 24, limit: int = 50) -> List[Dict]: ...
+
+    @abstractmethod
+    def get_signals_by_symbol(self, symbol: str, hours: int = 24, limit: int = 20) -> List[Dict]: ...
+
+    @abstractmethod
+    def get_signals_by_levels(self, levels: List[int], hours: int = 24, limit: int = 50,
+                              symbol: Optional[str] = None, unpublished_only: bool = False) -> List[Dict]:
+        """여러 레벨의 시그널을 한 번에 조회 (레벨 → 관련성 순, 선택적으로 미발행만)"""
+
+    @abstractmethod
+    def get_signals_per_level(self, levels: List[int], hours: int = 24, limit: int = 50,
+                              symbol: Optional[str] = None, unpublished_only: bool = False) -> List[Dict]:
+        """레벨마다 관련성 상위 limit 개 (한 번의 윈도 쿼리, 상위 레벨이 많아도 하위 레벨이 밀려나지 않음)"""
+
+    @abstractmethod
+    def get_signal_feed(self, levels: Optional[List[int]] = None, symbol: Optional[str] = None,
+                        hours: int = 24, limit: int = 50, cursor: Optional[str] = None) -> List[Dict]:
+        """대시보드 시그널 목록 (최신순, (created_at, id) 키셋 커서, 요약 컬럼만)"""
+
+    @abstractmethod
+    def get_trending_symbols(self, hours: int = 24, limit: int = 15) -> List[Dict]: ...
+
+    @abstractmethod
+    def get_price_impact_summary(self, hours: int = 24) -> Dict: ...
+
+    @abstractmethod
+    def get_important_symbols_today(self) -> List[Dict]: ...
+
+    @abstractmethod
+    def mark_signal_as_processed(self, signal_id: str) -> bool: ...
+
+    @abstractmethod
+    def get_dashboard_stats(self) -> Dict: ...
+
+    @abstractmethod
+    def count_since(self, table: str, cutoff: str) -> int:
+        """table(COUNTABLE_TABLES) 에서 created_at >= cutoff 인 행 수"""
+
+    @abstractmethod
+    def get_articles_for_dashboard(self, limit: int = 50, min_priority: int = 0,
+                                   symbol: Optional[str] = None, cursor: Optional[str] = None) -> List[Dict]: ...
+
+    def get_articles_by_symbol_dashboard(self, symbol: str, limit: int = 20,
+                                         cursor: Optional[str] = None) -> List[Dict]:
+        """종목별 기사 조회 (대시보드용)"""
+        return self.get_articles_for_dashboard(limit=limit, symbol=symbol, cursor=cursor)
+
+
+class CachedStorage(StorageBackend):
+    """
+    Supabase 앞단의 로컬 write-through 캐시
+
+    쓰기는 Supabase에 먼저 저장하고 같은 ID로 로컬에도 기록합니다.
+    조회는 모두 로컬 디스크에서 처리하므로 대시보드 요청이 네트워크를 타지 않습니다.
+    """
+
+    def __init__(self, remote: StorageBackend, local):
+        self.remote = remote
+        self.local = local
+        logger.info("Cached storage initialized (Supabase write-through + local reads)")
+
+    def insert_raw_news(self, news: RawNews) -> Optional[str]:
+        news_id = self.remote.insert_raw_news(news)
+        if news_id:
+            self.local.insert_raw_news(news, news_id=news_id)
+        return news_id
+
+    def insert_analyzed_news(self, news: AnalyzedNews) -> Optional[str]:
+        news_id = self.remote.insert_analyzed_news(news)
+        if news_id:
+            self.local.insert_analyzed_news(news, news_id=news_id)
+        return news_id
+
+    def insert_analyzed_news_many(self, news_list: List[AnalyzedNews]) -> List[Optional[str]]:
+        ids = self.remote.insert_analyzed_news_many(news_list)
+        with self.local.batch():
+            for news, news_id in zip(news_list, ids):
+                if news_id:
+                    self.local.insert_analyzed_news(news, news_id=news_id)
+        return ids
+
+    def upsert_analyzed_news_many(self, news_list: List[AnalyzedNews]) -> List[Optional[str]]:
+        ids = self.remote.upsert_analyzed_news_many(news_list)
+        with self.local.batch():
+            for news, news_id in zip(news_list, ids):
+                if news_id:
+                    self.local.upsert_analyzed_news(news, news_id=news_id)
+        return ids
+
+    def insert_published_article(self, article: PublishedArticle) -> Optional[str]:
+        article_id = self.remote.insert_published_article(article)
+        if article_id:
+            self.local.insert_published_article(article, article_id=article_id)
+        return article_id
+
+    def get_news_before(self, cutoff: str, cursor: Optional[str] = None, limit: int = 500) -> List[Dict]:
+        # 아카이브는 원본(Supabase) 기준 (캐시 도입 전에 수집된 행도 보관)
+        return self.remote.get_news_before(cutoff, cursor, limit)
+
+    def cleanup_old_news(self, cutoff: Optional[str] = None, archive: bool = True):
+        cutoff = cutoff or cleanup_cutoff()
+        if archive and not self._archive_before_cleanup(cutoff):
+            return
+        self.remote.cleanup_old_news(cutoff, archive=False)
+        self.local.cleanup_old_news(cutoff, archive=False)
+
+    def mark_signal_as_processed(self, signal_id: str) -> bool:
+        return self.remote.mark_signal_as_processed(signal_id)
+
+    def get_raw_news_by_url(self, url: str) -> Optional[Dict]:
+        return self.local.get_raw_news_by_url(url) or self.remote.get_raw_news_by_url(url)
+
+    def get_unanalyzed_news(self, limit: int = 50) -> List[Dict]:
+        return self.local.get_unanalyzed_news(limit)
+
+    def get_high_relevance_news(self, min_score: int = 70, limit: int = 20) -> List[Dict]:
+        return self.local.get_high_relevance_news(min_score, limit)
+
+    def get_unpublished_news_by_symbol(self, symbol: str, limit: int = 5) -> List[Dict]:
+        return self.local.get_unpublished_news_by_symbol(symbol, limit)
+
+    def get_recent_articles(self, days: int = 7, limit: int = 10) -> List[Dict]:
+        return self.local.get_recent_articles(days, limit)
+
+    def get_signals_by_level(self, level: int, hours: int = 24, limit: int = 50) -> List[Dict]:
+        return self.local.get_signals_by_level(level, hours, limit)
+
+    def get_signals_by_symbol(self, symbol: str, hours: int = 24, limit: int = 20) -> List[Dict]:
+        return self.local.get_signals_by_symbol(symbol, hours, limit)
+
+    def get_signals_by_levels(self, levels: List[int], hours: int = 24, limit: int = 50,
+                              symbol: Optional[str] = None, unpublished_only: bool = False) -> List[Dict]:
+        return self.local.get_signals_by_levels(levels, hours, limit, symbol, unpublished_only)
+
+    def get_signals_per_level(self, levels: List[int], hours: int = 24, limit: int = 50,
+                              symbol: Optional[str] = None, unpublished_only: bool = False) -> List[Dict]:
+        return self.local.get_signals_per_level(levels, hours, limit, symbol, unpublished_only)
+
+    def get_signal_feed(self, levels: Optional[List[int]] = None, symbol: Optional[str] = None,
+                        hours: int = 24, limit: int = 50, cursor: Optional[str] = None) -> List[Dict]:
+        return self.local.get_signal_feed(levels, symbol, hours, limit, cursor)
+
+    def get_trending_symbols(self, hours: int = 24, limit: int = 15) -> List[Dict]:
+        return self.local.get_trending_symbols(hours, limit)
+
+    def get_price_impact_summary(self, hours: int = 24) -> Dict:
+        return self.local.get_price_impact_summary(hours)
+
+    def get_important_symbols_today(self) -> List[Dict]:
+        return self.local.get_important_symbols_today()
+
+    def get_dashboard_stats(self) -> Dict:
+        return self.local.get_dashboard_stats()
+
+    def count_since(self, table: str, cutoff: str) -> int:
+        return self.local.count_since(table, cutoff)
+
+    def get_articles_for_dashboard(self, limit: int = 50, min_priority: int = 0,
+                                   symbol: Optional[str] = None, cursor: Optional[str] = None) -> List[Dict]:
+        return self.local.get_articles_for_dashboard(limit, min_priority, symbol, cursor)
+
+
+class InstrumentedStorage:
+    """저장소 메서드 호출마다 db_call_seconds{op, backend} 기록 (메트릭 활성 시에만 사용)"""
+
+    def __init__(self, backend: StorageBackend):
+        self._backend = backend
+        self._name = type(backend).__name__
+
+    def __getattr__(self, name):
+        attr = getattr(self._backend, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+        return metrics.timer("db_call_seconds", op=name, backend=self._name)(attr)
+
+
+def get_storage(backend: Optional[str] = None) -> StorageBackend:
+    """설정(STORAGE_BACKEND)에 맞는 저장소 생성 (메트릭 활성 시 호출 시간 계측)"""
+    storage = _create_storage(backend)
+    return InstrumentedStorage(storage) if metrics.ENABLED else storage
+
+
+def _create_storage(backend: Optional[str] = None) -> StorageBackend:
+    from config.settings import STORAGE_BACKEND
+
+    backend = (backend or STORAGE_BACKEND).lower()
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown storage backend: {backend} (choose from {', '.join(BACKENDS)})")
+
+    if backend == "supabase":
+        from database.supabase_client import SupabaseClient
+        return SupabaseClient()
+
+    from database.local_store import LocalStore
+    if backend == "local":
+        return LocalStore()
+
+    from database.supabase_client import SupabaseClient
+    return CachedStorage(SupabaseClient(), LocalStore())
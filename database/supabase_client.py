@@ -7,8 +7,13 @@ import sys
 sys.path.append('..')
 from config.settings import SUPABASE_URL, SUPABASE_KEY
 from database.models import RawNews, AnalyzedNews, PublishedArticle
+from database.queries import (
+    ARTICLE_COLUMNS, HIGH_RELEVANCE_COLUMNS, SIGNAL_COLUMNS,
+    format_dashboard_article, postgrest_keyset_after_filter, postgrest_keyset_filter, supabase_select,
+)
+from database.storage import COUNTABLE_TABLES, StorageBackend, cleanup_cutoff
 
-class SupabaseClient:
+class SupabaseClient(StorageBackend):
     """Supabase 데이터베이스 클라이언트"""
 
     def __init__(self):
@@ -23,6 +28,8 @@ class SupabaseClient:
             result = self.client.table("news_raw").insert(news.to_dict()).execute()
             news_id = result.data[0]["id"] if result.data else None
             logger.info(f"Inserted raw news: {news.title[:50]}... (ID: {news_id})")
+            if news_id:
+                self._update_search_index("index_raw_news", news.to_dict(), news_id)
             return news_id
         except Exception as e:
             logger.error(f"Failed to insert raw news: {e}")
@@ -74,16 +81,28 @@ class SupabaseClient:
             logger.error(f"Failed to get analyzed news IDs: {e}")
             return set()
 
-    def cleanup_old_news(self):
-        """24시간 이상 된 원본 뉴스 삭제
+    def get_news_before(self, cutoff: str, cursor: Optional[str] = None, limit: int = 500) -> List[Dict]:
+        """cutoff 이전 원본 뉴스 + 분석 결과 (아카이브용, 키셋 오름차순)"""
+        query = self.client.table("news_raw")\
+            .select("*, analyzed_news(*)")\
+            .lt("created_at", cutoff)
+        if cursor:
+            query = query.or_(postgrest_keyset_after_filter(cursor))
+        result = query.order("created_at").order("id").limit(limit).execute()
+        return result.data or []
+
+    def cleanup_old_news(self, cutoff: Optional[str] = None, archive: bool = True):
+        """24시간 이상 된 원본 뉴스 삭제 (archive=True 면 먼저 database.archive 에 보관)
 
         NOTE: 이 메서드는 다음 시점에 자동 실행됩니다:
         1. 뉴스 수집 시작 전 (pipeline/news_pipeline.py)
         2. 스케줄러 뉴스 수집 작업 시작 전 (scheduler/jobs.py)
         3. 매일 새벽 3시 정기 정리 작업 (scheduler/jobs.py)
         """
+        cutoff_time = cutoff or cleanup_cutoff()
+        if archive and not self._archive_before_cleanup(cutoff_time):
+            return
         try:
-            cutoff_time = (datetime.now() - timedelta(hours=24)).isoformat()
             result = self.client.table("news_raw")\
                 .delete()\
                 .lt("created_at", cutoff_time)\
@@ -101,16 +120,73 @@ class SupabaseClient:
             result = self.client.table("analyzed_news").insert(news.to_dict()).execute()
             news_id = result.data[0]["id"] if result.data else None
             logger.info(f"Inserted analyzed news (score: {news.relevance_score}, ID: {news_id})")
+            if news_id:
+                self._update_search_index("index_analysis", news.to_dict())
             return news_id
         except Exception as e:
             logger.error(f"Failed to insert analyzed news: {e}")
             return None
 
+    def insert_analyzed_news_many(self, news_list: List[AnalyzedNews]) -> List[Optional[str]]:
+        """분석 결과 일괄 저장 (한 번의 insert, 실패 시 한 건씩)"""
+        if not news_list:
+            return []
+        rows = [news.to_dict() for news in news_list]
+        try:
+            result = self.client.table("analyzed_news").insert(rows).execute()
+            ids = [item["id"] for item in result.data] if len(result.data) == len(rows) else []
+            if not ids:
+                raise ValueError(f"expected {len(rows)} rows, got {len(result.data)}")
+        except Exception as e:
+            logger.warning(f"Bulk insert of analyzed news failed, falling back to single inserts: {e}")
+            return [self.insert_analyzed_news(news) for news in news_list]
+
+        # 저장이 끝난 뒤 인덱스 반영 (인덱스 오류로 같은 행을 다시 넣지 않도록 try 밖에서)
+        logger.info(f"Inserted {len(ids)} analyzed news")
+        for row in rows:
+            self._update_search_index("index_analysis", row)
+        return ids
+
+    def upsert_analyzed_news(self, news: AnalyzedNews) -> Optional[str]:
+        """분석 결과 한 건 upsert (raw_news_id 기준)"""
+        row = news.to_dict()
+        try:
+            result = self.client.table("analyzed_news")\
+                .upsert(row, on_conflict="raw_news_id")\
+                .execute()
+            news_id = result.data[0]["id"] if result.data else None
+        except Exception as e:
+            logger.error(f"Failed to upsert analyzed news ({news.raw_news_id}): {e}")
+            return None
+        if news_id:
+            self._update_search_index("index_analysis", row)
+        return news_id
+
+    def upsert_analyzed_news_many(self, news_list: List[AnalyzedNews]) -> List[Optional[str]]:
+        """분석 결과 일괄 upsert (raw_news_id 기준, 한 번의 요청, 실패 시 한 건씩)"""
+        if not news_list:
+            return []
+        rows = [news.to_dict() for news in news_list]
+        try:
+            result = self.client.table("analyzed_news")\
+                .upsert(rows, on_conflict="raw_news_id")\
+                .execute()
+        except Exception as e:
+            # 한 행의 오류(예: 정리된 news_raw 를 가리키는 FK)로 chunk 전체를 잃지 않도록
+            logger.warning(f"Bulk upsert of {len(rows)} analyzed news failed, falling back to single upserts: {e}")
+            return [self.upsert_analyzed_news(news) for news in news_list]
+
+        ids = {item["raw_news_id"]: item["id"] for item in result.data}
+        for row in rows:
+            if row["raw_news_id"] in ids:
+                self._update_search_index("index_analysis", row)
+        return [ids.get(row["raw_news_id"]) for row in rows]
+
     def get_high_relevance_news(self, min_score: int = 70, limit: int = 20) -> List[Dict]:
         """높은 관련성 점수의 뉴스 가져오기"""
         try:
             result = self.client.table("analyzed_news")\
-                .select("*, news_raw(*)")\
+                .select(supabase_select(HIGH_RELEVANCE_COLUMNS))\
                 .gte("relevance_score", min_score)\
                 .order("relevance_score", desc=True)\
                 .limit(limit)\
@@ -123,43 +199,20 @@ class SupabaseClient:
             return []
 
     def get_unpublished_news_by_symbol(self, symbol: str, limit: int = 5) -> List[Dict]:
-        """특정 종목 관련 미발행 뉴스"""
+        """특정 종목 관련 미발행 뉴스 (unpublished_signals 뷰에서 서버측 제외)"""
         try:
-            # 아직 발행되지 않은 분석 뉴스
-            published_ids = self._get_published_news_ids()
-
-            result = self.client.table("analyzed_news")\
+            result = self.client.table("unpublished_signals")\
                 .select("*, news_raw(*)")\
                 .contains("affected_symbols", [symbol])\
-                .limit(limit * 2)\
+                .limit(limit)\
                 .execute()
 
-            unpublished = [
-                news for news in result.data
-                if news["id"] not in published_ids
-            ][:limit]
-
-            logger.info(f"Found {len(unpublished)} unpublished news for {symbol}")
-            return unpublished
+            logger.info(f"Found {len(result.data)} unpublished news for {symbol}")
+            return result.data
         except Exception as e:
             logger.error(f"Failed to get unpublished news for {symbol}: {e}")
             return []
 
-    def _get_published_news_ids(self) -> set:
-        """이미 발행된 뉴스 ID 목록"""
-        try:
-            result = self.client.table("published_articles")\
-                .select("analyzed_news_ids")\
-                .execute()
-
-            all_ids = set()
-            for item in result.data:
-                all_ids.update(item["analyzed_news_ids"])
-            return all_ids
-        except Exception as e:
-            logger.error(f"Failed to get published news IDs: {e}")
-            return set()
-
     # ==================== Published Articles Operations ====================
 
     def insert_published_article(self, article: PublishedArticle) -> Optional[str]:
@@ -198,7 +251,7 @@ class SupabaseClient:
             cutoff_time = (datetime.now() - timedelta(hours=hours)).isoformat()
 
             result = self.client.table("analyzed_news")\
-                .select("*, news_raw(*)")\
+                .select(supabase_select(SIGNAL_COLUMNS))\
                 .eq("signal_level", level)\
                 .gte("created_at", cutoff_time)\
                 .order("relevance_score", desc=True)\
@@ -217,7 +270,7 @@ class SupabaseClient:
             cutoff_time = (datetime.now() - timedelta(hours=hours)).isoformat()
 
             result = self.client.table("analyzed_news")\
-                .select("*, news_raw(*)")\
+                .select(supabase_select(SIGNAL_COLUMNS))\
                 .contains("affected_symbols", [symbol])\
                 .gte("created_at", cutoff_time)\
                 .order("signal_level", desc=True)\
@@ -231,6 +284,75 @@ class SupabaseClient:
             logger.error(f"Failed to get signals for symbol: {e}")
             return []
 
+    def get_signals_by_levels(self, levels: List[int], hours: int = 24, limit: int = 50,
+                              symbol: Optional[str] = None, unpublished_only: bool = False) -> List[Dict]:
+        """여러 레벨 신호를 한 번에 조회 (레벨 → 관련성 순)"""
+        try:
+            cutoff_time = (datetime.now() - timedelta(hours=hours)).isoformat()
+            # 미발행 여부는 published_article_signals 기반 뷰에서 서버측으로 제외
+            query = self.client.table("unpublished_signals" if unpublished_only else "analyzed_news")\
+                .select(supabase_select(SIGNAL_COLUMNS))\
+                .in_("signal_level", list(levels))\
+                .gte("created_at", cutoff_time)
+
+            if symbol:
+                query = query.contains("affected_symbols", [symbol])
+
+            result = query.order("signal_level")\
+                .order("relevance_score", desc=True)\
+                .limit(limit)\
+                .execute()
+
+            logger.info(f"Found {len(result.data)} signals at levels {list(levels)}")
+            return result.data
+        except Exception as e:
+            logger.error(f"Failed to get signals by levels: {e}")
+            return []
+
+    def get_signals_per_level(self, levels: List[int], hours: int = 24, limit: int = 50,
+                              symbol: Optional[str] = None, unpublished_only: bool = False) -> List[Dict]:
+        """레벨마다 관련성 상위 limit 개 (signals_per_level RPC 한 번, 레벨 → 관련성 순)"""
+        try:
+            cutoff_time = (datetime.now() - timedelta(hours=hours)).isoformat()
+            result = self.client.rpc("signals_per_level", {
+                "p_levels": list(levels),
+                "p_since": cutoff_time,
+                "p_limit": limit,
+                "p_symbol": symbol,
+                "p_unpublished_only": unpublished_only,
+            }).execute()
+
+            logger.info(f"Found {len(result.data)} signals at levels {list(levels)} (up to {limit} per level)")
+            return result.data
+        except Exception as e:
+            logger.error(f"Failed to get signals per level: {e}")
+            return []
+
+    def get_signal_feed(self, levels: Optional[List[int]] = None, symbol: Optional[str] = None,
+                        hours: int = 24, limit: int = 50, cursor: Optional[str] = None) -> List[Dict]:
+        """대시보드 시그널 목록 (최신순, 키셋 커서)"""
+        cutoff_time = (datetime.now() - timedelta(hours=hours)).isoformat()
+        query = self.client.table("analyzed_news")\
+            .select(supabase_select(SIGNAL_COLUMNS))\
+            .gte("created_at", cutoff_time)
+
+        if levels:
+            query = query.in_("signal_level", list(levels))
+        if symbol:
+            query = query.contains("affected_symbols", [symbol])
+        if cursor:
+            query = query.or_(postgrest_keyset_filter(cursor))
+
+        try:
+            result = query.order("created_at", desc=True)\
+                .order("id", desc=True)\
+                .limit(limit)\
+                .execute()
+            return result.data
+        except Exception as e:
+            logger.error(f"Failed to get signal feed: {e}")
+            return []
+
     def get_trending_symbols(self, hours: int = 24, limit: int = 15) -> List[Dict]:
         """트렌딩 종목 (가장 많은 시그널) 조회"""
         try:
@@ -407,45 +529,47 @@ class SupabaseClient:
                 "last_updated": datetime.now().isoformat()
             }
 
-    def get_articles_for_dashboard(self, limit: int = 50, min_priority: int = 0, symbol: Optional[str] = None) -> List[Dict]:
-        """대시보드용 기사 목록"""
+    def count_since(self, table: str, cutoff: str) -> int:
+        """created_at >= cutoff 인 행 수"""
+        if table not in COUNTABLE_TABLES:
+            raise ValueError(f"Unknown table: {table}")
         try:
-            query = self.client.table("analyzed_news")\
-                .select("*, news_raw(*)")
+            result = self.client.table(table)\
+                .select("id", count="exact")\
+                .gte("created_at", cutoff)\
+                .limit(1)\
+                .execute()
+            return result.count or 0
+        except Exception as e:
+            logger.error(f"Failed to count {table}: {e}")
+            return 0
 
-            # 우선순위 필터
-            if min_priority > 0:
-                query = query.gte("relevance_score", min_priority)
+    def get_articles_for_dashboard(self, limit: int = 50, min_priority: int = 0,
+                                   symbol: Optional[str] = None, cursor: Optional[str] = None) -> List[Dict]:
+        """대시보드용 기사 목록 (최신순, 키셋 커서)"""
+        query = self.client.table("analyzed_news")\
+            .select(supabase_select(ARTICLE_COLUMNS))
 
-            # 종목 필터
-            if symbol:
-                query = query.contains("affected_symbols", [symbol])
+        # 우선순위 필터
+        if min_priority > 0:
+            query = query.gte("relevance_score", min_priority)
 
-            # 최근 순으로 정렬
+        # 종목 필터
+        if symbol:
+            query = query.contains("affected_symbols", [symbol])
+
+        # 다음 페이지 (커서 형식 오류는 ValueError 로 호출자에게)
+        if cursor:
+            query = query.or_(postgrest_keyset_filter(cursor))
+
+        try:
+            # 최근 순으로 정렬 (id 로 동률 정리 → 키셋이 안정적)
             result = query.order("created_at", desc=True)\
+                .order("id", desc=True)\
                 .limit(limit)\
                 .execute()
 
-            # 응답 데이터 정리
-            articles = []
-            for item in result.data:
-                raw_news = item.get("news_raw", {})
-                articles.append({
-                    "id": item.get("id"),
-                    "title": raw_news.get("title", "Untitled"),
-                    "url": raw_news.get("url", ""),
-                    "source": raw_news.get("source", "Unknown"),
-                    "symbols": item.get("affected_symbols", []),
-                    "priority_score": item.get("relevance_score", 0),
-                    "sentiment": item.get("sentiment", "neutral"),
-                    "sentiment_score": item.get("sentiment_score", 0.0),
-                    "has_policy_change": item.get("has_policy_change", False),
-                    "policy_type": item.get("policy_type", None),
-                    "published_at": raw_news.get("published_at", None),
-                    "collected_at": raw_news.get("created_at", None),
-                    "created_at": item.get("created_at", None)
-                })
-
+            articles = [format_dashboard_article(item) for item in result.data]
             logger.info(f"Retrieved {len(articles)} articles for dashboard")
             return articles
 
@@ -453,6 +577,7 @@ class SupabaseClient:
             logger.error(f"Failed to get articles for dashboard: {e}")
             return []
 
-    def get_articles_by_symbol_dashboard(self, symbol: str, limit: int = 20) -> List[Dict]:
+    def get_articles_by_symbol_dashboard(self, symbol: str, limit: int = 20,
+                                         cursor: Optional[str] = None) -> List[Dict]:
         """종목별 기사 조회 (대시보드용)"""
-        return self.get_articles_for_dashboard(limit=limit, symbol=symbol)
+        return self.get_articles_for_dashboard(limit=limit, symbol=symbol, cursor=cursor)
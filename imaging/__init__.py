@@ -0,0 +1,19 @@
+from .renderer import (
+    FORMATS,
+    OUTPUT_SIZES,
+    render_article_card,
+    render_batch,
+    render_buffer,
+    render_image,
+    render_job,
+)
+
+__all__ = [
+    'FORMATS',
+    'OUTPUT_SIZES',
+    'render_article_card',
+    'render_batch',
+    'render_buffer',
+    'render_image',
+    'render_job',
+]
@@ -0,0 +1,311 @@
+"""
+블로그 이미지 렌더러 (NumPy 벡터화)
+Vectorized renderer for placeholder and branded blog images
+
+그라디언트와 원형 오버레이를 픽셀 루프 대신 배열 연산으로 한 번에 계산하고,
+RGBX 버퍼를 Image.frombuffer 로 복사 없이 PIL 에 넘깁니다.
+크기별 거리 필드는 캐시되므로 같은 크기의 이미지를 여러 장 만들 때는
+색표 조회와 인코딩 비용만 듭니다.
+
+사용법:
+    from imaging import render_image, render_article_card
+
+    img = render_image(1200, 800, (0, 0, 0), (64, 64, 64))
+    paths = render_article_card("NVDA", "Blackwell 수요 급증", sizes=("og", "thumb"))
+"""
+
+import hashlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+Color = Tuple[int, int, int]
+
+PROJECT_ROOT = Path(__file__).parent.parent
+CARDS_DIR = PROJECT_ROOT / "public" / "images" / "cards"
+
+# 이름 → (가로, 세로). "blog" 는 기존 파일명을 그대로 씁니다 (접미사 없음)
+OUTPUT_SIZES: Dict[str, Tuple[int, int]] = {
+    "blog": (1200, 800),
+    "og": (1200, 630),
+    "square": (1080, 1080),
+    "thumb": (600, 400),
+}
+DEFAULT_SIZE = "blog"
+
+# 확장자 → (PIL 포맷, 저장 옵션)
+FORMATS: Dict[str, Tuple[str, Dict]] = {
+    "jpg": ("JPEG", {"quality": 95, "optimize": True}),
+    "webp": ("WEBP", {"quality": 90, "method": 4}),
+    "png": ("PNG", {}),
+}
+
+# 종목별 브랜드 그라디언트 (카드 기본값)
+BRAND_GRADIENTS: Dict[str, Tuple[Color, Color]] = {
+    "AAPL": ((0, 0, 0), (64, 64, 64)),
+    "ADBE": ((237, 28, 36), (255, 127, 39)),
+    "AMZN": ((35, 47, 62), (255, 153, 0)),
+    "GOOGL": ((66, 133, 244), (219, 68, 55)),
+    "META": ((0, 102, 255), (0, 153, 255)),
+    "MSFT": ((0, 120, 212), (0, 164, 239)),
+    "NFLX": ((229, 9, 20), (139, 0, 0)),
+    "NVDA": ((118, 185, 0), (0, 128, 0)),
+    "TSLA": ((220, 38, 38), (120, 20, 20)),
+    "UBER": ((0, 0, 0), (50, 50, 50)),
+}
+DEFAULT_GRADIENT: Tuple[Color, Color] = ((24, 24, 34), (64, 64, 96))
+
+# 한글 제목을 그릴 수 있는 글꼴 우선, 없으면 DejaVu → PIL 기본 글꼴
+FONT_CANDIDATES = (
+    "NotoSansCJK-Bold.ttc",
+    "NotoSansKR-Bold.otf",
+    "NanumGothicBold.ttf",
+    "AppleSDGothicNeo.ttc",
+    "malgunbd.ttf",
+    "DejaVuSans-Bold.ttf",
+)
+
+# 원형 오버레이: 중앙에서 100px 간격 5개 링, 2px 두께, 매우 옅은 흰색
+RING_COUNT = 5
+RING_SPACING = 100
+RING_WIDTH = 2
+
+# 그라디언트 색표 단계 수 (대각선 1442px 보다 촘촘하면 기존 픽셀 보간과 ±1 이내)
+GRADIENT_LEVELS = 4096
+
+
+# ==================== 배열 연산 ====================
+
+@lru_cache(maxsize=16)
+def _diagonal_index(width: int, height: int) -> np.ndarray:
+    """왼쪽 위 모서리로부터의 거리 / 대각선 길이를 GRADIENT_LEVELS 단계로 양자화 (H, W)"""
+    y = np.arange(height, dtype=np.float32)[:, None]
+    x = np.arange(width, dtype=np.float32)[None, :]
+    ratio = np.hypot(x, y) / np.float32(np.hypot(width, height))
+    index = np.rint(ratio * (GRADIENT_LEVELS - 1)).astype(np.uint16)
+    index.setflags(write=False)
+    return index
+
+
+@lru_cache(maxsize=16)
+def _ring_pixels(width: int, height: int) -> Tuple[np.ndarray, np.ndarray]:
+    """중앙 동심원 링에 걸리는 픽셀의 평탄 인덱스와 알파 (0~1)"""
+    y = np.arange(height, dtype=np.float32)[:, None] - height // 2
+    x = np.arange(width, dtype=np.float32)[None, :] - width // 2
+    distance = np.hypot(x, y)
+
+    alpha = np.zeros((height, width), dtype=np.float32)
+    max_radius = min(width, height) // 2
+    for i in range(RING_COUNT):
+        radius = max_radius - i * RING_SPACING
+        if radius <= 0:
+            break
+        ring = (distance <= radius) & (distance > radius - RING_WIDTH)
+        alpha[ring] = (5 + i * 2) / 255
+
+    index = np.flatnonzero(alpha)
+    return index, alpha.ravel()[index][:, None]
+
+
+def _gradient_lut(color1: Color, color2: Color) -> np.ndarray:
+    """단계별 RGBX 색표 (GRADIENT_LEVELS,) uint32"""
+    ratio = np.linspace(0, 1, GRADIENT_LEVELS, dtype=np.float32)[:, None]
+    lut = np.empty((GRADIENT_LEVELS, 4), dtype=np.uint8)
+    lut[:, :3] = np.asarray(color1, np.float32) * (1 - ratio) + np.asarray(color2, np.float32) * ratio
+    lut[:, 3] = 255
+    return lut.view(np.uint32).ravel()
+
+
+def render_buffer(width: int, height: int, color1: Color, color2: Color,
+                  overlay: bool = False) -> np.ndarray:
+    """
+    대각선 그라디언트 RGBX 버퍼 (H, W, 4) uint8
+
+    픽셀마다 보간하지 않고 색표(GRADIENT_LEVELS 단계)를 만든 뒤
+    캐시된 거리 인덱스로 한 번에 조회합니다.
+
+    Args:
+        color1: 왼쪽 위 색
+        color2: 오른쪽 아래 색
+        overlay: 중앙 동심원 오버레이 합성 여부
+    """
+    pixels = np.take(_gradient_lut(color1, color2), _diagonal_index(width, height))
+    buffer = pixels.view(np.uint8).reshape(height, width, 4)
+
+    if overlay:
+        add_ring_overlay(buffer)
+    return buffer
+
+
+def add_ring_overlay(buffer: np.ndarray) -> np.ndarray:
+    """중앙 동심원 링 픽셀만 흰색과 알파 블렌딩 (H, W, 3 또는 4 uint8 버퍼를 제자리 수정)"""
+    height, width, channels = buffer.shape
+    index, alpha = _ring_pixels(width, height)
+    flat = buffer.reshape(-1, channels)
+    flat[index, :3] = flat[index, :3] * (1 - alpha) + 255 * alpha
+    return buffer
+
+
+def to_image(buffer: np.ndarray) -> Image.Image:
+    """RGBX 버퍼를 복사 없이 PIL 이미지로 (읽기 전용, 버퍼와 메모리 공유)"""
+    height, width = buffer.shape[:2]
+    return Image.frombuffer("RGBX", (width, height), buffer, "raw", "RGBX", 0, 1)
+
+
+def render_image(width: int, height: int, color1: Color, color2: Color,
+                 overlay: bool = False) -> Image.Image:
+    """대각선 그라디언트 이미지"""
+    return to_image(render_buffer(width, height, color1, color2, overlay))
+
+
+# ==================== 텍스트 (브랜드 카드) ====================
+
+@lru_cache(maxsize=8)
+def _load_font(size: int):
+    for name in FONT_CANDIDATES:
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    return ImageFont.load_default()
+
+
+def _wrap(draw: ImageDraw.ImageDraw, text: str, font, max_width: int) -> List[str]:
+    lines, line = [], ""
+    for word in text.split():
+        candidate = f"{line} {word}".strip()
+        if line and draw.textlength(candidate, font=font) > max_width:
+            lines.append(line)
+            line = word
+        else:
+            line = candidate
+    if line:
+        lines.append(line)
+    return lines
+
+
+def draw_card_text(img: Image.Image, title: str, subtitle: Optional[str] = None,
+                   symbol: Optional[str] = None) -> Image.Image:
+    """제목/부제/종목 배지를 그린 새 이미지 (원본 버퍼는 건드리지 않음)"""
+    img = img.convert("RGB")
+    draw = ImageDraw.Draw(img)
+    width, height = img.size
+    margin = width // 15
+
+    title_font = _load_font(max(24, width // 18))
+    small_font = _load_font(max(16, width // 36))
+
+    y = margin
+    if symbol:
+        draw.text((margin, y), symbol, fill=(255, 255, 255), font=small_font)
+        y += int(getattr(small_font, "size", 16) * 1.8)
+
+    lines = _wrap(draw, title, title_font, width - 2 * margin)
+    line_height = int(getattr(title_font, "size", 20) * 1.3)
+    y = max(y, (height - line_height * len(lines)) // 2)
+    for line in lines:
+        draw.text((margin, y), line, fill=(255, 255, 255), font=title_font)
+        y += line_height
+
+    if subtitle:
+        draw.text((margin, y + line_height // 3), subtitle, fill=(230, 230, 230), font=small_font)
+    return img
+
+
+# ==================== 저장 / 배치 ====================
+
+def output_path(output_dir: Path, stem: str, size: str, fmt: str) -> Path:
+    """blog 크기는 기존 파일명 그대로, 나머지는 _<크기> 접미사"""
+    suffix = "" if size == DEFAULT_SIZE else f"_{size}"
+    return Path(output_dir) / f"{stem}{suffix}.{fmt}"
+
+
+def save_image(img: Image.Image, path: Path, fmt: str) -> Path:
+    pil_format, options = FORMATS[fmt]
+    if pil_format == "PNG" and img.mode == "RGBX":
+        img = img.convert("RGB")  # PNG 는 RGBX 를 지원하지 않음
+    img.save(path, pil_format, **options)
+    return path
+
+
+def render_job(job: Dict) -> List[str]:
+    """
+    한 이미지의 모든 크기/포맷 렌더링 (프로세스 풀 작업 단위)
+
+    job 키:
+        stem, gradient, output_dir (필수)
+        sizes, formats, overlay, title, subtitle, symbol (선택, title 이 있으면 텍스트 카드)
+    """
+    output_dir = Path(job["output_dir"])
+    output_dir.mkdir(parents=True, exist_ok=True)
+    color1, color2 = job["gradient"]
+
+    paths = []
+    for size in job.get("sizes") or (DEFAULT_SIZE,):
+        width, height = OUTPUT_SIZES[size]
+        img = render_image(width, height, tuple(color1), tuple(color2), job.get("overlay", False))
+        if job.get("title"):
+            img = draw_card_text(img, job["title"], job.get("subtitle"), job.get("symbol"))
+        for fmt in job.get("formats") or ("jpg",):
+            paths.append(str(save_image(img, output_path(output_dir, job["stem"], size, fmt), fmt)))
+    return paths
+
+
+def render_batch(jobs: Sequence[Dict], workers: Optional[int] = None) -> Tuple[List[str], Dict[str, str]]:
+    """
+    여러 작업을 프로세스 풀에서 렌더링
+
+    Args:
+        workers: 프로세스 수 (None = CPU 수, 1 = 현재 프로세스에서 순차 실행)
+
+    Returns:
+        (저장된 경로 목록, {stem: 오류 메시지})
+    """
+    paths: List[str] = []
+    failures: Dict[str, str] = {}
+
+    if workers == 1 or len(jobs) <= 1:
+        for job in jobs:
+            try:
+                paths.extend(render_job(job))
+            except Exception as e:
+                failures[job["stem"]] = f"{type(e).__name__}: {e}"
+        return paths, failures
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(render_job, job): job["stem"] for job in jobs}
+        for future in as_completed(futures):
+            try:
+                paths.extend(future.result())
+            except Exception as e:
+                failures[futures[future]] = f"{type(e).__name__}: {e}"
+    return paths, failures
+
+
+def render_article_card(symbol: str, title: str, subtitle: Optional[str] = None,
+                        output_dir: Path = CARDS_DIR, sizes: Iterable[str] = ("og",),
+                        formats: Iterable[str] = ("jpg",),
+                        gradient: Optional[Tuple[Color, Color]] = None) -> List[Path]:
+    """
+    기사별 브랜드 카드 즉시 생성 (종목 색 그라디언트 + 제목)
+
+    파일명은 <종목>_<제목 해시> 이므로 같은 제목이면 같은 파일을 덮어씁니다.
+    """
+    symbol = symbol.upper()
+    title_hash = hashlib.md5(title.encode()).hexdigest()[:8]
+    job = {
+        "stem": f"{symbol}_{title_hash}",
+        "gradient": gradient or BRAND_GRADIENTS.get(symbol, DEFAULT_GRADIENT),
+        "output_dir": str(output_dir),
+        "sizes": list(sizes),
+        "formats": list(formats),
+        "overlay": True,
+        "title": title,
+        "subtitle": subtitle,
+        "symbol": symbol,
+    }
+    return [Path(p) for p in render_job(job)]
@@ -22,8 +22,6 @@ logger.add(
     compression="zip"
 )
 
-from scheduler.jobs import JobScheduler
-
 def main():
     parser = argparse.ArgumentParser(
         description="Stock News Automation System"
@@ -43,6 +41,8 @@ def main():
 
     args = parser.parse_args()
 
+    # 모드를 고른 뒤에 import → 각 모드는 필요한 컴포넌트만 로드 (pipeline/registry.py)
+    from scheduler.jobs import JobScheduler
     scheduler = JobScheduler()
 
     try:
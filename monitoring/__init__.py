@@ -0,0 +1,11 @@
+from .metrics import inc, observe, set_gauge, timer, render_prometheus, start_snapshot_writer, write_snapshot
+
+__all__ = [
+    'inc',
+    'observe',
+    'set_gauge',
+    'timer',
+    'render_prometheus',
+    'start_snapshot_writer',
+    'write_snapshot'
+]
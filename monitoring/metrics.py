@@ -0,0 +1,287 @@
+"""
+경량 메트릭 계측
+Lightweight metrics instrumentation
+
+- counter / histogram / gauge (라벨: source, layer, symbol, stage, op ...)
+- timer(): with 문과 데코레이터 모두 지원하는 구간 타이머 (histogram 기록)
+- render_prometheus(): Prometheus 텍스트 포맷 (dashboard/server.py /metrics)
+- 선택적 주기 JSON 스냅샷 (.cache/metrics/<process>.json)
+  → 스케줄러 등 다른 프로세스의 메트릭도 대시보드 /metrics 에 함께 노출
+
+METRICS_ENABLED=false 이면 모든 호출이 즉시 반환하고 timer()는 공용 no-op 객체를 돌려줍니다.
+
+사용법:
+    from monitoring.metrics import timer, inc
+
+    with timer("collector_fetch_seconds", source="Bloomberg", layer="1"):
+        articles = collector.fetch_news()
+    inc("collector_articles_total", len(articles), source="Bloomberg", layer="1")
+
+    @timer("analysis_run_seconds")
+    def run_analysis(...): ...
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+PREFIX = "aivesto_"
+ENABLED = os.getenv("METRICS_ENABLED", "true").lower() in ("1", "true", "yes")
+SNAPSHOT_DIR = Path(__file__).parent.parent / ".cache" / "metrics"
+SNAPSHOT_INTERVAL = float(os.getenv("METRICS_SNAPSHOT_INTERVAL", 0))  # 0 = 스냅샷 끔
+SNAPSHOT_MAX_AGE = 600  # 이보다 오래된 다른 프로세스 스냅샷은 무시 (초)
+
+# 초 단위 지연 버킷 (DB 호출 ~ 전체 파이프라인)
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items() if v is not None))
+
+
+class _Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def to_dict(self) -> Dict:
+        return {"buckets": list(self.buckets), "counts": self.counts, "sum": self.sum, "count": self.count}
+
+
+class MetricsRegistry:
+    """프로세스 단위 메트릭 저장소 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters: Dict[str, Dict[LabelKey, float]] = {}
+        self.gauges: Dict[str, Dict[LabelKey, float]] = {}
+        self.histograms: Dict[str, Dict[LabelKey, _Histogram]] = {}
+
+    def inc(self, name: str, value: float = 1, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            series = self.counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def set(self, name: str, value: float, **labels):
+        with self._lock:
+            self.gauges.setdefault(name, {})[_label_key(labels)] = value
+
+    def observe(self, name: str, value: float, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            series = self.histograms.setdefault(name, {})
+            if key not in series:
+                series[key] = _Histogram()
+            series[key].observe(value)
+
+    def snapshot(self) -> Dict:
+        """JSON 직렬화 가능한 현재 값"""
+        def rows(metrics, convert=lambda v: v):
+            return {
+                name: [{"labels": dict(key), "value": convert(value)} for key, value in series.items()]
+                for name, series in metrics.items()
+            }
+
+        with self._lock:
+            return {
+                "process": _process_name(),
+                "pid": os.getpid(),
+                "timestamp": time.time(),
+                "counters": rows(self.counters),
+                "gauges": rows(self.gauges),
+                "histograms": rows(self.histograms, lambda h: h.to_dict()),
+            }
+
+
+registry = MetricsRegistry()
+
+
+# ==================== 기록 API ====================
+
+def inc(name: str, value: float = 1, **labels):
+    if ENABLED:
+        registry.inc(name, value, **labels)
+
+
+def set_gauge(name: str, value: float, **labels):
+    if ENABLED:
+        registry.set(name, value, **labels)
+
+
+def observe(name: str, seconds: float, **labels):
+    if ENABLED:
+        registry.observe(name, seconds, **labels)
+
+
+class _Timer:
+    """with 블록/데코레이터 구간 시간 → histogram, 예외 시 <name>_errors_total 증가"""
+
+    __slots__ = ("name", "labels", "_start")
+
+    def __init__(self, name: str, labels: Dict):
+        self.name = name
+        self.labels = labels
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        registry.observe(self.name, time.perf_counter() - self._start, **self.labels)
+        if exc_type is not None:
+            registry.inc(f"{self.name.removesuffix('_seconds')}_errors_total", **self.labels)
+        return False
+
+    def __call__(self, func):
+        name, labels = self.name, self.labels
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not ENABLED:
+                return func(*args, **kwargs)
+            with _Timer(name, labels):
+                return func(*args, **kwargs)
+        return wrapper
+
+
+class _NoopTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __call__(self, func):
+        return func
+
+
+_NOOP = _NoopTimer()
+
+
+def timer(name: str, **labels):
+    """구간 타이머 (with 문 또는 @데코레이터)"""
+    if not ENABLED:
+        return _NOOP
+    return _Timer(name, labels)
+
+
+# ==================== Prometheus 텍스트 포맷 ====================
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ")
+
+
+def _format_labels(labels: Dict, extra: Optional[Dict] = None) -> str:
+    merged = {**labels, **(extra or {})}
+    if not merged:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in sorted(merged.items())) + "}"
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+def _render_snapshot(snapshot: Dict, lines: Dict[str, list], extra: Optional[Dict] = None):
+    for kind, type_name in (("counters", "counter"), ("gauges", "gauge")):
+        for name, series in snapshot[kind].items():
+            metric = PREFIX + name
+            out = lines.setdefault(metric, [f"# TYPE {metric} {type_name}"])
+            for row in series:
+                out.append(f"{metric}{_format_labels(row['labels'], extra)} {_format_value(row['value'])}")
+
+    for name, series in snapshot["histograms"].items():
+        metric = PREFIX + name
+        out = lines.setdefault(metric, [f"# TYPE {metric} histogram"])
+        for row in series:
+            hist = row["value"]
+            cumulative = 0
+            for bound, count in zip(list(hist["buckets"]) + ["+Inf"], hist["counts"]):
+                cumulative += count
+                out.append(f"{metric}_bucket{_format_labels(row['labels'], {**(extra or {}), 'le': bound})} {cumulative}")
+            out.append(f"{metric}_sum{_format_labels(row['labels'], extra)} {hist['sum']:.6f}")
+            out.append(f"{metric}_count{_format_labels(row['labels'], extra)} {hist['count']}")
+
+
+def render_prometheus(include_snapshots: bool = True) -> str:
+    """현재 프로세스 + (선택) 다른 프로세스 스냅샷을 Prometheus 텍스트로"""
+    lines: Dict[str, list] = {}
+    _render_snapshot(registry.snapshot(), lines)
+
+    if include_snapshots and SNAPSHOT_DIR.exists():
+        own = _process_name()
+        for path in sorted(SNAPSHOT_DIR.glob("*.json")):
+            try:
+                snapshot = json.loads(path.read_text())
+            except (OSError, ValueError):
+                continue
+            if snapshot.get("process") == own or time.time() - snapshot.get("timestamp", 0) > SNAPSHOT_MAX_AGE:
+                continue
+            _render_snapshot(snapshot, lines, {"process": snapshot["process"]})
+
+    return "\n".join(line for block in lines.values() for line in block) + "\n"
+
+
+# ==================== JSON 스냅샷 ====================
+
+_process_label: Optional[str] = None
+
+
+def _process_name() -> str:
+    return _process_label or f"pid{os.getpid()}"
+
+
+def write_snapshot(path: Optional[Path] = None) -> Path:
+    """현재 값을 JSON으로 원자적 저장"""
+    path = Path(path) if path else SNAPSHOT_DIR / f"{_process_name()}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(registry.snapshot(), ensure_ascii=False))
+    os.replace(tmp, path)
+    return path
+
+
+def start_snapshot_writer(process: str, interval: float = SNAPSHOT_INTERVAL) -> Optional[threading.Thread]:
+    """
+    interval 초마다 스냅샷을 쓰는 데몬 스레드 시작
+
+    Args:
+        process: 스냅샷 파일명/process 라벨 (예: "scheduler")
+        interval: 0 이하면 시작하지 않음 (METRICS_SNAPSHOT_INTERVAL)
+    """
+    global _process_label
+    _process_label = process
+    if not ENABLED or interval <= 0:
+        return None
+
+    def loop():
+        while True:
+            time.sleep(interval)
+            try:
+                write_snapshot()
+            except OSError:
+                pass
+
+    thread = threading.Thread(target=loop, name="metrics-snapshot", daemon=True)
+    thread.start()
+    return thread
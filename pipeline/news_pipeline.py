@@ -7,25 +7,16 @@ sys.path.append('..')
 
 from typing import List, Dict, Optional
 from datetime import datetime
+from functools import cached_property
 from loguru import logger
 
-# Collectors
-from collectors.bloomberg_collector import BloombergCollector
-from collectors.reuters_collector import ReutersCollector
-from collectors.wsj_collector import WSJCollector
-from collectors.fox_collector import FoxCollector
-from collectors.cnn_collector import CNNCollector
-from collectors.yahoo_collector import YahooCollector
-
-# Analyzers
-from analyzers.ner_extractor import NERExtractor
-from analyzers.sentiment_analyzer import SentimentAnalyzer
-from analyzers.policy_detector import PolicyDetector
-from analyzers.amplification_detector import AmplificationDetector
+# Collectors / Analyzers 는 처음 쓸 때 레지스트리에서 로드
+from pipeline.registry import LAYER1_COLLECTORS, LAYER2_COLLECTORS, create
 
 # Database
-from database.supabase_client import SupabaseClient
+from database.storage import StorageBackend
 from database.models import RawNews
+from monitoring.metrics import inc, timer
 
 
 class NewsPipeline:
@@ -42,42 +33,40 @@ class NewsPipeline:
     7. Supabase 저장
     """
 
-    def __init__(self, db_client: Optional[SupabaseClient] = None, use_finbert: bool = False):
+    def __init__(self, db_client: Optional[StorageBackend] = None, use_finbert: bool = False):
         """
         Args:
-            db_client: Supabase 클라이언트 (None이면 저장만 안 함, 수집은 진행)
+            db_client: 저장소 (database.storage.get_storage, None이면 저장만 안 함, 수집은 진행)
             use_finbert: FinBERT 사용 여부 (느리지만 정확)
         """
         self.db = db_client
-
-        # 더미 DB 클라이언트 (수집기 초기화용)
-        dummy_db = db_client if db_client else type('DummyDB', (), {})()
-
-        # Layer 1 수집기 (항상 초기화)
-        self.layer1_collectors = [
-            BloombergCollector(dummy_db),
-            ReutersCollector(dummy_db),
-            WSJCollector(dummy_db)
-        ]
-
-        # Layer 2 수집기 (항상 초기화)
-        self.layer2_collectors = [
-            FoxCollector(dummy_db),
-            CNNCollector(dummy_db),
-            YahooCollector(dummy_db)
-        ]
-
-        # 분석 엔진
-        self.ner = NERExtractor(use_spacy=False)  # Regex만 (빠름)
-        self.sentiment = SentimentAnalyzer(use_finbert=use_finbert)
-        self.policy = PolicyDetector()
-        self.amplification = AmplificationDetector(time_window_hours=24)
+        self.use_finbert = use_finbert
 
         logger.info("NewsPipeline initialized")
-        logger.info(f"  Layer 1 collectors: {len(self.layer1_collectors)}")
-        logger.info(f"  Layer 2 collectors: {len(self.layer2_collectors)}")
+        logger.info(f"  Layer 1 collectors: {len(LAYER1_COLLECTORS)}")
+        logger.info(f"  Layer 2 collectors: {len(LAYER2_COLLECTORS)}")
         logger.info(f"  FinBERT enabled: {use_finbert}")
 
+    # Layer 1 수집기
+    @cached_property
+    def layer1_collectors(self):
+        return [create(name, self.db) for name in LAYER1_COLLECTORS]
+
+    # Layer 2 수집기
+    @cached_property
+    def layer2_collectors(self):
+        return [create(name, self.db) for name in LAYER2_COLLECTORS]
+
+    # 분석 엔진 (상주 분석 서비스가 떠 있으면 사용, 없으면 프로세스 안에서)
+    @cached_property
+    def analysis(self):
+        from analyzers.analysis_service import AnalysisClient
+        return AnalysisClient(use_finbert=self.use_finbert)
+
+    @cached_property
+    def amplification(self):
+        return create("amplification_detector", time_window_hours=24)
+
     def run(self, save_to_db: bool = True) -> Dict:
         """
         전체 파이프라인 실행
@@ -103,30 +92,35 @@ class NewsPipeline:
             self.db.cleanup_old_news()
 
         # 1. Layer 1 수집
-        layer1_articles = self._collect_layer1()
+        with timer("pipeline_stage_seconds", stage="collect_layer1"):
+            layer1_articles = self._collect_layer1()
         logger.info(f"✅ Layer 1 collected: {len(layer1_articles)} articles")
 
         # 2. Layer 2 수집
-        layer2_articles = self._collect_layer2()
+        with timer("pipeline_stage_seconds", stage="collect_layer2"):
+            layer2_articles = self._collect_layer2()
         logger.info(f"✅ Layer 2 collected: {len(layer2_articles)} articles")
 
         # 3. 분석 파이프라인 (Layer 1 + Layer 2)
         all_articles = layer1_articles + layer2_articles
-        analyzed_articles = self._analyze_articles(all_articles)
+        with timer("pipeline_stage_seconds", stage="analyze"):
+            analyzed_articles = self._analyze_articles(all_articles)
         logger.info(f"✅ Analysis complete: {len(analyzed_articles)} articles")
 
         # 4. 증폭 감지
-        amplification_results = self._detect_amplification(
-            layer1_articles,
-            layer2_articles,
-            analyzed_articles
-        )
+        with timer("pipeline_stage_seconds", stage="amplification"):
+            amplification_results = self._detect_amplification(
+                layer1_articles,
+                layer2_articles,
+                analyzed_articles
+            )
         logger.info(f"✅ Amplification detection complete")
 
         # 5. Supabase 저장
         saved_count = 0
         if save_to_db and self.db:
-            saved_count = self._save_to_database(analyzed_articles)
+            with timer("pipeline_stage_seconds", stage="save"):
+                saved_count = self._save_to_database(analyzed_articles)
             logger.info(f"✅ Saved to Supabase: {saved_count} articles")
 
         # 통계
@@ -144,6 +138,9 @@ class NewsPipeline:
             'amplification_detected': amplification_results.get('has_amplification', False),
             'duration_seconds': round(duration, 2)
         }
+        inc("pipeline_runs_total")
+        inc("pipeline_articles_total", stats['total_articles'])
+        inc("pipeline_high_priority_total", stats['high_priority_count'])
 
         logger.info("\n" + "="*60)
         logger.info("📊 Pipeline Stats:")
@@ -171,10 +168,13 @@ class NewsPipeline:
 
         for collector in self.layer1_collectors:
             try:
-                articles = collector.fetch_news()
+                with timer("collector_fetch_seconds", source=collector.source_name, layer="1"):
+                    articles = collector.fetch_news()
                 all_articles.extend(articles)
+                inc("collector_articles_total", len(articles), source=collector.source_name, layer="1")
                 logger.info(f"  {collector.source_name}: {len(articles)}")
             except Exception as e:
+                inc("collector_errors_total", source=collector.source_name, layer="1")
                 logger.error(f"  ❌ {collector.source_name} failed: {e}")
 
         return all_articles
@@ -186,10 +186,13 @@ class NewsPipeline:
 
         for collector in self.layer2_collectors:
             try:
-                articles = collector.fetch_news()
+                with timer("collector_fetch_seconds", source=collector.source_name, layer="2"):
+                    articles = collector.fetch_news()
                 all_articles.extend(articles)
+                inc("collector_articles_total", len(articles), source=collector.source_name, layer="2")
                 logger.info(f"  {collector.source_name}: {len(articles)}")
             except Exception as e:
+                inc("collector_errors_total", source=collector.source_name, layer="2")
                 logger.error(f"  ❌ {collector.source_name} failed: {e}")
 
         return all_articles
@@ -199,44 +202,32 @@ class NewsPipeline:
         logger.info("\n🔬 Analyzing articles...")
         analyzed = []
 
-        for article in articles:
-            try:
-                # 텍스트 준비
-                text = f"{article.title} {article.content or ''}"
-
-                # 1. NER (종목 심볼 추출)
-                symbols = self.ner.extract_symbols(text)
-
-                # 2. Sentiment (감성 분석)
-                sentiment_result = self.sentiment.analyze(text, method='vader')
-
-                # 3. Policy (정책 감지)
-                policy_result = self.policy.detect(text)
-
-                # 4. Priority Score 계산
-                priority_score = self._calculate_priority_score(
-                    sentiment_result,
-                    policy_result,
-                    len(symbols)
-                )
-
-                # 결과 저장
-                analyzed_article = {
-                    'raw_news': article,
-                    'symbols': symbols,
-                    'sentiment': sentiment_result['sentiment'],
-                    'sentiment_score': sentiment_result['score'],
-                    'has_policy': policy_result['has_policy_change'],
-                    'policy_type': policy_result['change_type'],
-                    'policy_description': policy_result.get('policy_description', ''),
-                    'priority_score': priority_score,
-                    'analyzed_at': datetime.now().isoformat()
-                }
-
-                analyzed.append(analyzed_article)
-
-            except Exception as e:
-                logger.warning(f"  Analysis failed for article: {e}")
+        results = self.analysis.analyze_many(articles, method='vader')
+
+        for article, result in zip(articles, results):
+            if result is None:
+                continue
+            symbols, sentiment_result, policy_result = result['symbols'], result['sentiment'], result['policy']
+
+            # Priority Score 계산
+            priority_score = self._calculate_priority_score(
+                sentiment_result,
+                policy_result,
+                len(symbols)
+            )
+
+            # 결과 저장
+            analyzed.append({
+                'raw_news': article,
+                'symbols': symbols,
+                'sentiment': sentiment_result['sentiment'],
+                'sentiment_score': sentiment_result['score'],
+                'has_policy': policy_result['has_policy_change'],
+                'policy_type': policy_result['change_type'],
+                'policy_description': policy_result.get('policy_description', ''),
+                'priority_score': priority_score,
+                'analyzed_at': datetime.now().isoformat()
+            })
 
         return analyzed
 
@@ -0,0 +1,84 @@
+"""
+지연 로딩 컴포넌트 레지스트리
+Lazy component registry
+
+수집기/분석기/작성기 등 컴포넌트를 "모듈:클래스" 문자열로 등록해 두고,
+처음 사용할 때 해당 모듈만 import 합니다. 크론으로 짧게 도는 CLI 모드
+(collect/analyze/generate)가 쓰지 않는 모듈(torch, spaCy, 알림 등)을
+import 하느라 시작 시간을 쓰지 않도록 합니다.
+
+MODE_COMPONENTS 는 main.py 의 각 --mode 가 필요로 하는 컴포넌트 목록이며,
+benchmarks/startup.py 가 모드별 시작 시간을 잴 때도 사용합니다.
+
+사용법:
+    collector = create("finnhub_collector", db)
+    SentimentAnalyzer = resolve("sentiment_analyzer")
+"""
+
+import importlib
+from typing import Dict, Tuple
+
+COMPONENTS: Dict[str, str] = {
+    # Collectors (API / RSS)
+    "finnhub_collector": "collectors.finnhub_collector:FinnhubCollector",
+    "alpha_vantage_collector": "collectors.alpha_vantage_collector:AlphaVantageCollector",
+    "rss_collector": "collectors.rss_collector:RSSCollector",
+    # Collectors (Layer 1 / Layer 2)
+    "bloomberg_collector": "collectors.bloomberg_collector:BloombergCollector",
+    "reuters_collector": "collectors.reuters_collector:ReutersCollector",
+    "wsj_collector": "collectors.wsj_collector:WSJCollector",
+    "fox_collector": "collectors.fox_collector:FoxCollector",
+    "cnn_collector": "collectors.cnn_collector:CNNCollector",
+    "yahoo_collector": "collectors.yahoo_collector:YahooCollector",
+    # Analyzers
+    "analysis_pipeline": "analyzers.analysis_pipeline:AnalysisPipeline",
+    "ner_extractor": "analyzers.ner_extractor:NERExtractor",
+    "sentiment_analyzer": "analyzers.sentiment_analyzer:SentimentAnalyzer",
+    "policy_detector": "analyzers.policy_detector:PolicyDetector",
+    "amplification_detector": "analyzers.amplification_detector:AmplificationDetector",
+    # Output
+    "article_generator": "writers.article_generator:ArticleGenerator",
+    "signal_api": "dashboard.signal_api:SignalAPI",
+    "email_alerts": "alerts.email_alerts:EmailAlertService",
+    "telegram_alerts": "alerts.telegram_alerts:TelegramAlertService",
+    "article_queue": "blogger.article_queue:ArticleQueueManager",
+}
+
+API_COLLECTORS = ("finnhub_collector", "alpha_vantage_collector", "rss_collector")
+LAYER1_COLLECTORS = ("bloomberg_collector", "reuters_collector", "wsj_collector")
+LAYER2_COLLECTORS = ("fox_collector", "cnn_collector", "yahoo_collector")
+
+# main.py --mode → 필요한 컴포넌트 (run/once 는 전체)
+MODE_COMPONENTS: Dict[str, Tuple[str, ...]] = {
+    "collect": API_COLLECTORS,
+    "analyze": ("analysis_pipeline",),
+    "generate": ("article_generator",),
+    "run": API_COLLECTORS + (
+        "analysis_pipeline", "article_generator", "signal_api",
+        "email_alerts", "telegram_alerts", "article_queue",
+    ),
+}
+MODE_COMPONENTS["once"] = MODE_COMPONENTS["run"]
+
+# 시작 시간 벤치마크에서 로드 여부를 확인하는 무거운 모듈
+HEAVY_MODULES = ("torch", "transformers", "spacy", "pandas", "supabase")
+
+_resolved: Dict[str, type] = {}
+
+
+def resolve(name: str) -> type:
+    """등록된 컴포넌트 클래스 (첫 호출 때만 모듈 import)"""
+    cls = _resolved.get(name)
+    if cls is None:
+        try:
+            target = COMPONENTS[name]
+        except KeyError:
+            raise ValueError(f"Unknown component: {name}") from None
+        module_name, attr = target.split(":")
+        cls = _resolved[name] = getattr(importlib.import_module(module_name), attr)
+    return cls
+
+
+def create(name: str, *args, **kwargs):
+    """등록된 컴포넌트 인스턴스 생성"""
+    return resolve(name)(*args, **kwargs)
@@ -0,0 +1,468 @@
+"""
+분석 작업 큐 (리스 기반 분배)
+Lease-based work distribution for parallel analysis agents
+
+batch_01..20.json / batch_metadata.json 처럼 미분석 뉴스를 손으로 나눠 에이전트에 주던
+방식을 대신하는 로컬 내구성 큐입니다 (.cache/work_queue.sqlite, 여러 프로세스가 공유).
+
+- sync:      저장소의 미분석 뉴스를 큐에 추가 (news_raw 스냅샷 포함, 이미 있는 ID 는 무시)
+- lease:     워커가 배치를 리스로 가져감 (lease_ttl 초 안에 heartbeat 또는 submit)
+- heartbeat: 리스 연장 (리스를 잃었으면 False → 워커는 배치를 버림)
+- submit:    결과를 도착하는 대로 검증/저장, 항목마다 한 번만 반영 (먼저 낸 결과 우선)
+- release:   제출되지 않은 항목을 큐로 되돌림
+
+만료된 리스의 항목은 다시 대기 상태가 되고 MAX_ATTEMPTS 번 실패하면 failed 로 남습니다.
+대기 항목이 없는데 straggler_after 초 넘게 걸리는 리스가 있으면 남은 항목의 절반을
+떼어 새 워커에 줍니다 (원래 워커가 먼저 끝내면 나중 결과는 중복으로 버려짐).
+
+사용법 (수동 에이전트):
+    python -m pipeline.work_queue sync
+    python -m pipeline.work_queue lease --worker agent-3 --out batch.json
+    python -m pipeline.work_queue heartbeat <lease_id>
+    python -m pipeline.work_queue submit <lease_id> analysis_results.json
+    python -m pipeline.work_queue stats
+
+자동 워커 (ANALYSIS_LLM_BACKEND 또는 --backend):
+    python -m pipeline.work_queue run --backend stub --workers 4
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from loguru import logger
+
+from analyzers.batch_worker import extract_items, to_analyzed_news
+from analyzers.llm_backends import LLMBackend
+from analyzers.relevance_analyzer import RelevanceAnalyzer, signal_level_for
+from monitoring.metrics import inc
+
+PROJECT_ROOT = Path(__file__).parent.parent
+QUEUE_PATH = PROJECT_ROOT / ".cache" / "work_queue.sqlite"
+DEFAULT_BATCH_SIZE = 20
+LEASE_TTL_SECONDS = 600
+STRAGGLER_SECONDS = 180        # 이보다 오래된 리스는 대기 항목이 없을 때 나눠 줌
+MAX_ATTEMPTS = 3
+PRUNE_AFTER_SECONDS = 48 * 3600  # 원본 뉴스는 24시간 뒤 삭제되므로 끝난 항목도 정리
+IDLE_POLL_SECONDS = 5
+
+STATES = ("pending", "leased", "ingesting", "done", "failed")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    news_id TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    lease_id TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    enqueued_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_items_state ON items (state, enqueued_at);
+CREATE INDEX IF NOT EXISTS idx_items_lease ON items (lease_id, state);
+
+CREATE TABLE IF NOT EXISTS leases (
+    lease_id TEXT PRIMARY KEY,
+    worker TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+);
+"""
+
+
+def _placeholders(values: List) -> str:
+    return ", ".join("?" * len(values))
+
+
+class WorkQueue:
+    """미분석 뉴스 ID 의 내구성 작업 큐"""
+
+    def __init__(self, path: Path = QUEUE_PATH, lease_ttl: float = LEASE_TTL_SECONDS,
+                 straggler_after: float = STRAGGLER_SECONDS, max_attempts: int = MAX_ATTEMPTS):
+        self.path = Path(path)
+        self.lease_ttl = lease_ttl
+        self.straggler_after = straggler_after
+        self.max_attempts = max_attempts
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # BEGIN IMMEDIATE 로 프로세스 간 리스/제출을 직렬화
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _transaction(self):
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    # ==================== 적재 ====================
+
+    def enqueue(self, news_list: Iterable[Dict]) -> int:
+        """뉴스(news_raw 행)를 대기열에 추가 → 새로 들어간 개수"""
+        now = time.time()
+        rows = [
+            (str(news["id"]), json.dumps(news, ensure_ascii=False, default=str), now, now)
+            for news in news_list if news.get("id")
+        ]
+        with self._transaction() as conn:
+            added = conn.executemany(
+                "INSERT OR IGNORE INTO items (news_id, payload, enqueued_at, updated_at) VALUES (?, ?, ?, ?)",
+                rows
+            ).rowcount
+        inc("work_queue_enqueued_total", added)
+        return added
+
+    def sync(self, db, limit: int = 1000) -> int:
+        """저장소의 미분석 뉴스를 큐에 반영하고 오래된 완료 항목 정리"""
+        added = self.enqueue(db.get_unanalyzed_news(limit=limit))
+        with self._transaction() as conn:
+            pruned = conn.execute(
+                "DELETE FROM items WHERE state IN ('done', 'failed') AND updated_at < ?",
+                (time.time() - PRUNE_AFTER_SECONDS,)
+            ).rowcount
+        logger.info(f"Work queue sync: {added} enqueued, {pruned} pruned")
+        return added
+
+    # ==================== 리스 ====================
+
+    def lease(self, worker: str, batch_size: int = DEFAULT_BATCH_SIZE) -> Optional[Dict]:
+        """
+        배치 리스
+
+        Returns:
+            {"lease_id", "worker", "expires_at", "news": [news_raw 행, ...]} 또는 None (줄 작업 없음)
+        """
+        with self._transaction() as conn:
+            now = time.time()
+            self._reap(conn, now)
+
+            rows = conn.execute(
+                "SELECT news_id, payload FROM items WHERE state = 'pending' ORDER BY enqueued_at LIMIT ?",
+                (batch_size,)
+            ).fetchall()
+            if not rows:
+                rows = self._split_straggler(conn, now, batch_size)
+            if not rows:
+                return None
+
+            lease_id = uuid.uuid4().hex
+            expires_at = now + self.lease_ttl
+            conn.execute("INSERT INTO leases VALUES (?, ?, ?, ?)", (lease_id, worker, now, expires_at))
+            conn.executemany(
+                "UPDATE items SET state = 'leased', lease_id = ?, updated_at = ? WHERE news_id = ?",
+                [(lease_id, now, row["news_id"]) for row in rows]
+            )
+
+        inc("work_queue_leases_total")
+        logger.info(f"Leased {len(rows)} news items to {worker} ({lease_id[:8]})")
+        return {
+            "lease_id": lease_id,
+            "worker": worker,
+            "expires_at": expires_at,
+            "news": [json.loads(row["payload"]) for row in rows],
+        }
+
+    def heartbeat(self, lease_id: str) -> bool:
+        """리스 연장 (이미 만료/회수됐으면 False)"""
+        with self._transaction() as conn:
+            now = time.time()
+            return conn.execute(
+                "UPDATE leases SET expires_at = ? WHERE lease_id = ? AND expires_at >= ?",
+                (now + self.lease_ttl, lease_id, now)
+            ).rowcount == 1
+
+    def release(self, lease_id: str) -> int:
+        """리스 종료: 제출되지 않은 항목을 대기열로 되돌림 (시도 횟수 증가) → 되돌린 개수"""
+        with self._transaction() as conn:
+            returned = self._requeue(conn, "state = 'leased' AND lease_id = ?", (lease_id,), time.time())
+            conn.execute("DELETE FROM leases WHERE lease_id = ?", (lease_id,))
+        if returned:
+            logger.warning(f"Returned {returned} unsubmitted items from lease {lease_id[:8]}")
+        return returned
+
+    def _requeue(self, conn, where: str, params: tuple, now: float) -> int:
+        count = conn.execute(
+            f"UPDATE items SET state = CASE WHEN attempts + 1 >= ? THEN 'failed' ELSE 'pending' END, "
+            f"attempts = attempts + 1, lease_id = NULL, updated_at = ? WHERE {where}",
+            (self.max_attempts, now, *params)
+        ).rowcount
+        inc("work_queue_requeued_total", count)
+        return count
+
+    def _reap(self, conn, now: float):
+        """만료된 리스의 항목, 오래 멈춘 저장 중 항목을 대기열로 되돌림"""
+        expired = [row["lease_id"] for row in conn.execute("SELECT lease_id FROM leases WHERE expires_at < ?", (now,))]
+        if expired:
+            returned = self._requeue(
+                conn, f"state = 'leased' AND lease_id IN ({_placeholders(expired)})", tuple(expired), now
+            )
+            conn.execute(f"DELETE FROM leases WHERE lease_id IN ({_placeholders(expired)})", expired)
+            logger.warning(f"Reaped {len(expired)} expired leases ({returned} items re-queued)")
+        self._requeue(conn, "state = 'ingesting' AND updated_at < ?", (now - self.lease_ttl,), now)
+
+    def _split_straggler(self, conn, now: float, batch_size: int) -> List[sqlite3.Row]:
+        """가장 많이 남은 오래된 리스에서 남은 항목의 절반을 떼어 옴"""
+        straggler = conn.execute(
+            "SELECT l.lease_id, COUNT(*) AS remaining FROM leases l "
+            "JOIN items i ON i.lease_id = l.lease_id AND i.state = 'leased' "
+            "WHERE l.created_at <= ? GROUP BY l.lease_id HAVING remaining >= 2 "
+            "ORDER BY remaining DESC, l.created_at LIMIT 1",
+            (now - self.straggler_after,)
+        ).fetchone()
+        if straggler is None:
+            return []
+
+        take = min(batch_size, straggler["remaining"] // 2)
+        inc("work_queue_splits_total")
+        logger.info(f"Splitting straggler lease {straggler['lease_id'][:8]}: {take}/{straggler['remaining']} items")
+        return conn.execute(
+            "SELECT news_id, payload FROM items WHERE lease_id = ? AND state = 'leased' "
+            "ORDER BY enqueued_at DESC LIMIT ?",
+            (straggler["lease_id"], take)
+        ).fetchall()
+
+    # ==================== 제출 ====================
+
+    def submit(self, lease_id: str, results: List[Dict], db, analyzer: RelevanceAnalyzer) -> Dict:
+        """
+        분석 결과 제출 (부분 제출 가능)
+
+        results 는 analysis_results_XX.json 의 항목 형식 (news_id + 분석 필드).
+        임계값 이상은 AnalyzedNews 로 일괄 저장/갱신 (raw_news_id 기준), 미만은 저장 없이 완료 처리,
+        형식 오류는 대기열로 되돌립니다. 이미 완료된 항목의 결과는 버립니다.
+
+        Returns:
+            {"saved", "filtered", "invalid", "duplicate"} 개수
+        """
+        valid, filtered, invalid = [], [], []
+        for item in results:
+            if not isinstance(item, dict) or not item.get("news_id"):
+                continue
+            news_id = str(item["news_id"])
+            try:
+                parsed = analyzer._parse_item(item)
+            except (KeyError, ValueError, TypeError) as e:
+                logger.warning(f"Invalid analysis for {news_id}: {e}")
+                invalid.append(news_id)
+                continue
+            if parsed is None:
+                filtered.append(news_id)
+            else:
+                parsed["news_id"] = news_id
+                parsed["signal_level"] = signal_level_for(parsed["relevance_score"])
+                valid.append(parsed)
+
+        # 1) 아직 끝나지 않은 항목만 선점 (다른 워커가 먼저 냈으면 중복)
+        submitted = [p["news_id"] for p in valid] + filtered
+        with self._transaction() as conn:
+            now = time.time()
+            claimed = set()
+            if submitted:
+                claimed = {
+                    row["news_id"] for row in conn.execute(
+                        f"SELECT news_id FROM items WHERE news_id IN ({_placeholders(submitted)}) "
+                        "AND state IN ('pending', 'leased')", submitted
+                    )
+                }
+                conn.executemany(
+                    "UPDATE items SET state = 'ingesting', lease_id = ?, updated_at = ? WHERE news_id = ?",
+                    [(lease_id, now, news_id) for news_id in claimed]
+                )
+            if invalid:
+                self._requeue(
+                    conn, f"state = 'leased' AND lease_id = ? AND news_id IN ({_placeholders(invalid)})",
+                    (lease_id, *invalid), now
+                )
+
+        # 2) 트랜잭션 밖에서 저장 (3 전에 멈추면 _reap 이 다시 대기열에 넣으므로 upsert 로 멱등하게)
+        valid = [p for p in valid if p["news_id"] in claimed]
+        filtered = [news_id for news_id in filtered if news_id in claimed]
+        done, unsaved = list(filtered), []
+        if valid:
+            ids = db.upsert_analyzed_news_many([to_analyzed_news(p) for p in valid])
+            for parsed, saved_id in zip(valid, ids):
+                (done if saved_id else unsaved).append(parsed["news_id"])
+
+        # 3) 완료/재시도 반영
+        with self._transaction() as conn:
+            now = time.time()
+            if done:
+                conn.execute(
+                    f"UPDATE items SET state = 'done', lease_id = NULL, updated_at = ? "
+                    f"WHERE news_id IN ({_placeholders(done)})", (now, *done)
+                )
+            if unsaved:
+                self._requeue(conn, f"news_id IN ({_placeholders(unsaved)})", tuple(unsaved), now)
+
+        summary = {
+            "saved": len(valid) - len(unsaved),
+            "filtered": len(filtered),
+            "invalid": len(invalid) + len(unsaved),
+            "duplicate": len(submitted) - len(claimed),
+        }
+        inc("work_queue_submitted_total", summary["saved"] + summary["filtered"])
+        logger.info(f"Lease {lease_id[:8]} submit: {summary}")
+        return summary
+
+    # ==================== 상태 ====================
+
+    def stats(self) -> Dict:
+        """상태별 항목 수 + 활성 리스"""
+        with self._lock:
+            counts = dict(self._conn.execute("SELECT state, COUNT(*) FROM items GROUP BY state").fetchall())
+            leases = self._conn.execute(
+                "SELECT COUNT(*) AS active, MIN(created_at) AS oldest FROM leases WHERE expires_at >= ?",
+                (time.time(),)
+            ).fetchone()
+        return {
+            **{state: counts.get(state, 0) for state in STATES},
+            "active_leases": leases["active"],
+            "oldest_lease_seconds": round(time.time() - leases["oldest"], 1) if leases["oldest"] else 0,
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# ==================== 자동 워커 ====================
+
+def _heartbeat_loop(queue: WorkQueue, lease_id: str, stop: threading.Event):
+    while not stop.wait(queue.lease_ttl / 3):
+        if not queue.heartbeat(lease_id):
+            logger.warning(f"Lost lease {lease_id[:8]}")
+            return
+
+
+def run_worker(queue: WorkQueue, db, analyzer: RelevanceAnalyzer, backend: LLMBackend,
+               worker: str, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """
+    큐가 빌 때까지 리스 → LLM 분석 → 제출 반복 → 저장 건수
+
+    대기 항목은 없지만 다른 워커의 리스가 남아 있으면 잠시 기다렸다가 느린 배치를 나눠 받습니다.
+    """
+    saved = 0
+    while True:
+        lease = queue.lease(worker, batch_size)
+        if lease is None:
+            if queue.stats()["active_leases"] == 0:
+                return saved
+            time.sleep(IDLE_POLL_SECONDS)
+            continue
+
+        stop = threading.Event()
+        threading.Thread(target=_heartbeat_loop, args=(queue, lease["lease_id"], stop), daemon=True).start()
+        try:
+            items = extract_items(backend.complete(analyzer._build_batch_prompt(lease["news"])))
+            saved += queue.submit(lease["lease_id"], items, db, analyzer)["saved"]
+        except Exception as e:
+            logger.warning(f"{worker} batch failed: {e}")
+        finally:
+            stop.set()
+            queue.release(lease["lease_id"])
+
+
+def run_workers(queue: WorkQueue, db, analyzer: RelevanceAnalyzer, backend: LLMBackend,
+                workers: int = 4, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """워커 스레드 N개로 큐 처리 → 저장 건수"""
+    totals = [0] * workers
+
+    def work(index: int):
+        totals[index] = run_worker(queue, db, analyzer, backend, f"worker-{index + 1}", batch_size)
+
+    threads = [threading.Thread(target=work, args=(i,), name=f"worker-{i + 1}") for i in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sum(totals)
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+    from analyzers.llm_backends import get_llm_backend
+    from database.storage import get_storage
+
+    parser = argparse.ArgumentParser(description="리스 기반 분석 작업 큐")
+    parser.add_argument("--storage", help="supabase | local | cached (기본: STORAGE_BACKEND)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sync_parser = sub.add_parser("sync", help="미분석 뉴스를 큐에 추가")
+    sync_parser.add_argument("--limit", type=int, default=1000)
+
+    lease_parser = sub.add_parser("lease", help="배치 리스 (batch_XX.json 형식으로 저장)")
+    lease_parser.add_argument("--worker", required=True)
+    lease_parser.add_argument("--size", type=int, default=DEFAULT_BATCH_SIZE)
+    lease_parser.add_argument("--out", help="출력 파일 (기본: stdout)")
+
+    heartbeat_parser = sub.add_parser("heartbeat", help="리스 연장")
+    heartbeat_parser.add_argument("lease_id")
+
+    submit_parser = sub.add_parser("submit", help="결과 제출 (analysis_results_XX.json 형식)")
+    submit_parser.add_argument("lease_id")
+    submit_parser.add_argument("results_file")
+    submit_parser.add_argument("--keep-lease", action="store_true", help="부분 제출 후 리스 유지")
+
+    run_parser = sub.add_parser("run", help="LLM 백엔드로 자동 처리")
+    run_parser.add_argument("--backend", help="anthropic | openai | stub (기본: ANALYSIS_LLM_BACKEND)")
+    run_parser.add_argument("--workers", type=int, default=4)
+    run_parser.add_argument("--size", type=int, default=DEFAULT_BATCH_SIZE)
+    run_parser.add_argument("--no-sync", action="store_true")
+
+    sub.add_parser("stats", help="큐 상태")
+    args = parser.parse_args()
+
+    queue = WorkQueue()
+    if args.command == "stats":
+        print(json.dumps(queue.stats(), indent=2))
+    elif args.command == "heartbeat":
+        print("ok" if queue.heartbeat(args.lease_id) else "lost")
+    elif args.command == "lease":
+        lease = queue.lease(args.worker, args.size)
+        if lease is None:
+            print("No work available")
+            sys.exit(1)
+        batch = {**lease, "news_count": len(lease["news"])}
+        text = json.dumps(batch, ensure_ascii=False, indent=2, default=str)
+        if args.out:
+            Path(args.out).write_text(text, encoding="utf-8")
+            print(f"{lease['lease_id']} ({len(lease['news'])} news) → {args.out}")
+        else:
+            print(text)
+    else:
+        db = get_storage(args.storage)
+        if args.command == "sync":
+            queue.sync(db, args.limit)
+            print(json.dumps(queue.stats(), indent=2))
+        elif args.command == "submit":
+            data = json.loads(Path(args.results_file).read_text(encoding="utf-8"))
+            results = data.get("results", []) if isinstance(data, dict) else data
+            print(json.dumps(queue.submit(args.lease_id, results, db, RelevanceAnalyzer())))
+            if not args.keep_lease:
+                queue.release(args.lease_id)
+        elif args.command == "run":
+            backend = get_llm_backend(args.backend)
+            if backend is None:
+                print("No LLM backend configured. Set ANALYSIS_LLM_BACKEND or pass --backend.")
+                sys.exit(1)
+            if not args.no_sync:
+                queue.sync(db)
+            saved = run_workers(queue, db, RelevanceAnalyzer(backend), backend, args.workers, args.size)
+            print(f"Saved {saved} analysis results")
+            print(json.dumps(queue.stats(), indent=2))
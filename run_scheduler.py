@@ -12,7 +12,8 @@ from datetime import datetime
 from loguru import logger
 
 from pipeline.news_pipeline import NewsPipeline
-from database.supabase_client import SupabaseClient
+from database.storage import get_storage
+from monitoring.metrics import start_snapshot_writer
 
 
 # 로그 설정
@@ -34,10 +35,10 @@ def run_pipeline():
         # DB 연결 (선택)
         db_client = None
         try:
-            db_client = SupabaseClient()
-            logger.info("✅ Supabase connected")
+            db_client = get_storage()
+            logger.info(f"✅ Storage connected ({type(db_client).__name__})")
         except Exception as e:
-            logger.warning(f"⚠️  Supabase not available: {e}")
+            logger.warning(f"⚠️  Storage not available: {e}")
             logger.info("Running without database")
 
         # 파이프라인 실행
@@ -70,6 +71,7 @@ def main():
     logger.info("="*70)
 
     scheduler = BlockingScheduler()
+    start_snapshot_writer("scheduler")
 
     # 스케줄 설정
     schedules = [
@@ -1,19 +1,14 @@
-import schedule
 import time
 from datetime import datetime
+from functools import cached_property
 from loguru import logger
 import sys
 import os
 
 sys.path.append('..')
-from database.supabase_client import SupabaseClient
-from collectors import FinnhubCollector, AlphaVantageCollector, RSSCollector
-from analyzers import AnalysisPipeline
-from writers import ArticleGenerator
-from dashboard import SignalAPI
-from alerts import EmailAlertService
-from alerts.telegram_alerts import TelegramAlertService
-from blogger import ArticleQueueManager
+from database.storage import get_storage
+from pipeline.registry import API_COLLECTORS, MODE_COMPONENTS, create
+from monitoring.metrics import start_snapshot_writer, timer
 from config.settings import (
     NEWS_COLLECTION_INTERVAL,
     ANALYSIS_INTERVAL,
@@ -21,24 +16,20 @@ from config.settings import (
 )
 
 class JobScheduler:
-    """작업 스케줄러"""
+    """작업 스케줄러 (컴포넌트는 처음 쓰는 작업에서 생성)"""
+
+    # 레지스트리 컴포넌트 → 이 클래스의 속성
+    COMPONENT_ATTRS = {
+        **{name: "collectors" for name in API_COLLECTORS},
+        "analysis_pipeline": "analyzer",
+        "article_generator": "writer",
+        "signal_api": "signal_api",
+        "email_alerts": "email_service",
+        "telegram_alerts": "telegram_service",
+        "article_queue": "queue_manager",
+    }
 
     def __init__(self):
-        self.db = SupabaseClient()
-        self.collectors = [
-            FinnhubCollector(self.db),
-            AlphaVantageCollector(self.db),
-            RSSCollector(self.db)
-        ]
-        self.analyzer = AnalysisPipeline(self.db)
-        self.writer = ArticleGenerator(self.db)
-
-        # 신호 대시보드 초기화 (프롬프트 기반 분석)
-        self.signal_api = SignalAPI()
-        self.email_service = EmailAlertService()
-        self.telegram_service = TelegramAlertService()
-        self.queue_manager = ArticleQueueManager()
-
         # 알림 수신자 (환경 변수에서 로드)
         self.alert_recipients = os.getenv("ALERT_RECIPIENTS", "").split(",") if os.getenv("ALERT_RECIPIENTS") else []
         self.telegram_chat_ids = os.getenv("TELEGRAM_CHAT_IDS", "").split(",") if os.getenv("TELEGRAM_CHAT_IDS") else []
@@ -47,6 +38,45 @@ class JobScheduler:
         if self.telegram_chat_ids:
             logger.info(f"✅ Telegram alerts enabled for {len(self.telegram_chat_ids)} chat(s)")
 
+    @cached_property
+    def db(self):
+        return get_storage()
+
+    @cached_property
+    def collectors(self):
+        return [create(name, self.db) for name in API_COLLECTORS]
+
+    @cached_property
+    def analyzer(self):
+        return create("analysis_pipeline", self.db)
+
+    @cached_property
+    def writer(self):
+        return create("article_generator", self.db)
+
+    # 신호 대시보드 (프롬프트 기반 분석)
+    @cached_property
+    def signal_api(self):
+        return create("signal_api")
+
+    @cached_property
+    def email_service(self):
+        return create("email_alerts")
+
+    @cached_property
+    def telegram_service(self):
+        return create("telegram_alerts")
+
+    @cached_property
+    def queue_manager(self):
+        return create("article_queue")
+
+    def load(self, mode: str):
+        """모드(main.py --mode)에 필요한 컴포넌트를 미리 생성 (시작 시간 벤치마크용)"""
+        for attr in dict.fromkeys(self.COMPONENT_ATTRS[name] for name in MODE_COMPONENTS[mode]):
+            getattr(self, attr)
+
+    @timer("job_seconds", job="collect_news")
     def collect_news_job(self):
         """뉴스 수집 작업"""
         logger.info("=== Starting news collection job ===")
@@ -68,6 +98,7 @@ class JobScheduler:
 
         logger.info(f"=== News collection completed: {total_collected} items ===")
 
+    @timer("job_seconds", job="analyze_news")
     def analyze_news_job(self):
         """뉴스 분석 작업 (자동 분석 - 모든 미분석 뉴스)"""
         logger.info("=== Starting news analysis job (AUTO MODE) ===")
@@ -79,6 +110,7 @@ class JobScheduler:
         except Exception as e:
             logger.error(f"Analysis job error: {e}")
 
+    @timer("job_seconds", job="generate_articles")
     def generate_articles_job(self, tier: str = "tier_1"):
         """블로그 글 생성 작업"""
         logger.info("=== Starting article generation job ===")
@@ -89,6 +121,7 @@ class JobScheduler:
         except Exception as e:
             logger.error(f"Article generation job error: {e}")
 
+    @timer("job_seconds", job="cleanup")
     def cleanup_job(self):
         """오래된 데이터 정리 작업"""
         logger.info("=== Starting cleanup job ===")
@@ -99,6 +132,16 @@ class JobScheduler:
         except Exception as e:
             logger.error(f"Cleanup job error: {e}")
 
+        # 15분마다 쌓인 아카이브 파일을 날짜 파티션별로 합침
+        try:
+            from database.archive import ARCHIVE_AVAILABLE, NewsArchive
+            from config.settings import NEWS_ARCHIVE_ENABLED
+            if NEWS_ARCHIVE_ENABLED and ARCHIVE_AVAILABLE:
+                NewsArchive().compact()
+        except Exception as e:
+            logger.error(f"Archive compaction error: {e}")
+
+    @timer("job_seconds", job="check_analysis_prompts")
     def check_analysis_prompts_job(self):
         """📝 분석 프롬프트 생성 완료 확인"""
         logger.info("=== Checking analysis prompts ===")
@@ -123,6 +166,7 @@ class JobScheduler:
         except Exception as e:
             logger.error(f"Check prompts job error: {e}")
 
+    @timer("job_seconds", job="send_daily_digest")
     def send_daily_digest_job(self):
         """일일 요약 이메일 & 텔레그램 발송"""
         logger.info("=== Starting daily digest job ===")
@@ -161,6 +205,7 @@ class JobScheduler:
         else:
             logger.warning("=== No digest sent (no recipients configured) ===")
 
+    @timer("job_seconds", job="send_blog_recommendations")
     def send_blog_recommendations_job(self):
         """블로거 글쓰기 추천 업데이트"""
         logger.info("=== Starting blog recommendations job ===")
@@ -179,6 +224,8 @@ class JobScheduler:
 
     def setup_schedule(self):
         """스케줄 설정"""
+        import schedule
+
         # 뉴스 수집: 15분마다
         schedule.every(NEWS_COLLECTION_INTERVAL // 60).minutes.do(self.collect_news_job)
 
@@ -241,12 +288,14 @@ class JobScheduler:
     def run_forever(self):
         """스케줄러 무한 실행"""
         self.setup_schedule()
+        start_snapshot_writer("jobs")
 
         # 시작 시 한 번 실행
         logger.info("Running initial job cycle...")
         self.run_once()
 
         # 무한 루프
+        import schedule
         logger.info("Starting scheduler loop...")
         while True:
             try:
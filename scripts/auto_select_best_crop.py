@@ -1,18 +1,33 @@
 #!/usr/bin/env python3
 """
 AI를 사용하여 4개 크롭 이미지 중 프롬프트에 가장 적합한 이미지를 자동으로 선택
-Claude Vision API를 사용한 이미지 분석
+
+1단계: NumPy로 선명도/대비/피사체 중심성/색채감을 계산해 로컬에서 순위 결정 (네트워크 없음)
+2단계: 로컬 점수 차이가 작아 판단이 어려운 그룹만 Claude Vision API로 동시 분석
 """
+import io
 import os
+import sys
 import json
 import base64
+import argparse
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+from PIL import Image
 from dotenv import load_dotenv
 from supabase import create_client
 from loguru import logger
 from anthropic import Anthropic
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.llm_cache import get_cache
+
 # aivesto .env 로드
 env_path = Path(__file__).parent.parent / '.env'
 load_dotenv(env_path)
@@ -24,38 +39,165 @@ anthropic_api_key = os.getenv("ANTHROPIC_API_KEY")
 if not supabase_url or not supabase_key:
     raise ValueError("SUPABASE_URL and SUPABASE_ANON_KEY must be set in .env file")
 if not anthropic_api_key:
-    raise ValueError("ANTHROPIC_API_KEY must be set in .env file")
+    logger.warning("ANTHROPIC_API_KEY가 없습니다 - 로컬 점수만으로 선택합니다")
+
+# 로컬 점수 1위와 2위의 차이가 이 값(100점 만점) 미만이면 Claude에게 판단을 맡김
+LOCAL_DECISION_MARGIN = 5.0
+
+# 로컬 점수 가중치 (합계 1.0)
+LOCAL_SCORE_WEIGHTS = {
+    'sharpness': 0.35,
+    'contrast': 0.20,
+    'centering': 0.25,
+    'colorfulness': 0.20,
+}
+
+# 정규화 기준값 (이 값 이상이면 만점)
+SHARPNESS_REFERENCE = 1000.0     # 라플라시안 분산
+CONTRAST_REFERENCE = 80.0        # 휘도 표준편차
+COLORFULNESS_REFERENCE = 110.0   # Hasler-Süsstrunk 색채감
+
+# 로컬 분석용 축소 크기 (긴 변 기준)
+LOCAL_SCORE_MAX_SIDE = 512
+
+DOWNLOAD_WORKERS = 16
+LLM_WORKERS = 4
+REQUEST_TIMEOUT = 30
+
+# 한 번에 다운로드/분석하는 원본 그룹 수 (그룹당 크롭 4장을 메모리에 올림)
+GROUP_CHUNK_SIZE = 50
+# .in_() 필터 한 요청에 넣는 원본 ID 수 (PostgREST URL 길이 제한)
+ID_BATCH_SIZE = 100
+
+_anthropic_client = None
+
+def get_anthropic_client() -> Anthropic:
+    """모든 스레드가 공유하는 Anthropic 클라이언트"""
+    global _anthropic_client
+    if _anthropic_client is None:
+        _anthropic_client = Anthropic(api_key=anthropic_api_key)
+    return _anthropic_client
 
 def download_image(url: str) -> bytes:
     """URL에서 이미지 다운로드"""
-    response = requests.get(url)
+    response = requests.get(url, timeout=REQUEST_TIMEOUT)
     response.raise_for_status()
     return response.content
 
+def compute_crop_metrics(image_bytes: bytes) -> Dict[str, float]:
+    """
+    이미지 바이트에서 로컬 품질 지표 계산 (NumPy 배열 연산만 사용)
+
+    Returns:
+        {'sharpness', 'contrast', 'centering', 'colorfulness'}
+    """
+    with Image.open(io.BytesIO(image_bytes)) as img:
+        img = img.convert('RGB')
+        img.thumbnail((LOCAL_SCORE_MAX_SIDE, LOCAL_SCORE_MAX_SIDE))
+        rgb = np.asarray(img, dtype=np.float32)
+
+    gray = rgb @ np.array([0.299, 0.587, 0.114], dtype=np.float32)
+    height, width = gray.shape
+
+    # 선명도: 라플라시안 분산
+    laplacian = (
+        gray[:-2, 1:-1] + gray[2:, 1:-1] + gray[1:-1, :-2] + gray[1:-1, 2:]
+        - 4.0 * gray[1:-1, 1:-1]
+    )
+    sharpness = float(laplacian.var()) if laplacian.size else 0.0
+
+    # 대비: 휘도 표준편차
+    contrast = float(gray.std())
+
+    # 중심성: 그래디언트 크기를 saliency로 보고 무게중심이 이미지 중앙에 가까울수록 1
+    grad_y, grad_x = np.gradient(gray)
+    saliency = np.hypot(grad_x, grad_y)
+    total = float(saliency.sum())
+    if total > 0:
+        center_y = float(saliency.sum(axis=1) @ np.arange(height, dtype=np.float32)) / total
+        center_x = float(saliency.sum(axis=0) @ np.arange(width, dtype=np.float32)) / total
+        offset = np.hypot(
+            (center_x - (width - 1) / 2) / width,
+            (center_y - (height - 1) / 2) / height
+        ) / np.hypot(0.5, 0.5)
+        centering = float(1.0 - min(offset, 1.0))
+    else:
+        centering = 0.0
+
+    # 색채감: Hasler & Süsstrunk (2003)
+    red, green, blue = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    rg = red - green
+    yb = 0.5 * (red + green) - blue
+    colorfulness = float(
+        np.hypot(rg.std(), yb.std()) + 0.3 * np.hypot(rg.mean(), yb.mean())
+    )
+
+    return {
+        'sharpness': sharpness,
+        'contrast': contrast,
+        'centering': centering,
+        'colorfulness': colorfulness,
+    }
+
+def score_crop_metrics(metrics: Dict[str, float]) -> float:
+    """지표를 0~100점으로 환산"""
+    normalized = {
+        'sharpness': min(1.0, np.log1p(metrics['sharpness']) / np.log1p(SHARPNESS_REFERENCE)),
+        'contrast': min(1.0, metrics['contrast'] / CONTRAST_REFERENCE),
+        'centering': metrics['centering'],
+        'colorfulness': min(1.0, metrics['colorfulness'] / COLORFULNESS_REFERENCE),
+    }
+    return round(float(100.0 * sum(LOCAL_SCORE_WEIGHTS[k] * v for k, v in normalized.items())), 1)
+
+def rank_crops_locally(crop_images: List[Dict], margin: float = LOCAL_DECISION_MARGIN) -> Dict:
+    """
+    다운로드된 4개 크롭을 로컬 점수로 순위 결정
+
+    Args:
+        crop_images: [{'position': 'top_left', 'data': b'...'}, ...]
+        margin: 1위와 2위 점수 차이가 이 값 미만이면 결정 보류
+
+    Returns:
+        {'best_crop', 'scores', 'metrics', 'margin', 'decisive'}
+    """
+    metrics = {crop['position']: compute_crop_metrics(crop['data']) for crop in crop_images}
+    scores = {position: score_crop_metrics(m) for position, m in metrics.items()}
+
+    ranked = sorted(scores, key=scores.get, reverse=True)
+    gap = scores[ranked[0]] - scores[ranked[1]] if len(ranked) > 1 else 100.0
+
+    return {
+        'best_crop': ranked[0],
+        'scores': scores,
+        'metrics': metrics,
+        'margin': round(gap, 1),
+        'decisive': gap >= margin,
+    }
+
 def analyze_crops_with_claude(prompt: str, crop_images: list) -> dict:
     """
     Claude Vision API로 4개 크롭 이미지 분석
 
     Args:
         prompt: 원본 Midjourney 프롬프트
-        crop_images: [{'position': 'top_left', 'url': '...', 'image_id': '...'}, ...]
+        crop_images: [{'position': 'top_left', 'url': '...', 'image_id': '...', 'data': b'...'}, ...]
+            ('data'가 있으면 다시 다운로드하지 않음)
 
     Returns:
         {'best_crop': 'top_left', 'scores': {...}, 'reasoning': '...'}
     """
-    client = Anthropic(api_key=anthropic_api_key)
+    client = get_anthropic_client()
 
     # 이미지 다운로드 및 base64 인코딩
     image_contents = []
     for crop in crop_images:
         try:
-            img_data = download_image(crop['url'])
+            img_data = crop.get('data') or download_image(crop['url'])
             b64_data = base64.b64encode(img_data).decode('utf-8')
             image_contents.append({
                 'position': crop['position'],
                 'b64': b64_data
             })
-            logger.info(f"  {crop['position']} 이미지 다운로드 완료")
         except Exception as e:
             logger.error(f"  {crop['position']} 다운로드 실패: {e}")
             return None
@@ -112,18 +254,24 @@ def analyze_crops_with_claude(prompt: str, crop_images: list) -> dict:
             "text": f"**Image {idx}: {img['position']}**"
         })
 
+    model = "claude-3-5-sonnet-20241022"
+    messages = [{
+        "role": "user",
+        "content": content
+    }]
+
     try:
-        response = client.messages.create(
-            model="claude-3-5-sonnet-20241022",
-            max_tokens=1024,
-            messages=[{
-                "role": "user",
-                "content": content
-            }]
+        # 같은 프롬프트/이미지 조합은 디스크 캐시에서 재사용
+        response_text = get_cache().cached_call(
+            "anthropic", model, messages, {"max_tokens": 1024},
+            lambda: client.messages.create(
+                model=model,
+                max_tokens=1024,
+                messages=messages
+            ).content[0].text
         )
 
         # 응답 파싱
-        response_text = response.content[0].text
         logger.info(f"📊 Claude 분석 완료")
         logger.debug(f"응답: {response_text}")
 
@@ -145,9 +293,10 @@ def analyze_crops_with_claude(prompt: str, crop_images: list) -> dict:
         traceback.print_exc()
         return None
 
-def update_recommendation_in_db(parent_image_id: str, best_crop_position: str, scores: dict, reasoning: str):
+def update_recommendation_in_db(parent_image_id: str, best_crop_position: str, scores: dict, reasoning: str,
+                                method: str = "llm", supabase=None):
     """추천 결과를 Supabase에 저장"""
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = supabase or create_client(supabase_url, supabase_key)
 
     # 원본 이미지의 metadata에 추천 정보 저장
     metadata = {
@@ -155,7 +304,8 @@ def update_recommendation_in_db(parent_image_id: str, best_crop_position: str, s
             "best_crop": best_crop_position,
             "scores": scores,
             "reasoning": reasoning,
-            "analyzed_at": "2025-11-16T15:35:00Z"
+            "method": method,
+            "analyzed_at": datetime.now(timezone.utc).isoformat()
         }
     }
 
@@ -166,7 +316,144 @@ def update_recommendation_in_db(parent_image_id: str, best_crop_position: str, s
 
     logger.success(f"✅ 추천 정보 DB 저장 완료: {best_crop_position}")
 
+def fetch_crop_groups(supabase, originals: List[Dict]) -> List[Dict]:
+    """원본별 크롭 4장 조회 (원본 ID 를 ID_BATCH_SIZE 개씩 나눠 .in_() 필터)"""
+    crops_by_parent: Dict[str, List[Dict]] = {}
+    for start in range(0, len(originals), ID_BATCH_SIZE):
+        batch_ids = [original['image_id'] for original in originals[start:start + ID_BATCH_SIZE]]
+        crops = supabase.table('midjourney_images')\
+            .select('image_id, parent_image_id, crop_position, crop_number, public_url')\
+            .in_('parent_image_id', batch_ids)\
+            .eq('image_type', 'cropped')\
+            .order('crop_number')\
+            .execute()
+        for crop in crops.data or []:
+            crops_by_parent.setdefault(crop['parent_image_id'], []).append(crop)
+
+    groups = []
+    for original in originals:
+        group_crops = crops_by_parent.get(original['image_id'], [])
+        if len(group_crops) != 4:
+            logger.warning(f"  ⚠️  {original['image_id']}: 크롭 이미지가 {len(group_crops)}개입니다 (4개 필요)")
+            continue
+        groups.append({
+            'original': original,
+            'crops': [{
+                'position': crop['crop_position'],
+                'url': crop['public_url'],
+                'image_id': crop['image_id']
+            } for crop in group_crops]
+        })
+    return groups
+
+def download_group_images(groups: List[Dict], workers: int = DOWNLOAD_WORKERS) -> List[Dict]:
+    """그룹들의 크롭 이미지를 동시에 다운로드 (실패한 그룹은 제외)"""
+    all_crops = [crop for group in groups for crop in group['crops']]
+
+    def fetch(crop):
+        try:
+            crop['data'] = download_image(crop['url'])
+        except Exception as e:
+            logger.error(f"  {crop['image_id']} 다운로드 실패: {e}")
+            crop['data'] = None
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(fetch, all_crops))
+
+    return [group for group in groups if all(crop['data'] for crop in group['crops'])]
+
+def log_result(original_id: str, result: Dict):
+    logger.success(f"  🏆 {original_id}: {result['best_crop']} ({result['method']})")
+    for pos, score in result['scores'].items():
+        emoji = "⭐" if pos == result['best_crop'] else "  "
+        logger.info(f"     {emoji} {pos}: {score}점")
+    logger.info(f"  💭 이유: {result['reasoning'][:100]}...")
+
+def process_chunk(supabase, originals: List[Dict], args, use_llm: bool) -> int:
+    """
+    원본 한 청크의 크롭 조회 → 다운로드 → 로컬 점수 → (필요 시) Claude Vision → DB 저장
+
+    Returns:
+        추천을 저장한 원본 수
+    """
+    # 1단계: 다운로드 + 로컬 점수
+    groups = download_group_images(fetch_crop_groups(supabase, originals))
+    logger.info(f"✓ {len(groups)}개 그룹 다운로드 완료, 로컬 점수 계산 중...")
+
+    resolved: Dict[str, Dict] = {}
+    undecided = []
+
+    for group in groups:
+        original_id = group['original']['image_id']
+        try:
+            local = rank_crops_locally(group['crops'], margin=args.margin)
+        except Exception as e:
+            logger.error(f"  ❌ {original_id} 로컬 분석 실패: {e}")
+            continue
+
+        if local['decisive'] or not use_llm:
+            resolved[original_id] = {
+                'best_crop': local['best_crop'],
+                'scores': local['scores'],
+                'reasoning': f"로컬 점수 (1·2위 차이 {local['margin']}점): "
+                             + json.dumps(local['metrics'][local['best_crop']], ensure_ascii=False),
+                'method': 'local',
+            }
+        else:
+            group['local'] = local
+            undecided.append(group)
+
+    logger.info(f"✓ 로컬 결정 {len(resolved)}개, Claude Vision 필요 {len(undecided)}개")
+
+    # 2단계: 판단이 어려운 그룹만 Claude Vision으로 동시 분석
+    def analyze(group):
+        return group, analyze_crops_with_claude(group['original']['prompt'], group['crops'])
+
+    if undecided:
+        with ThreadPoolExecutor(max_workers=args.llm_workers) as executor:
+            for group, result in executor.map(analyze, undecided):
+                original_id = group['original']['image_id']
+                if result:
+                    result['method'] = 'llm'
+                else:
+                    # Claude 실패 시 로컬 1위 사용
+                    local = group['local']
+                    result = {
+                        'best_crop': local['best_crop'],
+                        'scores': local['scores'],
+                        'reasoning': f"Claude 분석 실패, 로컬 점수 사용 (차이 {local['margin']}점)",
+                        'method': 'local',
+                    }
+                resolved[original_id] = result
+
+    # DB에 저장
+    for original_id, result in resolved.items():
+        log_result(original_id, result)
+        update_recommendation_in_db(
+            original_id,
+            result['best_crop'],
+            result['scores'],
+            result['reasoning'],
+            method=result['method'],
+            supabase=supabase
+        )
+
+    # 다음 청크 전에 이미지 데이터 해제
+    for group in groups:
+        for crop in group['crops']:
+            crop.pop('data', None)
+    return len(resolved)
+
 def main():
+    parser = argparse.ArgumentParser(description="4개 크롭 중 최적 이미지 자동 선택")
+    parser.add_argument("--margin", type=float, default=LOCAL_DECISION_MARGIN,
+                        help="로컬 1·2위 점수 차이가 이 값 미만이면 Claude Vision 사용")
+    parser.add_argument("--llm-workers", type=int, default=LLM_WORKERS,
+                        help="동시에 실행할 Claude Vision 호출 수")
+    parser.add_argument("--local-only", action="store_true",
+                        help="Claude Vision 없이 로컬 점수만으로 선택")
+    args = parser.parse_args()
+
     logger.info("=" * 60)
     logger.info("🤖 AI 자동 크롭 이미지 선택")
     logger.info("=" * 60)
@@ -186,56 +473,16 @@ def main():
 
     logger.info(f"📥 {len(originals.data)}개 원본 이미지 발견\n")
 
-    for idx, original in enumerate(originals.data, 1):
-        logger.info(f"[{idx}/{len(originals.data)}] {original['image_id']}")
-        logger.info(f"  프롬프트: {original['prompt'][:60]}...")
-
-        # 크롭 이미지 조회
-        crops = supabase.table('midjourney_images')\
-            .select('*')\
-            .eq('parent_image_id', original['image_id'])\
-            .eq('image_type', 'cropped')\
-            .order('crop_number')\
-            .execute()
-
-        if not crops.data or len(crops.data) != 4:
-            logger.warning(f"  ⚠️  크롭 이미지가 {len(crops.data) if crops.data else 0}개입니다 (4개 필요)")
-            continue
-
-        logger.info(f"  ✓ 크롭 이미지 4개 확인")
-
-        # 크롭 이미지 정보 구성
-        crop_images = [{
-            'position': crop['crop_position'],
-            'url': crop['public_url'],
-            'image_id': crop['image_id']
-        } for crop in crops.data]
-
-        # Claude로 분석
-        result = analyze_crops_with_claude(original['prompt'], crop_images)
-
-        if result:
-            logger.success(f"  🏆 최고 추천: {result['best_crop']}")
-            logger.info(f"  📊 점수:")
-            for pos, score in result['scores'].items():
-                emoji = "⭐" if pos == result['best_crop'] else "  "
-                logger.info(f"     {emoji} {pos}: {score}점")
-            logger.info(f"  💭 이유: {result['reasoning'][:100]}...")
-
-            # DB에 저장
-            update_recommendation_in_db(
-                original['image_id'],
-                result['best_crop'],
-                result['scores'],
-                result['reasoning']
-            )
-        else:
-            logger.error(f"  ❌ 분석 실패")
-
-        logger.info("")
+    # 원본을 GROUP_CHUNK_SIZE 개씩 조회 → 다운로드 → 점수 → 저장 (크롭 데이터는 청크마다 해제)
+    use_llm = not args.local_only and bool(anthropic_api_key)
+    total = 0
+    for start in range(0, len(originals.data), GROUP_CHUNK_SIZE):
+        chunk = originals.data[start:start + GROUP_CHUNK_SIZE]
+        logger.info(f"📦 원본 {start + 1}-{start + len(chunk)} / {len(originals.data)}")
+        total += process_chunk(supabase, chunk, args, use_llm)
 
     logger.info("=" * 60)
-    logger.success("✅ 모든 이미지 분석 완료!")
+    logger.success(f"✅ 모든 이미지 분석 완료! ({total}개)")
     logger.info("=" * 60)
 
 if __name__ == "__main__":
@@ -6,6 +6,9 @@ available, else fall back to deterministic templates.
 Input  : JSON from blog_content_analyzer.py
 Output : JSON map {section_index: {prompt, image_type, section_title, position}}
 
+LLM calls (--llm) go through the shared disk cache in scripts/llm_cache.py and
+run concurrently across sections, so re-running on unchanged sections is free.
+
 Env:
   OPENAI_API_KEY or ANTHROPIC_API_KEY (optional; improves quality)
 """
@@ -13,13 +16,17 @@ Env:
 import argparse
 import json
 import os
+import sys
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 
-import requests
 from dotenv import load_dotenv
 from loguru import logger
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.llm_cache import get_cache, get_session, fan_out
+
 load_dotenv()
 
 DEFAULT_BRAND = {
@@ -34,24 +41,27 @@ Keep brand consistency using provided palette and style hints. Prefer realistic
 lighting unless asked for diagrams. Include --ar 16:9 for hero/diagram, --ar 4:5
 for product close-ups to fit blog columns."""
 
+OPENAI_MODEL = "gpt-4o-mini"
+CLAUDE_MODEL = "claude-3-5-sonnet-20241022"
+LLM_PARAMS = {"max_tokens": 300, "temperature": 0.7}
+
 
 def _call_openai(messages: List[Dict]) -> str:
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         raise RuntimeError("OPENAI_API_KEY missing")
-    resp = requests.post(
-        "https://api.openai.com/v1/chat/completions",
-        headers={"Authorization": f"Bearer {api_key}"},
-        json={
-            "model": "gpt-4o-mini",
-            "messages": messages,
-            "max_tokens": 300,
-            "temperature": 0.7,
-        },
-        timeout=30,
-    )
-    resp.raise_for_status()
-    return resp.json()["choices"][0]["message"]["content"].strip()
+
+    def request() -> str:
+        resp = get_session().post(
+            "https://api.openai.com/v1/chat/completions",
+            headers={"Authorization": f"Bearer {api_key}"},
+            json={"model": OPENAI_MODEL, "messages": messages, **LLM_PARAMS},
+            timeout=30,
+        )
+        resp.raise_for_status()
+        return resp.json()["choices"][0]["message"]["content"].strip()
+
+    return get_cache().cached_call("openai", OPENAI_MODEL, messages, LLM_PARAMS, request)
 
 
 def _call_claude(messages: List[Dict]) -> str:
@@ -69,24 +79,42 @@ def _call_claude(messages: List[Dict]) -> str:
         else:
             user_msgs.append(msg)
 
-    resp = requests.post(
-        "https://api.anthropic.com/v1/messages",
-        headers={
-            "x-api-key": api_key,
-            "anthropic-version": "2023-06-01",
-            "content-type": "application/json",
-        },
-        json={
-            "model": "claude-3-5-sonnet-20241022",
-            "max_tokens": 300,
-            "system": system_msg,
-            "messages": user_msgs,
-            "temperature": 0.7,
-        },
-        timeout=30,
-    )
-    resp.raise_for_status()
-    return resp.json()["content"][0]["text"].strip()
+    def request() -> str:
+        resp = get_session().post(
+            "https://api.anthropic.com/v1/messages",
+            headers={
+                "x-api-key": api_key,
+                "anthropic-version": "2023-06-01",
+                "content-type": "application/json",
+            },
+            json={
+                "model": CLAUDE_MODEL,
+                "system": system_msg,
+                "messages": user_msgs,
+                **LLM_PARAMS,
+            },
+            timeout=30,
+        )
+        resp.raise_for_status()
+        return resp.json()["content"][0]["text"].strip()
+
+    return get_cache().cached_call("anthropic", CLAUDE_MODEL, messages, LLM_PARAMS, request)
+
+
+def _call_llm(messages: List[Dict]) -> Optional[str]:
+    """Call whichever provider has a key configured (OpenAI first). None if unavailable/failed."""
+    providers = []
+    if os.getenv("OPENAI_API_KEY"):
+        providers.append(_call_openai)
+    if os.getenv("ANTHROPIC_API_KEY"):
+        providers.append(_call_claude)
+
+    for call in providers:
+        try:
+            return call(messages)
+        except Exception as e:
+            logger.warning(f"LLM call failed ({call.__name__}): {e}")
+    return None
 
 
 def _generate_contextual_prompt(section: Dict, brand: Dict) -> str:
@@ -132,22 +160,51 @@ def _generate_contextual_prompt(section: Dict, brand: Dict) -> str:
         return "Professional technology concept visualization, modern digital innovation, green (#16B31E) and black color palette, clean high-contrast design, corporate tech aesthetic, dramatic lighting --ar 16:9 --quality 1"
 
 
-def build_prompts(analysis: Dict, brand: Dict = DEFAULT_BRAND) -> Dict[str, Dict]:
-    prompts = {}
-    for section in analysis["sections"]:
+def build_prompts(
+    analysis: Dict,
+    brand: Dict = DEFAULT_BRAND,
+    use_llm: bool = False,
+    max_workers: int = 4,
+) -> Dict[str, Dict]:
+    """
+    Build one prompt per section.
+
+    With use_llm, sections are sent to the LLM concurrently (max_workers at a
+    time, cached on disk); sections whose call fails fall back to templates.
+    """
+
+    def prompt_for(section: Dict) -> str:
         idx = section["index"]
-        user_msg = (
-            f"Section: {section['title']}\n"
-            f"Keywords: {', '.join(section.get('keywords', []))}\n"
-            f"Image type: {section.get('image_type')}\n"
-            f"Brand palette: {brand.get('palette')}\n"
-            f"Brand style: {brand.get('style')}\n"
-        )
+        if use_llm:
+            user_msg = (
+                f"Section: {section['title']}\n"
+                f"Keywords: {', '.join(section.get('keywords', []))}\n"
+                f"Image type: {section.get('image_type')}\n"
+                f"Brand palette: {brand.get('palette')}\n"
+                f"Brand style: {brand.get('style')}\n"
+            )
+            text = _call_llm([
+                {"role": "system", "content": SYSTEM_MESSAGE},
+                {"role": "user", "content": user_msg},
+            ])
+            if text:
+                logger.info(f"✅ Generated LLM prompt for section {idx}: {section.get('title')}")
+                return text
 
         # Generate high-quality contextual prompts directly
-        prompt_text = _generate_contextual_prompt(section, brand)
         logger.info(f"✅ Generated contextual prompt for section {idx}: {section.get('title')}")
+        return _generate_contextual_prompt(section, brand)
+
+    sections = analysis["sections"]
+    prompt_texts = fan_out(prompt_for, sections, max_workers=max_workers if use_llm else 1)
+
+    if use_llm:
+        cache = get_cache()
+        logger.info(f"LLM cache: {cache.hits} hits, {cache.misses} misses")
 
+    prompts = {}
+    for section, prompt_text in zip(sections, prompt_texts):
+        idx = section["index"]
         prompts[str(idx)] = {
             "section_index": idx,
             "section_title": section["title"],
@@ -166,6 +223,8 @@ def main():
     parser.add_argument("--brand-palette", nargs="*", default=None, help="Override brand hex colors, e.g. #16B31E #0B0B0B")
     parser.add_argument("--brand-style", default=None, help="Style sentence to enforce")
     parser.add_argument("--out", type=Path, default=Path("tmp") / "prompts.json")
+    parser.add_argument("--llm", action="store_true", help="Use OpenAI/Claude (cached) instead of templates")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent LLM calls")
     args = parser.parse_args()
 
     analysis = json.loads(args.analysis_json.read_text(encoding="utf-8"))
@@ -175,7 +234,7 @@ def main():
     if args.brand_style:
         brand["style"] = args.brand_style
 
-    prompts = build_prompts(analysis, brand)
+    prompts = build_prompts(analysis, brand, use_llm=args.llm, max_workers=args.workers)
     args.out.parent.mkdir(parents=True, exist_ok=True)
     args.out.write_text(json.dumps(prompts, ensure_ascii=False, indent=2), encoding="utf-8")
     print(f"Saved {len(prompts)} prompts to {args.out}")
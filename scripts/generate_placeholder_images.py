@@ -2,11 +2,27 @@
 """
 Generate professional placeholder images for blog articles
 Creates gradient background images with company branding
+
+Rendering is vectorized (imaging.renderer) and spread across a process pool.
+
+Usage:
+    python scripts/generate_placeholder_images.py
+    python scripts/generate_placeholder_images.py --sizes blog,og,thumb --formats jpg,webp
 """
 
-from PIL import Image, ImageDraw, ImageFont
+import argparse
+import sys
+import time
 from pathlib import Path
 
+import numpy as np
+from PIL import Image
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from imaging.renderer import FORMATS, OUTPUT_SIZES, add_ring_overlay, render_batch, render_image  # noqa: E402
+
 # Image configurations with company colors
 IMAGE_CONFIGS = {
     # Apple images
@@ -145,93 +161,53 @@ IMAGE_CONFIGS = {
 
 def create_gradient_image(width, height, color1, color2):
     """Create a diagonal gradient image from top-left to bottom-right"""
-    img = Image.new('RGB', (width, height))
-    pixels = img.load()
-
-    # Calculate max distance for normalization
-    max_distance = ((width ** 2) + (height ** 2)) ** 0.5
-
-    for y in range(height):
-        for x in range(width):
-            # Calculate distance from top-left corner
-            distance = ((x ** 2) + (y ** 2)) ** 0.5
-            # Normalize to 0-1 range
-            ratio = distance / max_distance
-
-            # Interpolate between color1 and color2
-            r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-            g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-            b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-
-            pixels[x, y] = (r, g, b)
-
-    return img
+    return render_image(width, height, color1, color2).convert('RGB')
 
 
 def add_overlay_pattern(img):
     """Add subtle overlay pattern to image (no text)"""
-    width, height = img.size
-
-    # Create a subtle radial gradient overlay for visual interest
-    overlay = Image.new('RGBA', (width, height), (255, 255, 255, 0))
-    draw = ImageDraw.Draw(overlay)
-
-    # Add subtle circular pattern in center for depth
-    center_x, center_y = width // 2, height // 2
-    max_radius = min(width, height) // 2
-
-    for i in range(5):
-        radius = max_radius - (i * 100)
-        alpha = 5 + (i * 2)  # Very subtle
-        draw.ellipse(
-            [center_x - radius, center_y - radius, center_x + radius, center_y + radius],
-            fill=None,
-            outline=(255, 255, 255, alpha),
-            width=2
-        )
-
-    # Blend overlay with original image
-    img = Image.alpha_composite(img.convert('RGBA'), overlay)
-    return img.convert('RGB')
+    # 기존 이미지 내용 위에 링 알파만 블렌딩
+    buffer = np.array(img.convert('RGB'))
+    return Image.fromarray(add_ring_overlay(buffer), 'RGB')
 
 
-def generate_all_images(output_dir):
-    """Generate all placeholder images"""
+def generate_all_images(output_dir, sizes=("blog",), formats=("jpg",), workers=None):
+    """Generate all placeholder images (every size/format in one pass)"""
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
     print("=" * 60)
     print("Generating placeholder images for blog articles")
+    print(f"Sizes: {', '.join(sizes)}  Formats: {', '.join(formats)}")
     print("=" * 60)
 
-    total = len(IMAGE_CONFIGS)
-    success = 0
-
-    for filename, config in IMAGE_CONFIGS.items():
-        try:
-            print(f"\n📸 Creating: {filename}")
-            print(f"   Gradient: {config['gradient'][0]} → {config['gradient'][1]}")
+    jobs = [
+        {
+            "stem": Path(filename).stem,
+            "gradient": config['gradient'],
+            "output_dir": str(output_dir),
+            "sizes": list(sizes),
+            "formats": list(formats),
+        }
+        for filename, config in IMAGE_CONFIGS.items()
+    ]
 
-            # Create diagonal gradient background
-            img = create_gradient_image(1200, 800, config['gradient'][0], config['gradient'][1])
+    start = time.perf_counter()
+    paths, failures = render_batch(jobs, workers=workers)
+    elapsed = time.perf_counter() - start
 
-            # Save image (no overlay, pure gradient)
-            filepath = output_dir / filename
-            img.save(filepath, 'JPEG', quality=95, optimize=True)
+    for stem, error in failures.items():
+        print(f"   ✗ Failed: {stem}: {error}")
 
-            print(f"   ✓ Saved: {filepath}")
-            success += 1
-
-        except Exception as e:
-            print(f"   ✗ Failed: {e}")
-            import traceback
-            traceback.print_exc()
+    total = len(IMAGE_CONFIGS)
+    success = total - len(failures)
 
     print("\n" + "=" * 60)
     print("Summary")
     print("=" * 60)
     print(f"Total images: {total}")
-    print(f"Successfully created: {success}")
+    print(f"Successfully created: {success} ({len(paths)} files)")
+    print(f"Elapsed: {elapsed:.2f}s")
     print(f"Output directory: {output_dir}")
 
     if success == total:
@@ -243,7 +219,16 @@ def generate_all_images(output_dir):
 
 
 if __name__ == "__main__":
-    import sys
-    project_root = Path(__file__).parent.parent
-    images_dir = project_root / "public" / "images"
-    sys.exit(generate_all_images(images_dir))
+    parser = argparse.ArgumentParser(description="Generate placeholder images for blog articles")
+    parser.add_argument("--output", type=Path, default=project_root / "public" / "images")
+    parser.add_argument("--sizes", default="blog", help=f"Comma-separated: {', '.join(OUTPUT_SIZES)}")
+    parser.add_argument("--formats", default="jpg", help=f"Comma-separated: {', '.join(FORMATS)}")
+    parser.add_argument("--workers", type=int, help="Process count (default: CPU count, 1 = serial)")
+    args = parser.parse_args()
+
+    sizes, formats = args.sizes.split(","), args.formats.split(",")
+    unknown = [s for s in sizes if s not in OUTPUT_SIZES] + [f for f in formats if f not in FORMATS]
+    if unknown:
+        parser.error(f"Unknown size/format: {', '.join(unknown)}")
+
+    sys.exit(generate_all_images(args.output, sizes, formats, args.workers))
@@ -1,16 +1,71 @@
 #!/usr/bin/env python3
 """
 블로그 기사를 정적 HTML로 변환하여 Vercel 배포용으로 생성
+
+증분 빌드: 빌드 매니페스트(.build/static_blog_manifest.json)에 원본 해시와 템플릿 버전을
+기록해 두고, 바뀐 기사만 다시 렌더링합니다. 인덱스(blog.html)는 기사 메타데이터가
+바뀐 경우에만 다시 생성하고, 내용이 같은 출력 파일은 건드리지 않습니다.
 """
 import os
 import sys
 import glob
+import json
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
 import markdown
 
 # 프로젝트 루트를 path에 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
+MANIFEST_VERSION = 1
+
+
+def template_version():
+    """템플릿 버전 - 이 스크립트가 바뀌면 모든 기사를 다시 빌드"""
+    with open(os.path.abspath(__file__), 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+
+def hash_file(file_path):
+    """원본 파일 내용 해시"""
+    with open(file_path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def write_if_changed(output_path, text):
+    """내용이 다를 때만 파일을 씀 (변경 없으면 mtime 유지). 썼으면 True"""
+    data = text.encode('utf-8')
+    if os.path.exists(output_path):
+        with open(output_path, 'rb') as f:
+            if f.read() == data:
+                return False
+    tmp_path = output_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, output_path)
+    return True
+
+
+def load_manifest(manifest_path):
+    """빌드 매니페스트 로드 (없거나 형식이 다르면 빈 매니페스트)"""
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('version') == MANIFEST_VERSION:
+            return manifest
+    except (OSError, ValueError):
+        pass
+    return {'version': MANIFEST_VERSION, 'articles': {}, 'index': {}}
+
+
+def save_manifest(manifest, manifest_path):
+    os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+    write_if_changed(manifest_path, json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True))
+
+
 def parse_article(file_path):
     """마크다운 파일 파싱"""
     with open(file_path, 'r', encoding='utf-8') as f:
@@ -60,9 +115,9 @@ def parse_article(file_path):
     }
 
 
-def create_article_html(article, output_path):
-    """개별 기사 HTML 생성"""
-    html = f"""<!DOCTYPE html>
+def render_article_html(article):
+    """개별 기사 HTML 문자열 렌더링"""
+    return f"""<!DOCTYPE html>
 <html lang="ko">
 <head>
     <meta charset="UTF-8">
@@ -274,12 +329,22 @@ def create_article_html(article, output_path):
 </html>
 """
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html)
+
+def create_article_html(article, output_path):
+    """개별 기사 HTML 생성 (내용이 같으면 쓰지 않음)"""
+    return write_if_changed(output_path, render_article_html(article))
+
+
+def build_article(file_path, output_path):
+    """기사 하나를 파싱/렌더링 (프로세스 풀 작업 단위). 인덱스용 메타데이터 반환"""
+    article = parse_article(file_path)
+    written = create_article_html(article, output_path)
+    metadata = {key: article[key] for key in ('title', 'date', 'filename', 'symbol')}
+    return metadata, written
 
 
 def create_blog_index(articles, output_path):
-    """블로그 인덱스 페이지 생성"""
+    """블로그 인덱스 페이지 생성 (내용이 같으면 쓰지 않음)"""
     articles_html = []
 
     for article in articles:
@@ -452,15 +517,20 @@ def create_blog_index(articles, output_path):
 </html>
 """
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html)
+    return write_if_changed(output_path, html)
 
 
 def main():
+    parser = argparse.ArgumentParser(description='Generate static blog HTML (incremental)')
+    parser.add_argument('--force', action='store_true', help='매니페스트를 무시하고 전체 재빌드')
+    parser.add_argument('--workers', type=int, default=None, help='렌더링 프로세스 수 (기본: CPU 수)')
+    args = parser.parse_args()
+
     base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     articles_dir = os.path.join(base_dir, 'articles')
     public_dir = os.path.join(base_dir, 'public')
     public_articles_dir = os.path.join(public_dir, 'articles')
+    manifest_path = os.path.join(base_dir, '.build', 'static_blog_manifest.json')
 
     # public/articles 디렉토리 생성
     os.makedirs(public_articles_dir, exist_ok=True)
@@ -469,36 +539,101 @@ def main():
     print(f"📄 Generating Static Blog HTML")
     print(f"{'='*60}\n")
 
-    # 모든 기사 파일 찾기
-    article_files = glob.glob(os.path.join(articles_dir, 'article_*.md'))
-    articles = []
-
-    # 각 기사를 HTML로 변환
-    for file_path in sorted(article_files, reverse=True):
-        try:
-            article = parse_article(file_path)
-            articles.append(article)
-
-            # HTML 파일 생성
-            html_filename = article['filename'].replace('.md', '.html')
-            output_path = os.path.join(public_articles_dir, html_filename)
-            create_article_html(article, output_path)
-
+    version = template_version()
+    manifest = load_manifest(manifest_path)
+    if args.force:
+        manifest = {'version': MANIFEST_VERSION, 'articles': {}, 'index': {}}
+    previous = manifest['articles']
+
+    # 모든 기사 파일 찾기 + 변경 여부 판단
+    article_files = sorted(glob.glob(os.path.join(articles_dir, 'article_*.md')), reverse=True)
+    entries = {}
+    pending = []
+
+    for file_path in article_files:
+        filename = os.path.basename(file_path)
+        html_filename = filename.replace('.md', '.html')
+        output_path = os.path.join(public_articles_dir, html_filename)
+        source_hash = hash_file(file_path)
+        entry = previous.get(filename)
+
+        if (entry and entry.get('source_hash') == source_hash
+                and entry.get('template_version') == version
+                and os.path.exists(output_path)):
+            entries[filename] = entry
+        else:
+            entries[filename] = {'source_hash': source_hash, 'template_version': version}
+            pending.append((filename, file_path, output_path))
+
+    # 바뀐 기사만 렌더링 (여러 개면 프로세스 풀 사용)
+    written_count = 0
+    failed = set()
+
+    def record(filename, metadata, written):
+        nonlocal written_count
+        entries[filename]['metadata'] = metadata
+        html_filename = filename.replace('.md', '.html')
+        if written:
+            written_count += 1
             print(f"✅ Generated: {html_filename}")
+        else:
+            print(f"⏭️  Unchanged output: {html_filename}")
+
+    if len(pending) > 1 and args.workers != 1:
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            futures = {
+                executor.submit(build_article, file_path, output_path): (filename, file_path)
+                for filename, file_path, output_path in pending
+            }
+            for future, (filename, file_path) in futures.items():
+                try:
+                    record(filename, *future.result())
+                except Exception as e:
+                    print(f"❌ Error processing {file_path}: {e}")
+                    failed.add(filename)
+    else:
+        for filename, file_path, output_path in pending:
+            try:
+                record(filename, *build_article(file_path, output_path))
+            except Exception as e:
+                print(f"❌ Error processing {file_path}: {e}")
+                failed.add(filename)
+
+    for filename in failed:
+        del entries[filename]
+
+    removed = sorted(set(previous) - set(entries) - failed)
+    for filename in removed:
+        print(f"🗑️  Source removed: {filename} (output left in place)")
+
+    # 블로그 인덱스 페이지 생성 (메타데이터가 바뀐 경우에만)
+    articles = [entries[os.path.basename(p)]['metadata'] for p in article_files
+                if os.path.basename(p) in entries]
+    index_hash = hashlib.sha256(
+        json.dumps([articles, version], ensure_ascii=False, sort_keys=True).encode('utf-8')
+    ).hexdigest()
+    blog_index_path = os.path.join(public_dir, 'blog.html')
+    index_written = False
 
-        except Exception as e:
-            print(f"❌ Error processing {file_path}: {e}")
+    if manifest['index'].get('hash') != index_hash or not os.path.exists(blog_index_path):
+        index_written = create_blog_index(articles, blog_index_path)
+    if index_written:
+        print(f"\n✅ Generated: blog.html (index page)")
+    else:
+        print(f"\n⏭️  blog.html unchanged")
 
-    # 블로그 인덱스 페이지 생성
-    blog_index_path = os.path.join(public_dir, 'blog.html')
-    create_blog_index(articles, blog_index_path)
-    print(f"\n✅ Generated: blog.html (index page)")
+    manifest['articles'] = entries
+    manifest['index'] = {'hash': index_hash}
+    save_manifest(manifest, manifest_path)
 
     print(f"\n{'='*60}")
     print(f"📊 Summary")
     print(f"{'='*60}")
-    print(f"✅ Generated {len(articles)} article pages")
-    print(f"✅ Generated 1 blog index page")
+    print(f"📄 {len(articles)} articles ({len(pending)} rebuilt, {len(article_files) - len(pending)} skipped)")
+    print(f"✅ Wrote {written_count} article pages")
+    print(f"✅ Index page {'regenerated' if index_written else 'unchanged'}")
+    if failed:
+        print(f"❌ {len(failed)} failed")
     print(f"📂 Output directory: {public_articles_dir}")
     print(f"{'='*60}\n")
 
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+블로그 HTML 후처리 변환 엔진
+
+각 페이지를 한 번만 읽고 파싱(심볼/날짜/제목/설명 추출)한 뒤, 등록된 변환을
+순서대로 적용합니다.
+
+- 변환은 register_transform()으로 등록하며 order 순으로 실행됩니다.
+- marker 문자열이 이미 페이지에 있으면 해당 변환은 건너뜁니다 (멱등성).
+- 결과 해시가 원본과 같으면 파일을 쓰지 않습니다.
+- 백업은 .build/html_backups/<sha256>.html 에 내용 주소 방식으로 저장되어
+  같은 내용은 한 번만 저장됩니다 (index.jsonl에 파일별 이력 기록).
+- 여러 파일은 프로세스 풀에서 병렬 처리됩니다.
+
+사용법:
+    python scripts/html_transform.py --list
+    python scripts/html_transform.py public/article_*.html --only seo_meta,json_ld
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import cached_property
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+BACKUP_DIR = Path(__file__).parent.parent / ".build" / "html_backups"
+
+# 변환을 등록하는 모듈 (엔진 CLI/워커 프로세스에서 import)
+TRANSFORM_MODULES = [
+    "scripts.upgrade_all_blogs",
+    "scripts.redesign_all_blogs",
+]
+
+
+@dataclass
+class Page:
+    """변환 대상 페이지 (메타데이터는 원본에서 처음 접근할 때 한 번만 추출)"""
+    path: Path
+    html: str
+    source: str = field(init=False)
+
+    def __post_init__(self):
+        self.source = self.html
+
+    @cached_property
+    def symbol(self) -> Optional[str]:
+        match = re.search(r'article_([a-z]+)_', self.path.name, re.IGNORECASE)
+        return match.group(1).upper() if match else None
+
+    @cached_property
+    def date(self) -> str:
+        match = re.search(r'(\d{8})\.html$', self.path.name)
+        if match:
+            return f"{match.group(1)[:4]}-{match.group(1)[4:6]}-{match.group(1)[6:]}"
+        return "2025-11-18"
+
+    @cached_property
+    def title(self) -> str:
+        match = re.search(r'<title>([^|]+)', self.source)
+        return match.group(1).strip() if match else f"{self.symbol} 투자 분석"
+
+    @cached_property
+    def description(self) -> str:
+        match = re.search(r'<p>(.{50,200}?)\.</p>', self.source, re.DOTALL)
+        description = match.group(1).strip() if match else f"{self.symbol} 투자 분석"
+        return re.sub(r'<[^>]+>', '', description)
+
+
+@dataclass
+class Transform:
+    name: str
+    func: Callable[[Page], str]
+    order: int
+    marker: Optional[str] = None
+    description: str = ""
+
+    def is_applied(self, page: Page) -> bool:
+        return bool(self.marker) and self.marker in page.html
+
+
+_REGISTRY: Dict[str, Transform] = {}
+
+
+def register_transform(name: str, order: int, marker: Optional[str] = None):
+    """
+    변환 등록 데코레이터
+
+    Args:
+        name: 변환 이름 (CLI --only 에서 사용)
+        order: 실행 순서 (작을수록 먼저)
+        marker: 이 문자열이 페이지에 있으면 이미 적용된 것으로 보고 건너뜀
+    """
+    def decorator(func: Callable[[Page], str]):
+        _REGISTRY[name] = Transform(
+            name=name,
+            func=func,
+            order=order,
+            marker=marker,
+            description=(func.__doc__ or "").strip().splitlines()[0] if func.__doc__ else "",
+        )
+        return func
+    return decorator
+
+
+def load_transforms() -> None:
+    """기본 변환 모듈을 import 하여 등록"""
+    import importlib
+    for module_name in TRANSFORM_MODULES:
+        importlib.import_module(module_name)
+
+
+def get_transforms(names: Optional[List[str]] = None) -> List[Transform]:
+    """이름 목록(없으면 전체)에 해당하는 변환을 order 순으로 반환"""
+    load_transforms()
+    if names is None:
+        selected = list(_REGISTRY.values())
+    else:
+        unknown = [n for n in names if n not in _REGISTRY]
+        if unknown:
+            raise KeyError(f"Unknown transform(s): {', '.join(unknown)}")
+        selected = [_REGISTRY[n] for n in names]
+    return sorted(selected, key=lambda t: t.order)
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def backup_content(html: str, backup_dir: Path = BACKUP_DIR) -> str:
+    """내용 주소 방식 백업 (같은 내용이면 다시 쓰지 않음). 해시 반환"""
+    digest = content_hash(html)
+    backup_path = backup_dir / f"{digest}.html"
+    if not backup_path.exists():
+        backup_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = backup_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(html, encoding='utf-8')
+        os.replace(tmp_path, backup_path)
+    return digest
+
+
+def transform_file(
+    file_path: str,
+    names: Optional[List[str]] = None,
+    backup: bool = True,
+    dry_run: bool = False,
+) -> Dict:
+    """
+    파일 하나에 변환 적용 (프로세스 풀 작업 단위)
+
+    Returns:
+        {'file', 'changed', 'applied', 'skipped', 'before', 'after', 'error'}
+    """
+    path = Path(file_path)
+    result = {'file': str(path), 'changed': False, 'applied': [], 'skipped': [], 'error': None}
+
+    try:
+        original = path.read_text(encoding='utf-8')
+        page = Page(path=path, html=original)
+
+        for transform in get_transforms(names):
+            if transform.is_applied(page):
+                result['skipped'].append(transform.name)
+                continue
+            updated = transform.func(page)
+            if updated != page.html:
+                page.html = updated
+                result['applied'].append(transform.name)
+
+        before, after = content_hash(original), content_hash(page.html)
+        result['before'], result['after'] = before, after
+        if before == after:
+            return result
+
+        result['changed'] = True
+        if dry_run:
+            return result
+
+        if backup:
+            backup_content(original)
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        tmp_path.write_text(page.html, encoding='utf-8')
+        os.replace(tmp_path, path)
+    except Exception as e:
+        result['error'] = str(e)
+
+    return result
+
+
+def run_transforms(
+    files: List[Path],
+    names: Optional[List[str]] = None,
+    workers: Optional[int] = None,
+    backup: bool = True,
+    dry_run: bool = False,
+) -> List[Dict]:
+    """여러 파일에 변환을 병렬 적용하고 백업 이력을 기록"""
+    files = [str(f) for f in files]
+    get_transforms(names)  # 잘못된 이름은 워커를 띄우기 전에 실패
+
+    if len(files) > 1 and workers != 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(
+                transform_file, files,
+                [names] * len(files), [backup] * len(files), [dry_run] * len(files)
+            ))
+    else:
+        results = [transform_file(f, names, backup, dry_run) for f in files]
+
+    if backup and not dry_run:
+        changed = [r for r in results if r['changed'] and not r['error']]
+        if changed:
+            BACKUP_DIR.mkdir(parents=True, exist_ok=True)
+            with open(BACKUP_DIR / "index.jsonl", 'a', encoding='utf-8') as f:
+                for r in changed:
+                    f.write(json.dumps({
+                        'file': r['file'],
+                        'backup': r['before'],
+                        'result': r['after'],
+                        'transforms': r['applied'],
+                        'at': datetime.now().isoformat(),
+                    }, ensure_ascii=False) + "\n")
+
+    return results
+
+
+def print_results(results: List[Dict]) -> None:
+    for r in results:
+        name = Path(r['file']).name
+        if r['error']:
+            print(f"❌ {name}: {r['error']}")
+        elif r['changed']:
+            print(f"✅ {name}: {', '.join(r['applied'])}")
+        else:
+            print(f"⏭️  {name}: 변경 없음")
+
+    changed = sum(1 for r in results if r['changed'])
+    failed = sum(1 for r in results if r['error'])
+    print(f"\n📊 {len(results)}개 중 {changed}개 변경, {len(results) - changed - failed}개 그대로, {failed}개 오류")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="블로그 HTML 후처리 변환 엔진")
+    parser.add_argument("files", nargs="*", type=Path, help="변환할 HTML 파일")
+    parser.add_argument("--only", help="적용할 변환 이름 (쉼표 구분, 기본: 전체)")
+    parser.add_argument("--workers", type=int, help="프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--no-backup", action="store_true", help="백업하지 않음")
+    parser.add_argument("--dry-run", action="store_true", help="파일을 쓰지 않고 결과만 출력")
+    parser.add_argument("--list", action="store_true", help="등록된 변환 목록")
+    args = parser.parse_args()
+
+    if args.list:
+        for t in get_transforms():
+            print(f"{t.order:>4}  {t.name:<20} {t.description}")
+        return
+
+    if not args.files:
+        parser.print_help()
+        return
+
+    names = args.only.split(",") if args.only else None
+    results = run_transforms(
+        args.files, names, workers=args.workers, backup=not args.no_backup, dry_run=args.dry_run
+    )
+    print_results(results)
+
+
+if __name__ == "__main__":
+    # 변환 모듈은 scripts.html_transform 레지스트리에 등록하므로 같은 모듈 인스턴스로 실행
+    from scripts import html_transform
+    html_transform.main()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Shared disk-backed cache + pooled HTTP session for LLM calls made by scripts.
+
+Responses are keyed by a hash of (provider, model, messages, params), so
+re-running the image pipeline on unchanged sections costs no API calls.
+Entries expire after a TTL and the store is bounded by entry count (least
+recently used entries are evicted first).
+
+Usage:
+    from scripts.llm_cache import get_cache, get_session, fan_out
+
+    text = get_cache().cached_call(
+        "openai", "gpt-4o-mini", messages, {"temperature": 0.7},
+        lambda: call_api(messages),
+    )
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar
+
+import requests
+from requests.adapters import HTTPAdapter
+from loguru import logger
+
+DEFAULT_CACHE_PATH = Path(__file__).parent.parent / ".cache" / "llm_cache.sqlite"
+DEFAULT_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", 30 * 24 * 3600))
+DEFAULT_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", 5000))
+DEFAULT_MAX_WORKERS = 4
+
+T = TypeVar("T")
+
+
+class LLMCache:
+    """SQLite-backed LLM response cache (thread-safe)."""
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.path = Path(path) if path else DEFAULT_CACHE_PATH
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS llm_cache (
+                key TEXT PRIMARY KEY,
+                provider TEXT NOT NULL,
+                model TEXT NOT NULL,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_cache_accessed ON llm_cache (accessed_at)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(provider: str, model: str, messages: Any, params: Optional[Dict] = None) -> str:
+        payload = json.dumps(
+            {"provider": provider, "model": model, "messages": messages, "params": params or {}},
+            ensure_ascii=False,
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            response, created_at = row
+            if self.ttl_seconds and now - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            self._conn.execute("UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+        return json.loads(response)
+
+    def set(self, key: str, provider: str, model: str, response: Any):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache VALUES (?, ?, ?, ?, ?, ?)",
+                (key, provider, model, json.dumps(response, ensure_ascii=False), now, now),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """Drop expired entries, then least recently used ones above max_entries."""
+        if self.ttl_seconds:
+            self._conn.execute(
+                "DELETE FROM llm_cache WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+            )
+        if self.max_entries:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()
+            overflow = count - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    "DELETE FROM llm_cache WHERE key IN "
+                    "(SELECT key FROM llm_cache ORDER BY accessed_at ASC LIMIT ?)",
+                    (overflow,),
+                )
+
+    def cached_call(
+        self,
+        provider: str,
+        model: str,
+        messages: Any,
+        params: Optional[Dict],
+        call: Callable[[], T],
+    ) -> T:
+        """Return the cached response for this request, or run `call` and store it."""
+        key = self.make_key(provider, model, messages, params)
+        cached = self.get(key)
+        if cached is not None:
+            self.hits += 1
+            logger.debug(f"LLM cache hit ({provider}/{model})")
+            return cached
+
+        self.misses += 1
+        response = call()
+        self.set(key, provider, model, response)
+        return response
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_cache")
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_cache: Optional[LLMCache] = None
+_session: Optional[requests.Session] = None
+_singleton_lock = threading.Lock()
+
+
+def get_cache() -> LLMCache:
+    """Process-wide LLM cache."""
+    global _cache
+    with _singleton_lock:
+        if _cache is None:
+            _cache = LLMCache()
+        return _cache
+
+
+def get_session(pool_size: int = 16) -> requests.Session:
+    """Process-wide keep-alive session for LLM HTTP APIs."""
+    global _session
+    with _singleton_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+def fan_out(fn: Callable[[Any], T], items: Iterable[Any], max_workers: int = DEFAULT_MAX_WORKERS) -> List[T]:
+    """Run fn over items with bounded concurrency, preserving input order."""
+    items = list(items)
+    if max_workers <= 1 or len(items) <= 1:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(fn, items))
@@ -18,23 +18,30 @@
 """
 
 import os
-import requests
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from pathlib import Path
 from dotenv import load_dotenv
 from loguru import logger
-from supabase import create_client
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+from http_client import get_supabase, fetch_json
+from sec_edgar import EdgarClient
+from upsert_writer import dedupe_rows, upsert_rows, today
 
 load_dotenv()
 
+# FMP 종목별 호출 동시 실행 수
+FMP_WORKERS = 4
+
 
 class CorporateEventsCollector:
     """기업 이슈 뉴스 수집기"""
 
     def __init__(self):
-        self.supabase_url = os.getenv("SUPABASE_URL")
-        self.supabase_key = os.getenv("SUPABASE_KEY")
-        self.supabase = create_client(self.supabase_url, self.supabase_key)
+        self.supabase = get_supabase()
 
         self.fmp_key = os.getenv("FMP_API_KEY")
 
@@ -44,30 +51,18 @@ class CorporateEventsCollector:
             "META", "TSLA", "NFLX", "ADBE", "UBER"
         ]
 
+        self.edgar = EdgarClient()
+
     def collect_sec_filings(self, symbol: str) -> List[Dict[str, Any]]:
         """
-        SEC 필링 수집 (8-K, 10-K, 10-Q)
+        SEC 필링 수집 (8-K, 10-K, 10-Q 등, 마지막 수집 이후 새 필링만)
         Source: SEC EDGAR API
         """
         logger.info(f"📊 {symbol} SEC 필링 수집 중...")
 
         try:
-            # SEC EDGAR API
-            url = f"https://data.sec.gov/submissions/CIK{self.get_cik(symbol)}.json"
-            headers = {
-                "User-Agent": "Aivesto aivesto@example.com"
-            }
-
-            # 임시 데이터 (실제 SEC API 응답 파싱 필요)
-            filings = [
-                {
-                    "symbol": symbol,
-                    "filing_type": "8-K",
-                    "filing_date": "2025-11-15",
-                    "description": "Results of Operations and Financial Condition",
-                    "url": f"https://www.sec.gov/edgar/{symbol}/8-K"
-                }
-            ]
+            self.edgar.refresh_cik_map()
+            filings = self.edgar.fetch_new_filings(symbol)
 
             logger.success(f"  ✅ {symbol} SEC 필링 {len(filings)}개 수집 완료")
             return filings
@@ -76,17 +71,10 @@ class CorporateEventsCollector:
             logger.error(f"  ❌ {symbol} SEC 필링 수집 실패: {e}")
             return []
 
-    def get_cik(self, symbol: str) -> str:
-        """종목 심볼에서 CIK 번호 가져오기"""
-        # TODO: SEC CIK 매핑 테이블 구축
-        cik_map = {
-            "AAPL": "0000320193",
-            "MSFT": "0000789019",
-            "GOOGL": "0001652044",
-            "AMZN": "0001018724",
-            "NVDA": "0001045810"
-        }
-        return cik_map.get(symbol, "0000000000")
+    def get_cik(self, symbol: str) -> Optional[str]:
+        """종목 심볼에서 CIK 번호 가져오기 (SEC 전체 매핑 캐시 사용)"""
+        self.edgar.refresh_cik_map()
+        return self.edgar.get_cik(symbol)
 
     def collect_insider_trading(self, symbol: str) -> List[Dict[str, Any]]:
         """
@@ -107,10 +95,7 @@ class CorporateEventsCollector:
                 "apikey": self.fmp_key
             }
 
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-
-            data = response.json()
+            data = fetch_json(url, params)
 
             insider_trades = []
             for trade in data[:10]:  # 최근 10건
@@ -148,10 +133,7 @@ class CorporateEventsCollector:
                 "apikey": self.fmp_key
             }
 
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-
-            data = response.json()
+            data = fetch_json(url, params)
 
             press_releases = []
             for release in data:
@@ -213,24 +195,42 @@ class CorporateEventsCollector:
         return signal
 
     def save_to_database(self, data: List[Dict[str, Any]]):
-        """수집한 데이터를 Supabase에 저장"""
+        """수집한 데이터를 Supabase에 저장 (종목+이벤트+날짜+설명 기준 upsert)"""
 
         logger.info("💾 Supabase에 저장 중...")
 
-        for item in data:
-            try:
-                result = self.supabase.table('corporate_events').insert({
-                    "symbol": item.get("symbol"),
-                    "event_type": item.get("event_type"),
-                    "event_description": item.get("description", ""),
-                    "signal": item.get("signal", ""),
-                    "severity": item.get("severity", "MEDIUM")
-                }).execute()
+        rows = [{
+            "symbol": item.get("symbol"),
+            "event_type": item.get("event_type"),
+            "event_date": item.get("date") or today(),
+            "event_description": item.get("description", ""),
+            "signal": item.get("signal", ""),
+            "severity": item.get("severity", "MEDIUM")
+        } for item in data]
+
+        upsert_rows(self.supabase, 'corporate_events', rows)
 
-                logger.success(f"  ✅ {item.get('symbol')} 저장 완료")
+    def save_filings(self, filings: List[Dict[str, Any]]) -> bool:
+        """
+        SEC 필링을 corporate_events 에 저장 (접수번호를 설명에 넣어 필링마다 한 행)
 
-            except Exception as e:
-                logger.error(f"  ❌ 저장 실패: {e}")
+        Returns:
+            모든 행을 저장했으면 True (필링이 없어도 True)
+        """
+        rows = dedupe_rows('corporate_events', [{
+            "symbol": filing["symbol"],
+            "event_type": f"SEC_{filing['filing_type']}",
+            "event_date": filing.get("filing_date") or today(),
+            "event_description": f"{filing.get('description', '')} [{filing['accession_number']}]",
+            "signal": None,
+            "severity": "MEDIUM",
+            "source_url": filing.get("url")
+        } for filing in filings])
+        if not rows:
+            return True
+
+        logger.info("💾 SEC 필링 저장 중...")
+        return upsert_rows(self.supabase, 'corporate_events', rows) == len(rows)
 
     def run(self):
         """기업 이벤트 수집 실행"""
@@ -243,18 +243,25 @@ class CorporateEventsCollector:
         all_insider_trades = []
         all_press_releases = []
 
-        # 각 종목별 데이터 수집
-        for symbol in self.tracked_symbols[:3]:  # 테스트: 3개만
-            # 1. SEC 필링
-            filings = self.collect_sec_filings(symbol)
-            all_filings.extend(filings)
+        # 1. SEC 필링 (전체 종목 동시 조회, 초당 10회 이내)
+        filings_by_symbol = self.edgar.fetch_many(self.tracked_symbols)
+        for symbol in self.tracked_symbols:
+            all_filings.extend(filings_by_symbol.get(symbol, []))
 
-            # 2. 내부자 매매
-            insider_trades = self.collect_insider_trading(symbol)
-            all_insider_trades.extend(insider_trades)
+        # 저장한 뒤에만 EDGAR 상태를 전진 (실패하면 다음 실행에서 같은 필링을 다시 받음)
+        if self.save_filings(all_filings):
+            self.edgar.confirm(self.tracked_symbols)
+        else:
+            logger.warning("SEC 필링 저장 실패 - 다음 실행에서 다시 수집합니다")
 
-            # 3. 보도자료
-            press_releases = self.collect_press_releases(symbol)
+        # 2~3. 내부자 매매 + 보도자료 (종목별 동시 조회)
+        with ThreadPoolExecutor(max_workers=FMP_WORKERS) as executor:
+            insider_results = list(executor.map(self.collect_insider_trading, self.tracked_symbols))
+            press_results = list(executor.map(self.collect_press_releases, self.tracked_symbols))
+
+        for insider_trades in insider_results:
+            all_insider_trades.extend(insider_trades)
+        for press_releases in press_results:
             all_press_releases.extend(press_releases)
 
         # 4. 시그널 분석
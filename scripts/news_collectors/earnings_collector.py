@@ -16,25 +16,32 @@
 - Seeking Alpha (Premium)
 """
 
+import csv
+import io
 import os
-import requests
+import sys
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 from loguru import logger
-from supabase import create_client
+from pathlib import Path
 from typing import List, Dict, Any
 import yfinance as yf
 
+sys.path.insert(0, str(Path(__file__).parent))
+from http_client import get_supabase, fetch_json, fetch_text
+from upsert_writer import upsert_rows
+
 load_dotenv()
 
+# 실적 일정은 하루 두 번만 갱신
+CALENDAR_CACHE_TTL = 12 * 60 * 60
+
 
 class EarningsNewsCollector:
     """실적 뉴스 수집기"""
 
     def __init__(self):
-        self.supabase_url = os.getenv("SUPABASE_URL")
-        self.supabase_key = os.getenv("SUPABASE_KEY")
-        self.supabase = create_client(self.supabase_url, self.supabase_key)
+        self.supabase = get_supabase()
 
         # API Keys
         self.alpha_vantage_key = os.getenv("ALPHA_VANTAGE_API_KEY")
@@ -58,32 +65,29 @@ class EarningsNewsCollector:
             return []
 
         try:
-            earnings_calendar = []
+            # 전체 종목 일정을 한 번에 받아 추적 종목만 필터 (종목별 호출 대신 1회)
+            url = f"https://www.alphavantage.co/query"
+            params = {
+                "function": "EARNINGS_CALENDAR",
+                "horizon": "3month",
+                "apikey": self.alpha_vantage_key
+            }
 
-            for symbol in self.tracked_symbols:
-                url = f"https://www.alphavantage.co/query"
-                params = {
-                    "function": "EARNINGS_CALENDAR",
-                    "symbol": symbol,
-                    "apikey": self.alpha_vantage_key
-                }
-
-                response = requests.get(url, params=params)
-                response.raise_for_status()
-
-                # CSV 파싱
-                lines = response.text.strip().split('\n')
-                if len(lines) > 1:
-                    headers = lines[0].split(',')
-                    for line in lines[1:]:
-                        values = line.split(',')
-                        if len(values) == len(headers):
-                            earnings_calendar.append({
-                                "symbol": symbol,
-                                "report_date": values[0],
-                                "fiscal_period": values[1] if len(values) > 1 else None,
-                                "estimate": float(values[2]) if len(values) > 2 and values[2] else None
-                            })
+            text = fetch_text(url, params, cache_ttl=CALENDAR_CACHE_TTL)
+
+            # CSV 파싱 (symbol,name,reportDate,fiscalDateEnding,estimate,currency)
+            tracked = set(self.tracked_symbols)
+            until = (datetime.now() + timedelta(days=days_ahead)).strftime('%Y-%m-%d')
+            earnings_calendar = []
+            for row in csv.DictReader(io.StringIO(text)):
+                if row.get("symbol") not in tracked or row.get("reportDate", "") > until:
+                    continue
+                earnings_calendar.append({
+                    "symbol": row["symbol"],
+                    "report_date": row.get("reportDate"),
+                    "fiscal_period": row.get("fiscalDateEnding") or None,
+                    "estimate": float(row["estimate"]) if row.get("estimate") else None
+                })
 
             logger.success(f"  ✅ 실적 일정 {len(earnings_calendar)}개 수집 완료")
             return earnings_calendar
@@ -143,10 +147,7 @@ class EarningsNewsCollector:
             url = f"https://financialmodelingprep.com/api/v3/analyst-stock-recommendations/{symbol}"
             params = {"apikey": self.fmp_key}
 
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-
-            data = response.json()
+            data = fetch_json(url, params)
 
             analyst_ratings = []
             for rating in data[:10]:  # 최근 10개
@@ -213,28 +214,23 @@ class EarningsNewsCollector:
         return signal
 
     def save_to_database(self, data: List[Dict[str, Any]], data_type: str):
-        """수집한 데이터를 Supabase에 저장"""
+        """수집한 데이터를 Supabase에 저장 (종목+분기 기준 upsert)"""
 
         logger.info(f"💾 {data_type} Supabase에 저장 중...")
 
-        for item in data:
-            try:
-                if data_type == "earnings":
-                    result = self.supabase.table('earnings_news').insert({
-                        "symbol": item.get("symbol"),
-                        "quarter": item.get("quarter"),
-                        "eps_actual": item.get("eps_actual"),
-                        "eps_consensus": item.get("eps_consensus"),
-                        "revenue_actual": item.get("revenue_actual"),
-                        "revenue_consensus": item.get("revenue_consensus"),
-                        "guidance": item.get("guidance", "MAINTAIN"),
-                        "signal_strength": item.get("signal_strength", "NEUTRAL")
-                    }).execute()
-
-                logger.success(f"  ✅ {item.get('symbol')} 저장 완료")
-
-            except Exception as e:
-                logger.error(f"  ❌ 저장 실패: {e}")
+        if data_type == "earnings":
+            rows = [{
+                "symbol": item.get("symbol"),
+                "quarter": item.get("quarter"),
+                "eps_actual": item.get("eps_actual"),
+                "eps_consensus": item.get("eps_consensus"),
+                "revenue_actual": item.get("revenue_actual"),
+                "revenue_consensus": item.get("revenue_consensus"),
+                "guidance": item.get("guidance", "MAINTAIN"),
+                "signal_strength": item.get("signal_strength", "NEUTRAL")
+            } for item in data]
+
+            upsert_rows(self.supabase, 'earnings_news', rows)
 
     def run(self):
         """실적 뉴스 수집 실행"""
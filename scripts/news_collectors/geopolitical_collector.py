@@ -19,14 +19,18 @@
 """
 
 import os
-import requests
+import sys
 from datetime import datetime
 from dotenv import load_dotenv
 from loguru import logger
-from supabase import create_client
+from pathlib import Path
 from typing import List, Dict, Any
 import yfinance as yf
 
+sys.path.insert(0, str(Path(__file__).parent))
+from http_client import get_supabase
+from upsert_writer import upsert_rows, today
+
 load_dotenv()
 
 
@@ -34,9 +38,7 @@ class GeopoliticalCollector:
     """지정학적 뉴스 수집기"""
 
     def __init__(self):
-        self.supabase_url = os.getenv("SUPABASE_URL")
-        self.supabase_key = os.getenv("SUPABASE_KEY")
-        self.supabase = create_client(self.supabase_url, self.supabase_key)
+        self.supabase = get_supabase()
 
         self.alpha_vantage_key = os.getenv("ALPHA_VANTAGE_API_KEY")
 
@@ -227,23 +229,19 @@ class GeopoliticalCollector:
         return signal
 
     def save_to_database(self, data: List[Dict[str, Any]]):
-        """수집한 데이터를 Supabase에 저장"""
+        """수집한 데이터를 Supabase에 저장 (지역+이벤트+날짜 기준 upsert)"""
 
         logger.info("💾 Supabase에 저장 중...")
 
-        for item in data:
-            try:
-                result = self.supabase.table('geopolitical_news').insert({
-                    "region": item.get("region", "UNKNOWN"),
-                    "event_type": item.get("event_type", ""),
-                    "affected_sectors": item.get("affected_stocks", []),
-                    "signal": item.get("signal", "")
-                }).execute()
-
-                logger.success(f"  ✅ {item.get('region')} 저장 완료")
+        rows = [{
+            "region": item.get("region") or "UNKNOWN",
+            "event_type": item.get("event_type", ""),
+            "event_date": item.get("date") or today(),
+            "affected_sectors": item.get("affected_stocks", []),
+            "signal": item.get("signal", "")
+        } for item in data]
 
-            except Exception as e:
-                logger.error(f"  ❌ 저장 실패: {e}")
+        upsert_rows(self.supabase, 'geopolitical_news', rows)
 
     def run(self):
         """지정학적 뉴스 수집 실행"""
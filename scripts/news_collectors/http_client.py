@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+뉴스 수집기 공용 HTTP 전송 계층
+
+- 프로세스 전체에서 하나의 requests.Session (호스트별 keep-alive 연결 풀)
+- 기본 타임아웃
+- 429/5xx 및 연결 오류 시 지수 백오프 + 지터 재시도 (Retry-After 존중)
+- 자주 바뀌지 않는 시계열(FRED CPI/GDP/실업률 등)을 위한 디스크 응답 캐시
+- aiohttp 기반 비동기 버전 (AsyncHttpClient)
+- 공용 Supabase 클라이언트
+
+사용법:
+    from http_client import fetch_json, get_supabase
+
+    data = fetch_json(url, params, cache_ttl=FRED_CACHE_TTL)
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import random
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from loguru import logger
+
+DEFAULT_TIMEOUT = (5, 30)  # (connect, read) 초
+MAX_RETRIES = 4
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 30.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+POOL_CONNECTIONS = 10  # 캐시할 호스트 풀 수
+POOL_MAXSIZE = 16  # 호스트당 연결 수
+
+CACHE_PATH = Path(__file__).parent.parent.parent / ".cache" / "http_cache.sqlite"
+FRED_CACHE_TTL = 12 * 60 * 60
+# 캐시 키에서 제외할 인증 파라미터
+SECRET_PARAMS = {"api_key", "apikey", "token", "key"}
+
+_session: Optional[requests.Session] = None
+_cache: Optional["ResponseCache"] = None
+_supabase = None
+_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """프로세스 공용 keep-alive 세션"""
+    global _session
+    with _lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+def get_supabase():
+    """프로세스 공용 Supabase 클라이언트"""
+    global _supabase
+    with _lock:
+        if _supabase is None:
+            from supabase import create_client
+            _supabase = create_client(os.getenv("SUPABASE_URL"), os.getenv("SUPABASE_KEY"))
+        return _supabase
+
+
+def backoff_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Retry-After가 있으면 그 값, 없으면 full-jitter 지수 백오프"""
+    if retry_after:
+        try:
+            return min(float(retry_after), BACKOFF_MAX)
+        except ValueError:
+            pass
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)))
+
+
+def http_get(
+    url: str,
+    params: Optional[Dict] = None,
+    headers: Optional[Dict] = None,
+    timeout=DEFAULT_TIMEOUT,
+    max_retries: int = MAX_RETRIES,
+    before_request: Optional[Callable[[], None]] = None,
+) -> requests.Response:
+    """
+    재시도가 포함된 GET
+
+    429/5xx/연결 오류는 재시도하고, 그 밖의 4xx나 재시도 소진 시 예외를 던집니다.
+    304 등 3xx 응답은 그대로 반환합니다. before_request 는 재시도를 포함한 매 요청 직전에
+    호출됩니다 (예: RateLimiter.wait).
+    """
+    session = get_session()
+    for attempt in range(max_retries + 1):
+        if before_request:
+            before_request()
+        try:
+            response = session.get(url, params=params, headers=headers, timeout=timeout)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if attempt == max_retries:
+                raise
+            delay = backoff_delay(attempt)
+            logger.warning(f"HTTP 연결 오류, {delay:.1f}초 후 재시도 ({attempt + 1}/{max_retries}): {e}")
+            time.sleep(delay)
+            continue
+
+        if response.status_code in RETRY_STATUSES and attempt < max_retries:
+            delay = backoff_delay(attempt, response.headers.get("Retry-After"))
+            logger.warning(f"HTTP {response.status_code} ({url}), {delay:.1f}초 후 재시도 ({attempt + 1}/{max_retries})")
+            time.sleep(delay)
+            continue
+
+        response.raise_for_status()
+        return response
+
+
+class ResponseCache:
+    """만료 시각이 있는 디스크 응답 캐시 (SQLite, 스레드 안전)"""
+
+    def __init__(self, path: Path = CACHE_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS http_cache (
+                key TEXT PRIMARY KEY,
+                body TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            )"""
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict] = None) -> str:
+        public = {k: v for k, v in (params or {}).items() if k.lower() not in SECRET_PARAMS}
+        payload = json.dumps([url, public], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, expires_at FROM http_cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or row[1] < time.time():
+            return None
+        return row[0]
+
+    def set(self, key: str, body: str, ttl: float):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO http_cache VALUES (?, ?, ?)", (key, body, time.time() + ttl)
+            )
+            self._conn.execute("DELETE FROM http_cache WHERE expires_at < ?", (time.time(),))
+            self._conn.commit()
+
+
+def get_cache() -> ResponseCache:
+    global _cache
+    with _lock:
+        if _cache is None:
+            _cache = ResponseCache()
+        return _cache
+
+
+def fetch_text(url: str, params: Optional[Dict] = None, cache_ttl: float = 0, **kwargs) -> str:
+    """응답 본문 (cache_ttl > 0 이면 디스크 캐시 사용)"""
+    if cache_ttl > 0:
+        key = ResponseCache.make_key(url, params)
+        cached = get_cache().get(key)
+        if cached is not None:
+            logger.debug(f"HTTP cache hit: {url}")
+            return cached
+
+    text = http_get(url, params=params, **kwargs).text
+
+    if cache_ttl > 0:
+        get_cache().set(key, text, cache_ttl)
+    return text
+
+
+def fetch_json(url: str, params: Optional[Dict] = None, cache_ttl: float = 0, **kwargs) -> Any:
+    return json.loads(fetch_text(url, params, cache_ttl, **kwargs))
+
+
+class AsyncHttpClient:
+    """
+    aiohttp 기반 비동기 클라이언트 (재시도/캐시 규칙은 동기 버전과 동일)
+
+    async with AsyncHttpClient() as client:
+        results = await asyncio.gather(*(client.fetch_json(u) for u in urls))
+    """
+
+    def __init__(self, limit_per_host: int = POOL_MAXSIZE, max_retries: int = MAX_RETRIES):
+        self.limit_per_host = limit_per_host
+        self.max_retries = max_retries
+        self._session = None
+
+    async def __aenter__(self):
+        import aiohttp
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit_per_host=self.limit_per_host),
+            timeout=aiohttp.ClientTimeout(connect=DEFAULT_TIMEOUT[0], sock_read=DEFAULT_TIMEOUT[1]),
+        )
+        return self
+
+    async def __aexit__(self, *exc):
+        await self._session.close()
+
+    async def fetch_text(self, url: str, params: Optional[Dict] = None, cache_ttl: float = 0,
+                         headers: Optional[Dict] = None) -> str:
+        import aiohttp
+
+        if cache_ttl > 0:
+            key = ResponseCache.make_key(url, params)
+            cached = get_cache().get(key)
+            if cached is not None:
+                return cached
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with self._session.get(url, params=params, headers=headers) as response:
+                    if response.status in RETRY_STATUSES and attempt < self.max_retries:
+                        delay = backoff_delay(attempt, response.headers.get("Retry-After"))
+                        logger.warning(f"HTTP {response.status} ({url}), {delay:.1f}초 후 재시도")
+                        await asyncio.sleep(delay)
+                        continue
+                    response.raise_for_status()
+                    text = await response.text()
+                    break
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == self.max_retries:
+                    raise
+                await asyncio.sleep(backoff_delay(attempt))
+
+        if cache_ttl > 0:
+            get_cache().set(key, text, cache_ttl)
+        return text
+
+    async def fetch_json(self, url: str, params: Optional[Dict] = None, cache_ttl: float = 0,
+                         headers: Optional[Dict] = None) -> Any:
+        return json.loads(await self.fetch_text(url, params, cache_ttl, headers))
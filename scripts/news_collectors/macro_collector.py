@@ -20,13 +20,17 @@
 """
 
 import os
-import requests
+import sys
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 from loguru import logger
-from supabase import create_client
+from pathlib import Path
 from typing import List, Dict, Any
 
+sys.path.insert(0, str(Path(__file__).parent))
+from http_client import get_supabase, fetch_json, FRED_CACHE_TTL
+from upsert_writer import upsert_rows, today
+
 load_dotenv()
 
 
@@ -34,9 +38,7 @@ class MacroNewsCollector:
     """거시경제 뉴스 수집기"""
 
     def __init__(self):
-        self.supabase_url = os.getenv("SUPABASE_URL")
-        self.supabase_key = os.getenv("SUPABASE_KEY")
-        self.supabase = create_client(self.supabase_url, self.supabase_key)
+        self.supabase = get_supabase()
 
         # API Keys (환경변수로 설정)
         self.alpha_vantage_key = os.getenv("ALPHA_VANTAGE_API_KEY")
@@ -63,10 +65,7 @@ class MacroNewsCollector:
                 "sort_order": "desc"
             }
 
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-
-            data = response.json()
+            data = fetch_json(url, params, cache_ttl=FRED_CACHE_TTL)
             observations = data.get("observations", [])
 
             cpi_data = []
@@ -105,10 +104,7 @@ class MacroNewsCollector:
                 "sort_order": "desc"
             }
 
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-
-            data = response.json()
+            data = fetch_json(url, params, cache_ttl=FRED_CACHE_TTL)
             observations = data.get("observations", [])
 
             unemployment_data = []
@@ -147,10 +143,7 @@ class MacroNewsCollector:
                 "sort_order": "desc"
             }
 
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-
-            data = response.json()
+            data = fetch_json(url, params, cache_ttl=FRED_CACHE_TTL)
             observations = data.get("observations", [])
 
             gdp_data = []
@@ -251,26 +244,21 @@ class MacroNewsCollector:
         return signal
 
     def save_to_database(self, data: List[Dict[str, Any]]):
-        """수집한 데이터를 Supabase에 저장"""
+        """수집한 데이터를 Supabase에 저장 (지표+날짜 기준 upsert)"""
 
         logger.info("💾 Supabase에 저장 중...")
 
-        for item in data:
-            try:
-                # macro_news 테이블에 저장
-                result = self.supabase.table('macro_news').insert({
-                    "event_type": item.get("indicator"),
-                    "actual": item.get("value"),
-                    "consensus": None,  # TODO: consensus 데이터 추가
-                    "previous": None,  # TODO: previous 데이터 추가
-                    "impact": "HIGH",
-                    "affected_sectors": item.get("affected_sectors", []),
-                }).execute()
-
-                logger.success(f"  ✅ {item.get('indicator')} 저장 완료")
-
-            except Exception as e:
-                logger.error(f"  ❌ 저장 실패: {e}")
+        rows = [{
+            "event_type": item.get("indicator"),
+            "event_date": item.get("date") or today(),
+            "actual": item.get("value"),
+            "consensus": None,  # TODO: consensus 데이터 추가
+            "previous": None,  # TODO: previous 데이터 추가
+            "impact": "HIGH",
+            "affected_sectors": item.get("affected_sectors", []),
+        } for item in data]
+
+        upsert_rows(self.supabase, 'macro_news', rows)
 
     def run(self):
         """거시경제 뉴스 수집 실행"""
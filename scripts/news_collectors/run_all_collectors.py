@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+전체 뉴스 수집기 실행
+
+6개 수집기를 한 프로세스에서 동시에 실행하여 HTTP 연결 풀, 응답 캐시,
+Supabase 클라이언트를 공유합니다.
+
+사용법:
+    python scripts/news_collectors/run_all_collectors.py
+    python scripts/news_collectors/run_all_collectors.py --only macro,earnings
+"""
+
+import argparse
+import importlib
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+COLLECTORS = {
+    "macro": ("macro_collector", "MacroNewsCollector"),
+    "earnings": ("earnings_collector", "EarningsNewsCollector"),
+    "sector": ("sector_collector", "SectorNewsCollector"),
+    "geopolitical": ("geopolitical_collector", "GeopoliticalCollector"),
+    "tech_trends": ("tech_trends_collector", "TechTrendsCollector"),
+    "corporate_events": ("corporate_events_collector", "CorporateEventsCollector"),
+}
+
+
+def run_collector(name: str):
+    module_name, class_name = COLLECTORS[name]
+    try:
+        collector = getattr(importlib.import_module(module_name), class_name)()
+        return name, collector.run(), None
+    except Exception as e:
+        logger.error(f"❌ {name} 수집기 실패: {e}")
+        return name, None, str(e)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="전체 뉴스 수집기 실행")
+    parser.add_argument("--only", help=f"실행할 수집기 (쉼표 구분): {', '.join(COLLECTORS)}")
+    parser.add_argument("--workers", type=int, default=len(COLLECTORS), help="동시 실행 수집기 수")
+    args = parser.parse_args()
+
+    names = args.only.split(",") if args.only else list(COLLECTORS)
+    unknown = [n for n in names if n not in COLLECTORS]
+    if unknown:
+        parser.error(f"알 수 없는 수집기: {', '.join(unknown)}")
+
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        results = list(executor.map(run_collector, names))
+
+    logger.info("=" * 60)
+    for name, result, error in results:
+        if error:
+            logger.error(f"❌ {name}: {error}")
+        else:
+            logger.success(f"✅ {name}: 시그널 {len(result.get('signals', []))}개")
+    logger.info("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+SEC EDGAR 클라이언트 (CIK 매핑 캐시 + 증분 필링 조회)
+
+- 전체 ticker→CIK 표(company_tickers.json)를 SQLite에 캐시하고 하루 한 번만 갱신
+- CIK별 마지막으로 본 접수번호(accession)와 ETag/Last-Modified를 저장하여
+  조건부 요청으로 변경이 없으면 304만 받고, 변경이 있으면 새 필링만 반환
+  (상태는 호출자가 필링을 저장한 뒤 confirm() 할 때 전진, 그 전에 실패하면 다음 실행에서 다시 반환)
+- SEC 공정 사용 한도(초당 10회) 안에서 스레드 풀로 동시 조회 (재시도 요청도 RateLimiter 통과)
+
+테스트용 로컬 서버를 쓰려면 SEC_EDGAR_DATA_URL / SEC_EDGAR_WWW_URL 환경 변수로
+기본 URL을 바꿉니다:
+    SEC_EDGAR_DATA_URL=http://localhost:8000 SEC_EDGAR_WWW_URL=http://localhost:8000 \\
+        python scripts/news_collectors/corporate_events_collector.py
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import requests
+from loguru import logger
+
+from http_client import http_get
+
+DEFAULT_DB_PATH = Path(__file__).parent.parent.parent / ".cache" / "sec_edgar.sqlite"
+DATA_URL = os.getenv("SEC_EDGAR_DATA_URL", "https://data.sec.gov")
+WWW_URL = os.getenv("SEC_EDGAR_WWW_URL", "https://www.sec.gov")
+USER_AGENT = os.getenv("SEC_EDGAR_USER_AGENT", "Aivesto aivesto@example.com")
+
+MAX_REQUESTS_PER_SECOND = 10
+DEFAULT_WORKERS = 8
+CIK_MAP_TTL = 24 * 60 * 60
+FIRST_FETCH_LOOKBACK_DAYS = 30
+DEFAULT_FORMS = ("8-K", "10-K", "10-Q", "4", "SC 13D", "S-1")
+
+
+class RateLimiter:
+    """스레드 간 공유하는 최소 간격 기반 요청 제한"""
+
+    def __init__(self, per_second: float):
+        self.interval = 1.0 / per_second
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+class EdgarClient:
+    """SEC EDGAR 조회 (CIK 캐시 + 증분 submissions)"""
+
+    def __init__(
+        self,
+        db_path: Path = DEFAULT_DB_PATH,
+        data_url: str = DATA_URL,
+        www_url: str = WWW_URL,
+        max_workers: int = DEFAULT_WORKERS,
+    ):
+        self.data_url = data_url.rstrip("/")
+        self.www_url = www_url.rstrip("/")
+        self.max_workers = max_workers
+        self.limiter = RateLimiter(MAX_REQUESTS_PER_SECOND)
+
+        self.headers = {"User-Agent": USER_AGENT, "Accept-Encoding": "gzip, deflate"}
+
+        self._lock = threading.Lock()
+        db_path = Path(db_path)
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS cik_map (
+                ticker TEXT PRIMARY KEY,
+                cik TEXT NOT NULL,
+                title TEXT
+            );
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+            CREATE TABLE IF NOT EXISTS submission_state (
+                cik TEXT PRIMARY KEY,
+                last_accession TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                checked_at REAL
+            );
+            """
+        )
+        self._conn.commit()
+        self._cik_map: Optional[Dict[str, str]] = None
+        # confirm() 전까지 저장하지 않은 CIK별 상태 (last_accession, etag, last_modified)
+        self._pending: Dict[str, tuple] = {}
+
+    def _get(self, url: str, headers: Optional[Dict] = None) -> requests.Response:
+        return http_get(url, headers={**self.headers, **(headers or {})}, before_request=self.limiter.wait)
+
+    # ------------------------------------------------------------------
+    # ticker → CIK
+    # ------------------------------------------------------------------
+    @staticmethod
+    def normalize_ticker(symbol: str) -> str:
+        """SEC 표기로 변환 (BRK.B → BRK-B)"""
+        return symbol.upper().replace(".", "-")
+
+    def _cik_map_age(self) -> float:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'cik_map_updated_at'").fetchone()
+        return time.time() - float(row[0]) if row else float("inf")
+
+    def refresh_cik_map(self, force: bool = False) -> int:
+        """company_tickers.json을 받아 캐시 갱신 (TTL 이내면 생략)"""
+        with self._lock:
+            if not force and self._cik_map_age() < CIK_MAP_TTL:
+                return 0
+
+        try:
+            response = self._get(f"{self.www_url}/files/company_tickers.json")
+            response.raise_for_status()
+            rows = [
+                (item["ticker"].upper(), str(item["cik_str"]).zfill(10), item.get("title", ""))
+                for item in response.json().values()
+            ]
+        except Exception as e:
+            logger.warning(f"SEC CIK 매핑 갱신 실패 (기존 캐시 사용): {e}")
+            return 0
+
+        with self._lock:
+            self._conn.execute("DELETE FROM cik_map")
+            self._conn.executemany("INSERT OR REPLACE INTO cik_map VALUES (?, ?, ?)", rows)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('cik_map_updated_at', ?)", (str(time.time()),)
+            )
+            self._conn.commit()
+            self._cik_map = None
+
+        logger.info(f"SEC CIK 매핑 {len(rows)}개 갱신")
+        return len(rows)
+
+    def get_cik(self, symbol: str) -> Optional[str]:
+        """10자리 CIK (없으면 None). 매핑은 처음 접근할 때 메모리에 한 번 로드"""
+        with self._lock:
+            if self._cik_map is None:
+                self._cik_map = dict(self._conn.execute("SELECT ticker, cik FROM cik_map"))
+            return self._cik_map.get(self.normalize_ticker(symbol))
+
+    # ------------------------------------------------------------------
+    # 증분 submissions
+    # ------------------------------------------------------------------
+    def _load_state(self, cik: str) -> Dict:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_accession, etag, last_modified FROM submission_state WHERE cik = ?", (cik,)
+            ).fetchone()
+        if not row:
+            return {}
+        return {"last_accession": row[0], "etag": row[1], "last_modified": row[2]}
+
+    def _save_state(self, cik: str, last_accession: Optional[str], etag: Optional[str], last_modified: Optional[str]):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO submission_state VALUES (?, ?, ?, ?, ?)",
+                (cik, last_accession, etag, last_modified, time.time()),
+            )
+            self._conn.commit()
+
+    def filing_url(self, cik: str, accession: str, document: str) -> str:
+        return f"{self.www_url}/Archives/edgar/data/{int(cik)}/{accession.replace('-', '')}/{document}"
+
+    def fetch_new_filings(
+        self,
+        symbol: str,
+        forms: Iterable[str] = DEFAULT_FORMS,
+    ) -> List[Dict]:
+        """
+        마지막으로 본 접수번호 이후의 새 필링 (최신순)
+
+        첫 조회에서는 최근 FIRST_FETCH_LOOKBACK_DAYS일치만 반환합니다.
+        새 접수번호/ETag 는 confirm(symbols) 를 호출해야 저장되므로, 필링을 저장하기 전에
+        실패하면 다음 조회에서 같은 필링을 다시 받습니다.
+        """
+        cik = self.get_cik(symbol)
+        if not cik:
+            logger.warning(f"  ⚠️  {symbol} CIK를 찾을 수 없음")
+            return []
+
+        state = self._load_state(cik)
+        headers = {}
+        if state.get("etag"):
+            headers["If-None-Match"] = state["etag"]
+        if state.get("last_modified"):
+            headers["If-Modified-Since"] = state["last_modified"]
+
+        response = self._get(f"{self.data_url}/submissions/CIK{cik}.json", headers=headers)
+        if response.status_code == 304:
+            return []
+        response.raise_for_status()
+
+        recent = response.json().get("filings", {}).get("recent", {})
+        accessions = recent.get("accessionNumber", [])
+        forms = set(forms)
+        last_seen = state.get("last_accession")
+        cutoff = (datetime.now() - timedelta(days=FIRST_FETCH_LOOKBACK_DAYS)).strftime("%Y-%m-%d")
+
+        filings = []
+        for i, accession in enumerate(accessions):
+            if accession == last_seen:
+                break
+            filing_date = recent["filingDate"][i]
+            if last_seen is None and filing_date < cutoff:
+                break
+            form = recent["form"][i]
+            if form not in forms:
+                continue
+            document = recent.get("primaryDocument", [""] * len(accessions))[i]
+            filings.append({
+                "symbol": symbol,
+                "cik": cik,
+                "accession_number": accession,
+                "filing_type": form,
+                "filing_date": filing_date,
+                "description": (recent.get("primaryDocDescription") or [""] * len(accessions))[i] or form,
+                "items": (recent.get("items") or [""] * len(accessions))[i],
+                "url": self.filing_url(cik, accession, document),
+            })
+
+        with self._lock:
+            self._pending[cik] = (
+                accessions[0] if accessions else last_seen,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+            )
+        return filings
+
+    def confirm(self, symbols: Iterable[str]) -> int:
+        """fetch_new_filings 로 받은 필링을 처리했음을 확인하고 상태 저장 → 저장한 CIK 수"""
+        confirmed = 0
+        for symbol in symbols:
+            cik = self.get_cik(symbol)
+            with self._lock:
+                state = self._pending.pop(cik, None) if cik else None
+            if state:
+                self._save_state(cik, *state)
+                confirmed += 1
+        return confirmed
+
+    def fetch_many(self, symbols: List[str], forms: Iterable[str] = DEFAULT_FORMS) -> Dict[str, List[Dict]]:
+        """여러 종목의 새 필링을 동시에 조회 (요청 속도는 RateLimiter가 제한)"""
+        self.refresh_cik_map()
+        forms = tuple(forms)
+
+        def fetch(symbol: str) -> List[Dict]:
+            try:
+                return self.fetch_new_filings(symbol, forms)
+            except Exception as e:
+                logger.error(f"  ❌ {symbol} SEC 필링 수집 실패: {e}")
+                return []
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return dict(zip(symbols, executor.map(fetch, symbols)))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
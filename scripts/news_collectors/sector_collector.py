@@ -17,13 +17,17 @@
 """
 
 import os
-import requests
+import sys
 from datetime import datetime
 from dotenv import load_dotenv
 from loguru import logger
-from supabase import create_client
+from pathlib import Path
 from typing import List, Dict, Any
 
+sys.path.insert(0, str(Path(__file__).parent))
+from http_client import get_supabase
+from upsert_writer import upsert_rows, today
+
 load_dotenv()
 
 
@@ -31,9 +35,7 @@ class SectorNewsCollector:
     """산업군 뉴스 수집기"""
 
     def __init__(self):
-        self.supabase_url = os.getenv("SUPABASE_URL")
-        self.supabase_key = os.getenv("SUPABASE_KEY")
-        self.supabase = create_client(self.supabase_url, self.supabase_key)
+        self.supabase = get_supabase()
 
         self.alpha_vantage_key = os.getenv("ALPHA_VANTAGE_API_KEY")
 
@@ -209,24 +211,20 @@ class SectorNewsCollector:
         return policy_news
 
     def save_to_database(self, data: List[Dict[str, Any]]):
-        """수집한 데이터를 Supabase에 저장"""
+        """수집한 데이터를 Supabase에 저장 (섹터+이벤트+날짜 기준 upsert)"""
 
         logger.info("💾 Supabase에 저장 중...")
 
-        for item in data:
-            try:
-                result = self.supabase.table('sector_news').insert({
-                    "sector": item.get("sector"),
-                    "event_type": item.get("event_type", "MARKET_MOVE"),
-                    "impact_level": item.get("impact_level", "MEDIUM"),
-                    "affected_stocks": item.get("affected_stocks", []),
-                    "signal": item.get("signal", "")
-                }).execute()
-
-                logger.success(f"  ✅ {item.get('sector')} 저장 완료")
+        rows = [{
+            "sector": item.get("sector"),
+            "event_type": item.get("event_type", "MARKET_MOVE"),
+            "event_date": item.get("date") or today(),
+            "impact_level": item.get("impact_level", "MEDIUM"),
+            "affected_stocks": item.get("affected_stocks", []),
+            "signal": item.get("signal", "")
+        } for item in data]
 
-            except Exception as e:
-                logger.error(f"  ❌ 저장 실패: {e}")
+        upsert_rows(self.supabase, 'sector_news', rows)
 
     def run(self):
         """섹터 뉴스 수집 실행"""
@@ -17,15 +17,18 @@ AI·오픈소스·테크 트렌드 뉴스 수집기
 - NVIDIA, OpenAI, Anthropic 공식 블로그
 """
 
-import os
-import requests
+import sys
 import feedparser
 from datetime import datetime
 from dotenv import load_dotenv
 from loguru import logger
-from supabase import create_client
+from pathlib import Path
 from typing import List, Dict, Any
 
+sys.path.insert(0, str(Path(__file__).parent))
+from http_client import get_supabase, fetch_text
+from upsert_writer import upsert_rows
+
 load_dotenv()
 
 
@@ -33,9 +36,7 @@ class TechTrendsCollector:
     """AI/테크 트렌드 뉴스 수집기"""
 
     def __init__(self):
-        self.supabase_url = os.getenv("SUPABASE_URL")
-        self.supabase_key = os.getenv("SUPABASE_KEY")
-        self.supabase = create_client(self.supabase_url, self.supabase_key)
+        self.supabase = get_supabase()
 
         # RSS 피드 URL
         self.rss_feeds = {
@@ -66,7 +67,7 @@ class TechTrendsCollector:
         logger.info(f"📊 {source_name} RSS 수집 중...")
 
         try:
-            feed = feedparser.parse(feed_url)
+            feed = feedparser.parse(fetch_text(feed_url))
 
             news_items = []
             for entry in feed.entries[:20]:  # 최근 20개
@@ -103,7 +104,7 @@ class TechTrendsCollector:
         try:
             # NVIDIA Developer Blog RSS
             nvidia_rss = "https://blogs.nvidia.com/feed/"
-            feed = feedparser.parse(nvidia_rss)
+            feed = feedparser.parse(fetch_text(nvidia_rss))
 
             nvidia_news = []
             for entry in feed.entries[:10]:
@@ -204,28 +205,22 @@ class TechTrendsCollector:
         return companies
 
     def save_to_database(self, data: List[Dict[str, Any]]):
-        """수집한 데이터를 Supabase에 저장"""
+        """수집한 데이터를 Supabase에 저장 (기사 URL 기준 upsert)"""
 
         logger.info("💾 Supabase에 저장 중...")
 
-        for item in data:
-            try:
-                # 뉴스 원본 데이터 포함하여 저장
-                # summary는 title과 합쳐서 저장 (스키마에 summary 필드 없음)
-                result = self.supabase.table('tech_trends').insert({
-                    "trend_type": item.get("trend_type", "GENERAL"),
-                    "title": item.get("title", "") + (f" - {item.get('summary', '')[:200]}" if item.get('summary') else ""),  # 제목 + 요약
-                    "source": item.get("source", ""),  # 뉴스 출처
-                    "source_url": item.get("link", ""),  # 뉴스 링크 (link → source_url)
-                    "companies": item.get("affected_stocks", []),
-                    "signal": item.get("signal", ""),
-                    "impact_score": item.get("impact_score", 0)
-                }).execute()
-
-                logger.success(f"  ✅ 저장 완료: {item.get('title', 'No title')[:50]}")
-
-            except Exception as e:
-                logger.error(f"  ❌ 저장 실패: {e}")
+        # summary는 title과 합쳐서 저장 (스키마에 summary 필드 없음)
+        rows = [{
+            "trend_type": item.get("trend_type", "GENERAL"),
+            "title": item.get("title", "") + (f" - {item.get('summary', '')[:200]}" if item.get('summary') else ""),  # 제목 + 요약
+            "source": item.get("source", ""),  # 뉴스 출처
+            "source_url": item.get("link", ""),  # 뉴스 링크 (link → source_url)
+            "companies": item.get("affected_stocks", []),
+            "signal": item.get("signal", ""),
+            "impact_score": item.get("impact_score", 0)
+        } for item in data]
+
+        upsert_rows(self.supabase, 'tech_trends', rows)
 
     def run(self):
         """테크 트렌드 수집 실행"""
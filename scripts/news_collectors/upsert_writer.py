@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+카테고리 뉴스 테이블 일괄 upsert
+
+테이블별 자연 키(NATURAL_KEYS)를 기준으로 여러 행을 한 번의 요청으로
+upsert 하여, 수집기를 다시 실행해도 중복 행이 생기지 않습니다.
+자연 키는 database/news_tables_schema.sql 의 UNIQUE 인덱스와 일치해야 합니다
+(이미 배포된 DB 는 database/news_tables_natural_keys_migration.sql 로 추가).
+
+사용법:
+    from upsert_writer import upsert_rows
+
+    upsert_rows(supabase, "macro_news", rows)
+"""
+
+from datetime import date
+from typing import Any, Dict, List, Tuple
+
+from loguru import logger
+from postgrest.types import ReturnMethod
+
+# 테이블별 자연 키 (schema의 uq_* 인덱스와 동일한 컬럼 순서)
+# sector_news/geopolitical_news 키는 같은 날 같은 유형의 서로 다른 이벤트를 한 행으로 합침 (나중 값 우선)
+NATURAL_KEYS: Dict[str, Tuple[str, ...]] = {
+    "macro_news": ("event_type", "event_date"),
+    "earnings_news": ("symbol", "quarter"),
+    "sector_news": ("sector", "event_type", "event_date"),
+    "corporate_events": ("symbol", "event_type", "event_date", "event_description"),
+    "tech_trends": ("source_url",),
+    "geopolitical_news": ("region", "event_type", "event_date"),
+}
+
+# PostgREST 요청 본문 크기를 고려한 최대 행 수 (대부분 1회 요청으로 끝남)
+DEFAULT_CHUNK_SIZE = 500
+
+
+def today() -> str:
+    return date.today().isoformat()
+
+
+def dedupe_rows(table: str, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    같은 자연 키를 가진 행은 마지막 것만 남김
+
+    한 upsert 요청 안에 같은 키가 두 번 있으면 Postgres가
+    'ON CONFLICT DO UPDATE command cannot affect row a second time' 오류를 냅니다.
+    자연 키가 모두 비어 있는 행(예: 링크 없는 tech_trends)은 서로 다른 행인데도
+    하나로 합쳐지고 재실행 시 중복을 막을 수 없으므로 건너뜁니다.
+    """
+    keys = NATURAL_KEYS[table]
+    unique: Dict[Tuple, Dict[str, Any]] = {}
+    skipped = 0
+    for row in rows:
+        key = tuple(row.get(k) for k in keys)
+        if all(value in (None, "") for value in key):
+            skipped += 1
+            continue
+        unique[key] = row
+    if skipped:
+        logger.warning(f"  ⚠️  {table}: 자연 키({', '.join(keys)})가 비어 있는 {skipped}행 건너뜀")
+    return list(unique.values())
+
+
+def upsert_rows(
+    supabase,
+    table: str,
+    rows: List[Dict[str, Any]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> int:
+    """
+    자연 키 기준 일괄 upsert
+
+    Returns:
+        저장한 행 수 (실패한 청크 제외)
+    """
+    if table not in NATURAL_KEYS:
+        raise KeyError(f"No natural key declared for table: {table}")
+
+    rows = dedupe_rows(table, rows)
+    if not rows:
+        return 0
+
+    on_conflict = ",".join(NATURAL_KEYS[table])
+    saved = 0
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start:start + chunk_size]
+        try:
+            supabase.table(table).upsert(
+                chunk, on_conflict=on_conflict, returning=ReturnMethod.minimal
+            ).execute()
+            saved += len(chunk)
+        except Exception as e:
+            logger.error(f"  ❌ {table} 저장 실패 ({len(chunk)}행): {e}")
+
+    logger.success(f"  ✅ {table} {saved}행 저장 완료")
+    return saved
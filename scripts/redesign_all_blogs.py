@@ -8,12 +8,20 @@
 3. 눈에 띄는 타이포그래피
 4. 섹션별 아이콘 및 스타일
 5. 인터랙티브 요소
+
+각 단계는 scripts/html_transform.py 엔진에 변환으로 등록되어 있습니다.
 """
 
 import os
 import re
+import sys
+import argparse
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.html_transform import register_transform, run_transforms, print_results
+
 PUBLIC_DIR = Path(__file__).parent.parent / "public"
 
 # 브랜드 컬러
@@ -557,66 +565,42 @@ def add_symbol_badge(html_content, symbol):
     return html_content
 
 
-def redesign_blog_article(file_path):
-    """블로그 글 디자인 개편"""
-
-    print(f"\n{'='*60}")
-    print(f"🎨 디자인 개편 중: {file_path.name}")
-    print('='*60)
-
-    # 파일 읽기
-    with open(file_path, 'r', encoding='utf-8') as f:
-        html_content = f.read()
+# 엔진 변환 등록 (업그레이드 변환 뒤, 실행 순서 100~120)
+REDESIGN_TRANSFORMS = ["modern_css", "section_titles", "symbol_badge"]
 
-    # 종목 심볼 추출
-    match = re.search(r'article_([a-z]+)_', file_path.name, re.IGNORECASE)
-    if not match:
-        print(f"⚠️  종목 심볼을 찾을 수 없습니다")
-        return
 
-    symbol = match.group(1).upper()
-    print(f"📊 종목: {symbol}")
+@register_transform("modern_css", order=100, marker="family=Pretendard")
+def _modern_css_transform(page):
+    """현대적인 CSS 스타일 적용"""
+    if not page.symbol:
+        return page.html
+    return re.sub(r'<style>.*?</style>', get_modern_css(page.symbol), page.html, flags=re.DOTALL)
 
-    # 백업 생성 (디자인 백업)
-    backup_path = file_path.parent / f"{file_path.stem}_design_backup.html"
-    with open(backup_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
-    print(f"💾 디자인 백업: {backup_path.name}")
 
-    # CSS 교체
-    print("\n🎨 디자인 적용 중...")
-    print("  1️⃣  현대적인 CSS 스타일 적용...")
+@register_transform("section_titles", order=110)
+def _section_titles_transform(page):
+    """매력적인 헤드라인으로 변경"""
+    return update_section_titles(page.html)
 
-    # 기존 <style> 블록 찾기 및 교체
-    new_css = get_modern_css(symbol)
-    html_content = re.sub(
-        r'<style>.*?</style>',
-        new_css,
-        html_content,
-        flags=re.DOTALL
-    )
 
-    # 섹션 타이틀 변경
-    print("  2️⃣  매력적인 헤드라인으로 변경...")
-    html_content = update_section_titles(html_content)
+@register_transform("symbol_badge", order=120, marker='class="symbol-badge"')
+def _symbol_badge_transform(page):
+    """종목 배지 추가"""
+    return add_symbol_badge(page.html, page.symbol) if page.symbol else page.html
 
-    # 종목 배지 추가
-    print("  3️⃣  종목 배지 추가...")
-    html_content = add_symbol_badge(html_content, symbol)
 
-    # 파일 저장
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
-
-    print(f"\n✅ 완료: {file_path.name}")
-    print(f"   - 현대적 CSS 스타일 ✓")
-    print(f"   - 매력적인 헤드라인 ✓")
-    print(f"   - 종목 배지 추가 ✓")
-    print(f"   - 반응형 디자인 ✓")
+def redesign_blog_article(file_path):
+    """블로그 글 디자인 개편 (단일 파일)"""
+    print_results(run_transforms([file_path], REDESIGN_TRANSFORMS, workers=1))
 
 
 def main():
     """메인 함수"""
+    parser = argparse.ArgumentParser(description="블로그 디자인 전면 개편")
+    parser.add_argument("--workers", type=int, help="프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--dry-run", action="store_true", help="파일을 쓰지 않고 결과만 출력")
+    args = parser.parse_args()
+
     print("\n" + "="*60)
     print("🎨 블로그 디자인 전면 개편 시작")
     print("="*60)
@@ -627,25 +611,18 @@ def main():
     # 백업 파일 제외
     article_files = [f for f in article_files if 'backup' not in f.name]
 
-    print(f"\n📚 발견된 블로그 글: {len(article_files)}개")
-    for f in article_files:
-        print(f"   - {f.name}")
+    print(f"\n📚 발견된 블로그 글: {len(article_files)}개\n")
 
-    # 각 파일 디자인 개편
-    for file_path in article_files:
-        try:
-            redesign_blog_article(file_path)
-        except Exception as e:
-            print(f"\n❌ 오류 발생: {file_path.name}")
-            print(f"   {str(e)}")
-            continue
+    # 변환 엔진으로 일괄 적용 (변경된 파일만 쓰기 + 내용 주소 백업)
+    results = run_transforms(article_files, REDESIGN_TRANSFORMS, workers=args.workers, dry_run=args.dry_run)
+    print_results(results)
 
     print("\n" + "="*60)
     print("🎉 디자인 개편 완료!")
     print("="*60)
     print(f"\n📊 결과:")
     print(f"   - 처리된 파일: {len(article_files)}개")
-    print(f"   - 백업 위치: {PUBLIC_DIR}/*_design_backup.html")
+    print(f"   - 백업 위치: .build/html_backups/ (내용 주소, 중복 제거)")
     print(f"\n💡 적용된 개선사항:")
     print(f"   ✨ 현대적인 그라데이션 디자인")
     print(f"   ✨ 매력적인 타이포그래피")
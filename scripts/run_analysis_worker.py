@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+LLM 배치 분석 워커 실행 스크립트
+미분석 뉴스를 배치 프롬프트로 LLM 에 보내고 결과를 바로 DB 에 저장
+
+사용법:
+    python scripts/run_analysis_worker.py                      # ANALYSIS_LLM_BACKEND 사용, 한 번 실행
+    python scripts/run_analysis_worker.py --backend stub --storage local
+    python scripts/run_analysis_worker.py --loop 300           # 5분마다 반복
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from analyzers import AnalysisPipeline, RelevanceAnalyzer, get_llm_backend
+from database.storage import get_storage
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batched LLM relevance analysis worker")
+    parser.add_argument("--backend", help="anthropic | openai | stub (default: ANALYSIS_LLM_BACKEND)")
+    parser.add_argument("--storage", help="supabase | local | cached (default: STORAGE_BACKEND)")
+    parser.add_argument("--limit", type=int, default=200, help="news items per run")
+    parser.add_argument("--loop", type=int, default=0, help="repeat every N seconds (0 = run once)")
+    args = parser.parse_args()
+
+    backend = get_llm_backend(args.backend)
+    if backend is None:
+        print("❌ No LLM backend configured. Set ANALYSIS_LLM_BACKEND or pass --backend.")
+        sys.exit(1)
+
+    pipeline = AnalysisPipeline(get_storage(args.storage), RelevanceAnalyzer(backend))
+
+    while True:
+        started = time.perf_counter()
+        saved = pipeline.run_analysis(limit=args.limit)
+        logger.info(f"Analysis worker run: {saved} saved in {time.perf_counter() - started:.1f}s")
+        if not args.loop:
+            break
+        time.sleep(args.loop)
+
+
+if __name__ == "__main__":
+    main()
@@ -27,7 +27,7 @@ from scripts.multi_image_generator import generate_images
 from scripts.smart_image_injector import inject
 
 
-def run(markdown_path: Path, article_id: str, working_dir: Path):
+def run(markdown_path: Path, article_id: str, working_dir: Path, use_llm: bool = False):
     working_dir.mkdir(parents=True, exist_ok=True)
 
     # Step 1: analysis
@@ -37,7 +37,7 @@ def run(markdown_path: Path, article_id: str, working_dir: Path):
     logger.info(f"Analysis saved to {analysis_path}")
 
     # Step 2: prompts
-    prompts = build_prompts(analysis, DEFAULT_BRAND)
+    prompts = build_prompts(analysis, DEFAULT_BRAND, use_llm=use_llm)
     prompts_path = working_dir / "prompts.json"
     prompts_path.write_text(json.dumps(prompts, ensure_ascii=False, indent=2), encoding="utf-8")
     logger.info(f"Prompts saved to {prompts_path}")
@@ -72,9 +72,10 @@ def main():
     parser.add_argument("markdown_path", type=Path, help="Path to source Markdown")
     parser.add_argument("--article-id", required=True, help="Stable identifier (e.g., slug or DB id)")
     parser.add_argument("--workdir", type=Path, default=Path("tmp") / "pipeline")
+    parser.add_argument("--llm", action="store_true", help="Write prompts with OpenAI/Claude (cached) instead of templates")
     args = parser.parse_args()
 
-    run(args.markdown_path, args.article_id, args.workdir)
+    run(args.markdown_path, args.article_id, args.workdir, use_llm=args.llm)
 
 
 if __name__ == "__main__":
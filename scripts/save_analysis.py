@@ -1,85 +1,322 @@
 #!/usr/bin/env python3
 """
-분석 결과를 Supabase에 저장하는 스크립트
-Claude Code에서 생성한 JSON 파일을 읽어서 DB에 저장
+분석 결과를 DB에 저장하는 스크립트
+Claude Code / 병렬 에이전트가 생성한 결과 파일을 스트리밍으로 읽어 저장
+
+- 입력: JSON 배열, {"results"/"analyses"/...: [...]} (analysis_results_XX.json), JSONL — 여러 파일/글롭 가능
+- 파일 전체를 메모리에 올리지 않고 레코드 단위로 파싱
+- 레코드 검증/정규화 (심볼 대문자, enum, signal_level 보존 또는 점수로 계산)
+- CHUNK_SIZE 건씩 raw_news_id 기준 upsert → 같은 파일을 다시 넣어도 중복 없음
+- 끝까지 처리한 파일은 .cache/ingest_state.json 에 기록해 재실행 시 건너뜀 (--force 로 무시)
+
+사용법:
+    python scripts/save_analysis.py prompts/analysis_results_20251112_1000.json
+    python scripts/save_analysis.py "analysis_results_*.json" --chunk-size 500
+    python scripts/save_analysis.py results.jsonl --storage local --min-score 70
 """
 
-import sys
+import argparse
+import glob
 import json
+import sys
+import time
 from pathlib import Path
+from typing import Dict, Iterator, List
 from loguru import logger
 
 # 프로젝트 루트를 path에 추가
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from database.supabase_client import SupabaseClient
+from analyzers.relevance_analyzer import signal_level_for
 from database.models import AnalyzedNews, PriceImpact, Importance
 
-def save_analysis_results(json_file: str):
-    """분석 결과 JSON 파일을 읽어서 DB에 저장"""
+CHUNK_SIZE = 200
+READ_SIZE = 1 << 16
+STATE_PATH = Path(__file__).parent.parent / ".cache" / "ingest_state.json"
+MAX_SYMBOLS = 10
+
+# 에이전트마다 결과 배열 키 이름이 다름 (analysis_results_01..20.json)
+RESULT_KEYS = ("results", "analyses", "news_analysis", "news_analyses")
+
+_decoder = json.JSONDecoder()
 
-    try:
-        # JSON 파일 읽기
-        with open(json_file, 'r', encoding='utf-8') as f:
-            results = json.load(f)
 
-        if not isinstance(results, list):
-            logger.error("JSON file must contain an array of analysis results")
-            return 0
+# ==================== 스트리밍 파싱 ====================
 
-        # Supabase 연결
-        db = SupabaseClient()
+class _JSONStream:
+    """파일을 READ_SIZE 씩 읽으면서 JSON 값을 하나씩 디코딩 (소비한 부분은 버퍼에서 버림)"""
 
-        saved_count = 0
-        for result in results:
+    def __init__(self, f):
+        self.f = f
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.f.read(READ_SIZE)
+        self.buffer, self.pos, self.eof = self.buffer[self.pos:] + chunk, 0, not chunk
+        return bool(chunk)
+
+    def peek(self, skip: str = " \t\r\n") -> str:
+        """다음 의미 있는 문자 (파일 끝이면 '')"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in skip:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ""
+
+    def take(self) -> str:
+        char = self.peek()
+        self.pos += 1
+        return char
+
+    def value(self):
+        self.peek()
+        while True:
             try:
-                # 데이터 모델 생성
-                analyzed_news = AnalyzedNews(
-                    raw_news_id=result['news_id'],
-                    relevance_score=result['relevance_score'],
-                    affected_symbols=result['affected_symbols'],
-                    price_impact=PriceImpact(result['price_impact']),
-                    importance=Importance(result['importance']),
-                    analysis={
-                        'reasoning': result.get('reasoning', ''),
-                        'key_points': result.get('key_points', [])
-                    }
-                )
-
-                # DB 저장
-                news_id = db.insert_analyzed_news(analyzed_news)
-                if news_id:
-                    saved_count += 1
-                    logger.info(f"Saved analysis for news {result['news_id'][:8]}... (score: {result['relevance_score']})")
-
-            except Exception as e:
-                logger.error(f"Error saving analysis result: {e}")
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # 버퍼 끝에서 끝난 값(숫자 등)은 잘렸을 수 있으므로 더 읽고 다시 디코딩
+            if end == len(self.buffer) and self._fill():
                 continue
+            self.pos = end
+            return value
+
+    def array(self) -> Iterator:
+        """'[' 다음부터 원소를 하나씩"""
+        while True:
+            char = self.peek(" \t\r\n,")
+            if char == "]":
+                self.pos += 1
+                return
+            if not char:
+                raise ValueError("Unexpected end of file inside JSON array")
+            yield self.value()
+
+
+def iter_records(path: Path) -> Iterator[Dict]:
+    """결과 파일의 레코드를 순서대로 (JSONL / JSON 배열 / {"results" 등: [...]} / 단일 객체)"""
+    with open(path, "r", encoding="utf-8") as f:
+        if path.suffix in (".jsonl", ".ndjson"):
+            for line_no, line in enumerate(f, 1):
+                if line.strip():
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError as e:
+                        logger.warning(f"{path.name}:{line_no}: invalid JSON line ({e})")
+            return
+
+        stream = _JSONStream(f)
+        first = stream.take()
+        if first == "[":
+            yield from stream.array()
+            return
+        if first != "{":
+            raise ValueError(f"{path.name}: expected a JSON array or object")
+
+        # 에이전트 결과 파일: 결과 배열만 스트리밍, 나머지(요약 등)는 건너뜀
+        fields, found = {}, False
+        while stream.peek(" \t\r\n,") not in ("}", ""):
+            key = stream.value()
+            if stream.take() != ":":
+                raise ValueError(f"{path.name}: malformed object")
+            if key in RESULT_KEYS and stream.peek() == "[":
+                stream.take()
+                found = True
+                yield from stream.array()
+            else:
+                fields[key] = stream.value()
+        if not found and ("news_id" in fields or "raw_news_id" in fields):
+            yield fields   # 단일 레코드 객체
+
+
+# ==================== 검증 / 정규화 ====================
+
+def normalize_record(record: Dict) -> AnalyzedNews:
+    """
+    결과 레코드 → AnalyzedNews
+
+    Raises:
+        ValueError: 필수 필드 누락 또는 값 범위/형식 오류
+    """
+    if not isinstance(record, dict):
+        raise ValueError("record is not an object")
+
+    raw_news_id = str(record.get("news_id") or record.get("raw_news_id") or "").strip()
+    if not raw_news_id:
+        raise ValueError("missing news_id")
+
+    try:
+        score = int(record["relevance_score"])
+        price_impact = PriceImpact(str(record["price_impact"]).strip().lower())
+        importance = Importance(str(record["importance"]).strip().lower())
+    except KeyError as e:
+        raise ValueError(f"missing {e.args[0]}") from e
+    except (TypeError, ValueError) as e:
+        raise ValueError(str(e)) from e
+    if not 0 <= score <= 100:
+        raise ValueError(f"relevance_score out of range: {score}")
+
+    symbols = record.get("affected_symbols") or []
+    if isinstance(symbols, str):
+        symbols = symbols.split(",")
+    symbols = list(dict.fromkeys(s.strip().upper() for s in symbols if isinstance(s, str) and s.strip()))
+
+    try:
+        level = int(record.get("signal_level"))
+    except (TypeError, ValueError):
+        level = None
+    if level not in (1, 2, 3, 4):
+        level = signal_level_for(score)
+
+    analysis = {
+        "reasoning": record.get("reasoning", ""),
+        "key_points": record.get("key_points", []),
+    }
+    if record.get("policy_impact"):
+        analysis["policy_impact"] = record["policy_impact"]
+
+    return AnalyzedNews(
+        raw_news_id=raw_news_id,
+        relevance_score=score,
+        affected_symbols=symbols[:MAX_SYMBOLS],
+        price_impact=price_impact,
+        importance=importance,
+        analysis=analysis,
+        signal_level=level
+    )
+
+
+# ==================== 저장 ====================
+
+def _load_state() -> Dict:
+    try:
+        return json.loads(STATE_PATH.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _save_state(state: Dict):
+    STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp = STATE_PATH.with_suffix(".tmp")
+    tmp.write_text(json.dumps(state, indent=2), encoding="utf-8")
+    tmp.replace(STATE_PATH)
+
+
+def _fingerprint(path: Path) -> List:
+    stat = path.stat()
+    return [stat.st_size, stat.st_mtime]
+
+
+def expand_paths(patterns: List[str]) -> List[Path]:
+    """파일/글롭 → 정렬된 중복 없는 경로"""
+    paths = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern)) or ([pattern] if Path(pattern).exists() else [])
+        if not matches:
+            logger.warning(f"No files match {pattern}")
+        paths.extend(Path(match) for match in matches)
+    return list(dict.fromkeys(paths))
 
-        logger.info(f"Successfully saved {saved_count}/{len(results)} analysis results")
-        return saved_count
 
-    except FileNotFoundError:
-        logger.error(f"File not found: {json_file}")
-        return 0
-    except json.JSONDecodeError as e:
-        logger.error(f"Invalid JSON file: {e}")
-        return 0
-    except Exception as e:
-        logger.error(f"Error saving analysis results: {e}")
-        return 0
+def _flush(db, pending: Dict[str, AnalyzedNews], totals: Dict):
+    if not pending:
+        return
+    ids = db.upsert_analyzed_news_many(list(pending.values()))
+    saved = sum(1 for news_id in ids if news_id)
+    totals["saved"] += saved
+    totals["failed"] += len(ids) - saved
+    pending.clear()
+
+
+def ingest_files(paths: List[Path], db, chunk_size: int = CHUNK_SIZE, min_score: int = 0,
+                 force: bool = False) -> Dict:
+    """
+    결과 파일들을 스트리밍으로 읽어 raw_news_id 기준 chunk 단위 upsert
+
+    Returns:
+        {"files", "skipped_files", "records", "saved", "invalid", "filtered", "failed"}
+    """
+    state = _load_state()
+    totals = {"files": 0, "skipped_files": 0, "records": 0, "saved": 0, "invalid": 0, "filtered": 0, "failed": 0}
+    started = time.perf_counter()
+
+    for path in paths:
+        key = str(path.resolve())
+        if not force and state.get(key) == _fingerprint(path):
+            totals["skipped_files"] += 1
+            logger.info(f"Skipping {path.name} (already ingested, use --force to re-run)")
+            continue
+
+        pending: Dict[str, AnalyzedNews] = {}   # 같은 chunk 안에서는 마지막 레코드 우선
+        failed_before = totals["failed"]
+        try:
+            for record in iter_records(path):
+                totals["records"] += 1
+                try:
+                    news = normalize_record(record)
+                except ValueError as e:
+                    totals["invalid"] += 1
+                    logger.warning(f"{path.name}: skipping record #{totals['records']} ({e})")
+                    continue
+                if news.relevance_score < min_score:
+                    totals["filtered"] += 1
+                    continue
+
+                pending[news.raw_news_id] = news
+                if len(pending) >= chunk_size:
+                    _flush(db, pending, totals)
+                    rate = totals["records"] / max(time.perf_counter() - started, 1e-9)
+                    logger.info(f"  {path.name}: {totals['records']} records, {totals['saved']} saved ({rate:.0f}/s)")
+            _flush(db, pending, totals)
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to read {path}: {e}")
+            continue
+
+        totals["files"] += 1
+        if totals["failed"] == failed_before:
+            state[key] = _fingerprint(path)
+            _save_state(state)
+        logger.info(f"✅ {path.name} done ({totals['saved']} saved so far)")
+
+    logger.info(f"Ingest finished in {time.perf_counter() - started:.1f}s: {totals}")
+    return totals
+
+
+def save_analysis_results(json_file: str) -> int:
+    """분석 결과 파일 하나 저장 → 저장 건수 (이전 호출 방식 호환)"""
+    from database.storage import get_storage
+    return ingest_files(expand_paths([json_file]), get_storage(), force=True)["saved"]
+
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python scripts/save_analysis.py <json_file>")
-        print("Example: python scripts/save_analysis.py prompts/analysis_results_20251112_1000.json")
+    parser = argparse.ArgumentParser(description="분석 결과 파일 스트리밍 저장 (raw_news_id 기준 upsert)")
+    parser.add_argument("files", nargs="+", help="결과 파일 또는 글롭 (예: 'analysis_results_*.json')")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="upsert 한 번에 보내는 레코드 수")
+    parser.add_argument("--min-score", type=int, default=0, help="이 점수 미만 레코드는 저장하지 않음")
+    parser.add_argument("--storage", help="supabase | local | cached (기본: STORAGE_BACKEND)")
+    parser.add_argument("--force", action="store_true", help="이미 처리한 파일도 다시 저장")
+    args = parser.parse_args()
+
+    from database.storage import get_storage
+
+    paths = expand_paths(args.files)
+    if not paths:
+        print("\n❌ No result files found")
         sys.exit(1)
 
-    json_file = sys.argv[1]
-    count = save_analysis_results(json_file)
+    totals = ingest_files(paths, get_storage(args.storage), args.chunk_size, args.min_score, args.force)
 
-    if count > 0:
-        print(f"\n✅ Successfully saved {count} analysis results to database")
-    else:
-        print("\n❌ Failed to save analysis results")
+    print(f"\n📊 {totals['files']} files ({totals['skipped_files']} skipped), {totals['records']} records")
+    print(f"   saved {totals['saved']}, invalid {totals['invalid']}, filtered {totals['filtered']}, failed {totals['failed']}")
+    if totals["failed"] or (totals["saved"] == 0 and totals["skipped_files"] == 0):
+        print("\n❌ Some analysis results were not saved")
         sys.exit(1)
+    print(f"\n✅ Successfully saved {totals['saved']} analysis results to database")
@@ -8,14 +8,23 @@
 3. SEO 메타 태그 추가
 4. 관련 글 추천
 5. 소셜 공유 버튼
+
+각 기능은 scripts/html_transform.py 엔진에 변환으로 등록되어, 페이지당 한 번 파싱하고
+이미 적용된 변환은 건너뜁니다.
 """
 
 import os
 import re
+import sys
+import argparse
 from pathlib import Path
 from datetime import datetime
 import json
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.html_transform import register_transform, run_transforms, print_results
+
 # 설정
 PUBLIC_DIR = Path(__file__).parent.parent / "public"
 IMAGES_DIR = PUBLIC_DIR / "images"
@@ -322,78 +331,61 @@ def add_social_share_buttons(html_content, symbol):
     return html_content
 
 
-def upgrade_blog_article(file_path):
-    """블로그 글 업그레이드"""
-
-    print(f"\n{'='*60}")
-    print(f"📝 처리 중: {file_path.name}")
-    print('='*60)
-
-    # 파일 읽기
-    with open(file_path, 'r', encoding='utf-8') as f:
-        html_content = f.read()
+# 엔진 변환 등록 (실행 순서 10~60)
+UPGRADE_TRANSFORMS = [
+    "seo_meta", "json_ld", "image_placeholders",
+    "financial_table", "related_articles", "social_share",
+]
 
-    # 종목 심볼 추출
-    symbol = extract_symbol_from_filename(file_path.name)
-    if not symbol:
-        print(f"⚠️  종목 심볼을 찾을 수 없습니다: {file_path.name}")
-        return
 
-    print(f"📊 종목: {symbol}")
-
-    # 날짜 추출
-    date_match = re.search(r'(\d{8})\.html$', file_path.name)
-    date = f"{date_match.group(1)[:4]}-{date_match.group(1)[4:6]}-{date_match.group(1)[6:]}" if date_match else "2025-11-18"
+@register_transform("seo_meta", order=10, marker='property="og:type"')
+def _seo_meta_transform(page):
+    """SEO 메타 태그 추가"""
+    return add_seo_meta_tags(page.html, page.title, page.symbol, page.date) if page.symbol else page.html
 
-    # 제목 추출
-    title_match = re.search(r'<title>([^|]+)', html_content)
-    title = title_match.group(1).strip() if title_match else f"{symbol} 투자 분석"
 
-    print(f"📅 날짜: {date}")
-    print(f"📰 제목: {title}")
+@register_transform("json_ld", order=20, marker='application/ld+json')
+def _json_ld_transform(page):
+    """JSON-LD 구조화 데이터 추가"""
+    return add_json_ld_schema(page.html, page.title, page.symbol, page.date) if page.symbol else page.html
 
-    # 백업 생성
-    backup_path = file_path.parent / f"{file_path.stem}_backup.html"
-    with open(backup_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
-    print(f"💾 백업 생성: {backup_path.name}")
 
-    # 업그레이드 적용
-    print("\n🔧 업그레이드 적용 중...")
+@register_transform("image_placeholders", order=30, marker='class="article-image"')
+def _image_placeholders_transform(page):
+    """이미지 플레이스홀더 추가"""
+    return add_image_placeholders(page.html, page.symbol) if page.symbol else page.html
 
-    print("  1️⃣  SEO 메타 태그 추가...")
-    html_content = add_seo_meta_tags(html_content, title, symbol, date)
 
-    print("  2️⃣  JSON-LD 스키마 추가...")
-    html_content = add_json_ld_schema(html_content, title, symbol, date)
+@register_transform("financial_table", order=40, marker='FY2025 (전망)')
+def _financial_table_transform(page):
+    """재무 데이터 테이블 추가"""
+    return add_financial_table(page.html, page.symbol) if page.symbol else page.html
 
-    print("  3️⃣  이미지 플레이스홀더 추가...")
-    html_content = add_image_placeholders(html_content, symbol)
 
-    print("  4️⃣  재무 데이터 테이블 추가...")
-    html_content = add_financial_table(html_content, symbol)
+@register_transform("related_articles", order=50, marker='class="related-articles"')
+def _related_articles_transform(page):
+    """관련 글 추천 섹션 추가"""
+    return add_related_articles(page.html, page.symbol, page.path.name) if page.symbol else page.html
 
-    print("  5️⃣  관련 글 추천 섹션 추가...")
-    html_content = add_related_articles(html_content, symbol, file_path.name)
 
-    print("  6️⃣  소셜 공유 버튼 추가...")
-    html_content = add_social_share_buttons(html_content, symbol)
+@register_transform("social_share", order=60, marker='class="social-share"')
+def _social_share_transform(page):
+    """소셜 공유 버튼 추가"""
+    return add_social_share_buttons(page.html, page.symbol) if page.symbol else page.html
 
-    # 파일 저장
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
 
-    print(f"\n✅ 완료: {file_path.name}")
-    print(f"   - SEO 메타 태그 ✓")
-    print(f"   - JSON-LD 스키마 ✓")
-    print(f"   - 이미지 플레이스홀더 3개 ✓")
-    print(f"   - 재무 테이블 ✓")
-    print(f"   - 관련 글 추천 ✓")
-    print(f"   - 소셜 공유 버튼 ✓")
+def upgrade_blog_article(file_path):
+    """블로그 글 업그레이드 (단일 파일)"""
+    print_results(run_transforms([file_path], UPGRADE_TRANSFORMS, workers=1))
 
 
 def main():
     """메인 함수"""
+    parser = argparse.ArgumentParser(description="블로그 글 전체 업그레이드")
+    parser.add_argument("--workers", type=int, help="프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--dry-run", action="store_true", help="파일을 쓰지 않고 결과만 출력")
+    args = parser.parse_args()
+
     print("\n" + "="*60)
     print("🚀 블로그 글 전체 업그레이드 시작")
     print("="*60)
@@ -402,27 +394,20 @@ def main():
     article_files = list(PUBLIC_DIR.glob("article_*.html"))
 
     # 백업 파일 제외
-    article_files = [f for f in article_files if '_backup' not in f.name]
+    article_files = [f for f in article_files if 'backup' not in f.name]
 
-    print(f"\n📚 발견된 블로그 글: {len(article_files)}개")
-    for f in article_files:
-        print(f"   - {f.name}")
+    print(f"\n📚 발견된 블로그 글: {len(article_files)}개\n")
 
-    # 각 파일 업그레이드
-    for file_path in article_files:
-        try:
-            upgrade_blog_article(file_path)
-        except Exception as e:
-            print(f"\n❌ 오류 발생: {file_path.name}")
-            print(f"   {str(e)}")
-            continue
+    # 변환 엔진으로 일괄 적용 (변경된 파일만 쓰기 + 내용 주소 백업)
+    results = run_transforms(article_files, UPGRADE_TRANSFORMS, workers=args.workers, dry_run=args.dry_run)
+    print_results(results)
 
     print("\n" + "="*60)
     print("🎉 전체 업그레이드 완료!")
     print("="*60)
     print(f"\n📊 결과:")
     print(f"   - 처리된 파일: {len(article_files)}개")
-    print(f"   - 백업 위치: {PUBLIC_DIR}/*_backup.html")
+    print(f"   - 백업 위치: .build/html_backups/ (내용 주소, 중복 제거)")
     print(f"\n💡 다음 단계:")
     print(f"   1. 로컬 서버에서 확인: http://localhost:8080/blog.html")
     print(f"   2. 이미지 생성: python scripts/generate_blog_images_midjourney.py")
@@ -5,9 +5,12 @@ Article Quality Validation Script
 11단계 구조 및 SEO 규칙 검증
 """
 
+import os
 import re
 import sys
 import json
+import hashlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Tuple
 from datetime import datetime
@@ -15,6 +18,20 @@ from loguru import logger
 
 sys.path.append('..')
 
+# 검증 결과 캐시 (파일별: 내용 해시 + 규칙 버전)
+DEFAULT_CACHE_FILE = Path(__file__).parent.parent / ".build" / "validation_cache.json"
+
+
+def ruleset_version() -> str:
+    """규칙 버전 - 이 스크립트(검증 규칙)가 바뀌면 캐시 무효화"""
+    with open(os.path.abspath(__file__), 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+
+def _validate_file(file_path: str) -> Dict:
+    """프로세스 풀 작업 단위 (검증기는 상태가 없으므로 매번 새로 생성해도 됨)"""
+    return ArticleValidator().validate_article(file_path)
+
 
 class ArticleValidator:
     """블로그 기사 품질 검사 클래스"""
@@ -46,13 +63,6 @@ class ArticleValidator:
         "readability_score": 60,  # 가독성 점수: 60 이상
     }
 
-    def __init__(self):
-        """초기화"""
-        self.validation_results = {}
-        self.errors = []
-        self.warnings = []
-        self.suggestions = []
-
     def validate_article(self, file_path: str) -> Dict:
         """
         기사 파일 검증
@@ -63,10 +73,6 @@ class ArticleValidator:
         Returns:
             검증 결과 딕셔너리
         """
-        self.errors = []
-        self.warnings = []
-        self.suggestions = []
-
         if not Path(file_path).exists():
             logger.error(f"File not found: {file_path}")
             return {"status": "error", "message": f"파일을 찾을 수 없음: {file_path}"}
@@ -79,47 +85,62 @@ class ArticleValidator:
             logger.error(f"Failed to read file: {e}")
             return {"status": "error", "message": f"파일 읽기 실패: {e}"}
 
+        return self.validate_content(content, Path(file_path).name)
+
+    def validate_content(self, content: str, file_name: str) -> Dict:
+        """
+        기사 내용 검증 (상태 없음 - 인스턴스에 아무것도 저장하지 않음)
+
+        Args:
+            content: 기사 원문
+            file_name: 결과에 기록할 파일명
+
+        Returns:
+            검증 결과 딕셔너리
+        """
+        findings = {"errors": [], "warnings": [], "suggestions": []}
+
         # 기본 검증
-        self._validate_file_format(content)
-        self._validate_structure(content)
-        self._validate_seo(content)
-        self._validate_writing_rules(content)
+        self._validate_file_format(content, findings)
+        self._validate_structure(content, findings)
+        self._validate_seo(content, findings)
+        self._validate_writing_rules(content, findings)
 
         # 결과 종합
         total_checks = 11  # 11단계
         passed_sections = self._count_sections(content)
 
         result = {
-            "status": "success" if not self.errors else "warning",
-            "file": Path(file_path).name,
+            "status": "success" if not findings["errors"] else "warning",
+            "file": file_name,
             "timestamp": datetime.now().isoformat(),
             "sections_passed": passed_sections,
             "total_sections": total_checks,
             "completion_rate": f"{int((passed_sections / total_checks) * 100)}%",
-            "errors": self.errors,
-            "warnings": self.warnings,
-            "suggestions": self.suggestions,
-            "score": self._calculate_score()
+            "errors": findings["errors"],
+            "warnings": findings["warnings"],
+            "suggestions": findings["suggestions"],
+            "score": self._calculate_score(findings)
         }
 
         return result
 
-    def _validate_file_format(self, content: str):
+    def _validate_file_format(self, content: str, findings: Dict):
         """파일 형식 검증"""
         # TITLE과 CONTENT 구분 확인
         if "TITLE:" not in content or "CONTENT:" not in content:
-            self.errors.append("❌ 파일 형식: TITLE: / CONTENT: 구조 없음")
+            findings["errors"].append("❌ 파일 형식: TITLE: / CONTENT: 구조 없음")
         else:
-            self.suggestions.append("✅ 기본 파일 형식 준수")
+            findings["suggestions"].append("✅ 기본 파일 형식 준수")
 
         # 기본 내용 길이
         content_section = content.split("CONTENT:")[-1].strip() if "CONTENT:" in content else ""
         if len(content_section) < 500:
-            self.errors.append(f"❌ 내용 길이 부족: {len(content_section)}자 (최소 500자 권장)")
+            findings["errors"].append(f"❌ 내용 길이 부족: {len(content_section)}자 (최소 500자 권장)")
         elif len(content_section) < 1000:
-            self.warnings.append(f"⚠️ 내용 길이 부족: {len(content_section)}자 (권장: 1000-3000자)")
+            findings["warnings"].append(f"⚠️ 내용 길이 부족: {len(content_section)}자 (권장: 1000-3000자)")
 
-    def _validate_structure(self, content: str):
+    def _validate_structure(self, content: str, findings: Dict):
         """11단계 구조 검증"""
         content_lower = content.lower()
         section_mapping = {
@@ -147,19 +168,19 @@ class ArticleValidator:
 
         if missing_sections:
             for section in missing_sections:
-                self.errors.append(f"❌ 필수 섹션 누락: {section}")
+                findings["errors"].append(f"❌ 필수 섹션 누락: {section}")
 
         for section_name in found_sections:
-            self.suggestions.append(f"✅ 구조 확인: {section_name} 포함")
+            findings["suggestions"].append(f"✅ 구조 확인: {section_name} 포함")
 
         # 헤딩 개수 확인
         headings = re.findall(r'^#{1,3}\s+.+$', content, re.MULTILINE)
         if len(headings) < 3:
-            self.warnings.append(f"⚠️ 헤딩 부족: {len(headings)}개 (권장: 5개 이상)")
+            findings["warnings"].append(f"⚠️ 헤딩 부족: {len(headings)}개 (권장: 5개 이상)")
         else:
-            self.suggestions.append(f"✅ 구조 헤딩: {len(headings)}개 사용")
+            findings["suggestions"].append(f"✅ 구조 헤딩: {len(headings)}개 사용")
 
-    def _validate_seo(self, content: str):
+    def _validate_seo(self, content: str, findings: Dict):
         """SEO 규칙 검증"""
         # 제목 길이 확인
         title_match = re.search(r'TITLE:\s*\n?(.+?)(?:\n|$)', content)
@@ -167,107 +188,107 @@ class ArticleValidator:
             title = title_match.group(1).strip()
             title_length = len(title)
             if title_length < 20:
-                self.errors.append(f"❌ SEO 제목 길이 짧음: {title_length}자 (권장: 20-60자)")
+                findings["errors"].append(f"❌ SEO 제목 길이 짧음: {title_length}자 (권장: 20-60자)")
             elif title_length > 60:
-                self.errors.append(f"❌ SEO 제목 길이 김: {title_length}자 (권장: 20-60자)")
+                findings["errors"].append(f"❌ SEO 제목 길이 김: {title_length}자 (권장: 20-60자)")
             else:
-                self.suggestions.append(f"✅ SEO 제목: {title_length}자 (최적)")
+                findings["suggestions"].append(f"✅ SEO 제목: {title_length}자 (최적)")
 
             # 키워드 확인 (종목명, 핵심 용어)
             keywords = self._extract_keywords(title)
             if len(keywords) >= 2:
-                self.suggestions.append(f"✅ 제목 키워드: {len(keywords)}개 포함")
+                findings["suggestions"].append(f"✅ 제목 키워드: {len(keywords)}개 포함")
             else:
-                self.warnings.append(f"⚠️ 제목 키워드 부족: {len(keywords)}개 (권장: 2개 이상)")
+                findings["warnings"].append(f"⚠️ 제목 키워드 부족: {len(keywords)}개 (권장: 2개 이상)")
 
         # 문단 길이 확인
         paragraphs = re.split(r'\n\n+', content)
         short_paragraphs = [p for p in paragraphs if len(p) < 50 and len(p) > 5]
         if short_paragraphs:
-            self.warnings.append(f"⚠️ 짧은 문단: {len(short_paragraphs)}개 (권장: 50자 이상)")
+            findings["warnings"].append(f"⚠️ 짧은 문단: {len(short_paragraphs)}개 (권장: 50자 이상)")
 
         # 숫자 사용 확인
         numbers = re.findall(r'\d+(?:%|년|월|일|B|M|K|$)?', content)
         if len(numbers) >= 5:
-            self.suggestions.append(f"✅ 숫자 활용: {len(numbers)}개 통계/수치 포함")
+            findings["suggestions"].append(f"✅ 숫자 활용: {len(numbers)}개 통계/수치 포함")
         else:
-            self.warnings.append(f"⚠️ 숫자 부족: {len(numbers)}개 (권장: 5개 이상)")
+            findings["warnings"].append(f"⚠️ 숫자 부족: {len(numbers)}개 (권장: 5개 이상)")
 
         # 내부 링크 확인
         links = re.findall(r'\[.+?\]\(.+?\)', content)
         if len(links) >= 2:
-            self.suggestions.append(f"✅ 내부 링크: {len(links)}개 포함")
+            findings["suggestions"].append(f"✅ 내부 링크: {len(links)}개 포함")
         elif len(links) == 0:
-            self.warnings.append(f"⚠️ 링크 없음 (권장: 2-5개 내부 링크)")
+            findings["warnings"].append(f"⚠️ 링크 없음 (권장: 2-5개 내부 링크)")
 
-    def _validate_writing_rules(self, content: str):
+    def _validate_writing_rules(self, content: str, findings: Dict):
         """글쓰기 문서화 규칙 검증"""
         issues = []
 
         # 1. 한국어/영어 혼용 검증
         korean_ratio = self._calculate_korean_ratio(content)
         if korean_ratio < 70:
-            self.warnings.append(f"⚠️ 한국어 비율 낮음: {korean_ratio:.1f}% (권장: 70% 이상)")
+            findings["warnings"].append(f"⚠️ 한국어 비율 낮음: {korean_ratio:.1f}% (권장: 70% 이상)")
         else:
-            self.suggestions.append(f"✅ 한국어 비율: {korean_ratio:.1f}%")
+            findings["suggestions"].append(f"✅ 한국어 비율: {korean_ratio:.1f}%")
 
         # 2. 문장 길이 검증
         sentences = re.split(r'[.!?]\s+', content)
         long_sentences = [s for s in sentences if len(s) > 100]
         if len(long_sentences) > len(sentences) * 0.3:  # 30% 이상 길면 경고
-            self.warnings.append(f"⚠️ 긴 문장 많음: {len(long_sentences)}개 (권장: 평균 40-80자)")
+            findings["warnings"].append(f"⚠️ 긴 문장 많음: {len(long_sentences)}개 (권장: 평균 40-80자)")
 
         # 3. 불릿 포인트 사용
         bullets = re.findall(r'^[\s]*[-•*]\s+.+$', content, re.MULTILINE)
         if len(bullets) >= 3:
-            self.suggestions.append(f"✅ 불릿 포인트: {len(bullets)}개 사용")
+            findings["suggestions"].append(f"✅ 불릿 포인트: {len(bullets)}개 사용")
         else:
-            self.warnings.append(f"⚠️ 불릿 포인트 부족: {len(bullets)}개 (권장: 3개 이상)")
+            findings["warnings"].append(f"⚠️ 불릿 포인트 부족: {len(bullets)}개 (권장: 3개 이상)")
 
         # 4. 이모지 사용 적절성 (이모지 개수만 간단히 계산)
         emojis = [c for c in content if ord(c) > 0x1F000]  # 이모지는 높은 유니코드 범위
         if 0 < len(emojis) <= 10:
-            self.suggestions.append(f"✅ 이모지 사용: {len(emojis)}개 (적절한 수준)")
+            findings["suggestions"].append(f"✅ 이모지 사용: {len(emojis)}개 (적절한 수준)")
         elif len(emojis) == 0:
-            self.warnings.append(f"⚠️ 이모지 없음 (권장: 2-5개)")
+            findings["warnings"].append(f"⚠️ 이모지 없음 (권장: 2-5개)")
         else:
-            self.warnings.append(f"⚠️ 이모지 과다: {len(emojis)}개 (권장: 2-10개)")
+            findings["warnings"].append(f"⚠️ 이모지 과다: {len(emojis)}개 (권장: 2-10개)")
 
         # 5. 표(Table) 사용
         tables = re.findall(r'\|.*\|', content)
         if len(tables) >= 1:
-            self.suggestions.append(f"✅ 비교 표: {len(tables)}개 포함")
+            findings["suggestions"].append(f"✅ 비교 표: {len(tables)}개 포함")
 
         # 6. 인용구 사용
         quotes = re.findall(r'> .+', content)
         if len(quotes) >= 1:
-            self.suggestions.append(f"✅ 인용구: {len(quotes)}개 포함")
+            findings["suggestions"].append(f"✅ 인용구: {len(quotes)}개 포함")
 
         # 7. 코드/강조 블록
         code_blocks = re.findall(r'`{1,3}[\s\S]*?`{1,3}', content)
         if len(code_blocks) >= 1:
-            self.suggestions.append(f"✅ 코드/강조: {len(code_blocks)}개 포함")
+            findings["suggestions"].append(f"✅ 코드/강조: {len(code_blocks)}개 포함")
 
         # 8. 헤딩 계층 구조
         h1s = len(re.findall(r'^# ', content, re.MULTILINE))
         h2s = len(re.findall(r'^## ', content, re.MULTILINE))
         if h1s > 1:
-            self.warnings.append(f"⚠️ H1 헤딩 과다: {h1s}개 (권장: 1개)")
+            findings["warnings"].append(f"⚠️ H1 헤딩 과다: {h1s}개 (권장: 1개)")
         if h2s >= 3:
-            self.suggestions.append(f"✅ H2 헤딩: {h2s}개 (적절)")
+            findings["suggestions"].append(f"✅ H2 헤딩: {h2s}개 (적절)")
 
         # 9. 문단 단락 확인
         paragraphs = re.split(r'\n\n+', content)
         if len(paragraphs) >= 10:
-            self.suggestions.append(f"✅ 문단 구조: {len(paragraphs)}개 단락 (적절)")
+            findings["suggestions"].append(f"✅ 문단 구조: {len(paragraphs)}개 단락 (적절)")
         else:
-            self.warnings.append(f"⚠️ 문단 부족: {len(paragraphs)}개 (권장: 10개 이상)")
+            findings["warnings"].append(f"⚠️ 문단 부족: {len(paragraphs)}개 (권장: 10개 이상)")
 
         # 10. 결론/행동 유도 확인
         if any(word in content.lower() for word in ['결론', '종합', '액션', '투자', '체크리스트', 'cta']):
-            self.suggestions.append(f"✅ 명확한 결론/CTA 포함")
+            findings["suggestions"].append(f"✅ 명확한 결론/CTA 포함")
         else:
-            self.warnings.append(f"⚠️ 명확한 결론 부족")
+            findings["warnings"].append(f"⚠️ 명확한 결론 부족")
 
     def _extract_keywords(self, text: str) -> List[str]:
         """텍스트에서 키워드 추출"""
@@ -299,21 +320,36 @@ class ArticleValidator:
         found = sum(1 for keyword in section_keywords if re.search(keyword, content, re.IGNORECASE))
         return min(found + 2, 11)  # 최대 11
 
-    def _calculate_score(self) -> int:
+    def _calculate_score(self, findings: Dict) -> int:
         """종합 점수 계산 (0-100)"""
         base_score = 100
-        base_score -= len(self.errors) * 20  # 각 오류 -20점
-        base_score -= len(self.warnings) * 5  # 각 경고 -5점
-        base_score += len(self.suggestions) * 3  # 각 긍정 +3점
+        base_score -= len(findings["errors"]) * 20  # 각 오류 -20점
+        base_score -= len(findings["warnings"]) * 5  # 각 경고 -5점
+        base_score += len(findings["suggestions"]) * 3  # 각 긍정 +3점
         return max(0, min(100, base_score))
 
-    def validate_directory(self, dir_path: str, output_file: str = None) -> Dict:
+    def validate_directory(
+        self,
+        dir_path: str,
+        output_file: str = None,
+        workers: int = None,
+        cache_file: str = None,
+        use_cache: bool = True
+    ) -> Dict:
         """
         디렉토리의 모든 기사 검증
 
+        내용 해시와 규칙 버전이 캐시와 같은 기사는 다시 검증하지 않고, 나머지는
+        프로세스 풀에서 병렬로 검증합니다. output_file이 있으면 기사별 결과를
+        `<output>.jsonl.tmp`에 한 줄씩 바로 기록하고, 끝나면 `<output>.jsonl`로 바꾸고
+        요약 JSON을 씁니다 (실행 중에는 이전 결과 파일이 그대로 읽힘).
+
         Args:
             dir_path: 기사 디렉토리 경로
             output_file: 결과 저장 파일 (선택사항)
+            workers: 프로세스 수 (1이면 현재 프로세스에서 순차 실행)
+            cache_file: 결과 캐시 파일 경로 (기본: .build/validation_cache.json)
+            use_cache: 캐시 조회 여부 (False여도 새 결과는 캐시에 저장)
 
         Returns:
             검증 결과 종합
@@ -323,19 +359,74 @@ class ArticleValidator:
             logger.error(f"Directory not found: {dir_path}")
             return {"status": "error", "message": f"디렉토리를 찾을 수 없음: {dir_path}"}
 
-        results = []
-        md_files = list(dir_path.glob("*.md"))
+        md_files = sorted(dir_path.glob("*.md"))
+        version = ruleset_version()
+        cache_path = Path(cache_file) if cache_file else DEFAULT_CACHE_FILE
+        cache = self._load_cache(cache_path) if use_cache else {}
+        new_cache = {}
 
         logger.info(f"Validating {len(md_files)} articles in {dir_path}")
 
-        for file_path in md_files:
-            result = self.validate_article(str(file_path))
-            results.append(result)
+        stream = self._open_result_stream(output_file)
+        results_by_file = {}
+        pending = []
+
+        def record(file_path: Path, content_hash: str, result: Dict):
+            results_by_file[file_path.name] = result
+            if result.get("file"):
+                new_cache[file_path.name] = {
+                    "content_hash": content_hash,
+                    "ruleset_version": version,
+                    "result": result
+                }
+            if stream:
+                stream.write(json.dumps(result, ensure_ascii=False) + "\n")
+                stream.flush()
+
+        try:
+            for file_path in md_files:
+                content_hash = hashlib.sha256(file_path.read_bytes()).hexdigest()
+                entry = cache.get(file_path.name)
+                if (entry and entry.get("content_hash") == content_hash
+                        and entry.get("ruleset_version") == version):
+                    record(file_path, content_hash, entry["result"])
+                else:
+                    pending.append((file_path, content_hash))
+
+            logger.info(f"Cache hits: {len(md_files) - len(pending)}, to validate: {len(pending)}")
+
+            if len(pending) > 1 and workers != 1:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    futures = {
+                        executor.submit(_validate_file, str(file_path)): (file_path, content_hash)
+                        for file_path, content_hash in pending
+                    }
+                    for future in as_completed(futures):
+                        file_path, content_hash = futures[future]
+                        record(file_path, content_hash, future.result())
+            else:
+                for file_path, content_hash in pending:
+                    record(file_path, content_hash, self.validate_article(str(file_path)))
+        except BaseException:
+            if stream:
+                stream.close()
+                Path(stream.name).unlink(missing_ok=True)
+            raise
+
+        if stream:
+            stream.close()
+            os.replace(stream.name, Path(output_file).with_suffix(".jsonl"))
+
+        self._save_cache(cache_path, new_cache)
+
+        results = [results_by_file[p.name] for p in md_files if p.name in results_by_file]
 
         # 종합 통계
         summary = {
             "total_files": len(md_files),
             "validated_files": len(results),
+            "revalidated_files": len(pending),
+            "ruleset_version": version,
             "average_score": sum(r.get('score', 0) for r in results) / len(results) if results else 0,
             "high_quality": sum(1 for r in results if r.get('score', 0) >= 80),
             "medium_quality": sum(1 for r in results if 60 <= r.get('score', 0) < 80),
@@ -346,14 +437,51 @@ class ArticleValidator:
         # 결과 저장
         if output_file:
             try:
-                with open(output_file, 'w', encoding='utf-8') as f:
+                tmp_file = f"{output_file}.tmp"
+                with open(tmp_file, 'w', encoding='utf-8') as f:
                     json.dump(summary, f, ensure_ascii=False, indent=2)
+                os.replace(tmp_file, output_file)
                 logger.info(f"Validation results saved to {output_file}")
             except Exception as e:
                 logger.error(f"Failed to save results: {e}")
 
         return summary
 
+    @staticmethod
+    def _open_result_stream(output_file: str = None):
+        """기사별 결과를 한 줄씩 기록할 임시 JSONL 파일 열기 (<output>.jsonl.tmp, 완료 시 교체)"""
+        if not output_file:
+            return None
+        try:
+            return open(f"{Path(output_file).with_suffix('.jsonl')}.tmp", 'w', encoding='utf-8')
+        except Exception as e:
+            logger.error(f"Failed to open result stream: {e}")
+            return None
+
+    @staticmethod
+    def _load_cache(cache_path: Path) -> Dict:
+        """검증 결과 캐시 로드"""
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Failed to load validation cache: {e}")
+            return {}
+
+    @staticmethod
+    def _save_cache(cache_path: Path, cache: Dict):
+        """검증 결과 캐시 저장 (현재 디렉토리에 있는 기사만 유지)"""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, ensure_ascii=False)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.warning(f"Failed to save validation cache: {e}")
+
     def print_report(self, result: Dict, verbose: bool = False):
         """검증 결과 리포트 출력"""
         print("\n" + "=" * 70)
@@ -397,6 +525,8 @@ def main():
     parser.add_argument("--dir", help="검사할 기사 디렉토리 경로")
     parser.add_argument("--output", help="결과 저장 파일 경로 (JSON)")
     parser.add_argument("--verbose", action="store_true", help="상세 출력")
+    parser.add_argument("--workers", type=int, help="병렬 검증 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--no-cache", action="store_true", help="캐시를 무시하고 전체 재검증")
 
     args = parser.parse_args()
 
@@ -409,11 +539,13 @@ def main():
 
     elif args.dir:
         # 디렉토리 검증
-        summary = validator.validate_directory(args.dir, args.output)
+        summary = validator.validate_directory(
+            args.dir, args.output, workers=args.workers, use_cache=not args.no_cache
+        )
         print("\n" + "=" * 70)
         print("📊 종합 검증 결과")
         print("=" * 70)
-        print(f"\n총 파일 수: {summary['total_files']}")
+        print(f"\n총 파일 수: {summary['total_files']} (재검증 {summary['revalidated_files']}개)")
         print(f"평균 점수: {summary['average_score']:.1f}/100")
         print(f"🟢 높음 (80점 이상): {summary['high_quality']}개")
         print(f"🟡 중간 (60-79점): {summary['medium_quality']}개")
@@ -10,6 +10,8 @@ import hashlib
 from pathlib import Path
 from io import BytesIO
 
+from monitoring.metrics import timer
+
 from . import config as Globals
 
 # Discord API 상수는 config에서 가져옴
@@ -786,7 +788,8 @@ def generate_images_batch(
                 print(f"  참조 이미지: {len(image_paths)}개")
         
         request_timestamp = time.time()
-        response = PassPromptToSelfBot(prompt, image_paths=image_paths)
+        with timer("image_step_seconds", step="request"):
+            response = PassPromptToSelfBot(prompt, image_paths=image_paths)
         
         if response.status_code == 204:
             # 진행 중 메시지 찾기
@@ -956,7 +959,9 @@ def generate_images_batch(
                             filename = f"midjourney_{req_info['index']}_{prompt_hash}_{img_idx}{ext}"
                             download_path = os.path.join(download_dir, filename)
                             
-                            if download_image(img_url, download_path):
+                            with timer("image_step_seconds", step="download"):
+                                downloaded = download_image(img_url, download_path)
+                            if downloaded:
                                 downloaded_paths.append(download_path)
                                 local_path = download_path
                                 
@@ -965,9 +970,10 @@ def generate_images_batch(
                                     try:
                                         cropped_dir = os.path.join(download_dir, "cropped")
                                         os.makedirs(cropped_dir, exist_ok=True)
-                                        cropped_paths_for_storage = crop_image_cross(
-                                            download_path, cropped_dir
-                                        )
+                                        with timer("image_step_seconds", step="crop"):
+                                            cropped_paths_for_storage = crop_image_cross(
+                                                download_path, cropped_dir
+                                            )
                                     except Exception as e:
                                         if verbose:
                                             print(f"  ⚠ 크롭 실패 {filename}: {e}")
@@ -975,19 +981,20 @@ def generate_images_batch(
                         # Supabase 저장 (기본)
                         if auto_upload:
                             try:
-                                upload_result = save_image_to_supabase(
-                                    image_url=img_url,
-                                    prompt=req_info['prompt'],
-                                    storage_manager=storage_manager,
-                                    cropped_paths=None,  # Supabase에서 자동 크롭
-                                    metadata={
-                                        "source": "midjourney_batch",
-                                        "request_timestamp": req_info['request_timestamp'],
-                                        "image_index": img_idx
-                                    },
-                                    verbose=verbose,
-                                    auto_crop=True  # Supabase 저장 시 항상 크롭
-                                )
+                                with timer("image_step_seconds", step="upload"):
+                                    upload_result = save_image_to_supabase(
+                                        image_url=img_url,
+                                        prompt=req_info['prompt'],
+                                        storage_manager=storage_manager,
+                                        cropped_paths=None,  # Supabase에서 자동 크롭
+                                        metadata={
+                                            "source": "midjourney_batch",
+                                            "request_timestamp": req_info['request_timestamp'],
+                                            "image_index": img_idx
+                                        },
+                                        verbose=verbose,
+                                        auto_crop=True  # Supabase 저장 시 항상 크롭
+                                    )
                                 
                                 if upload_result and upload_result.get('success'):
                                     # 원본 이미지 ID 추가
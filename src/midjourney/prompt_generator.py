@@ -1,6 +1,7 @@
 """Midjourney 프롬프트 생성기 - LLM을 활용한 영문 프롬프트 작성"""
 import os
 import asyncio
+import hashlib
 from pathlib import Path
 from typing import List, Optional, Dict, Union
 import logging
@@ -12,6 +13,89 @@ from src.ai.chat_ai.glm_api import GLMClient, GLMRequest
 
 logger = logging.getLogger(__name__)
 
+# 시스템 프롬프트(_build_system_prompt / _build_user_prompt)를 수정하면 올려서 캐시를 무효화
+SYSTEM_PROMPT_VERSION = "2025-11-18"
+
+# 배치 생성 시 동시에 실행할 LLM 호출 수 기본값
+DEFAULT_BATCH_CONCURRENCY = 4
+
+
+class PromptCache:
+    """생성된 프롬프트의 영구 캐시 (JSON 파일)
+
+    키는 (타겟 문장, 배경 문장, 비율, 스타일, 추가 파라미터, 모델, 시스템 프롬프트 버전)의
+    해시이므로, 기사를 수정해 다시 생성하면 바뀐 문장만 LLM을 호출합니다.
+    """
+
+    def __init__(self, cache_file: Optional[str] = None):
+        """
+        Args:
+            cache_file: 캐시 JSON 파일 경로
+        """
+        if cache_file is None:
+            base_dir = Path(__file__).parent.parent.parent
+            cache_file = str(base_dir / "data" / "images" / "prompt_cache.json")
+
+        self.cache_file = Path(cache_file)
+        self.entries = self._load()
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Dict]:
+        """캐시 파일 로드"""
+        if self.cache_file.exists():
+            try:
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except Exception as e:
+                logger.warning(f"프롬프트 캐시 로드 실패: {e}")
+        return {}
+
+    @staticmethod
+    def make_key(
+        target_sentence: str,
+        context_sentences: List[str],
+        aspect_ratio: str,
+        style: Optional[str],
+        additional_params: Dict[str, str],
+        model: str
+    ) -> str:
+        """캐시 키 생성"""
+        payload = json.dumps(
+            [
+                target_sentence,
+                list(context_sentences),
+                aspect_ratio,
+                style,
+                additional_params,
+                model,
+                SYSTEM_PROMPT_VERSION
+            ],
+            ensure_ascii=False,
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        return self.entries.get(key)
+
+    def set(self, key: str, result: Dict):
+        self.entries[key] = result
+        self._dirty = True
+
+    def save(self):
+        """변경된 경우에만 원자적으로 저장"""
+        if not self._dirty:
+            return
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_suffix(".tmp")
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_file, self.cache_file)
+            self._dirty = False
+        except Exception as e:
+            logger.error(f"프롬프트 캐시 저장 실패: {e}")
+
 
 class MidjourneyPromptGenerator:
     """타겟 문장과 배경 문장을 기반으로 Midjourney 프롬프트 생성"""
@@ -19,7 +103,9 @@ class MidjourneyPromptGenerator:
     def __init__(self, 
                  model: Optional[Union[ModelType, str]] = None,
                  guide_path: Optional[str] = None,
-                 use_glm: bool = True):
+                 use_glm: bool = True,
+                 cache: Optional[PromptCache] = None,
+                 use_cache: bool = True):
         """
         Args:
             model: 사용할 LLM 모델 
@@ -27,6 +113,8 @@ class MidjourneyPromptGenerator:
                 - ModelType.CLAUDE_HAIKU_4_5: Claude Haiku 4.5 사용 (옵션)
             guide_path: Midjourney 프롬프트 가이드 파일 경로
             use_glm: GLM 4.6 사용 여부 (기본값: True, model이 None일 때만 적용)
+            cache: 프롬프트 캐시 (None이면 기본 경로의 캐시 사용)
+            use_cache: 캐시 사용 여부
         """
         # 모델 설정: 기본값은 GLM 4.6
         if model is None:
@@ -59,6 +147,11 @@ class MidjourneyPromptGenerator:
         
         self.guide_path = Path(guide_path)
         self.prompt_guide = self._load_guide()
+
+        if use_cache:
+            self.cache = cache if cache is not None else PromptCache()
+        else:
+            self.cache = None
     
     def _load_guide(self) -> str:
         """Midjourney 프롬프트 가이드 로드"""
@@ -98,46 +191,78 @@ class MidjourneyPromptGenerator:
                 "keywords": ["추출된", "주요", "키워드"]
             }
         """
+        context_sentences = context_sentences or []
+        additional_params = additional_params or {}
+
+        cache_key = self._cache_key(
+            target_sentence, context_sentences, aspect_ratio, style, additional_params
+        )
+        cached = self.cache.get(cache_key) if self.cache else None
+        if cached is not None:
+            return cached
+
         # 시스템 프롬프트 구성
         system_prompt = self._build_system_prompt()
         
         # 사용자 프롬프트 구성
         user_prompt = self._build_user_prompt(
             target_sentence=target_sentence,
-            context_sentences=context_sentences or [],
+            context_sentences=context_sentences,
             aspect_ratio=aspect_ratio,
             style=style,
-            additional_params=additional_params or {}
+            additional_params=additional_params
         )
         
         # LLM 호출
         try:
-            if self.use_glm:
-                # GLM 4.6 사용
-                response = asyncio.run(self._generate_with_glm(user_prompt, system_prompt))
-            else:
-                # Claude Haiku 사용
-                messages = [
-                    {"role": "user", "content": user_prompt}
-                ]
-                response = self.llm_client.generate(
-                    prompt=messages,
-                    model=self.model,
-                    max_tokens=1000,
-                    temperature=0.7,  # 창의성을 위한 적절한 온도
-                    system_prompt=system_prompt
-                )
+            response = asyncio.run(self._generate_async(user_prompt, system_prompt))
             
             # 응답 파싱
             result = self._parse_response(response)
+            if self.cache:
+                self.cache.set(cache_key, result)
+                self.cache.save()
             return result
             
         except Exception as e:
             logger.error(f"프롬프트 생성 실패: {e}")
-            # 폴백: 기본 프롬프트 생성
+            # 폴백: 기본 프롬프트 생성 (캐시하지 않음)
             return self._generate_fallback_prompt(
                 target_sentence, context_sentences, aspect_ratio, style, additional_params
             )
+
+    def _cache_key(
+        self,
+        target_sentence: str,
+        context_sentences: List[str],
+        aspect_ratio: str,
+        style: Optional[str],
+        additional_params: Dict[str, str]
+    ) -> str:
+        """현재 모델 기준 캐시 키"""
+        model_name = self.model.value if isinstance(self.model, ModelType) else str(self.model)
+        return PromptCache.make_key(
+            target_sentence, context_sentences, aspect_ratio, style, additional_params, model_name
+        )
+
+    async def _generate_async(self, user_prompt: str, system_prompt: str) -> str:
+        """현재 이벤트 루프에서 LLM 호출 (GLM은 비동기, Claude는 스레드로 위임)"""
+        if self.use_glm:
+            # GLM 4.6 사용
+            return await self._generate_with_glm(user_prompt, system_prompt)
+
+        # Claude Haiku 사용 (동기 클라이언트)
+        messages = [
+            {"role": "user", "content": user_prompt}
+        ]
+        return await asyncio.to_thread(
+            self.llm_client.generate,
+            prompt=messages,
+            model=self.model,
+            max_tokens=1000,
+            temperature=0.7,  # 창의성을 위한 적절한 온도
+            system_prompt=system_prompt
+        )
     
     async def _generate_with_glm(self, user_prompt: str, system_prompt: str) -> str:
         """GLM 4.6을 사용하여 텍스트 생성"""
@@ -441,35 +566,95 @@ The prompt field must contain ONLY English words, proper Midjourney syntax, and
         target_sentences: List[str],
         context_sentences_map: Optional[Dict[int, List[str]]] = None,
         aspect_ratio: str = "16:9",
-        style: Optional[str] = None
+        style: Optional[str] = None,
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY
     ) -> List[Dict[str, str]]:
         """
-        여러 문장에 대한 프롬프트 배치 생성
+        여러 문장에 대한 프롬프트 배치 생성 (동기 래퍼)
         
         Args:
             target_sentences: 타겟 문장 리스트
             context_sentences_map: 인덱스별 배경 문장 맵 (선택적)
             aspect_ratio: 이미지 비율
             style: 스타일 힌트
+            max_concurrency: 동시에 실행할 LLM 호출 수
         
         Returns:
             프롬프트 딕셔너리 리스트
         """
-        results = []
-        context_sentences_map = context_sentences_map or {}
+        return asyncio.run(self.agenerate_batch_prompts(
+            target_sentences=target_sentences,
+            context_sentences_map=context_sentences_map,
+            aspect_ratio=aspect_ratio,
+            style=style,
+            max_concurrency=max_concurrency
+        ))
+
+    async def agenerate_batch_prompts(
+        self,
+        target_sentences: List[str],
+        context_sentences_map: Optional[Dict[int, List[str]]] = None,
+        aspect_ratio: str = "16:9",
+        style: Optional[str] = None,
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY
+    ) -> List[Dict[str, str]]:
+        """
+        여러 문장에 대한 프롬프트를 하나의 이벤트 루프/클라이언트에서 동시 생성
         
-        for idx, target in enumerate(target_sentences):
-            context = context_sentences_map.get(idx, [])
-            result = self.generate_prompt(
+        캐시에 있는 문장은 LLM을 호출하지 않고, 나머지는 max_concurrency 개씩 동시에 호출합니다.
+        이미 실행 중인 이벤트 루프(예: FastAPI 엔드포인트)에서는 이 메서드를 await 하세요.
+        
+        Returns:
+            target_sentences와 같은 순서의 프롬프트 딕셔너리 리스트
+        """
+        context_sentences_map = context_sentences_map or {}
+        system_prompt = self._build_system_prompt()
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        results: List[Optional[Dict[str, str]]] = [None] * len(target_sentences)
+
+        async def generate_one(idx: int, target: str, context: List[str], cache_key: str):
+            user_prompt = self._build_user_prompt(
                 target_sentence=target,
                 context_sentences=context,
                 aspect_ratio=aspect_ratio,
-                style=style
+                style=style,
+                additional_params={}
             )
-            results.append(result)
-        
-        return results
+            async with semaphore:
+                try:
+                    response = await self._generate_async(user_prompt, system_prompt)
+                    result = self._parse_response(response)
+                    if self.cache:
+                        self.cache.set(cache_key, result)
+                except Exception as e:
+                    logger.error(f"프롬프트 생성 실패 (#{idx}): {e}")
+                    result = self._generate_fallback_prompt(
+                        target, context, aspect_ratio, style, {}
+                    )
+            results[idx] = result
 
+        tasks = []
+        for idx, target in enumerate(target_sentences):
+            context = context_sentences_map.get(idx, [])
+            cache_key = self._cache_key(target, context, aspect_ratio, style, {})
+            cached = self.cache.get(cache_key) if self.cache else None
+            if cached is not None:
+                results[idx] = cached
+            else:
+                tasks.append(generate_one(idx, target, context, cache_key))
+
+        if tasks:
+            logger.info(
+                f"프롬프트 배치 생성: {len(tasks)}개 LLM 호출, "
+                f"{len(target_sentences) - len(tasks)}개 캐시 적중"
+            )
+            try:
+                await asyncio.gather(*tasks)
+            finally:
+                if self.cache:
+                    self.cache.save()
+
+        return results
 
 def generate_midjourney_prompt(
     target_sentence: str,
@@ -1376,7 +1376,7 @@ async def generate_prompt_batch(request: Dict):
         
         # 배치 프롬프트 생성
         generator = MidjourneyPromptGenerator(model=model)
-        results = generator.generate_batch_prompts(
+        results = await generator.agenerate_batch_prompts(
             target_sentences=target_sentences,
             context_sentences_map={i: context_sentences for i in range(len(target_sentences))} if context_sentences else None,
             aspect_ratio=aspect_ratio,
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+뉴스 아카이브 테스트
+compact 중단 복구(_recover)와 읽기/쓰기 잠금 (임시 경로 아카이브, pyarrow 필요)
+"""
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from loguru import logger
+
+pytest.importorskip("pyarrow")
+
+from database.archive import NewsArchive, to_records  # noqa: E402
+
+RUNS = 3
+ROWS_PER_RUN = 4
+
+
+@contextmanager
+def make_archive():
+    """같은 날짜/출처 파티션에 RUNS 개 파일을 쓴 임시 아카이브"""
+    with tempfile.TemporaryDirectory() as tmp:
+        archive = NewsArchive(Path(tmp) / "archive")
+        for run in range(RUNS):
+            records = []
+            for i in range(ROWS_PER_RUN):
+                records.extend(to_records({
+                    "id": f"{run}-{i}", "source": "Reuters", "title": f"NVDA earnings beat #{run}-{i}",
+                    "url": f"https://example.com/{run}/{i}", "content": "", "symbols": ["NVDA"],
+                    "created_at": f"2025-11-12T0{run}:00:00+00:00", "metadata": {},
+                })["news_raw"])
+            archive._write("news_raw", records, f"run{run}")
+        yield archive
+
+
+def leaf_of(archive):
+    return archive.root / "news_raw" / "date=2025-11-12" / "source=Reuters"
+
+
+def raw_ids(archive):
+    return archive.scan("news_raw", columns=["id"]).column("id").to_pylist()
+
+
+@contextmanager
+def crash_on_unlink(nth):
+    """nth 번째 part 파일 삭제에서 죽는 compact"""
+    real_unlink = Path.unlink
+    calls = {"n": 0}
+
+    def unlink(path, *args, **kwargs):
+        if path.name.startswith("part-"):
+            calls["n"] += 1
+            if calls["n"] == nth:
+                raise OSError("crashed while removing compacted sources")
+        return real_unlink(path, *args, **kwargs)
+
+    with mock.patch.object(Path, "unlink", unlink):
+        yield
+
+
+def test_recover_after_partial_unlink():
+    """매니페스트 기록 후 원본 일부만 지운 채 멈추면 다음 compact 가 마저 지우고 합친 파일을 채택"""
+    logger.info("🗄️  Testing recovery after partial source unlink")
+    with make_archive() as archive:
+        with crash_on_unlink(2):
+            with pytest.raises(OSError):
+                archive.compact(before="2025-11-13")
+        leaf = leaf_of(archive)
+        assert len(list(leaf.glob(".compact-*.json"))) == 1
+        assert len(list(leaf.glob("part-*.parquet"))) == RUNS - 1
+
+        assert archive.compact(before="2025-11-13") == 0
+        assert not list(leaf.glob(".compact-*"))
+        assert len(list(leaf.glob("part-*.parquet"))) == 1
+        ids = raw_ids(archive)
+        assert len(ids) == RUNS * ROWS_PER_RUN and len(set(ids)) == len(ids)
+
+
+def test_recover_before_unlink():
+    """매니페스트 기록 후 원본을 하나도 지우기 전에 멈추면 임시 파일을 버리고 다시 합침"""
+    logger.info("🗄️  Testing recovery with all sources intact")
+    with make_archive() as archive:
+        with crash_on_unlink(1):
+            with pytest.raises(OSError):
+                archive.compact(before="2025-11-13")
+        leaf = leaf_of(archive)
+        assert len(list(leaf.glob("part-*.parquet"))) == RUNS
+
+        assert archive.compact(before="2025-11-13") == 1
+        assert not list(leaf.glob(".compact-*"))
+        assert len(list(leaf.glob("part-*.parquet"))) == 1
+        ids = raw_ids(archive)
+        assert len(ids) == RUNS * ROWS_PER_RUN and len(set(ids)) == len(ids)
+
+
+def test_scan_waits_for_writer():
+    """쓰기 잠금이 잡혀 있는 동안 scan 은 기다림 (compact 중인 파일을 읽지 않음)"""
+    logger.info("🔒 Testing scan waits for exclusive lock")
+    with make_archive() as archive:
+        held = threading.Event()
+
+        def writer():
+            with archive._locked():
+                held.set()
+                time.sleep(0.3)
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        held.wait()
+        started = time.perf_counter()
+        assert len(raw_ids(archive)) == RUNS * ROWS_PER_RUN
+        assert time.perf_counter() - started >= 0.2
+        thread.join()
+
+
+if __name__ == "__main__":
+    test_recover_after_partial_unlink()
+    test_recover_before_unlink()
+    test_scan_waits_for_writer()
+    logger.info("✅ All news archive tests passed!")
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+작업 큐 테스트
+WorkQueue 리스/만료/제출 상태 전이 (임시 경로 큐 + LocalStore + stub 백엔드)
+"""
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+from loguru import logger
+
+from analyzers.batch_worker import extract_items
+from analyzers.llm_backends import StubBackend
+from analyzers.relevance_analyzer import RelevanceAnalyzer
+from database.local_store import LocalStore
+from database.models import RawNews
+from pipeline.work_queue import WorkQueue
+
+
+@contextmanager
+def make_env(count=4, **queue_kwargs):
+    """임시 디렉토리에 LocalStore + WorkQueue 생성, 뉴스 count 건 적재"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = LocalStore(Path(tmp) / "store.sqlite")
+        for i in range(count):
+            db.insert_raw_news(RawNews(
+                source="Reuters", title=f"NVDA earnings beat #{i}", url=f"https://example.com/{i}",
+                content="", published_at=datetime.now(), symbols=["NVDA"], metadata={}
+            ))
+        queue = WorkQueue(Path(tmp) / "queue.sqlite", **queue_kwargs)
+        queue.sync(db)
+        backend = StubBackend()
+        try:
+            yield queue, db, RelevanceAnalyzer(backend), backend
+        finally:
+            queue.close()
+
+
+def analyze(analyzer, backend, news):
+    """stub 백엔드로 리스 배치 분석"""
+    return extract_items(backend.complete(analyzer._build_batch_prompt(news)))
+
+
+def analyzed_count(db):
+    return db._query("SELECT COUNT(*) AS n FROM analyzed_news")[0]["n"]
+
+
+def item_row(queue, news_id):
+    return queue._conn.execute("SELECT state, attempts FROM items WHERE news_id = ?", (news_id,)).fetchone()
+
+
+class CrashAfterSave:
+    """저장 직후(완료 표시 전) 죽는 저장소"""
+
+    def __init__(self, db):
+        self.db = db
+
+    def upsert_analyzed_news_many(self, news_list):
+        self.db.upsert_analyzed_news_many(news_list)
+        raise RuntimeError("crashed before marking items done")
+
+
+def test_resubmit_after_crash():
+    """저장 후 완료 표시 전에 멈춘 항목을 다시 제출해도 중복/실패 없이 완료"""
+    logger.info("🔁 Testing re-submit of an already saved lease")
+    with make_env(count=2, lease_ttl=0.2) as (queue, db, analyzer, backend):
+        lease = queue.lease("worker-1")
+        results = analyze(analyzer, backend, lease["news"])
+        try:
+            queue.submit(lease["lease_id"], results, CrashAfterSave(db), analyzer)
+            raise AssertionError("expected crash")
+        except RuntimeError:
+            pass
+        assert queue.stats()["ingesting"] == 2
+        assert analyzed_count(db) == 2
+
+        time.sleep(0.3)   # ingesting 항목이 _reap 으로 대기열에 돌아감
+        retry = queue.lease("worker-2")
+        assert sorted(n["id"] for n in retry["news"]) == sorted(n["id"] for n in lease["news"])
+        summary = queue.submit(retry["lease_id"], analyze(analyzer, backend, retry["news"]), db, analyzer)
+
+        assert summary["saved"] == 2 and summary["invalid"] == 0, summary
+        assert queue.stats()["done"] == 2
+        assert analyzed_count(db) == 2
+
+
+def test_expired_lease_requeued():
+    """heartbeat 없이 만료된 리스의 항목은 다른 워커에게 다시 감"""
+    logger.info("⏰ Testing lease expiry")
+    with make_env(count=3, lease_ttl=0.2) as (queue, db, analyzer, backend):
+        lease = queue.lease("worker-1")
+        assert len(lease["news"]) == 3
+        assert queue.lease("worker-2") is None
+
+        time.sleep(0.3)
+        assert not queue.heartbeat(lease["lease_id"])
+        retry = queue.lease("worker-2")
+        assert len(retry["news"]) == 3
+        assert item_row(queue, retry["news"][0]["id"])["attempts"] == 1
+
+
+def test_straggler_split_first_result_wins():
+    """대기 항목이 없으면 오래된 리스의 절반을 나눠 주고, 먼저 낸 결과만 반영"""
+    logger.info("🐢 Testing straggler split")
+    with make_env(count=4, straggler_after=0) as (queue, db, analyzer, backend):
+        slow = queue.lease("worker-1")
+        split = queue.lease("worker-2")
+        assert len(split["news"]) == 2
+        split_ids = {n["id"] for n in split["news"]}
+        assert split_ids <= {n["id"] for n in slow["news"]}
+
+        first = queue.submit(split["lease_id"], analyze(analyzer, backend, split["news"]), db, analyzer)
+        assert first["saved"] == 2
+        late = queue.submit(slow["lease_id"], analyze(analyzer, backend, slow["news"]), db, analyzer)
+        assert late["saved"] == 2 and late["duplicate"] == 2, late
+        assert queue.stats()["done"] == 4
+        assert analyzed_count(db) == 4
+
+
+def test_invalid_result_requeued():
+    """형식 오류 항목은 대기열로 돌아가고 나머지는 저장"""
+    logger.info("🧩 Testing invalid result re-queue")
+    with make_env(count=2) as (queue, db, analyzer, backend):
+        lease = queue.lease("worker-1")
+        results = analyze(analyzer, backend, lease["news"])
+        bad_id = results[0]["news_id"]
+        del results[0]["price_impact"]
+
+        summary = queue.submit(lease["lease_id"], results, db, analyzer)
+        assert summary["saved"] == 1 and summary["invalid"] == 1, summary
+        assert dict(item_row(queue, bad_id)) == {"state": "pending", "attempts": 1}
+        assert analyzed_count(db) == 1
+
+
+def test_max_attempts_failed():
+    """MAX_ATTEMPTS 번 돌려받은 항목은 failed 로 남고 더 이상 리스되지 않음"""
+    logger.info("💀 Testing max_attempts → failed")
+    with make_env(count=1, max_attempts=2) as (queue, db, analyzer, backend):
+        for _ in range(2):
+            lease = queue.lease("worker-1")
+            assert queue.release(lease["lease_id"]) == 1
+        assert queue.stats()["failed"] == 1
+        assert queue.lease("worker-1") is None
+
+
+if __name__ == "__main__":
+    test_resubmit_after_crash()
+    test_expired_lease_requeued()
+    test_straggler_split_first_result_wins()
+    test_invalid_result_requeued()
+    test_max_attempts_failed()
+    logger.info("✅ All work queue tests passed!")
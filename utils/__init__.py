@@ -0,0 +1 @@
+# Utility package (no project-internal dependencies)
@@ -0,0 +1,25 @@
+"""
+패키지 지연 export 헬퍼
+Lazy package exports
+
+collectors/analyzers/database/alerts 같은 하위 패키지의 __init__ 가 쓰는 헬퍼입니다.
+프로젝트 내부 모듈에 의존하지 않으므로, 하위 패키지가 pipeline 계층을 import 하지 않아도 됩니다.
+"""
+
+import importlib
+from typing import Dict
+
+
+def lazy_exports(package: str, exports: Dict[str, str]):
+    """
+    패키지 __init__ 용 지연 export (PEP 562 모듈 __getattr__)
+
+    `from collectors import FinnhubCollector` 가 collectors/finnhub_collector.py 만 import 하도록
+    exports = {"FinnhubCollector": ".finnhub_collector", ...} 를 넘깁니다.
+    """
+    def __getattr__(attr: str):
+        if attr not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {attr!r}")
+        return getattr(importlib.import_module(exports[attr], package), attr)
+
+    return __getattr__
@@ -4,7 +4,7 @@
 """
 import os
 import sys
-from flask import Flask, render_template, send_from_directory, jsonify, request
+from flask import Flask, Response, render_template, send_from_directory, jsonify, request, stream_with_context
 import markdown
 import glob
 from datetime import datetime
@@ -12,7 +12,10 @@ from datetime import datetime
 # 프로젝트 루트를 path에 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from database.supabase_client import SupabaseClient
+from database.storage import get_storage
+from database.queries import next_cursor
+from dashboard.event_stream import get_broadcaster, parse_last_event_id
+from database.search_index import DOC_KINDS, get_search_index
 
 app = Flask(__name__)
 
@@ -20,15 +23,15 @@ app = Flask(__name__)
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 ARTICLES_DIR = os.path.join(BASE_DIR, 'articles')
 
-# Supabase 클라이언트 (선택적)
+# 저장소 클라이언트 (선택적, STORAGE_BACKEND)
 try:
-    db_client = SupabaseClient()
+    db_client = get_storage()
     DB_ENABLED = True
-    print("✅ Supabase connected")
+    print(f"✅ Storage connected ({type(db_client).__name__})")
 except Exception as e:
     db_client = None
     DB_ENABLED = False
-    print(f"⚠️  Supabase not available: {e}")
+    print(f"⚠️  Storage not available: {e}")
 
 def parse_article(file_path):
     """마크다운 파일을 파싱하여 메타데이터와 콘텐츠 추출"""
@@ -166,21 +169,25 @@ def api_articles():
         min_priority = request.args.get('min_priority', 0, type=int)
         symbol = request.args.get('symbol', None, type=str)
         limit = request.args.get('limit', 50, type=int)
+        cursor = request.args.get('cursor', None, type=str)
 
         if symbol:
-            articles = db_client.get_articles_by_symbol_dashboard(symbol, limit)
+            articles = db_client.get_articles_by_symbol_dashboard(symbol, limit, cursor)
         else:
-            articles = db_client.get_articles_for_dashboard(limit, min_priority, symbol)
+            articles = db_client.get_articles_for_dashboard(limit, min_priority, symbol, cursor)
 
         return jsonify({
             "articles": articles,
             "count": len(articles),
+            "next_cursor": next_cursor(articles, limit),
             "filters": {
                 "min_priority": min_priority,
                 "symbol": symbol,
                 "limit": limit
             }
         })
+    except ValueError as e:
+        return jsonify({"error": str(e), "articles": []}), 400
     except Exception as e:
         return jsonify({"error": str(e), "articles": []}), 500
 
@@ -199,6 +206,47 @@ def api_trending():
         return jsonify({"error": str(e), "trending": []}), 500
 
 
+@app.route('/api/stream')
+def api_stream():
+    """실시간 통계/시그널 스트림 API (SSE, Last-Event-ID로 재개)"""
+    last_event_id = parse_last_event_id(
+        request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    )
+    return Response(
+        stream_with_context(get_broadcaster().stream(last_event_id)),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
+@app.route('/api/search')
+def api_search():
+    """뉴스/분석/기사 전문 검색 API (bm25 순위, 스니펫, 기간/레벨 필터)"""
+    query = request.args.get('q', '', type=str).strip()
+    kind = request.args.get('type', None, type=str)
+    if not query:
+        return jsonify({"error": "q parameter is required", "results": []}), 400
+    if kind and kind not in DOC_KINDS:
+        return jsonify({"error": f"type must be one of {', '.join(DOC_KINDS)}", "results": []}), 400
+
+    try:
+        results = get_search_index().search(
+            query,
+            kind=kind,
+            hours=request.args.get('hours', None, type=float),
+            since=request.args.get('since', None, type=str),
+            until=request.args.get('until', None, type=str),
+            level=request.args.get('level', None, type=int),
+            max_level=request.args.get('max_level', None, type=int),
+            symbol=request.args.get('symbol', None, type=str),
+            limit=request.args.get('limit', 20, type=int),
+            offset=request.args.get('offset', 0, type=int)
+        )
+        return jsonify({"query": query, "count": len(results), "results": results})
+    except Exception as e:
+        return jsonify({"error": str(e), "results": []}), 500
+
+
 @app.route('/api/published-articles')
 def api_published_articles():
     """발행된 블로그 기사 목록 API (로컬 파일 기반)"""
@@ -5,14 +5,14 @@ import sys
 from pathlib import Path
 
 sys.path.append('..')
-from database.supabase_client import SupabaseClient
+from database.storage import StorageBackend
 from database.models import PublishedArticle
 from writers.article_formatter import ArticleFormatter
 
 class ArticleGenerator:
     """Claude Code를 사용한 블로그 글 생성 (프롬프트 방식)"""
 
-    def __init__(self, db_client: SupabaseClient):
+    def __init__(self, db_client: StorageBackend):
         self.db = db_client
         self.prompts_dir = Path("prompts")
         self.prompts_dir.mkdir(exist_ok=True)